@@ -18,6 +18,11 @@ from .statistics import StatisticsCalculator, StatisticsResult
 from .probability import ProbabilityCalculator, ProbabilityResult
 from .geometry import GeometryCalculator, GeometryResult
 from .coordinate import CoordinateCalculator, CoordinateResult
+from .spatial_index import PointGridIndex
+from .line_intersection import LineIntersectionEngine, IntersectionResult
+from .polynomial_roots import PolynomialRootFinder, PolynomialRootResult
+from .polygon import PolygonCalculator, PolygonResult, PolygonBatchResult
+from .function_overlay import FunctionOverlayDrawer, OverlayFunction, OverlayResult
 
 __all__ = [
     'PrimeFactorCalculator',
@@ -46,5 +51,16 @@ __all__ = [
     'GeometryCalculator',
     'GeometryResult',
     'CoordinateCalculator',
-    'CoordinateResult'
+    'CoordinateResult',
+    'PointGridIndex',
+    'LineIntersectionEngine',
+    'IntersectionResult',
+    'PolynomialRootFinder',
+    'PolynomialRootResult',
+    'PolygonCalculator',
+    'PolygonResult',
+    'PolygonBatchResult',
+    'FunctionOverlayDrawer',
+    'OverlayFunction',
+    'OverlayResult'
 ]
@@ -393,3 +393,33 @@ class AlgebraicCalculator:
                     return term.coefficient
 
         return 0.0
+
+    def to_coefficients(self, expr: str, var: str = 'x') -> List[float]:
+        """
+        한 문자에 대한 다항식을 계수 리스트로 변환
+
+        Args:
+            expr: 식 (예: "x^3 - 6x^2 + 11x - 6")
+            var: 변수
+
+        Returns:
+            높은 차수부터의 계수 리스트 (예: [1, -6, 11, -6])
+
+        Raises:
+            ValueError: 다른 문자가 포함된 경우
+        """
+        terms = self.simplify(self.parse_expression(expr))
+
+        degree = 0
+        for term in terms:
+            others = set(term.variables) - {var}
+            if others:
+                raise ValueError(f"'{var}' 이외의 문자가 포함되어 있습니다: {', '.join(sorted(others))}")
+            degree = max(degree, term.variables.get(var, 0))
+
+        coefficients = [0.0] * (degree + 1)
+        for term in terms:
+            coefficients[degree - term.variables.get(var, 0)] += term.coefficient
+
+        logger.debug(f"계수 변환: {expr} → {coefficients}")
+        return coefficients
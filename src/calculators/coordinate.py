@@ -1,14 +1,20 @@
 """
 좌표평면 계산 모듈
 두 점 사이의 거리, 중점, 기울기 등을 계산합니다.
+많은 점을 한 번에 다루는 거리 행렬, 최근접 점 검색도 제공합니다.
 """
 import math
-from typing import Tuple
+import numpy as np
+from typing import Tuple, Optional, Iterator
 from dataclasses import dataclass
+from .spatial_index import PointGridIndex, as_point_array
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# 거리 행렬 계산 시 한 번에 처리할 기본 행 수
+DEFAULT_CHUNK_SIZE = 1024
+
 
 @dataclass
 class CoordinateResult:
@@ -266,3 +272,211 @@ class CoordinateCalculator:
         # 삼각형 넓이 공식 사용: 0이면 일직선
         area = abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
         return area < 1e-10  # 부동소수점 오차 고려
+
+    def iter_distance_chunks(
+        self,
+        points,
+        other=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        거리 행렬을 행 묶음 단위로 계산
+
+        한 번에 (chunk_size, M) 크기의 블록만 만들므로 임시 메모리 사용량이
+        전체 점 개수에 관계없이 chunk_size × M으로 제한됩니다.
+
+        Args:
+            points: (N, 2) 점 배열
+            other: (M, 2) 점 배열 (None이면 points 자신)
+            chunk_size: 한 번에 처리할 행 수
+
+        Yields:
+            (시작 행 번호, (행 수, M) 거리 블록)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+        a = as_point_array(points)
+        b = a if other is None else as_point_array(other)
+
+        for start in range(0, len(a), chunk_size):
+            block = a[start:start + chunk_size]
+            dx = block[:, 0, None] - b[None, :, 0]
+            dy = block[:, 1, None] - b[None, :, 1]
+            yield start, np.hypot(dx, dy)
+
+    def distance_matrix(
+        self,
+        points,
+        other=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> np.ndarray:
+        """
+        모든 점 쌍 사이의 거리 행렬
+
+        Args:
+            points: (N, 2) 점 배열
+            other: (M, 2) 점 배열 (None이면 points 자신과의 거리)
+            chunk_size: 한 번에 처리할 행 수
+
+        Returns:
+            (N, M) 거리 행렬
+        """
+        a = as_point_array(points)
+        m = len(a) if other is None else len(as_point_array(other))
+        logger.debug(f"거리 행렬 계산: {len(a)} x {m}")
+
+        result = np.empty((len(a), m), dtype=float)
+        for start, block in self.iter_distance_chunks(a, other, chunk_size):
+            result[start:start + len(block)] = block
+        return result
+
+    def build_index(self, points, cell_size: Optional[float] = None) -> PointGridIndex:
+        """
+        최근접 점 검색용 격자 색인 생성
+
+        점 집합이 바뀌지 않는 동안 색인을 재사용하면 매 질의가 주변 칸만 확인합니다.
+
+        Args:
+            points: (N, 2) 점 배열
+            cell_size: 격자 칸 크기 (None이면 자동)
+
+        Returns:
+            PointGridIndex 객체
+        """
+        return PointGridIndex(points, cell_size)
+
+    def nearest_neighbors(
+        self,
+        points,
+        queries,
+        k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        각 질의점에서 가장 가까운 k개의 점
+
+        Args:
+            points: (N, 2) 점 배열
+            queries: (Q, 2) 질의점 배열
+            k: 찾을 점의 개수
+
+        Returns:
+            (Q, k) 거리 배열, (Q, k) 인덱스 배열 - 가까운 순서
+        """
+        index = points if isinstance(points, PointGridIndex) else self.build_index(points)
+        distances, indices = index.query(queries, k)
+        logger.debug(f"최근접 점 검색: 질의 {len(indices)}개, k = {k}")
+        return distances, indices
+
+    def point_line_distances(self, points, a, b, c) -> np.ndarray:
+        """
+        여러 점과 직선 사이의 거리 (벡터화)
+        직선: ax + by + c = 0
+        거리: |ax₀ + by₀ + c| / √(a² + b²)
+
+        a, b, c가 스칼라이면 N개의 점과 한 직선, 길이 N의 배열이면
+        i번째 점과 i번째 직선 사이의 거리를 계산합니다.
+
+        Args:
+            points: (N, 2) 점 배열
+            a, b, c: 직선 방정식의 계수 (스칼라 또는 길이 N 배열)
+
+        Returns:
+            (N,) 거리 배열
+
+        Raises:
+            ValueError: a와 b가 모두 0인 직선이 있을 때
+        """
+        pts = as_point_array(points)
+        a, b, c = (np.asarray(v, dtype=float) for v in (a, b, c))
+
+        denominator = np.hypot(a, b)
+        if np.any(denominator == 0):
+            raise ValueError("a와 b가 모두 0이면 직선이 아닙니다.")
+
+        return np.abs(a * pts[:, 0] + b * pts[:, 1] + c) / denominator
+
+    def slopes(self, points1, points2) -> np.ndarray:
+        """
+        여러 점 쌍의 기울기 (벡터화): (y2-y1)/(x2-x1)
+
+        Args:
+            points1: (N, 2) 첫 번째 점 배열
+            points2: (N, 2) 두 번째 점 배열 (또는 하나의 점)
+
+        Returns:
+            (N,) 기울기 배열 (수직선은 NaN)
+        """
+        p1 = as_point_array(points1)
+        p2 = as_point_array(points2)
+        d = p2 - p1
+
+        result = np.full(len(d), np.nan)
+        defined = d[:, 0] != 0
+        result[defined] = d[defined, 1] / d[defined, 0]
+        return result
+
+    def midpoints(self, points1, points2) -> np.ndarray:
+        """
+        여러 점 쌍의 중점 (벡터화): ((x1+x2)/2, (y1+y2)/2)
+
+        Args:
+            points1: (N, 2) 첫 번째 점 배열
+            points2: (N, 2) 두 번째 점 배열 (또는 하나의 점)
+
+        Returns:
+            (N, 2) 중점 배열
+        """
+        return (as_point_array(points1) + as_point_array(points2)) / 2
+
+    def collinear_mask(
+        self,
+        points1,
+        points2,
+        points3,
+        tolerance: float = 1e-10
+    ) -> np.ndarray:
+        """
+        여러 세 점 묶음이 각각 한 직선 위에 있는지 (벡터화)
+
+        Args:
+            points1, points2, points3: (N, 2) 점 배열
+            tolerance: 허용 오차 (is_collinear와 같은 넓이 기준)
+
+        Returns:
+            (N,) bool 배열
+        """
+        p1 = as_point_array(points1)
+        d2 = as_point_array(points2) - p1
+        d3 = as_point_array(points3) - p1
+        area = np.abs(d2[:, 0] * d3[:, 1] - d3[:, 0] * d2[:, 1])
+        return area < tolerance
+
+    def is_collinear_many(self, points, tolerance: float = 1e-10) -> bool:
+        """
+        점 집합 전체가 한 직선 위에 있는지 확인
+
+        첫 점에서 가장 먼 점을 기준 방향으로 잡고 모든 점과의 외적을 한 번에 구합니다.
+        좌표 크기에 관계없이 판정하도록 허용 오차는 기준 벡터 길이의 제곱에 비례합니다.
+
+        Args:
+            points: (N, 2) 점 배열
+            tolerance: 상대 허용 오차
+
+        Returns:
+            True if collinear, False otherwise
+        """
+        pts = as_point_array(points)
+        if len(pts) < 3:
+            return True
+
+        rel = pts[1:] - pts[0]
+        lengths = np.einsum('ij,ij->i', rel, rel)
+        far = int(np.argmax(lengths))
+        if lengths[far] == 0:
+            # 모든 점이 같은 위치
+            return True
+
+        direction = rel[far]
+        cross = rel[:, 0] * direction[1] - rel[:, 1] * direction[0]
+        return bool(np.abs(cross).max() < tolerance * max(1.0, lengths[far]))
@@ -3,9 +3,11 @@
 정비례, 반비례 함수의 그래프를 그립니다.
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple, Union
 from matplotlib.figure import Figure
+from ..rendering.sampling import adaptive_sample
+from ..rendering.spec import PlotSpec, Series, RefLine
+from ..rendering.backends import render_matplotlib
 from ..utils.logger import get_logger
 
 logger = get_logger()
@@ -53,14 +55,14 @@ class FunctionGraphDrawer:
 
         return True, ""
 
-    def draw_proportional(
+    def proportional_spec(
         self,
         a: Union[int, float],
         x_range: Tuple[int, int],
         grid_alpha: float = 0.6
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        정비례 함수 그래프 그리기 (y = ax)
+        정비례 함수 그래프 명세 (y = ax)
 
         Args:
             a: 비례 상수
@@ -68,7 +70,7 @@ class FunctionGraphDrawer:
             grid_alpha: 격자 투명도
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
 
         Raises:
             ValueError: 매개변수가 유효하지 않을 때
@@ -83,35 +85,53 @@ class FunctionGraphDrawer:
         start, end = x_range
         logger.debug(f"정비례 함수 그리기: y = {a}x, 범위: [{start}, {end}]")
 
-        # 그래프 생성
-        fig, ax = plt.subplots(figsize=(8, 6))
-
-        # x축, y축 중심선
-        ax.axhline(y=0, color='k', linewidth=1)
-        ax.axvline(x=0, color='k', linewidth=1)
-        ax.grid(True, linestyle='--', alpha=grid_alpha)
-
         # 함수 그래프
         x = np.linspace(start, end, 100)
         y = a * x
-        ax.plot(x, y, label=f'y = {a}x', color='blue', linewidth=2)
 
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.set_title(f'정비례 함수: y = {a}x', fontsize=14)
-        ax.legend(fontsize=10)
+        return PlotSpec(
+            title=f'정비례 함수: y = {a}x',
+            layers=(
+                # x축, y축 중심선
+                RefLine('h', 0),
+                RefLine('v', 0),
+                Series.from_arrays(x, y, label=f'y = {a}x', color='blue'),
+            ),
+            grid_alpha=grid_alpha
+        )
+
+    def draw_proportional(
+        self,
+        a: Union[int, float],
+        x_range: Tuple[int, int],
+        grid_alpha: float = 0.6
+    ) -> Figure:
+        """
+        정비례 함수 그래프 그리기 (y = ax)
+
+        Args:
+            a: 비례 상수
+            x_range: x축 범위
+            grid_alpha: 격자 투명도
+
+        Returns:
+            matplotlib Figure 객체
 
+        Raises:
+            ValueError: 매개변수가 유효하지 않을 때
+        """
+        fig = render_matplotlib(self.proportional_spec(a, x_range, grid_alpha))
         logger.info("정비례 함수 그래프 생성 완료")
         return fig
 
-    def draw_inverse_proportional(
+    def inverse_proportional_spec(
         self,
         a: Union[int, float],
         x_range: Tuple[int, int],
         grid_alpha: float = 0.6
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        반비례 함수 그래프 그리기 (y = a/x)
+        반비례 함수 그래프 명세 (y = a/x)
 
         Args:
             a: 비례 상수
@@ -119,7 +139,7 @@ class FunctionGraphDrawer:
             grid_alpha: 격자 투명도
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
 
         Raises:
             ValueError: 매개변수가 유효하지 않을 때
@@ -139,36 +159,78 @@ class FunctionGraphDrawer:
         start, end = x_range
         logger.debug(f"반비례 함수 그리기: y = {a}/x, 범위: [{start}, {end}]")
 
-        # 그래프 생성
-        fig, ax = plt.subplots(figsize=(8, 6))
-
-        # x축, y축 중심선
-        ax.axhline(y=0, color='k', linewidth=1)
-        ax.axvline(x=0, color='k', linewidth=1)
-        ax.grid(True, linestyle='--', alpha=grid_alpha)
-
-        # 0을 포함하지 않도록 구간 분리
-        if start < 0:
-            x_neg = np.linspace(start, -0.01, 100)
-            y_neg = a / x_neg
-            ax.plot(x_neg, y_neg, color='red', linewidth=2)
+        # 점근선(x = 0) 근처는 촘촘히, 완만한 곳은 드물게 샘플링 (x = 0에서 선이 끊김)
+        x, y = adaptive_sample(
+            lambda t: a / t,
+            (start, end),
+            y_range=(-self.y_limit, self.y_limit)
+        )
+
+        return PlotSpec(
+            title=f'반비례 함수: y = {a}/x',
+            layers=(
+                # x축, y축 중심선
+                RefLine('h', 0),
+                RefLine('v', 0),
+                Series.from_arrays(x, y, label=f'y = {a}/x', color='red'),
+            ),
+            grid_alpha=grid_alpha,
+            # y축 범위 제한 (무한대 발산 방지)
+            ylim=(-self.y_limit, self.y_limit)
+        )
 
-        if end > 0:
-            x_pos = np.linspace(0.01, end, 100)
-            y_pos = a / x_pos
-            ax.plot(x_pos, y_pos, color='red', linewidth=2, label=f'y = {a}/x')
+    def draw_inverse_proportional(
+        self,
+        a: Union[int, float],
+        x_range: Tuple[int, int],
+        grid_alpha: float = 0.6
+    ) -> Figure:
+        """
+        반비례 함수 그래프 그리기 (y = a/x)
 
-        # y축 범위 제한 (무한대 발산 방지)
-        ax.set_ylim(-self.y_limit, self.y_limit)
+        Args:
+            a: 비례 상수
+            x_range: x축 범위
+            grid_alpha: 격자 투명도
 
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.set_title(f'반비례 함수: y = {a}/x', fontsize=14)
-        ax.legend(fontsize=10)
+        Returns:
+            matplotlib Figure 객체
 
+        Raises:
+            ValueError: 매개변수가 유효하지 않을 때
+        """
+        fig = render_matplotlib(self.inverse_proportional_spec(a, x_range, grid_alpha))
         logger.info("반비례 함수 그래프 생성 완료")
         return fig
 
+    def function_spec(
+        self,
+        func_type: str,
+        a: Union[int, float],
+        x_range: Tuple[int, int]
+    ) -> PlotSpec:
+        """
+        함수 그래프 명세 (통합 메서드)
+
+        Args:
+            func_type: 함수 종류 ('proportional' or 'inverse')
+            a: 비례 상수
+            x_range: x축 범위
+
+        Returns:
+            PlotSpec 객체
+
+        Raises:
+            ValueError: 함수 종류가 유효하지 않을 때
+        """
+        if func_type == 'proportional':
+            return self.proportional_spec(a, x_range)
+        elif func_type == 'inverse':
+            return self.inverse_proportional_spec(a, x_range)
+        else:
+            logger.error(f"지원하지 않는 함수 종류: {func_type}")
+            raise ValueError(f"지원하지 않는 함수 종류: {func_type}")
+
     def draw_function(
         self,
         func_type: str,
@@ -0,0 +1,306 @@
+"""
+여러 함수 겹쳐 그리기 모듈
+일차함수, 이차함수, 반비례 함수를 섞어 여러 개(반 전체 학생의 답 등)를 한 그래프에 그립니다.
+
+모든 함수를 y = p·x² + q·x + r + s/x 꼴의 (K, 4) 계수 배열로 바꾸어
+공유 x 격자에서 (K, N) 배열로 한 번에 계산하고, 꼭짓점과 절편도 벡터화하여 구합니다.
+"""
+import numpy as np
+from typing import List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from matplotlib.figure import Figure
+from ..rendering.spec import PlotSpec, Series, Marker, RefLine
+from ..rendering.backends import render_matplotlib
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 함수 종류별 계수 개수
+FUNCTION_KINDS = {
+    'linear': 2,     # y = ax + b
+    'quadratic': 3,  # y = ax² + bx + c
+    'inverse': 1,    # y = a/x
+}
+
+# 곡선 색상 (순환 사용)
+OVERLAY_COLORS = (
+    '#1f77b4', '#d62728', '#2ca02c', '#ff7f0e', '#9467bd',
+    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
+)
+
+# 범례를 표시할 최대 곡선 수
+MAX_LEGEND_ENTRIES = 10
+
+# 0으로 볼 계수 크기
+COEFFICIENT_TOLERANCE = 1e-10
+
+
+@dataclass(frozen=True)
+class OverlayFunction:
+    """겹쳐 그릴 함수 하나"""
+    kind: str  # 'linear', 'quadratic', 'inverse'
+    coefficients: Tuple[float, ...]
+    label: Optional[str] = None
+
+
+@dataclass
+class OverlayResult:
+    """겹쳐 그리기 계산 결과 클래스"""
+    x: np.ndarray  # (N,) 공유 x 격자
+    y: np.ndarray  # (K, N) 함수 값 (정의되지 않는 점은 NaN)
+    kinds: List[str]
+    labels: List[str]
+    vertices: np.ndarray  # (K, 2) 꼭짓점 (이차함수가 아니면 NaN)
+    y_intercepts: np.ndarray  # (K,) y절편 (반비례는 NaN)
+    x_intercepts: np.ndarray  # (K, 2) x절편 (없으면 NaN)
+    coefficients: np.ndarray = field(repr=False, default=None)  # (K, 4) [p, q, r, s]
+
+
+class FunctionOverlayDrawer:
+    """여러 함수 겹쳐 그리기 클래스"""
+
+    def __init__(self, x_limit: int = 10, y_limit: int = 10):
+        """
+        초기화
+
+        Args:
+            x_limit: x축 제한 값
+            y_limit: y축 제한 값 (반비례 함수가 있을 때 y 범위)
+        """
+        self.x_limit = x_limit
+        self.y_limit = y_limit
+        logger.info(f"함수 겹쳐 그리기 초기화 (x_limit: {x_limit}, y_limit: {y_limit})")
+
+    def validate_functions(
+        self,
+        functions: Sequence[Union[OverlayFunction, Tuple]]
+    ) -> List[OverlayFunction]:
+        """
+        함수 목록 검증
+
+        Args:
+            functions: OverlayFunction 또는 (종류, 계수[, 이름]) 튜플 목록
+
+        Returns:
+            OverlayFunction 목록
+
+        Raises:
+            ValueError: 종류나 계수가 올바르지 않을 때
+        """
+        if len(functions) == 0:
+            raise ValueError("함수를 하나 이상 입력해야 합니다.")
+
+        validated = []
+        for i, func in enumerate(functions):
+            if not isinstance(func, OverlayFunction):
+                func = OverlayFunction(func[0], tuple(func[1]), *func[2:3])
+
+            if func.kind not in FUNCTION_KINDS:
+                raise ValueError(f"{i + 1}번째 함수: 지원하지 않는 함수 종류입니다: {func.kind}")
+            if len(func.coefficients) != FUNCTION_KINDS[func.kind]:
+                raise ValueError(
+                    f"{i + 1}번째 함수: {func.kind} 함수의 계수는 {FUNCTION_KINDS[func.kind]}개여야 합니다."
+                )
+            try:
+                coeffs = tuple(float(c) for c in func.coefficients)
+            except (TypeError, ValueError):
+                raise ValueError(f"{i + 1}번째 함수: 계수는 숫자여야 합니다.")
+            if not np.all(np.isfinite(coeffs)):
+                raise ValueError(f"{i + 1}번째 함수: 계수에 NaN 또는 무한대가 포함되어 있습니다.")
+            if func.kind in ('quadratic', 'inverse') and abs(coeffs[0]) < COEFFICIENT_TOLERANCE:
+                raise ValueError(f"{i + 1}번째 함수: a가 0이면 {func.kind} 함수가 아닙니다.")
+
+            validated.append(OverlayFunction(func.kind, coeffs, func.label))
+        return validated
+
+    @staticmethod
+    def to_coefficient_matrix(functions: Sequence[OverlayFunction]) -> np.ndarray:
+        """
+        함수 목록을 y = p·x² + q·x + r + s/x 계수 배열로 변환
+
+        Returns:
+            (K, 4) 배열 [p, q, r, s]
+        """
+        matrix = np.zeros((len(functions), 4))
+        for i, func in enumerate(functions):
+            if func.kind == 'linear':
+                matrix[i, 1:3] = func.coefficients
+            elif func.kind == 'quadratic':
+                matrix[i, 0:3] = func.coefficients
+            else:
+                matrix[i, 3] = func.coefficients[0]
+        return matrix
+
+    @staticmethod
+    def _default_label(func: OverlayFunction) -> str:
+        """함수식 이름"""
+        c = func.coefficients
+        if func.kind == 'linear':
+            return f'y = {c[0]}x + {c[1]}'
+        if func.kind == 'quadratic':
+            return f'y = {c[0]}x² + {c[1]}x + {c[2]}'
+        return f'y = {c[0]}/x'
+
+    def evaluate(
+        self,
+        functions: Sequence[Union[OverlayFunction, Tuple]],
+        x_range: Tuple[float, float],
+        num_points: int = 400
+    ) -> OverlayResult:
+        """
+        모든 함수를 공유 x 격자에서 한 번에 계산
+
+        Args:
+            functions: 함수 목록 (예: [('linear', (2, 1)), ('quadratic', (1, 0, -4)), ('inverse', (3,))])
+            x_range: x축 범위
+            num_points: 격자 점 개수
+
+        Returns:
+            OverlayResult 객체
+
+        Raises:
+            ValueError: 입력이 올바르지 않을 때
+        """
+        funcs = self.validate_functions(functions)
+        start, end = float(x_range[0]), float(x_range[1])
+        if not start < end:
+            raise ValueError("x 범위의 시작 값이 끝 값보다 작아야 합니다.")
+
+        x = np.linspace(start, end, num_points)
+        if start < 0 < end:
+            # 반비례 곡선이 x = 0에서 끊기도록 격자에 0을 넣음
+            x = np.union1d(x, [0.0])
+
+        coeffs = self.to_coefficient_matrix(funcs)
+        p, q, r, s = (coeffs[:, k:k + 1] for k in range(4))
+
+        inv_x = np.divide(1.0, x, out=np.full_like(x, np.nan), where=x != 0)
+        y = p * x**2 + q * x + r
+        has_inverse = s[:, 0] != 0
+        y[has_inverse] += s[has_inverse] * inv_x
+
+        vertices, y_intercepts, x_intercepts = self._features(coeffs)
+
+        logger.debug(f"함수 {len(funcs)}개 겹쳐 계산 (격자 {len(x)}점)")
+        return OverlayResult(
+            x=x,
+            y=y,
+            kinds=[f.kind for f in funcs],
+            labels=[f.label or self._default_label(f) for f in funcs],
+            vertices=vertices,
+            y_intercepts=y_intercepts,
+            x_intercepts=x_intercepts,
+            coefficients=coeffs
+        )
+
+    @staticmethod
+    def _features(coeffs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """꼭짓점, y절편, x절편 벡터화 계산"""
+        p, q, r, s = coeffs.T
+        k = len(coeffs)
+        is_quadratic = np.abs(p) >= COEFFICIENT_TOLERANCE
+        is_inverse = s != 0
+        is_linear = ~is_quadratic & ~is_inverse
+        safe_p = np.where(is_quadratic, p, 1.0)
+
+        # 꼭짓점 (이차함수만)
+        vx = np.where(is_quadratic, -q / (2 * safe_p), np.nan)
+        vy = p * vx**2 + q * vx + r
+        vertices = np.column_stack([vx, vy])
+
+        # y절편 (반비례는 x = 0에서 정의되지 않음)
+        y_intercepts = np.where(is_inverse, np.nan, r)
+
+        # x절편: 이차함수는 근의 공식, 일차함수는 -b/a, 반비례는 없음
+        x_intercepts = np.full((k, 2), np.nan)
+        disc = q**2 - 4 * p * r
+        real = is_quadratic & (disc >= 0)
+        sqrt_d = np.sqrt(np.where(real, disc, 0.0))
+        x_intercepts[:, 0] = np.where(real, (-q - sqrt_d) / (2 * safe_p), np.nan)
+        x_intercepts[:, 1] = np.where(real & (disc > 0), (-q + sqrt_d) / (2 * safe_p), np.nan)
+
+        sloped = is_linear & (q != 0)
+        safe_q = np.where(sloped, q, 1.0)
+        x_intercepts[:, 0] = np.where(sloped, -r / safe_q, x_intercepts[:, 0])
+
+        # 작은 쪽이 먼저 오도록 정렬 (NaN은 뒤로)
+        x_intercepts = np.sort(x_intercepts, axis=1)
+        return vertices, y_intercepts, x_intercepts
+
+    def overlay_spec(
+        self,
+        functions: Sequence[Union[OverlayFunction, Tuple]],
+        x_range: Tuple[float, float],
+        num_points: int = 400,
+        title: str = '함수 겹쳐 그리기'
+    ) -> PlotSpec:
+        """
+        여러 함수 겹쳐 그리기 명세
+
+        Args:
+            functions: 함수 목록
+            x_range: x축 범위
+            num_points: 격자 점 개수
+            title: 그래프 제목
+
+        Returns:
+            PlotSpec 객체
+        """
+        result = self.evaluate(functions, x_range, num_points)
+        k = len(result.labels)
+        start, end = float(result.x[0]), float(result.x[-1])
+
+        layers = [RefLine('h', 0), RefLine('v', 0)]
+        for i in range(k):
+            layers.append(Series.from_arrays(
+                result.x, result.y[i],
+                label=result.labels[i],
+                color=OVERLAY_COLORS[i % len(OVERLAY_COLORS)],
+                linewidth=2 if k <= MAX_LEGEND_ENTRIES else 1
+            ))
+
+        # 보이는 꼭짓점을 한 번에 표시
+        vx, vy = result.vertices.T
+        visible = np.isfinite(vx) & (vx >= start) & (vx <= end)
+        if np.any(visible):
+            layers.append(Marker.from_arrays(vx[visible], vy[visible], color='black', size=6))
+
+        return PlotSpec(
+            title=title,
+            layers=tuple(layers),
+            figsize=(10, 8),
+            title_bold=True,
+            xlim=(start, end),
+            ylim=self._ylim(result),
+            legend=k <= MAX_LEGEND_ENTRIES
+        )
+
+    def _ylim(self, result: OverlayResult) -> Tuple[float, float]:
+        """y 범위 (반비례가 있으면 ±y_limit, 아니면 모든 곡선을 담는 범위)"""
+        if 'inverse' in result.kinds:
+            return (-self.y_limit, self.y_limit)
+        finite = result.y[np.isfinite(result.y)]
+        lo, hi = float(finite.min()), float(finite.max())
+        margin = (hi - lo) * 0.1 or 1.0
+        return (lo - margin, hi + margin)
+
+    def draw_overlay(
+        self,
+        functions: Sequence[Union[OverlayFunction, Tuple]],
+        x_range: Tuple[float, float],
+        num_points: int = 400
+    ) -> Figure:
+        """
+        여러 함수 겹쳐 그리기
+
+        Args:
+            functions: 함수 목록
+            x_range: x축 범위
+            num_points: 격자 점 개수
+
+        Returns:
+            matplotlib Figure 객체
+        """
+        fig = render_matplotlib(self.overlay_spec(functions, x_range, num_points))
+        logger.info("함수 겹쳐 그리기 그래프 생성 완료")
+        return fig
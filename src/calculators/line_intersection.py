@@ -0,0 +1,156 @@
+"""
+직선 교점 모듈
+여러 일차함수 y = mx + b의 모든 교점을 한 번에 계산합니다.
+"""
+import numpy as np
+from typing import Tuple, Optional, Sequence
+from dataclasses import dataclass
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 기울기가 같은지(평행) 판정하는 허용 오차
+SLOPE_TOLERANCE = 1e-12
+
+
+@dataclass
+class IntersectionResult:
+    """직선 교점 계산 결과 클래스"""
+    points: np.ndarray            # (K, 2) 교점 좌표
+    pairs: np.ndarray             # (K, 2) 교점을 만드는 두 직선의 인덱스 (i < j)
+    parallel_pairs: np.ndarray    # (P, 2) 평행한(만나지 않는) 직선 쌍
+    coincident_pairs: np.ndarray  # (C, 2) 일치하는 직선 쌍
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+
+class LineIntersectionEngine:
+    """여러 직선의 교점 계산 클래스"""
+
+    def __init__(self, tolerance: float = SLOPE_TOLERANCE):
+        """
+        초기화
+
+        Args:
+            tolerance: 기울기와 y절편이 같은지 판정하는 허용 오차
+        """
+        self.tolerance = tolerance
+        logger.info("직선 교점 계산기 초기화")
+
+    def validate_lines(self, slopes, intercepts) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        직선 계수 검증
+
+        Args:
+            slopes: 기울기 배열
+            intercepts: y절편 배열
+
+        Returns:
+            (기울기, y절편) float 배열
+
+        Raises:
+            ValueError: 길이가 다르거나 NaN/무한대가 포함된 경우
+        """
+        try:
+            m = np.asarray(slopes, dtype=float).ravel()
+            b = np.asarray(intercepts, dtype=float).ravel()
+        except (TypeError, ValueError):
+            raise ValueError("기울기와 y절편은 숫자여야 합니다.")
+
+        if m.shape != b.shape:
+            raise ValueError("기울기와 y절편의 개수가 같아야 합니다.")
+        if not (np.all(np.isfinite(m)) and np.all(np.isfinite(b))):
+            raise ValueError("기울기와 y절편에 NaN 또는 무한대가 포함되어 있습니다.")
+        return m, b
+
+    def intersect(
+        self,
+        slopes,
+        intercepts,
+        x_range: Optional[Tuple[float, float]] = None,
+        y_range: Optional[Tuple[float, float]] = None
+    ) -> IntersectionResult:
+        """
+        모든 직선 쌍의 교점 계산
+
+        기울기 순으로 정렬한 뒤 기울기가 같은 직선끼리 묶으면, 같은 묶음 안의
+        쌍(평행 또는 일치)은 한 번의 비교로 모두 건너뛸 수 있습니다.
+        나머지 쌍의 교점은 하나의 NumPy 연산으로 계산합니다.
+
+        Args:
+            slopes: (M,) 기울기 배열
+            intercepts: (M,) y절편 배열
+            x_range: 교점을 남길 x 범위 (None이면 제한 없음)
+            y_range: 교점을 남길 y 범위 (None이면 제한 없음)
+
+        Returns:
+            IntersectionResult 객체 (교점은 x, y 순으로 정렬)
+        """
+        m, b = self.validate_lines(slopes, intercepts)
+        logger.debug(f"직선 교점 계산: 직선 {len(m)}개")
+
+        order = np.argsort(m, kind='stable')
+        m_sorted = m[order]
+
+        # 같은 기울기 묶음 번호
+        group = np.zeros(len(m), dtype=np.int64)
+        if len(m) > 1:
+            group[1:] = np.cumsum(np.diff(m_sorted) > self.tolerance)
+
+        i, j = np.triu_indices(len(m), k=1)
+        same = group[i] == group[j]
+
+        # 원래 인덱스로 되돌리기 (i < j)
+        pi, pj = order[i], order[j]
+        lo, hi = np.minimum(pi, pj), np.maximum(pi, pj)
+
+        # 같은 기울기 묶음: 평행 또는 일치
+        same_lo, same_hi = lo[same], hi[same]
+        coincident = np.abs(b[same_lo] - b[same_hi]) <= self.tolerance
+        coincident_pairs = np.column_stack([same_lo[coincident], same_hi[coincident]])
+        parallel_pairs = np.column_stack([same_lo[~coincident], same_hi[~coincident]])
+
+        # 나머지 쌍의 교점: m₁x + b₁ = m₂x + b₂ → x = (b₂ - b₁) / (m₁ - m₂)
+        lo, hi = lo[~same], hi[~same]
+        x = (b[hi] - b[lo]) / (m[lo] - m[hi])
+        y = m[lo] * x + b[lo]
+
+        keep = np.ones(len(x), dtype=bool)
+        if x_range is not None:
+            keep &= (x >= x_range[0]) & (x <= x_range[1])
+        if y_range is not None:
+            keep &= (y >= y_range[0]) & (y <= y_range[1])
+
+        x, y, lo, hi = x[keep], y[keep], lo[keep], hi[keep]
+        sort = np.lexsort((y, x))
+        points = np.column_stack([x[sort], y[sort]])
+        pairs = np.column_stack([lo[sort], hi[sort]])
+
+        logger.info(f"직선 교점 {len(points)}개 (평행 {len(parallel_pairs)}쌍, 일치 {len(coincident_pairs)}쌍)")
+        return IntersectionResult(
+            points=points,
+            pairs=pairs,
+            parallel_pairs=parallel_pairs,
+            coincident_pairs=coincident_pairs
+        )
+
+    def intersect_lines(
+        self,
+        lines: Sequence[Tuple[float, float]],
+        x_range: Optional[Tuple[float, float]] = None,
+        y_range: Optional[Tuple[float, float]] = None
+    ) -> IntersectionResult:
+        """
+        (기울기, y절편) 쌍의 목록으로 교점 계산
+
+        Args:
+            lines: [(m, b), ...] 직선 목록
+            x_range: 교점을 남길 x 범위
+            y_range: 교점을 남길 y 범위
+
+        Returns:
+            IntersectionResult 객체
+        """
+        arr = np.asarray(lines, dtype=float).reshape(-1, 2)
+        return self.intersect(arr[:, 0], arr[:, 1], x_range, y_range)
@@ -3,9 +3,11 @@
 y = ax + b 형태의 일차함수 그래프를 그립니다.
 """
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Sequence
 from matplotlib.figure import Figure
+from .line_intersection import LineIntersectionEngine, IntersectionResult
+from ..rendering.spec import PlotSpec, Series, Marker, RefLine, Annotation
+from ..rendering.backends import render_matplotlib
 from ..utils.logger import get_logger
 
 logger = get_logger()
@@ -26,15 +28,15 @@ class LinearFunctionDrawer:
         self.y_limit = y_limit
         logger.info(f"일차함수 그래프 초기화 (x_limit: {x_limit}, y_limit: {y_limit})")
 
-    def draw(
+    def graph_spec(
         self,
         a: float,
         b: float,
         x_range: Tuple[int, int],
         grid_alpha: float = 0.6
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        일차함수 그래프 그리기: y = ax + b
+        일차함수 그래프 명세: y = ax + b
 
         Args:
             a: 기울기
@@ -43,24 +45,19 @@ class LinearFunctionDrawer:
             grid_alpha: 격자 투명도
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
         """
         logger.debug(f"일차함수 그리기: y = {a}x + {b}, 범위: {x_range}")
 
-        # 그래프 생성
-        fig, ax = plt.subplots(figsize=(8, 6))
-
         # 축 설정
-        ax.axhline(y=0, color='k', linewidth=1)
-        ax.axvline(x=0, color='k', linewidth=1)
-        ax.grid(True, linestyle='--', alpha=grid_alpha)
+        layers = [RefLine('h', 0), RefLine('v', 0)]
 
         # 함수 그래프
         start, end = x_range
         x = np.linspace(start, end, 100)
         y = a * x + b
 
-        ax.plot(x, y, label=f'y = {a}x + {b}', color='blue', linewidth=2)
+        layers.append(Series.from_arrays(x, y, label=f'y = {a}x + {b}', color='blue'))
 
         # 기울기 표시 (삼각형)
         if a != 0:
@@ -73,25 +70,47 @@ class LinearFunctionDrawer:
             y1 = a * x1 + b
 
             # 삼각형 그리기
-            ax.plot([x0, x1], [y0, y0], 'r--', linewidth=1, alpha=0.7)
-            ax.plot([x1, x1], [y0, y1], 'r--', linewidth=1, alpha=0.7)
-            ax.plot([x0, x1], [y0, y1], 'r-', linewidth=1.5, alpha=0.7)
+            guide = dict(color='red', linewidth=1, alpha=0.7)
+            layers.append(Series.from_arrays([x0, x1], [y0, y0], linestyle='--', **guide))
+            layers.append(Series.from_arrays([x1, x1], [y0, y1], linestyle='--', **guide))
+            layers.append(Series.from_arrays([x0, x1], [y0, y1], color='red', linewidth=1.5, alpha=0.7))
 
             # 주석
             mid_x = (x0 + x1) / 2
-            ax.text(mid_x, y0 - 0.5, '1', ha='center', fontsize=9, color='red')
-            ax.text(x1 + 0.3, (y0 + y1) / 2, f'{a}', ha='left', fontsize=9, color='red')
+            layers.append(Annotation(mid_x, y0 - 0.5, '1', color='red', fontsize=9, ha='center'))
+            layers.append(Annotation(x1 + 0.3, (y0 + y1) / 2, f'{a}', color='red', fontsize=9))
 
         # y절편 표시
         if start <= 0 <= end:
-            ax.plot(0, b, 'ro', markersize=8)
-            ax.text(0.3, b, f'({0}, {b})', fontsize=10)
+            layers.append(Marker.at(0, b, color='red'))
+            layers.append(Annotation(0.3, b, f'({0}, {b})'))
 
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.set_title(f'일차함수: y = {a}x + {b}', fontsize=14)
-        ax.legend(fontsize=10)
+        return PlotSpec(
+            title=f'일차함수: y = {a}x + {b}',
+            layers=tuple(layers),
+            grid_alpha=grid_alpha
+        )
 
+    def draw(
+        self,
+        a: float,
+        b: float,
+        x_range: Tuple[int, int],
+        grid_alpha: float = 0.6
+    ) -> Figure:
+        """
+        일차함수 그래프 그리기: y = ax + b
+
+        Args:
+            a: 기울기
+            b: y절편
+            x_range: x축 범위
+            grid_alpha: 격자 투명도
+
+        Returns:
+            matplotlib Figure 객체
+        """
+        fig = render_matplotlib(self.graph_spec(a, b, x_range, grid_alpha))
         logger.info("일차함수 그래프 생성 완료")
         return fig
 
@@ -170,3 +189,27 @@ class LinearFunctionDrawer:
 
         logger.debug(f"수직선: y = {new_a}x + {new_b}")
         return (new_a, new_b)
+
+    def find_intersections(
+        self,
+        lines: Sequence[Tuple[float, float]],
+        x_range: Optional[Tuple[float, float]] = None,
+        y_range: Optional[Tuple[float, float]] = None
+    ) -> IntersectionResult:
+        """
+        여러 일차함수의 모든 교점 구하기
+
+        Args:
+            lines: [(a, b), ...] 일차함수 y = ax + b 목록
+            x_range: 교점을 남길 x 범위 (None이면 ±x_limit)
+            y_range: 교점을 남길 y 범위 (None이면 ±y_limit)
+
+        Returns:
+            IntersectionResult 객체
+        """
+        if x_range is None:
+            x_range = (-self.x_limit, self.x_limit)
+        if y_range is None:
+            y_range = (-self.y_limit, self.y_limit)
+
+        return LineIntersectionEngine().intersect_lines(lines, x_range, y_range)
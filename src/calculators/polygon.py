@@ -0,0 +1,311 @@
+"""
+다각형 계산 모듈
+꼭짓점 배열로 주어진 다각형의 넓이, 둘레, 무게중심, 방향을 계산합니다.
+신발끈 공식(shoelace formula)을 NumPy로 벡터화하여 꼭짓점이 많은 다각형과
+여러 다각형 묶음(ragged batch)을 한 번에 처리합니다.
+"""
+import numpy as np
+from typing import Tuple, List, Sequence
+from dataclasses import dataclass, field
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 넓이가 0인(퇴화된) 다각형 판정용 엡실론
+EPSILON = 1e-12
+
+# 방향 코드
+ORIENTATION_CCW = 1
+ORIENTATION_CW = -1
+ORIENTATION_DEGENERATE = 0
+
+_ORIENTATION_NAMES = {
+    ORIENTATION_CCW: 'ccw',
+    ORIENTATION_CW: 'cw',
+    ORIENTATION_DEGENERATE: 'degenerate'
+}
+
+
+@dataclass
+class PolygonResult:
+    """다각형 계산 결과 클래스"""
+    area: float
+    signed_area: float
+    perimeter: float
+    centroid: Tuple[float, float]
+    orientation: str  # 'ccw', 'cw', 'degenerate'
+    vertex_count: int
+    steps: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PolygonBatchResult:
+    """다각형 묶음 계산 결과 클래스 (다각형마다 한 행)"""
+    areas: np.ndarray         # (M,)
+    signed_areas: np.ndarray  # (M,)
+    perimeters: np.ndarray    # (M,)
+    centroids: np.ndarray     # (M, 2)
+    orientations: np.ndarray  # (M,) 1: 반시계, -1: 시계, 0: 퇴화
+    vertex_counts: np.ndarray  # (M,)
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+
+class PolygonCalculator:
+    """다각형 계산기 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        logger.info("다각형 계산기 초기화")
+
+    def validate_vertices(self, vertices) -> np.ndarray:
+        """
+        꼭짓점 배열 검증
+
+        Args:
+            vertices: (N, 2) 형태의 꼭짓점 좌표
+
+        Returns:
+            float64 (N, 2) 배열
+
+        Raises:
+            ValueError: 형태가 잘못되었거나 NaN/무한대가 포함된 경우
+        """
+        try:
+            arr = np.asarray(vertices, dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError("꼭짓점은 숫자 좌표여야 합니다.")
+
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError("꼭짓점 배열은 (N, 2) 형태여야 합니다.")
+        if not np.all(np.isfinite(arr)):
+            raise ValueError("꼭짓점에 NaN 또는 무한대가 포함되어 있습니다.")
+        return arr
+
+    def validate_offsets(self, offsets, total: int) -> np.ndarray:
+        """
+        다각형 묶음의 오프셋 배열 검증
+
+        Args:
+            offsets: 각 다각형의 시작 위치 + 마지막 끝 위치 (길이 M+1)
+            total: 전체 꼭짓점 수
+
+        Returns:
+            int64 오프셋 배열
+
+        Raises:
+            ValueError: 오프셋이 잘못된 경우
+        """
+        offs = np.asarray(offsets)
+        if offs.ndim != 1 or len(offs) < 2:
+            raise ValueError("오프셋은 길이가 2 이상인 1차원 배열이어야 합니다.")
+        if not np.issubdtype(offs.dtype, np.integer):
+            raise ValueError("오프셋은 정수여야 합니다.")
+        offs = offs.astype(np.int64)
+        if offs[0] != 0 or offs[-1] != total:
+            raise ValueError(f"오프셋은 0에서 시작해 {total}에서 끝나야 합니다.")
+        if np.any(np.diff(offs) < 3):
+            raise ValueError("각 다각형은 꼭짓점이 3개 이상이어야 합니다.")
+        return offs
+
+    def signed_area(self, vertices) -> float:
+        """
+        부호 있는 넓이 (반시계 방향이면 양수)
+
+        Args:
+            vertices: (N, 2) 꼭짓점 배열
+
+        Returns:
+            부호 있는 넓이
+        """
+        pts = self._validate_polygon(vertices)
+        return float(self._cross_terms(pts).sum() / 2)
+
+    def area(self, vertices) -> float:
+        """다각형 넓이: |Σ(xᵢyᵢ₊₁ - xᵢ₊₁yᵢ)| / 2"""
+        return abs(self.signed_area(vertices))
+
+    def perimeter(self, vertices) -> float:
+        """다각형 둘레: 변의 길이의 합"""
+        pts = self._validate_polygon(vertices)
+        edges = np.roll(pts, -1, axis=0) - pts
+        return float(np.hypot(edges[:, 0], edges[:, 1]).sum())
+
+    def centroid(self, vertices) -> Tuple[float, float]:
+        """
+        다각형의 무게중심 (넓이 기준)
+
+        퇴화된 다각형(넓이 0)은 꼭짓점의 평균을 반환합니다.
+        """
+        pts = self._validate_polygon(vertices)
+        cross = self._cross_terms(pts)
+        return self._centroid_from_cross(pts, cross)
+
+    def orientation(self, vertices) -> str:
+        """꼭짓점 방향: 'ccw'(반시계), 'cw'(시계), 'degenerate'(퇴화)"""
+        return _ORIENTATION_NAMES[self._orientation_code(self.signed_area(vertices))]
+
+    def analyze(self, vertices) -> PolygonResult:
+        """
+        다각형의 넓이, 둘레, 무게중심, 방향을 한 번에 계산
+
+        Args:
+            vertices: (N, 2) 꼭짓점 배열 (마지막 점과 첫 점은 자동으로 연결)
+
+        Returns:
+            PolygonResult 객체
+        """
+        pts = self._validate_polygon(vertices)
+        n = len(pts)
+        logger.debug(f"다각형 계산: 꼭짓점 {n}개")
+
+        nxt = np.roll(pts, -1, axis=0)
+        cross = pts[:, 0] * nxt[:, 1] - nxt[:, 0] * pts[:, 1]
+        edges = nxt - pts
+
+        signed = float(cross.sum() / 2)
+        perimeter = float(np.hypot(edges[:, 0], edges[:, 1]).sum())
+        cx, cy = self._centroid_from_cross(pts, cross)
+        orientation = _ORIENTATION_NAMES[self._orientation_code(signed)]
+
+        steps = []
+        steps.append(f"꼭짓점 {n}개의 다각형")
+        steps.append("신발끈 공식: S = |Σ(xᵢyᵢ₊₁ - xᵢ₊₁yᵢ)| / 2")
+        steps.append(f"Σ(xᵢyᵢ₊₁ - xᵢ₊₁yᵢ) = {cross.sum()}")
+        steps.append(f"넓이 = |{cross.sum()}| / 2 = {abs(signed)}")
+        steps.append(f"둘레 = 변 {n}개의 길이의 합 = {perimeter}")
+        steps.append(f"무게중심 = ({cx}, {cy})")
+        steps.append(f"방향: {orientation}")
+
+        logger.info(f"다각형 넓이 = {abs(signed)}, 둘레 = {perimeter}")
+        return PolygonResult(
+            area=abs(signed),
+            signed_area=signed,
+            perimeter=perimeter,
+            centroid=(cx, cy),
+            orientation=orientation,
+            vertex_count=n,
+            steps=steps
+        )
+
+    def analyze_batch(self, vertices, offsets) -> PolygonBatchResult:
+        """
+        여러 다각형을 한 번에 계산 (ragged batch)
+
+        모든 다각형의 꼭짓점을 하나의 (총 꼭짓점 수, 2) 배열로 이어 붙이고,
+        다각형 i의 꼭짓점은 vertices[offsets[i]:offsets[i+1]]로 지정합니다.
+
+        Args:
+            vertices: 이어 붙인 꼭짓점 배열
+            offsets: 길이 M+1의 오프셋 배열 (0으로 시작, 총 꼭짓점 수로 끝)
+
+        Returns:
+            PolygonBatchResult 객체
+        """
+        pts = self.validate_vertices(vertices)
+        offs = self.validate_offsets(offsets, len(pts))
+        starts = offs[:-1]
+        counts = np.diff(offs)
+        logger.debug(f"다각형 묶음 계산: 다각형 {len(counts)}개, 꼭짓점 {len(pts)}개")
+
+        # 각 꼭짓점의 다음 꼭짓점 인덱스 (다각형의 마지막 점은 첫 점으로 연결)
+        nxt_idx = np.arange(1, len(pts) + 1)
+        nxt_idx[offs[1:] - 1] = starts
+        nxt = pts[nxt_idx]
+
+        x, y = pts[:, 0], pts[:, 1]
+        xn, yn = nxt[:, 0], nxt[:, 1]
+        cross = x * yn - xn * y
+        edges = nxt - pts
+
+        signed = np.add.reduceat(cross, starts) / 2
+        perimeters = np.add.reduceat(np.hypot(edges[:, 0], edges[:, 1]), starts)
+
+        cx_sum = np.add.reduceat((x + xn) * cross, starts)
+        cy_sum = np.add.reduceat((y + yn) * cross, starts)
+        degenerate = np.abs(signed) <= EPSILON
+
+        # 퇴화된 다각형은 꼭짓점 평균으로 대체
+        safe = np.where(degenerate, 1.0, 6 * signed)
+        centroids = np.column_stack([cx_sum / safe, cy_sum / safe])
+        if np.any(degenerate):
+            means = np.add.reduceat(pts, starts, axis=0) / counts[:, None]
+            centroids[degenerate] = means[degenerate]
+
+        orientations = np.sign(signed).astype(np.int8)
+        orientations[degenerate] = ORIENTATION_DEGENERATE
+
+        logger.info(f"다각형 묶음 계산 완료: {len(counts)}개")
+        return PolygonBatchResult(
+            areas=np.abs(signed),
+            signed_areas=signed,
+            perimeters=perimeters,
+            centroids=centroids,
+            orientations=orientations,
+            vertex_counts=counts
+        )
+
+    def analyze_many(self, polygons: Sequence) -> PolygonBatchResult:
+        """
+        다각형 목록을 한 번에 계산
+
+        Args:
+            polygons: (Nᵢ, 2) 꼭짓점 배열들의 목록
+
+        Returns:
+            PolygonBatchResult 객체
+        """
+        vertices, offsets = self.pack(polygons)
+        return self.analyze_batch(vertices, offsets)
+
+    @staticmethod
+    def pack(polygons: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        다각형 목록을 (꼭짓점 배열, 오프셋 배열)로 변환
+
+        Args:
+            polygons: (Nᵢ, 2) 꼭짓점 배열들의 목록
+
+        Returns:
+            (이어 붙인 꼭짓점 배열, 길이 M+1의 오프셋 배열)
+        """
+        if len(polygons) == 0:
+            raise ValueError("다각형이 하나 이상 필요합니다.")
+        arrays = [np.asarray(p, dtype=float).reshape(-1, 2) for p in polygons]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in arrays], out=offsets[1:])
+        return np.concatenate(arrays), offsets
+
+    def _validate_polygon(self, vertices) -> np.ndarray:
+        """단일 다각형 검증 (꼭짓점 3개 이상)"""
+        pts = self.validate_vertices(vertices)
+        if len(pts) < 3:
+            raise ValueError("다각형은 꼭짓점이 3개 이상이어야 합니다.")
+        return pts
+
+    @staticmethod
+    def _cross_terms(pts: np.ndarray) -> np.ndarray:
+        """신발끈 공식의 각 항: xᵢyᵢ₊₁ - xᵢ₊₁yᵢ"""
+        nxt = np.roll(pts, -1, axis=0)
+        return pts[:, 0] * nxt[:, 1] - nxt[:, 0] * pts[:, 1]
+
+    @staticmethod
+    def _centroid_from_cross(pts: np.ndarray, cross: np.ndarray) -> Tuple[float, float]:
+        """신발끈 항으로부터 무게중심 계산"""
+        signed = cross.sum() / 2
+        if abs(signed) <= EPSILON:
+            mean = pts.mean(axis=0)
+            return (float(mean[0]), float(mean[1]))
+
+        nxt = np.roll(pts, -1, axis=0)
+        cx = ((pts[:, 0] + nxt[:, 0]) * cross).sum() / (6 * signed)
+        cy = ((pts[:, 1] + nxt[:, 1]) * cross).sum() / (6 * signed)
+        return (float(cx), float(cy))
+
+    @staticmethod
+    def _orientation_code(signed: float) -> int:
+        """부호 있는 넓이로 방향 코드 결정"""
+        if abs(signed) <= EPSILON:
+            return ORIENTATION_DEGENERATE
+        return ORIENTATION_CCW if signed > 0 else ORIENTATION_CW
@@ -0,0 +1,315 @@
+"""
+고차방정식 풀이 모듈
+n차 다항식 aₙxⁿ + ... + a₁x + a₀ = 0의 근을 구합니다.
+정수 계수는 유리근 정리로 정확한 근을 먼저 찾고, 나머지는 동반행렬의 고윳값과
+뉴턴 방법 보정으로 구합니다. 같은 차수의 다항식 여러 개를 한 번에 풀 수 있습니다.
+"""
+import math
+import numpy as np
+from fractions import Fraction
+from typing import List, Union, Sequence, Tuple
+from dataclasses import dataclass, field
+from .algebraic_expression import AlgebraicCalculator
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 허수부를 0으로 볼 허용 오차
+IMAG_TOLERANCE = 1e-9
+
+# 뉴턴 보정 반복 횟수
+NEWTON_ITERATIONS = 3
+
+# 유리근 후보를 만들 최대 계수 크기 (약수 나열 비용 제한)
+MAX_RATIONAL_COEFFICIENT = 10 ** 4
+
+
+@dataclass
+class PolynomialRootResult:
+    """고차방정식 해 클래스"""
+    coefficients: List[float]  # 높은 차수부터
+    degree: int
+    roots: List[Union[float, complex]]  # 중근 포함, 실근 먼저
+    rational_roots: List[Fraction] = field(default_factory=list)
+    steps: List[str] = field(default_factory=list)
+
+    @property
+    def real_roots(self) -> List[float]:
+        """실근 목록"""
+        return [r for r in self.roots if not isinstance(r, complex)]
+
+
+class PolynomialRootFinder:
+    """고차방정식 풀이 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        logger.info("고차방정식 풀이 초기화")
+
+    def validate_coefficients(self, coefficients: Sequence[float]) -> np.ndarray:
+        """
+        계수 검증 및 최고차항의 0 제거
+
+        Args:
+            coefficients: 높은 차수부터의 계수
+
+        Returns:
+            float 계수 배열 (최고차항 계수 ≠ 0)
+
+        Raises:
+            ValueError: 숫자가 아니거나 차수가 1 미만일 때
+        """
+        try:
+            coeffs = np.asarray(coefficients, dtype=float).ravel()
+        except (TypeError, ValueError):
+            raise ValueError("계수는 숫자여야 합니다.")
+
+        if not np.all(np.isfinite(coeffs)):
+            raise ValueError("계수에 NaN 또는 무한대가 포함되어 있습니다.")
+
+        nonzero = np.flatnonzero(coeffs)
+        if len(nonzero) == 0:
+            raise ValueError("모든 계수가 0입니다 (항등식).")
+        coeffs = coeffs[nonzero[0]:]
+        if len(coeffs) < 2:
+            raise ValueError("상수 다항식은 근이 없습니다.")
+        return coeffs
+
+    def solve(self, coefficients: Sequence[float]) -> PolynomialRootResult:
+        """
+        n차방정식 풀이
+
+        Args:
+            coefficients: 높은 차수부터의 계수 (예: x³ - 6x² + 11x - 6 → [1, -6, 11, -6])
+
+        Returns:
+            PolynomialRootResult 객체
+        """
+        coeffs = self.validate_coefficients(coefficients)
+        degree = len(coeffs) - 1
+        logger.debug(f"{degree}차방정식 풀이: {list(coeffs)}")
+
+        steps = []
+        steps.append(f"주어진 방정식: {self._format_polynomial(coeffs)} = 0 ({degree}차)")
+
+        rational_roots: List[Fraction] = []
+        remaining = coeffs
+
+        if self._is_integral(coeffs):
+            int_coeffs = [int(c) for c in coeffs]
+            rational_roots, reduced = self._find_rational_roots(int_coeffs)
+            if rational_roots:
+                steps.append("유리근 정리로 정확한 근을 찾습니다:")
+                for r in rational_roots:
+                    steps.append(f"  x = {r}")
+            remaining = np.array([float(c) for c in reduced])
+
+        roots: List[Union[float, complex]] = [float(r) for r in rational_roots]
+        if len(remaining) > 1:
+            if rational_roots:
+                steps.append(f"조립제법으로 나눈 나머지 식: {self._format_polynomial(remaining)} = 0")
+            steps.append("동반행렬의 고윳값으로 나머지 근을 구하고 뉴턴 방법으로 보정합니다.")
+            numeric = self.solve_batch(remaining.reshape(1, -1))[0]
+            roots.extend(self._clean_root(z) for z in numeric)
+
+        roots = self._sort_roots(roots)
+        steps.append(f"근: {', '.join(str(r) for r in roots)}")
+
+        logger.info(f"{degree}차방정식 근: {roots}")
+        return PolynomialRootResult(
+            coefficients=[float(c) for c in coeffs],
+            degree=degree,
+            roots=roots,
+            rational_roots=sorted(rational_roots),
+            steps=steps
+        )
+
+    def solve_batch(self, coefficients) -> np.ndarray:
+        """
+        같은 차수의 다항식 여러 개를 한 번에 풀기
+
+        모든 다항식의 동반행렬을 (B, n, n) 배열로 쌓아 고윳값을 한 번에 구한 뒤,
+        호너법으로 뉴턴 보정을 벡터화하여 적용합니다.
+
+        Args:
+            coefficients: (B, n+1) 계수 배열 (각 행은 높은 차수부터, 최고차항 ≠ 0)
+
+        Returns:
+            (B, n) 복소수 근 배열
+        """
+        coeffs = np.asarray(coefficients, dtype=float)
+        if coeffs.ndim != 2 or coeffs.shape[1] < 2:
+            raise ValueError("계수 배열은 (B, n+1) 형태여야 합니다 (n ≥ 1).")
+        if not np.all(np.isfinite(coeffs)):
+            raise ValueError("계수에 NaN 또는 무한대가 포함되어 있습니다.")
+        if np.any(coeffs[:, 0] == 0):
+            raise ValueError("각 다항식의 최고차항 계수는 0이 아니어야 합니다.")
+
+        batch, n = coeffs.shape[0], coeffs.shape[1] - 1
+        logger.debug(f"고차방정식 일괄 풀이: {batch}개, {n}차")
+
+        monic = coeffs[:, 1:] / coeffs[:, :1]
+        if n == 1:
+            return (-monic).astype(complex)
+
+        # 동반행렬: 첫 행에 -a_{n-1}/a_n, ..., -a_0/a_n, 부대각선에 1
+        companion = np.zeros((batch, n, n))
+        companion[:, 0, :] = -monic
+        companion[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+
+        roots = np.linalg.eigvals(companion)
+        return self._newton_polish(coeffs, roots)
+
+    def real_roots_batch(self, coefficients) -> List[np.ndarray]:
+        """
+        여러 다항식의 실근만 구하기
+
+        Args:
+            coefficients: (B, n+1) 계수 배열
+
+        Returns:
+            다항식별 정렬된 실근 배열 목록
+        """
+        roots = self.solve_batch(coefficients)
+        is_real = np.abs(roots.imag) <= IMAG_TOLERANCE * np.maximum(1.0, np.abs(roots.real))
+        return [np.sort(row.real[mask]) for row, mask in zip(roots, is_real)]
+
+    def solve_expression(self, expr: str, var: str = 'x') -> PolynomialRootResult:
+        """
+        다항식 문자열로 풀기 (예: "x^3 - 6x^2 + 11x - 6")
+
+        Args:
+            expr: 다항식 (= 0으로 봄)
+            var: 변수 이름
+
+        Returns:
+            PolynomialRootResult 객체
+        """
+        coeffs = AlgebraicCalculator().to_coefficients(expr, var)
+        return self.solve(coeffs)
+
+    @staticmethod
+    def _newton_polish(coeffs: np.ndarray, roots: np.ndarray) -> np.ndarray:
+        """호너법 기반 뉴턴 보정 (잔차가 줄어드는 경우에만 적용)"""
+        c = coeffs[:, :, None].astype(complex)
+        z = roots.copy()
+
+        def evaluate(z):
+            p = np.broadcast_to(c[:, 0], z.shape).copy()
+            dp = np.zeros_like(z)
+            for k in range(1, c.shape[1]):
+                dp = dp * z + p
+                p = p * z + c[:, k]
+            return p, dp
+
+        p, dp = evaluate(z)
+        for _ in range(NEWTON_ITERATIONS):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                candidate = z - p / dp
+            valid = np.isfinite(candidate)
+            candidate = np.where(valid, candidate, z)
+            p_new, dp_new = evaluate(candidate)
+            better = valid & (np.abs(p_new) < np.abs(p))
+            z = np.where(better, candidate, z)
+            p = np.where(better, p_new, p)
+            dp = np.where(better, dp_new, dp)
+        return z
+
+    @staticmethod
+    def _is_integral(coeffs: np.ndarray) -> bool:
+        """모든 계수가 (크지 않은) 정수인지"""
+        return bool(
+            np.all(coeffs == np.round(coeffs))
+            and np.all(np.abs(coeffs) <= MAX_RATIONAL_COEFFICIENT)
+        )
+
+    @staticmethod
+    def _divisors(n: int) -> List[int]:
+        """양의 약수 목록"""
+        n = abs(n)
+        small, large = [], []
+        for d in range(1, math.isqrt(n) + 1):
+            if n % d == 0:
+                small.append(d)
+                if d != n // d:
+                    large.append(n // d)
+        return small + large[::-1]
+
+    def _find_rational_roots(self, coeffs: List[int]) -> Tuple[List[Fraction], List[Fraction]]:
+        """
+        유리근 정리로 정확한 유리근 찾기 (중근 포함)
+
+        Returns:
+            (유리근 목록, 유리근으로 나눈 나머지 다항식의 계수)
+        """
+        poly = [Fraction(c) for c in coeffs]
+        found: List[Fraction] = []
+
+        # x = 0 근 (상수항이 0)
+        while len(poly) > 1 and poly[-1] == 0:
+            found.append(Fraction(0))
+            poly.pop()
+
+        if len(poly) <= 1:
+            return found, poly
+
+        numerators = self._divisors(int(poly[-1]))
+        denominators = self._divisors(int(poly[0]))
+        candidates = sorted({
+            Fraction(sign * p, q)
+            for p in numerators for q in denominators for sign in (1, -1)
+        })
+
+        for r in candidates:
+            while len(poly) > 1:
+                quotient, remainder = self._synthetic_division(poly, r)
+                if remainder != 0:
+                    break
+                found.append(r)
+                poly = quotient
+        return found, poly
+
+    @staticmethod
+    def _synthetic_division(poly: List[Fraction], r: Fraction) -> Tuple[List[Fraction], Fraction]:
+        """조립제법: poly(x) = (x - r)·몫 + 나머지"""
+        acc = [poly[0]]
+        for c in poly[1:]:
+            acc.append(acc[-1] * r + c)
+        return acc[:-1], acc[-1]
+
+    @staticmethod
+    def _clean_root(z: complex) -> Union[float, complex]:
+        """허수부가 매우 작으면 실수로 변환"""
+        z = complex(z)
+        if abs(z.imag) <= IMAG_TOLERANCE * max(1.0, abs(z.real)):
+            return z.real
+        return z
+
+    @staticmethod
+    def _sort_roots(roots: List[Union[float, complex]]) -> List[Union[float, complex]]:
+        """실근(오름차순) 다음에 허근(실수부, 허수부 순)"""
+        real = sorted(r for r in roots if not isinstance(r, complex))
+        imag = sorted((r for r in roots if isinstance(r, complex)), key=lambda z: (z.real, z.imag))
+        return real + imag
+
+    @staticmethod
+    def _format_polynomial(coeffs: Sequence[float]) -> str:
+        """계수를 다항식 문자열로 포맷팅"""
+        degree = len(coeffs) - 1
+        parts = []
+        for i, c in enumerate(coeffs):
+            c = float(c)
+            if c == 0:
+                continue
+            power = degree - i
+            mag = abs(c)
+            mag_str = str(int(mag)) if mag == int(mag) else str(mag)
+            if power > 0 and mag == 1:
+                mag_str = ""
+            var = "" if power == 0 else ("x" if power == 1 else f"x^{power}")
+            sign = "-" if c < 0 else "+"
+            if not parts:
+                parts.append(f"{'-' if c < 0 else ''}{mag_str}{var}")
+            else:
+                parts.append(f" {sign} {mag_str}{var}")
+        return "".join(parts) if parts else "0"
@@ -3,9 +3,12 @@
 y = ax² + bx + c 형태의 이차함수 그래프를 그립니다.
 """
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Sequence
 from matplotlib.figure import Figure
+from ..rendering.sampling import adaptive_sample
+from ..rendering.spec import PlotSpec, Series, Marker, RefLine, Annotation
+from ..rendering.backends import render_matplotlib
+from ..rendering.animation import SweepAnimation
 from ..utils.logger import get_logger
 
 logger = get_logger()
@@ -26,16 +29,16 @@ class QuadraticFunctionDrawer:
         self.y_limit = y_limit
         logger.info(f"이차함수 그래프 초기화 (x_limit: {x_limit}, y_limit: {y_limit})")
 
-    def draw(
+    def graph_spec(
         self,
         a: float,
         b: float,
         c: float,
         x_range: Tuple[int, int],
         grid_alpha: float = 0.6
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        이차함수 그래프 그리기: y = ax² + bx + c
+        이차함수 그래프 명세: y = ax² + bx + c
 
         Args:
             a: x²의 계수
@@ -45,62 +48,81 @@ class QuadraticFunctionDrawer:
             grid_alpha: 격자 투명도
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
         """
         logger.debug(f"이차함수 그리기: y = {a}x² + {b}x + {c}, 범위: {x_range}")
 
-        # 그래프 생성
-        fig, ax = plt.subplots(figsize=(10, 8))
-
         # 축 설정
-        ax.axhline(y=0, color='k', linewidth=1)
-        ax.axvline(x=0, color='k', linewidth=1)
-        ax.grid(True, linestyle='--', alpha=grid_alpha)
+        layers = [RefLine('h', 0), RefLine('v', 0)]
 
         # 함수 그래프
         start, end = x_range
-        x = np.linspace(start, end, 300)
-        y = a * x**2 + b * x + c
+        x, y = adaptive_sample(lambda t: a * t**2 + b * t + c, (start, end))
 
-        ax.plot(x, y, label=f'y = {a}x² + {b}x + {c}', color='blue', linewidth=2)
+        layers.append(Series.from_arrays(x, y, label=f'y = {a}x² + {b}x + {c}', color='blue'))
 
         # 꼭짓점 계산 및 표시
         vertex_x, vertex_y = self.get_vertex(a, b, c)
 
         if start <= vertex_x <= end:
-            ax.plot(vertex_x, vertex_y, 'ro', markersize=10, label=f'꼭짓점 ({vertex_x:.2f}, {vertex_y:.2f})')
-            ax.text(vertex_x + 0.5, vertex_y + 0.5, f'({vertex_x:.2f}, {vertex_y:.2f})',
-                   fontsize=10, color='red')
+            layers.append(Marker.at(vertex_x, vertex_y, color='red', size=10,
+                                    label=f'꼭짓점 ({vertex_x:.2f}, {vertex_y:.2f})'))
+            layers.append(Annotation(vertex_x + 0.5, vertex_y + 0.5, f'({vertex_x:.2f}, {vertex_y:.2f})',
+                                     color='red'))
 
             # 대칭축
-            ax.axvline(x=vertex_x, color='red', linestyle='--', linewidth=1.5, alpha=0.5,
-                      label=f'대칭축: x = {vertex_x:.2f}')
+            layers.append(RefLine('v', vertex_x, color='red', linestyle='--', linewidth=1.5, alpha=0.5,
+                                  label=f'대칭축: x = {vertex_x:.2f}'))
 
         # y절편
         if start <= 0 <= end:
-            ax.plot(0, c, 'go', markersize=8, label=f'y절편: (0, {c})')
+            layers.append(Marker.at(0, c, color='green', label=f'y절편: (0, {c})'))
 
         # x절편 (근)
         x_intercepts = self.get_x_intercepts(a, b, c)
         if x_intercepts:
             for x_int in x_intercepts:
                 if start <= x_int <= end:
-                    ax.plot(x_int, 0, 'mo', markersize=8)
-                    ax.text(x_int, -0.5, f'({x_int:.2f}, 0)', fontsize=9, ha='center')
-
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.set_title(f'이차함수: y = {a}x² + {b}x + {c}', fontsize=14, fontweight='bold')
-        ax.legend(fontsize=10, loc='best')
-
-        # 축 범위 자동 조정
-        ax.set_xlim(start, end)
+                    layers.append(Marker.at(x_int, 0, color='magenta'))
+                    layers.append(Annotation(x_int, -0.5, f'({x_int:.2f}, 0)', fontsize=9, ha='center'))
 
         # y 범위는 함수 값에 따라 조정
-        y_min, y_max = np.min(y), np.max(y)
+        y_min, y_max = float(np.nanmin(y)), float(np.nanmax(y))
         margin = (y_max - y_min) * 0.1
-        ax.set_ylim(y_min - margin, y_max + margin)
 
+        return PlotSpec(
+            title=f'이차함수: y = {a}x² + {b}x + {c}',
+            layers=tuple(layers),
+            figsize=(10, 8),
+            title_bold=True,
+            xlim=(start, end),
+            ylim=(y_min - margin, y_max + margin),
+            grid_alpha=grid_alpha,
+            legend_loc='best'
+        )
+
+    def draw(
+        self,
+        a: float,
+        b: float,
+        c: float,
+        x_range: Tuple[int, int],
+        grid_alpha: float = 0.6
+    ) -> Figure:
+        """
+        이차함수 그래프 그리기: y = ax² + bx + c
+
+        Args:
+            a: x²의 계수
+            b: x의 계수
+            c: 상수항
+            x_range: x축 범위
+            grid_alpha: 격자 투명도
+
+        Returns:
+            matplotlib Figure 객체
+        """
+        fig = render_matplotlib(self.graph_spec(a, b, c, x_range, grid_alpha))
         logger.info("이차함수 그래프 생성 완료")
         return fig
 
@@ -262,14 +284,14 @@ class QuadraticFunctionDrawer:
             logger.debug(f"최댓값: x = {vertex_x}, y = {vertex_y}")
             return ("최댓값", vertex_x, vertex_y)
 
-    def compare_graphs(
+    def compare_spec(
         self,
         a1: float, b1: float, c1: float,
         a2: float, b2: float, c2: float,
         x_range: Tuple[int, int]
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        두 이차함수 그래프 비교
+        두 이차함수 비교 그래프 명세
 
         Args:
             a1, b1, c1: 첫 번째 함수 계수
@@ -277,56 +299,130 @@ class QuadraticFunctionDrawer:
             x_range: x축 범위
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
         """
         logger.debug("두 이차함수 비교")
 
-        fig, ax = plt.subplots(figsize=(10, 8))
-
         # 축 설정
-        ax.axhline(y=0, color='k', linewidth=1)
-        ax.axvline(x=0, color='k', linewidth=1)
-        ax.grid(True, linestyle='--', alpha=0.6)
+        layers = [RefLine('h', 0), RefLine('v', 0)]
 
         start, end = x_range
-        x = np.linspace(start, end, 300)
 
         # 첫 번째 함수
-        y1 = a1 * x**2 + b1 * x + c1
-        ax.plot(x, y1, label=f'y₁ = {a1}x² + {b1}x + {c1}', color='blue', linewidth=2)
+        x1, y1 = adaptive_sample(lambda t: a1 * t**2 + b1 * t + c1, (start, end))
+        layers.append(Series.from_arrays(x1, y1, label=f'y₁ = {a1}x² + {b1}x + {c1}', color='blue'))
 
         # 두 번째 함수
-        y2 = a2 * x**2 + b2 * x + c2
-        ax.plot(x, y2, label=f'y₂ = {a2}x² + {b2}x + {c2}', color='red', linewidth=2)
+        x2, y2 = adaptive_sample(lambda t: a2 * t**2 + b2 * t + c2, (start, end))
+        layers.append(Series.from_arrays(x2, y2, label=f'y₂ = {a2}x² + {b2}x + {c2}', color='red'))
 
         # 꼭짓점 표시
         v1_x, v1_y = self.get_vertex(a1, b1, c1)
         v2_x, v2_y = self.get_vertex(a2, b2, c2)
 
         if start <= v1_x <= end:
-            ax.plot(v1_x, v1_y, 'bo', markersize=8)
+            layers.append(Marker.at(v1_x, v1_y, color='blue'))
         if start <= v2_x <= end:
-            ax.plot(v2_x, v2_y, 'ro', markersize=8)
+            layers.append(Marker.at(v2_x, v2_y, color='red'))
 
-        ax.set_xlabel('x', fontsize=12)
-        ax.set_ylabel('y', fontsize=12)
-        ax.set_title('이차함수 비교', fontsize=14, fontweight='bold')
-        ax.legend(fontsize=10)
+        return PlotSpec(
+            title='이차함수 비교',
+            layers=tuple(layers),
+            figsize=(10, 8),
+            title_bold=True,
+            xlim=(start, end)
+        )
 
-        ax.set_xlim(start, end)
+    def compare_graphs(
+        self,
+        a1: float, b1: float, c1: float,
+        a2: float, b2: float, c2: float,
+        x_range: Tuple[int, int]
+    ) -> Figure:
+        """
+        두 이차함수 그래프 비교
 
+        Args:
+            a1, b1, c1: 첫 번째 함수 계수
+            a2, b2, c2: 두 번째 함수 계수
+            x_range: x축 범위
+
+        Returns:
+            matplotlib Figure 객체
+        """
+        fig = render_matplotlib(self.compare_spec(a1, b1, c1, a2, b2, c2, x_range))
         logger.info("이차함수 비교 그래프 생성 완료")
         return fig
 
-    def draw_parabola_from_vertex(
+    def sweep_animation(
+        self,
+        parameter: str = 'a',
+        values: Optional[Sequence[float]] = None,
+        a: float = 1.0,
+        b: float = 0.0,
+        c: float = 0.0,
+        x_range: Tuple[int, int] = (-5, 5),
+        num_points: int = 200
+    ) -> SweepAnimation:
+        """
+        한 계수를 바꿔 가며 그래프 변화를 보여주는 애니메이션
+
+        모든 프레임의 y 값과 꼭짓점을 (프레임 수, 점 개수) 배열로 한 번에 계산합니다.
+        a = 0인 프레임은 직선이 되고 꼭짓점은 표시하지 않습니다.
+
+        Args:
+            parameter: 바꿀 계수 ('a', 'b', 'c')
+            values: 계수 값 목록 (None이면 -3에서 3까지 120프레임)
+            a, b, c: 고정할 나머지 계수
+            x_range: x축 범위
+            num_points: 곡선의 점 개수
+
+        Returns:
+            SweepAnimation 객체
+
+        Raises:
+            ValueError: 계수 이름이 올바르지 않을 때
+        """
+        if parameter not in ('a', 'b', 'c'):
+            raise ValueError(f"바꿀 수 있는 계수는 a, b, c입니다: {parameter}")
+
+        values = np.linspace(-3, 3, 120) if values is None else np.asarray(values, dtype=float)
+        coeffs = {'a': np.full(len(values), float(a)),
+                  'b': np.full(len(values), float(b)),
+                  'c': np.full(len(values), float(c))}
+        coeffs[parameter] = values
+        A, B, C = coeffs['a'][:, None], coeffs['b'][:, None], coeffs['c'][:, None]
+
+        start, end = x_range
+        x = np.linspace(start, end, num_points)
+        y = A * x**2 + B * x + C
+
+        # 꼭짓점 (a = 0이면 없음)
+        is_quadratic = np.abs(coeffs['a']) >= 1e-10
+        safe_a = np.where(is_quadratic, coeffs['a'], 1.0)
+        vx = np.where(is_quadratic, -coeffs['b'] / (2 * safe_a), np.nan)
+        vy = coeffs['a'] * vx**2 + coeffs['b'] * vx + coeffs['c']
+        vx = np.where((vx >= start) & (vx <= end), vx, np.nan)
+
+        logger.debug(f"이차함수 애니메이션: {parameter} = {values[0]} → {values[-1]}, {len(values)}프레임")
+        return SweepAnimation(
+            x,
+            y,
+            labels=[f'{parameter} = {v:.2f}' for v in values],
+            title=f'이차함수 y = ax² + bx + c ({parameter}: {values[0]:g} → {values[-1]:g})',
+            points=np.column_stack([vx, vy]),
+            xlim=(start, end)
+        )
+
+    def parabola_from_vertex_spec(
         self,
         a: float,
         p: float,
         q: float,
         x_range: Tuple[int, int]
-    ) -> Figure:
+    ) -> PlotSpec:
         """
-        표준형으로 그래프 그리기: y = a(x - p)² + q
+        표준형 그래프 명세: y = a(x - p)² + q
 
         Args:
             a: 계수
@@ -335,7 +431,7 @@ class QuadraticFunctionDrawer:
             x_range: x축 범위
 
         Returns:
-            matplotlib Figure 객체
+            PlotSpec 객체
         """
         logger.debug(f"표준형 그래프: y = {a}(x - {p})² + {q}")
 
@@ -343,4 +439,25 @@ class QuadraticFunctionDrawer:
         b = -2 * a * p
         c = a * p**2 + q
 
-        return self.draw(a, b, c, x_range)
+        return self.graph_spec(a, b, c, x_range)
+
+    def draw_parabola_from_vertex(
+        self,
+        a: float,
+        p: float,
+        q: float,
+        x_range: Tuple[int, int]
+    ) -> Figure:
+        """
+        표준형으로 그래프 그리기: y = a(x - p)² + q
+
+        Args:
+            a: 계수
+            p: 꼭짓점 x 좌표
+            q: 꼭짓점 y 좌표
+            x_range: x축 범위
+
+        Returns:
+            matplotlib Figure 객체
+        """
+        return render_matplotlib(self.parabola_from_vertex_spec(a, p, q, x_range))
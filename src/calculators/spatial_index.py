@@ -0,0 +1,215 @@
+"""
+공간 색인 모듈
+좌표평면 위의 많은 점에서 가장 가까운 점을 빠르게 찾기 위한 균등 격자 색인을 제공합니다.
+"""
+import math
+import numpy as np
+from typing import Tuple, Optional
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+def as_point_array(points, name: str = "점") -> np.ndarray:
+    """
+    점 목록을 (N, 2) float 배열로 변환
+
+    Args:
+        points: (x, y) 좌표 목록 또는 (N, 2) 배열
+        name: 에러 메시지에 사용할 이름
+
+    Returns:
+        float64 (N, 2) 배열
+
+    Raises:
+        ValueError: 형태가 잘못되었거나 NaN/무한대가 포함된 경우
+    """
+    try:
+        arr = np.asarray(points, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}은(는) 숫자 좌표여야 합니다.")
+
+    if arr.ndim == 1 and arr.shape[0] == 2:
+        arr = arr.reshape(1, 2)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError(f"{name} 배열은 (N, 2) 형태여야 합니다.")
+    if not np.all(np.isfinite(arr)):
+        raise ValueError(f"{name}에 NaN 또는 무한대가 포함되어 있습니다.")
+    return arr
+
+
+class PointGridIndex:
+    """
+    균등 격자 공간 색인 클래스
+
+    점들을 한 변이 cell_size인 정사각형 칸에 나누어 담고, 칸 번호 순으로 정렬한
+    인덱스 배열(CSR 형태)로 보관합니다. 질의점 주변 칸을 한 겹씩 넓혀 가며 후보만
+    검사하므로 점이 수천 개여도 한 번의 질의는 주변 몇 칸만 확인합니다.
+    """
+
+    def __init__(self, points, cell_size: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            points: (N, 2) 점 배열
+            cell_size: 격자 한 칸의 크기 (None이면 칸당 점 1개 정도가 되도록 자동 결정)
+        """
+        pts = as_point_array(points)
+        if len(pts) == 0:
+            raise ValueError("색인할 점이 하나 이상 필요합니다.")
+
+        self.points = pts
+        self.origin = pts.min(axis=0)
+        extent = pts.max(axis=0) - self.origin
+
+        if cell_size is None:
+            longest = float(extent.max())
+            cell_size = longest / math.sqrt(len(pts)) if longest > 0 else 1.0
+        if not cell_size > 0:
+            raise ValueError("격자 칸 크기는 양수여야 합니다.")
+        self.cell_size = float(cell_size)
+
+        self.nx, self.ny = (np.floor(extent / self.cell_size).astype(np.int64) + 1)
+        cells = self._cell_coords(pts)
+        keys = cells[:, 0] * self.ny + cells[:, 1]
+
+        self._order = np.argsort(keys, kind='stable')
+        self._cell_start = np.searchsorted(
+            keys[self._order], np.arange(self.nx * self.ny + 1)
+        )
+        logger.debug(
+            f"격자 색인 생성: 점 {len(pts)}개, 칸 {self.nx}x{self.ny}, 칸 크기 {self.cell_size}"
+        )
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _cell_coords(self, pts: np.ndarray) -> np.ndarray:
+        """점이 속한 칸 좌표 (격자 밖이면 범위를 벗어난 값)"""
+        return np.floor((pts - self.origin) / self.cell_size).astype(np.int64)
+
+    def _candidates(self, cx: int, cy: int, r: int) -> np.ndarray:
+        """칸 (cx, cy)를 중심으로 반지름 r칸 안에 있는 점들의 인덱스"""
+        x0, x1 = max(cx - r, 0), min(cx + r, self.nx - 1)
+        y0, y1 = max(cy - r, 0), min(cy + r, self.ny - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+
+        # 같은 x 칸 줄의 y 칸들은 정렬 순서에서 연속 구간을 이룹니다
+        rows = np.arange(x0, x1 + 1) * self.ny
+        begins = self._cell_start[rows + y0]
+        ends = self._cell_start[rows + y1 + 1]
+        if len(rows) == 1:
+            return self._order[begins[0]:ends[0]]
+        return np.concatenate([self._order[b:e] for b, e in zip(begins, ends)])
+
+    def _max_ring(self, cx: int, cy: int) -> int:
+        """격자 전체를 덮기 위해 필요한 최대 반지름(칸 수)"""
+        return int(max(abs(cx), abs(cx - (self.nx - 1)), abs(cy), abs(cy - (self.ny - 1))))
+
+    def _min_ring(self, cx: int, cy: int) -> int:
+        """격자에 처음 닿는 반지름(칸 수, 격자 안이면 0)"""
+        return int(max(0, -cx, cx - (self.nx - 1), -cy, cy - (self.ny - 1)))
+
+    def nearest(self, x: float, y: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        한 점에서 가장 가까운 k개의 점
+
+        Args:
+            x, y: 질의점 좌표
+            k: 찾을 점의 개수
+
+        Returns:
+            (거리 배열, 인덱스 배열) - 가까운 순서
+        """
+        if k < 1 or k > len(self.points):
+            raise ValueError(f"k는 1 이상 {len(self.points)} 이하여야 합니다.")
+
+        q = np.array([x, y], dtype=float)
+        cx, cy = self._cell_coords(q.reshape(1, 2))[0]
+        max_ring = self._max_ring(cx, cy)
+
+        # 격자 밖의 먼 질의점은 빈 칸을 한 겹씩 넓히지 않고 격자에 닿는 반지름부터 시작
+        r = self._min_ring(cx, cy)
+        while True:
+            idx = self._candidates(cx, cy, r)
+            if len(idx) >= k:
+                diff = self.points[idx] - q
+                dist = np.hypot(diff[:, 0], diff[:, 1])
+                if k < len(idx):
+                    part = np.argpartition(dist, k - 1)[:k]
+                else:
+                    part = np.arange(len(idx))
+                # 반지름 r칸 상자는 질의점 중심 반지름 r·cell_size 원을 항상 포함합니다
+                kth = dist[part].max()
+                if kth <= r * self.cell_size or r >= max_ring:
+                    order = part[np.argsort(dist[part], kind='stable')]
+                    return dist[order], idx[order]
+                # 지금 후보의 k번째 거리보다 가까운 점은 그 거리를 덮는 상자 안에 모두 있음
+                r = min(int(math.ceil(kth / self.cell_size)), max_ring)
+            else:
+                r += 1
+
+    def query(self, queries, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 질의점 각각에 대해 가장 가까운 k개의 점
+
+        Args:
+            queries: (Q, 2) 질의점 배열
+            k: 찾을 점의 개수
+
+        Returns:
+            (Q, k) 거리 배열, (Q, k) 인덱스 배열
+        """
+        qs = as_point_array(queries, "질의점")
+        distances = np.empty((len(qs), k), dtype=float)
+        indices = np.empty((len(qs), k), dtype=np.int64)
+        for i, (x, y) in enumerate(qs):
+            distances[i], indices[i] = self.nearest(x, y, k)
+        return distances, indices
+
+    def query_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        질의점에서 radius 이내에 있는 점들의 인덱스 (가까운 순서)
+
+        Args:
+            x, y: 질의점 좌표
+            radius: 검색 반지름
+
+        Returns:
+            인덱스 배열
+        """
+        if radius < 0:
+            raise ValueError("검색 반지름은 0 이상이어야 합니다.")
+
+        q = np.array([x, y], dtype=float)
+        cx, cy = self._cell_coords(q.reshape(1, 2))[0]
+        r = min(int(math.ceil(radius / self.cell_size)), self._max_ring(cx, cy))
+        idx = self._candidates(cx, cy, r)
+
+        diff = self.points[idx] - q
+        dist = np.hypot(diff[:, 0], diff[:, 1])
+        inside = dist <= radius
+        return idx[inside][np.argsort(dist[inside], kind='stable')]
+
+    def snap(
+        self,
+        x: float,
+        y: float,
+        max_distance: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        질의점을 가장 가까운 점에 맞추기 (스냅)
+
+        Args:
+            x, y: 질의점 좌표
+            max_distance: 허용 거리 (이보다 멀면 None)
+
+        Returns:
+            가장 가까운 점의 인덱스 또는 None
+        """
+        dist, idx = self.nearest(x, y, 1)
+        if max_distance is not None and dist[0] > max_distance:
+            return None
+        return int(idx[0])
@@ -6,6 +6,8 @@ from .practice_generator import PracticeGenerator, Problem
 from .mistake_notes import MistakeNotes, MistakeEntry
 from .progress_tracker import ProgressTracker, TopicProgress, StudySession
 from .history_manager import HistoryManager, CalculationEntry
+from .retention import RetentionPolicy
+from .user_stores import UserStorePool, get_user_stores, get_shared_store
 from .visualizations import ProgressVisualizer
 from .data_export import DataExporter, ProgressDataFormatter, MistakeDataFormatter
 
@@ -27,6 +29,10 @@ __all__ = [
     'StudySession',
     'HistoryManager',
     'CalculationEntry',
+    'RetentionPolicy',
+    'UserStorePool',
+    'get_user_stores',
+    'get_shared_store',
     'ProgressVisualizer',
     'PlotlyVisualizer',
     'DataExporter',
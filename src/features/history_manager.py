@@ -1,15 +1,35 @@
 """
 계산 히스토리 모듈
 모든 계산 기록을 저장하고 조회할 수 있는 기능을 제공합니다.
+
+기본적으로 변경 사항을 추가 전용 저널에 한 줄씩 기록하므로, 계산 하나를 추가할 때
+전체 히스토리를 다시 쓰지 않습니다 (storage.journal 설정).
+storage.write_behind를 켜면 저장은 백그라운드 스레드가 모아서 합니다.
+storage.backend를 'sqlite'로 바꾸면 색인된 SQLite 테이블에서 필요한 행만 조회합니다.
+storage.backend를 'paged'로 바꾸면 기록 본문은 레코드 파일에 두고 작은 위치 색인만 불러와,
+최근 기록/페이지 조회 때 요청한 기록만 mmap으로 읽어 파싱합니다.
 """
 import json
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
+from ..storage.aggregates import RunningTotals
+from ..storage.backend import resolve_backend
+from ..storage.checked_json import read_checked_json, write_checked_json
+from ..storage.indexed_list import IndexedList, unique_id
+from ..storage.journal import JournalStore, DEFAULT_COMPACT_THRESHOLD, JOURNAL_SUFFIX
+from ..storage.paged import PAGES_SUFFIX, RecordFile, paged_base
+from ..storage.sqlite_store import SQLiteStore, sqlite_path
+from ..storage.write_behind import get_write_behind
+from .retention import RETENTION_BATCH, RetentionEngine, RetentionPolicy
+from .search_index import InvertedIndex
+from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 logger = get_logger()
+config = get_config()
 
 
 @dataclass
@@ -24,21 +44,805 @@ class CalculationEntry:
     is_favorite: bool  # 즐겨찾기 여부
 
 
+def _search_text(entry: CalculationEntry) -> str:
+    """검색 대상 문자열 (계산기 종류, 입력값, 출력값, 풀이과정)"""
+    return ' '.join([entry.calculator_type, str(entry.inputs), str(entry.outputs), *entry.steps])
+
+
+def _contribution(entry: CalculationEntry) -> Dict[Any, int]:
+    """기록 하나가 히스토리 통계에 기여하는 값"""
+    return {'total': 1, 'favorite': int(entry.is_favorite), ('type', entry.calculator_type): 1}
+
+
+def _matches(entry: CalculationEntry, keyword_lower: str) -> bool:
+    """계산기 종류, 입력값, 출력값, 풀이과정 중 하나에 키워드가 있는지 여부"""
+    return (keyword_lower in entry.calculator_type.lower() or
+            keyword_lower in str(entry.inputs).lower() or
+            keyword_lower in str(entry.outputs).lower() or
+            any(keyword_lower in step.lower() for step in entry.steps))
+
+
+# 히스토리 테이블 (seq가 클수록 최신)
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    calculator_type TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    steps TEXT NOT NULL,
+    is_favorite INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_history_id ON history(id);
+CREATE INDEX IF NOT EXISTS idx_history_type ON history(calculator_type, seq);
+CREATE INDEX IF NOT EXISTS idx_history_favorite ON history(is_favorite, seq);
+CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp);
+"""
+
+
+class SQLiteHistoryStore:
+    """SQLite 히스토리 저장소 클래스"""
+
+    def __init__(self, db_path: str):
+        """
+        초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db = SQLiteStore(db_path, HISTORY_SCHEMA)
+        logger.info(f"SQLite 히스토리 저장소 초기화: {db_path}")
+
+    @staticmethod
+    def _to_row(entry: CalculationEntry) -> tuple:
+        return (
+            entry.id,
+            entry.calculator_type,
+            entry.timestamp,
+            json.dumps(entry.inputs, ensure_ascii=False),
+            json.dumps(entry.outputs, ensure_ascii=False),
+            json.dumps(entry.steps, ensure_ascii=False),
+            int(entry.is_favorite)
+        )
+
+    @staticmethod
+    def _to_entry(row) -> CalculationEntry:
+        return CalculationEntry(
+            id=row['id'],
+            calculator_type=row['calculator_type'],
+            timestamp=row['timestamp'],
+            inputs=json.loads(row['inputs']),
+            outputs=json.loads(row['outputs']),
+            steps=json.loads(row['steps']),
+            is_favorite=bool(row['is_favorite'])
+        )
+
+    def _select(
+        self,
+        where: str = '',
+        params: tuple = (),
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[CalculationEntry]:
+        sql = 'SELECT * FROM history'
+        if where:
+            sql += f' WHERE {where}'
+        sql += ' ORDER BY seq DESC'
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params = params + (limit, offset)
+        return [self._to_entry(row) for row in self.db.query(sql, params)]
+
+    _INSERT = ('INSERT INTO history (id, calculator_type, timestamp, inputs, outputs, steps, is_favorite) '
+               'VALUES (?, ?, ?, ?, ?, ?, ?)')
+
+    def add(self, entry: CalculationEntry) -> int:
+        """
+        기록 추가
+
+        Returns:
+            행 번호 (seq)
+        """
+        with self.db.transaction() as conn:
+            return conn.execute(self._INSERT, self._to_row(entry)).lastrowid
+
+    def add_many(self, entries: List[CalculationEntry]):
+        """기록 여러 개 추가 (오래된 것부터)"""
+        self.db.executemany(self._INSERT, [self._to_row(entry) for entry in entries])
+
+    def iter_with_seq(self, seqs: Optional[List[int]] = None):
+        """(seq, 기록) 순회 (검색 색인 구성용, seqs를 주면 그 행만)"""
+        if seqs is None:
+            rows = self.db.query('SELECT * FROM history ORDER BY seq')
+        else:
+            rows = []
+            for i in range(0, len(seqs), 500):
+                chunk = tuple(seqs[i:i + 500])
+                marks = ', '.join('?' * len(chunk))
+                rows.extend(self.db.query(f'SELECT * FROM history WHERE seq IN ({marks})', chunk))
+        for row in rows:
+            yield row['seq'], self._to_entry(row)
+
+    def seqs(self) -> List[int]:
+        """모든 행 번호 (기본 키만 읽음)"""
+        return [row['seq'] for row in self.db.query('SELECT seq FROM history')]
+
+    def data_version(self) -> int:
+        """다른 연결(다른 워커 프로세스 등)이 변경을 커밋하면 바뀌는 값 (이 연결의 변경에는 그대로)"""
+        return self.db.query_one('PRAGMA data_version')[0]
+
+    def by_seqs(self, seqs: List[int]) -> List[CalculationEntry]:
+        """
+        행 번호로 기록 조회 (최신순, 기본 키 조회)
+
+        Args:
+            seqs: 행 번호 목록
+
+        Returns:
+            계산 기록 목록
+        """
+        seqs = sorted(seqs, reverse=True)
+        entries: List[CalculationEntry] = []
+        # SQLite 매개변수 개수 제한을 넘지 않도록 나누어 조회
+        for i in range(0, len(seqs), 500):
+            chunk = seqs[i:i + 500]
+            marks = ', '.join('?' * len(chunk))
+            entries.extend(self._select(f'seq IN ({marks})', tuple(chunk)))
+        return entries
+
+    def count(self) -> int:
+        """기록 수"""
+        return self.db.query_one('SELECT COUNT(*) AS n FROM history')['n']
+
+    def exists(self, entry_id: str) -> bool:
+        """기록 ID가 있는지 여부 (idx_history_id 사용)"""
+        return self.db.query_one('SELECT 1 AS n FROM history WHERE id = ? LIMIT 1', (entry_id,)) is not None
+
+    def all(self) -> List[CalculationEntry]:
+        """전체 기록 (최신순)"""
+        return self._select()
+
+    def recent(self, limit: int, offset: int = 0) -> List[CalculationEntry]:
+        """최근 기록 (최신 offset개를 건너뛴 limit개)"""
+        return self._select(limit=limit, offset=offset)
+
+    def by_type(self, calculator_type: str) -> List[CalculationEntry]:
+        """계산기 종류별 기록 (idx_history_type 사용)"""
+        return self._select('calculator_type = ?', (calculator_type,))
+
+    def favorites(self) -> List[CalculationEntry]:
+        """즐겨찾기 (idx_history_favorite 사용)"""
+        return self._select('is_favorite = 1')
+
+    def toggle_favorite(self, entry_id: str) -> Optional[bool]:
+        """
+        즐겨찾기 토글
+
+        Returns:
+            바뀐 값 (기록이 없으면 None)
+        """
+        with self.db.transaction(immediate=True) as conn:
+            row = conn.execute(
+                'SELECT seq, is_favorite FROM history WHERE id = ? ORDER BY seq DESC LIMIT 1',
+                (entry_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            value = not row['is_favorite']
+            conn.execute('UPDATE history SET is_favorite = ? WHERE seq = ?', (int(value), row['seq']))
+        return value
+
+    def delete(self, entry_id: str) -> List[int]:
+        """
+        기록 삭제
+
+        Returns:
+            삭제된 행 번호 목록
+        """
+        with self.db.transaction() as conn:
+            seqs = [row['seq'] for row in conn.execute('SELECT seq FROM history WHERE id = ?', (entry_id,))]
+            conn.execute('DELETE FROM history WHERE id = ?', (entry_id,))
+        return seqs
+
+    def delete_before(self, cutoff: str) -> int:
+        """
+        cutoff 시각 이전 기록 삭제 (idx_history_timestamp 사용)
+
+        Args:
+            cutoff: ISO 형식 시각
+
+        Returns:
+            삭제된 행 수
+        """
+        return self.db.execute('DELETE FROM history WHERE timestamp <= ?', (cutoff,))
+
+    def apply_retention(self, policy: RetentionPolicy, now: Optional[datetime] = None, age: bool = True) -> int:
+        """
+        보관 정책 적용 (시각은 idx_history_timestamp, 종류별 상한은 idx_history_type 사용)
+
+        Args:
+            policy: 보관 정책
+            now: 기준 시각 (None이면 현재)
+            age: 최대 보관 기간 규칙도 적용할지 여부 (False면 개수 상한만)
+
+        Returns:
+            삭제된 행 수
+        """
+        keep = ' AND is_favorite = 0' if policy.keep_favorites else ''
+        deleted = 0
+        with self.db.transaction() as conn:
+            if age and policy.max_age_days is not None:
+                cutoff = (now or datetime.now()) - timedelta(days=policy.max_age_days)
+                deleted += conn.execute(
+                    f'DELETE FROM history WHERE timestamp < ?{keep}', (cutoff.isoformat(),)
+                ).rowcount
+
+            for calculator_type, cap in policy.type_caps.items():
+                n = conn.execute(
+                    'SELECT COUNT(*) FROM history WHERE calculator_type = ?', (calculator_type,)
+                ).fetchone()[0]
+                if n > cap:
+                    deleted += conn.execute(
+                        'DELETE FROM history WHERE seq IN (SELECT seq FROM history '
+                        f'WHERE calculator_type = ?{keep} ORDER BY seq LIMIT ?)',
+                        (calculator_type, n - cap)
+                    ).rowcount
+
+            if policy.max_count is not None:
+                n = conn.execute('SELECT COUNT(*) FROM history').fetchone()[0]
+                if n > policy.max_count:
+                    where = ' WHERE is_favorite = 0' if policy.keep_favorites else ''
+                    deleted += conn.execute(
+                        f'DELETE FROM history WHERE seq IN (SELECT seq FROM history{where} '
+                        'ORDER BY seq LIMIT ?)',
+                        (n - policy.max_count,)
+                    ).rowcount
+        return deleted
+
+    def clear(self):
+        """모든 기록 삭제"""
+        self.db.execute('DELETE FROM history')
+
+    def statistics(self) -> Dict[str, Any]:
+        """개수 집계 (색인만 읽음)"""
+        row = self.db.query_one('SELECT COUNT(*) AS total, SUM(is_favorite) AS favorites FROM history')
+        type_counts = {
+            r['calculator_type']: r['n']
+            for r in self.db.query(
+                'SELECT calculator_type, COUNT(*) AS n FROM history GROUP BY calculator_type'
+            )
+        }
+        return {
+            'total': row['total'],
+            'favorites': row['favorites'] or 0,
+            'type_counts': type_counts
+        }
+
+    def close(self):
+        """연결 닫기"""
+        self.db.close()
+
+
+@dataclass
+class _PagedRow:
+    """페이지 저장소의 기록 색인 항목 (본문은 레코드 파일에 있음)"""
+    seq: int  # 클수록 최신
+    id: str
+    calculator_type: str
+    timestamp: str
+    is_favorite: bool  # 레코드 파일의 값보다 우선
+    offset: int  # 레코드 파일에서의 위치
+    length: int
+
+    def to_list(self) -> list:
+        return [self.seq, self.id, self.calculator_type, self.timestamp,
+                self.is_favorite, self.offset, self.length]
+
+
+def _row_contribution(row: _PagedRow) -> Dict[Any, int]:
+    """색인 항목 하나가 통계에 기여하는 값 (레코드 바이트 수 포함)"""
+    return {**_contribution(row), 'bytes': row.length}
+
+
+# 레코드 파일 압축 최소 기준 (죽은 바이트가 이보다 많고 살아 있는 바이트보다 많을 때)
+PAGES_COMPACT_MIN_BYTES = 1 << 20
+
+# 페이지 저장소 색인 형식 버전
+PAGED_INDEX_VERSION = 1
+
+
+class PagedHistoryStore:
+    """
+    페이지 히스토리 저장소 클래스
+
+    기록 본문은 레코드 파일(<경로>.<세대>.pages)에 JSON 한 줄씩 덧붙이고, 메모리에는
+    기록마다 ID/종류/시각/즐겨찾기/위치만 담은 작은 색인 항목을 둡니다. 색인은 체크섬
+    스냅샷(<경로>.index.json) + 저널로 저장합니다. 조회는 색인으로 고른 기록만 mmap에서
+    읽어 파싱하므로 최근 기록/페이지 조회 비용은 전체 기록 수가 아니라 돌려주는 기록 수에 비례합니다.
+
+    즐겨찾기 토글과 삭제는 색인만 바꾸고, 삭제로 죽은 바이트가 살아 있는 바이트보다
+    많아지면 살아 있는 레코드만 새 세대 파일로 복사합니다.
+    """
+
+    def __init__(self, base_path: str, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        """
+        초기화
+
+        Args:
+            base_path: 저장 파일 공통 경로 (확장자 제외, 예: data/history)
+            compact_threshold: 색인 저널 압축 기준 기록 수
+        """
+        self.base_path = base_path
+        self.journal = JournalStore(base_path + '.index.json', compact_threshold,
+                                    config.get('storage.load_cache', True))
+        self._rows: IndexedList[_PagedRow] = IndexedList(totals=RunningTotals(_row_contribution))
+        self._by_seq: Dict[int, _PagedRow] = {}
+        self._next_seq = 1
+        self._generation = 0
+        self._retention: Optional[RetentionEngine] = None
+        self._load()
+        self.data = RecordFile(self._data_path(self._generation))
+        logger.info(f"페이지 히스토리 저장소 초기화: {base_path} ({len(self._rows)}개)")
+
+    def _data_path(self, generation: int) -> str:
+        return f"{self.base_path}.{generation}{PAGES_SUFFIX}"
+
+    def _load(self):
+        """색인 스냅샷을 읽고 저널 기록 다시 적용 (기록 본문은 읽지 않음)"""
+        snapshot, records = self.journal.load(default=None)
+        if snapshot is not None:
+            if snapshot.get('version', PAGED_INDEX_VERSION) > PAGED_INDEX_VERSION:
+                raise ValueError(f"지원하지 않는 색인 버전입니다: {snapshot['version']}")
+            self._generation = snapshot['generation']
+            self._next_seq = snapshot['next_seq']
+            for values in snapshot['rows']:
+                self._put(_PagedRow(*values))
+        for record in records:
+            op = record.get('op')
+            if op == 'add':
+                self._put(_PagedRow(*record['row']))
+            elif op == 'favorite':
+                self._rows.update(record['id'], is_favorite=record['value'])
+            elif op == 'delete':
+                row = self._rows.remove(record['id'])
+                if row is not None:
+                    self._by_seq.pop(row.seq, None)
+            else:
+                logger.warning(f"알 수 없는 색인 저널 기록: {op}")
+
+    def _put(self, row: _PagedRow):
+        """색인 항목 추가 (같은 ID면 교체)"""
+        old = self._rows.get(row.id)
+        if old is not None:
+            self._by_seq.pop(old.seq, None)
+        self._rows.put(row)
+        self._by_seq[row.seq] = row
+        self._next_seq = max(self._next_seq, row.seq + 1)
+        if self._retention is not None:
+            self._retention.track(row)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            'version': PAGED_INDEX_VERSION,
+            'generation': self._generation,
+            'next_seq': self._next_seq,
+            'rows': [row.to_list() for row in self._rows.items()]
+        }
+
+    def _log(self, records: List[Dict[str, Any]]):
+        """색인 변경을 저널에 덧붙이기 (기준에 도달하면 스냅샷으로 압축)"""
+        self.journal.append_many(records)
+        if self.journal.needs_compaction:
+            self.journal.compact(self._snapshot())
+
+    def _read(self, row: _PagedRow) -> CalculationEntry:
+        """레코드 하나를 읽어 기록으로 만들기"""
+        entry = CalculationEntry(**json.loads(self.data.read(row.offset, row.length)))
+        entry.is_favorite = row.is_favorite
+        return entry
+
+    def _read_many(self, rows: List[_PagedRow]) -> List[CalculationEntry]:
+        return [self._read(row) for row in rows]
+
+    def add(self, entry: CalculationEntry) -> int:
+        """
+        기록 추가
+
+        Returns:
+            행 번호 (seq)
+        """
+        return self.add_many([entry])[-1]
+
+    def add_many(self, entries: List[CalculationEntry]) -> List[int]:
+        """
+        기록 여러 개 추가 (오래된 것부터, 레코드 파일과 저널에 한 번씩 씀)
+
+        Returns:
+            행 번호 목록
+        """
+        payloads = [
+            json.dumps(asdict(entry), ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+            for entry in entries
+        ]
+        spans = self.data.append(payloads)
+        rows = []
+        for entry, (offset, length) in zip(entries, spans):
+            row = _PagedRow(self._next_seq, entry.id, entry.calculator_type, entry.timestamp,
+                            entry.is_favorite, offset, length)
+            self._put(row)
+            rows.append(row)
+        self._log([{'op': 'add', 'row': row.to_list()} for row in rows])
+        return [row.seq for row in rows]
+
+    def iter_with_seq(self, seqs: Optional[List[int]] = None):
+        """(seq, 기록) 순회 (검색 색인 구성용, seqs를 주면 그 행만)"""
+        rows = self._rows.items() if seqs is None else [self._by_seq[seq] for seq in seqs if seq in self._by_seq]
+        for row in rows:
+            yield row.seq, self._read(row)
+
+    def seqs(self) -> List[int]:
+        """모든 행 번호"""
+        return list(self._by_seq)
+
+    def data_version(self) -> int:
+        """다른 쓰기 주체의 변경 표시 (한 프로세스의 이 객체만 쓰므로 항상 0)"""
+        return 0
+
+    def by_seqs(self, seqs: List[int]) -> List[CalculationEntry]:
+        """
+        행 번호로 기록 조회 (최신순)
+
+        Args:
+            seqs: 행 번호 목록
+
+        Returns:
+            계산 기록 목록
+        """
+        rows = [self._by_seq[seq] for seq in sorted(seqs, reverse=True) if seq in self._by_seq]
+        return self._read_many(rows)
+
+    def count(self) -> int:
+        """기록 수"""
+        return len(self._rows)
+
+    def exists(self, entry_id: str) -> bool:
+        """기록 ID가 있는지 여부"""
+        return entry_id in self._rows
+
+    def all(self) -> List[CalculationEntry]:
+        """전체 기록 (최신순)"""
+        return self._read_many(self._rows.newest())
+
+    def recent(self, limit: int, offset: int = 0) -> List[CalculationEntry]:
+        """최근 기록 (최신 offset개를 건너뛴 limit개, 그 기록만 읽음)"""
+        return self._read_many(self._rows.newest(offset + limit)[offset:])
+
+    def by_type(self, calculator_type: str) -> List[CalculationEntry]:
+        """계산기 종류별 기록 (색인으로 고른 기록만 읽음)"""
+        return self._read_many([row for row in self._rows.newest() if row.calculator_type == calculator_type])
+
+    def favorites(self) -> List[CalculationEntry]:
+        """즐겨찾기 (색인으로 고른 기록만 읽음)"""
+        return self._read_many([row for row in self._rows.newest() if row.is_favorite])
+
+    def toggle_favorite(self, entry_id: str) -> Optional[bool]:
+        """
+        즐겨찾기 토글 (색인만 바꿈)
+
+        Returns:
+            바뀐 값 (기록이 없으면 None)
+        """
+        row = self._rows.get(entry_id)
+        if row is None:
+            return None
+        self._rows.update(entry_id, is_favorite=not row.is_favorite)
+        if not row.is_favorite and self._retention is not None:
+            self._retention.restore(row)
+        self._log([{'op': 'favorite', 'id': entry_id, 'value': row.is_favorite}])
+        return row.is_favorite
+
+    def _remove(self, entry_id: str) -> Optional[_PagedRow]:
+        """색인 항목 삭제 (저널 기록은 호출하는 쪽에서)"""
+        row = self._rows.remove(entry_id)
+        if row is not None:
+            self._by_seq.pop(row.seq, None)
+        return row
+
+    def delete(self, entry_id: str) -> List[int]:
+        """
+        기록 삭제
+
+        Returns:
+            삭제된 행 번호 목록
+        """
+        row = self._remove(entry_id)
+        if row is None:
+            return []
+        self._log([{'op': 'delete', 'id': entry_id}])
+        self._maybe_compact_data()
+        return [row.seq]
+
+    def _delete_rows(self, rows: List[_PagedRow]) -> int:
+        """색인 항목 여러 개 삭제 (저널에 한 번에 씀)"""
+        for row in rows:
+            self._remove(row.id)
+        self._log([{'op': 'delete', 'id': row.id} for row in rows])
+        self._maybe_compact_data()
+        return len(rows)
+
+    def delete_before(self, cutoff: str) -> int:
+        """
+        cutoff 시각 이전 기록 삭제 (색인만 훑음)
+
+        Args:
+            cutoff: ISO 형식 시각
+
+        Returns:
+            삭제된 행 수
+        """
+        return self._delete_rows([row for row in self._rows.items() if row.timestamp <= cutoff])
+
+    def apply_retention(self, policy: RetentionPolicy, now: Optional[datetime] = None, age: bool = True) -> int:
+        """
+        보관 정책 적용 (처음 적용할 때 색인으로 시각 순서를 만들고 이후 추가분만 반영)
+
+        Args:
+            policy: 보관 정책
+            now: 기준 시각 (None이면 현재)
+            age: 최대 보관 기간 규칙도 적용할지 여부 (False면 개수 상한만)
+
+        Returns:
+            삭제된 행 수
+        """
+        if self._retention is None or self._retention.policy != policy:
+            self._retention = RetentionEngine(policy)
+            for row in self._rows.items():
+                self._retention.track(row)
+
+        doomed: List[_PagedRow] = []
+
+        def drop(entry_id: str):
+            row = self._remove(entry_id)
+            if row is not None:
+                doomed.append(row)
+
+        def count(calculator_type: Optional[str]) -> int:
+            key = 'total' if calculator_type is None else ('type', calculator_type)
+            return self._rows.totals.get(key)
+
+        self._retention.enforce(
+            self._rows.get, drop, count,
+            now=None if now is None else now.timestamp(), budget=None, age=age
+        )
+        if doomed:
+            self._log([{'op': 'delete', 'id': row.id} for row in doomed])
+            self._maybe_compact_data()
+        return len(doomed)
+
+    def clear(self):
+        """모든 기록 삭제 (빈 새 세대 파일로 바꿈)"""
+        self._rows.clear()
+        self._by_seq.clear()
+        if self._retention is not None:
+            self._retention.clear()
+        self._switch_generation([])
+
+    def _maybe_compact_data(self):
+        """죽은 바이트가 기준을 넘으면 레코드 파일 압축"""
+        live = self._rows.totals.get('bytes')
+        dead = self.data.size - live
+        if dead >= PAGES_COMPACT_MIN_BYTES and dead > live:
+            self.compact_data()
+
+    def compact_data(self):
+        """살아 있는 레코드만 새 세대 파일로 복사 (파싱하지 않음)"""
+        rows = self._rows.items()
+        before = self.data.size
+        self._switch_generation(rows)
+        logger.info(f"히스토리 레코드 파일 압축: {before} → {self.data.size} 바이트")
+
+    def _switch_generation(self, rows: List[_PagedRow]):
+        """
+        rows의 레코드를 새 세대 파일로 옮기고 색인 스냅샷 교체
+
+        새 파일과 스냅샷을 모두 쓴 뒤에 예전 파일을 지우므로, 도중에 멈추면 예전
+        스냅샷 + 예전 파일이 그대로 남습니다.
+        """
+        new_path = self._data_path(self._generation + 1)
+        spans = self.data.copy_to(new_path, [(row.offset, row.length) for row in rows])
+        for row, (offset, length) in zip(rows, spans):
+            row.offset, row.length = offset, length
+        self._generation += 1
+        self.journal.compact(self._snapshot())
+
+        old = self.data
+        self.data = RecordFile(new_path)
+        old.close()
+        try:
+            os.remove(old.path)
+        except OSError as e:
+            logger.warning(f"예전 레코드 파일 삭제 실패 ({old.path}): {e}")
+
+    def statistics(self) -> Dict[str, Any]:
+        """개수 집계 (누적 집계 사용)"""
+        totals = self._rows.totals
+        return {
+            'total': totals.get('total'),
+            'favorites': totals.get('favorite'),
+            'type_counts': totals.group('type')
+        }
+
+    def close(self):
+        """레코드 파일 닫기"""
+        self.data.close()
+
+
 class HistoryManager:
     """계산 히스토리 관리 클래스"""
 
-    def __init__(self, storage_path: str = "data/history.json"):
+    def __init__(
+        self,
+        storage_path: str = "data/history.json",
+        journal: Optional[bool] = None,
+        compact_threshold: Optional[int] = None,
+        backend: Optional[str] = None,
+        write_behind: Optional[bool] = None,
+        retention: Optional[RetentionPolicy] = None
+    ):
         """
         초기화
 
         Args:
             storage_path: 히스토리 저장 경로
+            journal: 저널 저장 방식 사용 여부 (None이면 설정값 storage.journal)
+                - 사용하면 변경마다 저널에 한 줄만 덧붙이고, 일정 개수마다 스냅샷으로 압축
+                - 사용하지 않으면 변경마다 전체 파일 다시 쓰기
+            compact_threshold: 저널 압축 기준 기록 수 (None이면 설정값)
+            backend: 저장 방식 'json', 'sqlite', 'paged' (None이면 설정값 storage.backend)
+                - sqlite이면 storage_path의 확장자를 .db로 바꾼 데이터베이스 사용
+                - paged이면 storage_path의 확장자를 뺀 경로에 레코드 파일과 위치 색인 사용
+            write_behind: 지연 쓰기 사용 여부 (None이면 설정값 storage.write_behind, json 방식만)
+                - 사용하면 변경은 메모리에만 반영하고 저장은 백그라운드에서 모아서 함
+            retention: 보관 정책 (None이면 설정값 storage.retention)
+                - 기록을 추가할 때마다 오래된 기록부터 조금씩(RETENTION_BATCH개까지) 정리
+                - sqlite/paged 방식은 개수 상한을 추가할 때마다, 기간 정리는 RETENTION_BATCH번 추가마다 적용
+
+        Raises:
+            ValueError: 지원하지 않는 저장 방식일 때
         """
         logger.info("계산 히스토리 관리자 초기화")
         self.storage_path = storage_path
+        self.backend = resolve_backend(backend)
+        self.retention = retention or RetentionPolicy.from_config()
+        self._retention = RetentionEngine(self.retention)
+        self._adds_since_retention = 0
         self.history: List[CalculationEntry] = []
+        self.journal = None
+        self.store = None  # SQLiteHistoryStore 또는 PagedHistoryStore
+        self.writer = None
+        self._pending_records: List[Dict[str, Any]] = []  # 아직 저널에 쓰지 않은 기록
+        self._compact_requested = False
+        self._journal_lock = threading.Lock()
+        # 검색 색인 (두 번째 검색 때 만들고 이후 추가/삭제 때 갱신)
+        self._index: Optional[InvertedIndex] = None
+        self._index_wanted = False  # 한 번 검색했으면 다음 검색 때 색인 생성
+        self._index_version: Optional[int] = None  # 색인을 맞춘 시점의 저장소 data_version
+        self._indexed: Dict[int, CalculationEntry] = {}  # 문서 번호 → 기록 (JSON 방식)
+        self._index_keys: Dict[str, List[int]] = {}  # 기록 ID → 문서 번호
+        self._next_key = 0
         self._ensure_storage_dir()
+
+        # 다른 인스턴스가 같은 파일에 아직 쓰지 않은 변경이 있으면 먼저 저장 (SQLite 이전 포함)
+        get_write_behind().flush(storage_path)
+
+        if compact_threshold is None:
+            compact_threshold = config.get('storage.compact_threshold', DEFAULT_COMPACT_THRESHOLD)
+
+        if self.backend in ('sqlite', 'paged'):
+            if self.backend == 'sqlite':
+                self.store = SQLiteHistoryStore(sqlite_path(storage_path))
+            else:
+                self.store = PagedHistoryStore(paged_base(storage_path), compact_threshold)
+            self._migrate_json()
+            self.apply_retention()
+            return
+
+        if write_behind is None:
+            write_behind = config.get('storage.write_behind', False)
+        if write_behind:
+            self.writer = get_write_behind()
+
+        if journal is None:
+            journal = config.get('storage.journal', True)
+        self.use_cache = config.get('storage.load_cache', True)
+        self.journal = JournalStore(storage_path, compact_threshold, self.use_cache) if journal else None
         self._load_history()
+        self._enforce_retention()
+
+    def _reset_index(self):
+        """검색 색인 버리기 (다음 검색 때 다시 만듦)"""
+        self._index = None
+        self._indexed = {}
+        self._index_keys = {}
+
+    def _index_entry(self, key: int, entry: CalculationEntry):
+        """기록 하나를 검색 색인에 추가"""
+        self._index.add(key, _search_text(entry))
+        self._index_keys.setdefault(entry.id, []).append(key)
+        if self.store is None:
+            self._indexed[key] = entry
+
+    def _build_index(self) -> InvertedIndex:
+        """검색 색인 만들기 (문서 번호가 클수록 최신)"""
+        if self._index is not None:
+            return self._index
+
+        if self.store is not None:
+            # 읽기 전에 버전을 기록 (읽는 중에 다른 연결이 쓰면 다음 검색 때 다시 맞춤)
+            self._index_version = self.store.data_version()
+            docs = list(self.store.iter_with_seq())
+        else:
+            docs = [(self._next_key + i, entry) for i, entry in enumerate(self._entries.items())]
+            self._next_key += len(docs)
+            self._indexed = dict(docs)
+
+        self._index = InvertedIndex()
+        self._index.add_many((key, _search_text(entry)) for key, entry in docs)
+        for key, entry in docs:
+            self._index_keys.setdefault(entry.id, []).append(key)
+        logger.info(f"검색 색인 생성: {len(self._index)}개")
+        return self._index
+
+    def _sync_index(self):
+        """다른 연결(다른 워커 프로세스, 같은 파일의 다른 관리자)이 추가/삭제한 행을 검색 색인에 반영"""
+        version = self.store.data_version()
+        if version == self._index_version:
+            return
+        self._index_version = version
+
+        seqs = set(self.store.seqs())
+        indexed = set()
+        for entry_id, keys in list(self._index_keys.items()):
+            alive = [key for key in keys if key in seqs]
+            for key in keys:
+                if key not in seqs:
+                    self._index.remove(key)
+            if alive:
+                self._index_keys[entry_id] = alive
+            else:
+                del self._index_keys[entry_id]
+            indexed.update(alive)
+
+        added = sorted(seqs - indexed)
+        for key, entry in self.store.iter_with_seq(added):
+            self._index_entry(key, entry)
+        logger.debug(f"검색 색인 동기화: {len(added)}개 추가, 전체 {len(self._index)}개")
+
+    def _unindex(self, entry_id: str):
+        """기록 ID의 문서를 검색 색인에서 삭제"""
+        if self._index is None:
+            return
+        for key in self._index_keys.pop(entry_id, []):
+            self._index.remove(key)
+            self._indexed.pop(key, None)
+
+    @property
+    def history(self) -> List[CalculationEntry]:
+        """전체 기록 (최신순, 새 목록)"""
+        if self.store is not None:
+            return self.store.all()
+        return self._entries.newest()
+
+    @history.setter
+    def history(self, entries: List[CalculationEntry]):
+        # 메모리에는 오래된 것부터 ID 색인 목록으로 보관 (ID가 겹치면 뒤에 번호를 붙임)
+        self._entries = IndexedList(totals=RunningTotals(_contribution))
+        for entry in reversed(entries):
+            if entry.id in self._entries:
+                entry.id = unique_id(entry.id, self._entries.__contains__)
+            self._entries.put(entry)
+            self._retention.track(entry)
 
     def _ensure_storage_dir(self):
         """저장 디렉토리 생성"""
@@ -46,13 +850,16 @@ class HistoryManager:
 
     def _load_history(self):
         """히스토리 불러오기"""
+        if self.journal is not None:
+            self._load_journal()
+            return
+
         if os.path.exists(self.storage_path):
             try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.history = [
-                        CalculationEntry(**entry) for entry in data
-                    ]
+                data = read_checked_json(self.storage_path, [], self.use_cache)
+                self.history = [
+                    CalculationEntry(**entry) for entry in data
+                ]
                 logger.info(f"히스토리 불러오기 완료: {len(self.history)}개")
             except Exception as e:
                 logger.error(f"히스토리 불러오기 실패: {e}")
@@ -61,16 +868,128 @@ class HistoryManager:
             logger.info("새 히스토리 생성")
             self.history = []
 
-    def _save_history(self):
-        """히스토리 저장"""
+    def _migrate_json(self):
+        """저장소(SQLite, 페이지)가 비어 있고 기존 JSON(저널) 파일이 있으면 한 번 옮겨 담기"""
+        has_json = (os.path.exists(self.storage_path) or
+                    os.path.exists(self.storage_path + JOURNAL_SUFFIX))
+        if not has_json or self.store.count() > 0:
+            return
+
+        # 저널 다시 적용은 메모리 목록에 해야 하므로 잠시 저장소를 떼어 둠
+        store, self.store = self.store, None
+        self.journal = JournalStore(self.storage_path)
+        self._load_journal()
+        store.add_many(self._entries.items())
+        logger.info(f"JSON 히스토리를 {self.backend} 저장소로 옮김: {len(self._entries)}개")
+        self.store, self.journal = store, None
+        self._entries.clear()
+        self._retention.clear()
+
+    def _load_journal(self):
+        """스냅샷을 읽고 저널 기록 다시 적용"""
         try:
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                data = [asdict(entry) for entry in self.history]
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"히스토리 저장 완료: {len(self.history)}개")
+            snapshot, records = self.journal.load(default=[])
+            self.history = [CalculationEntry(**entry) for entry in snapshot]
+            for record in records:
+                self._apply(record)
+            logger.info(f"히스토리 불러오기 완료: {len(self._entries)}개 (저널 기록 {len(records)}개)")
+        except Exception as e:
+            logger.error(f"히스토리 불러오기 실패: {e}")
+            self.history = []
+
+    def _apply(self, record: Dict[str, Any]):
+        """
+        저널 기록 하나를 메모리 상태에 적용
+
+        Args:
+            record: 저널 기록 ('add', 'favorite', 'delete')
+        """
+        op = record.get('op')
+        if op == 'add':
+            # 같은 ID가 있으면 그 자리에서 교체, 없으면 최신 항목으로 추가
+            entry = CalculationEntry(**record['entry'])
+            if self._entries.put(entry):
+                self._retention.track(entry)
+        elif op == 'favorite':
+            entry = self._entries.update(record['id'], is_favorite=record['value'])
+            if entry is not None and not entry.is_favorite:
+                self._retention.restore(entry)
+        elif op == 'delete':
+            self._entries.remove(record['id'])
+        else:
+            logger.warning(f"알 수 없는 저널 기록: {op}")
+
+    def _record(self, record: Dict[str, Any]):
+        """
+        변경 사항 저장 요청 (저널 방식이면 기록 한 줄, 아니면 전체 저장)
+
+        Args:
+            record: 저널 기록
+        """
+        if self.journal is not None:
+            with self._journal_lock:
+                self._pending_records.append(record)
+        self._persist()
+
+    def _persist(self):
+        """지연 쓰기면 저장을 예약하고 (실패하면 지연 쓰기가 재시도), 아니면 바로 저장"""
+        if self.writer is not None:
+            self.writer.schedule(self, self.storage_path, self._write_changes)
+            return
+        try:
+            self._write_changes()
         except Exception as e:
             logger.error(f"히스토리 저장 실패: {e}")
 
+    def _write_changes(self):
+        """
+        쌓인 변경 사항을 파일에 쓰기 (저널 덧붙이기 또는 압축, 아니면 전체 저장)
+
+        실패하면 쓰지 못한 기록을 되돌려 두고 예외를 냅니다 (다음 저장 때 함께 씀).
+        """
+        if self.journal is None:
+            self._save_history()
+            return
+
+        with self._journal_lock:
+            records, self._pending_records = self._pending_records, []
+            compact = (self._compact_requested or
+                       self.journal.pending + len(records) >= self.journal.compact_threshold)
+            self._compact_requested = False
+            # 압축하면 스냅샷이 아직 쓰지 않은 기록까지 모두 반영하므로 기록은 버림
+            entries = self._entries.newest() if compact else None
+
+        try:
+            if compact:
+                self.journal.compact([asdict(entry) for entry in entries])
+            else:
+                self.journal.append_many(records)
+        except Exception:
+            with self._journal_lock:
+                if compact:
+                    self._compact_requested = True
+                else:
+                    self._pending_records[:0] = records
+            raise
+
+    def compact(self):
+        """저널을 스냅샷으로 압축 (저널 방식이 아니면 전체 저장, 지연 쓰기여도 바로 씀)"""
+        self._compact_requested = True
+        self._persist()
+        self.flush()
+
+    def flush(self):
+        """지연 쓰기로 대기 중인 변경 사항을 지금 저장"""
+        if self.writer is not None:
+            self.writer.flush(self.storage_path)
+
+    def _save_history(self):
+        """히스토리 저장 (체크섬과 함께 임시 파일에 쓴 뒤 이름을 바꿔 교체, 실패하면 예외 발생)"""
+        entries = self._entries.newest()
+        data = [asdict(entry) for entry in entries]
+        write_checked_json(self.storage_path, data)
+        logger.info(f"히스토리 저장 완료: {len(entries)}개")
+
     def add_calculation(
         self,
         calculator_type: str,
@@ -91,6 +1010,8 @@ class HistoryManager:
             기록 ID
         """
         entry_id = f"{calculator_type}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        taken = self._entries.__contains__ if self.store is None else self.store.exists
+        entry_id = unique_id(entry_id, taken)
 
         entry = CalculationEntry(
             id=entry_id,
@@ -102,23 +1023,44 @@ class HistoryManager:
             is_favorite=False
         )
 
-        self.history.insert(0, entry)  # 최신 항목을 맨 앞에 추가
-        self._save_history()
+        if self.store is not None:
+            seq = self.store.add(entry)
+            if self._index is not None:
+                self._index_entry(seq, entry)
+            logger.info(f"계산 기록 추가: {entry_id}")
+            # 저장소 방식은 개수 상한을 추가할 때마다, 기간 정리는 일정 횟수마다 모아서 적용
+            self._adds_since_retention += 1
+            if self._adds_since_retention >= RETENTION_BATCH:
+                self.apply_retention()
+            elif self.retention.max_count is not None or self.retention.type_caps:
+                self._apply_store_retention(age=False)
+            return entry_id
+
+        self._entries.put(entry)  # 최신 항목은 목록 끝에 추가
+        if self._index is not None:
+            self._index_entry(self._next_key, entry)
+            self._next_key += 1
+        self._record({'op': 'add', 'entry': asdict(entry)})
+        self._retention.track(entry)
+        self._enforce_retention()
 
         logger.info(f"계산 기록 추가: {entry_id}")
         return entry_id
 
-    def get_recent_history(self, limit: int = 20) -> List[CalculationEntry]:
+    def get_recent_history(self, limit: int = 20, offset: int = 0) -> List[CalculationEntry]:
         """
-        최근 계산 기록 조회
+        최근 계산 기록 조회 (페이지 단위)
 
         Args:
             limit: 조회할 기록 수
+            offset: 건너뛸 최신 기록 수 (페이지 번호 × limit)
 
         Returns:
-            계산 기록 목록
+            계산 기록 목록 (최신순)
         """
-        return self.history[:limit]
+        if self.store is not None:
+            return self.store.recent(limit, offset)
+        return self._entries.newest(offset + limit)[offset:]
 
     def get_history_by_type(self, calculator_type: str) -> List[CalculationEntry]:
         """
@@ -130,6 +1072,8 @@ class HistoryManager:
         Returns:
             계산 기록 목록
         """
+        if self.store is not None:
+            return self.store.by_type(calculator_type)
         return [
             entry for entry in self.history
             if entry.calculator_type == calculator_type
@@ -137,6 +1081,8 @@ class HistoryManager:
 
     def get_favorites(self) -> List[CalculationEntry]:
         """즐겨찾기 조회"""
+        if self.store is not None:
+            return self.store.favorites()
         return [entry for entry in self.history if entry.is_favorite]
 
     def toggle_favorite(self, entry_id: str):
@@ -146,14 +1092,24 @@ class HistoryManager:
         Args:
             entry_id: 기록 ID
         """
-        for entry in self.history:
-            if entry.id == entry_id:
-                entry.is_favorite = not entry.is_favorite
-                logger.info(f"즐겨찾기 토글: {entry_id} → {entry.is_favorite}")
-                self._save_history()
-                return
+        if self.store is not None:
+            value = self.store.toggle_favorite(entry_id)
+            if value is None:
+                logger.warning(f"기록을 찾을 수 없음: {entry_id}")
+            else:
+                logger.info(f"즐겨찾기 토글: {entry_id} → {value}")
+            return
+
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            logger.warning(f"기록을 찾을 수 없음: {entry_id}")
+            return
 
-        logger.warning(f"기록을 찾을 수 없음: {entry_id}")
+        self._entries.update(entry_id, is_favorite=not entry.is_favorite)
+        if not entry.is_favorite:
+            self._retention.restore(entry)
+        logger.info(f"즐겨찾기 토글: {entry_id} → {entry.is_favorite}")
+        self._record({'op': 'favorite', 'id': entry_id, 'value': entry.is_favorite})
 
     def delete_entry(self, entry_id: str):
         """
@@ -162,32 +1118,47 @@ class HistoryManager:
         Args:
             entry_id: 기록 ID
         """
-        self.history = [e for e in self.history if e.id != entry_id]
+        self._unindex(entry_id)
+        if self.store is not None:
+            self.store.delete(entry_id)
+            logger.info(f"기록 삭제: {entry_id}")
+            return
+
+        self._entries.remove(entry_id)
         logger.info(f"기록 삭제: {entry_id}")
-        self._save_history()
+        self._record({'op': 'delete', 'id': entry_id})
 
     def search_history(self, keyword: str) -> List[CalculationEntry]:
         """
         키워드로 히스토리 검색
 
+        계산기 종류, 입력값, 출력값, 풀이과정 중 하나에 키워드가 부분 문자열로 있는 기록을 찾습니다.
+        역색인으로 후보를 좁힌 뒤 원문으로 확인하므로 결과는 전체를 훑을 때와 같습니다.
+        색인을 만드는 비용이 한 번 훑는 비용보다 크므로 첫 검색은 전체를 훑고, 다시 검색할 때 색인을 만듭니다.
+        토큰이 없는 검색어(기호만 입력 등)는 전체를 훑습니다.
+        SQLite 방식은 검색할 때마다 다른 연결의 변경을 확인해 색인에 반영합니다.
+
         Args:
             keyword: 검색 키워드
 
         Returns:
-            계산 기록 목록
+            계산 기록 목록 (최신순)
         """
         keyword_lower = keyword.lower()
-        results = []
-
-        for entry in self.history:
-            # 계산기 종류, 입력값, 출력값, 풀이과정에서 검색
-            if (keyword_lower in entry.calculator_type.lower() or
-                keyword_lower in str(entry.inputs).lower() or
-                keyword_lower in str(entry.outputs).lower() or
-                any(keyword_lower in step.lower() for step in entry.steps)):
-                results.append(entry)
+        if self._index is None and not self._index_wanted:
+            self._index_wanted = True
+            return [entry for entry in self.history if _matches(entry, keyword_lower)]
 
-        return results
+        if self._index is not None and self.store is not None:
+            self._sync_index()
+        keys = self._build_index().search(keyword)
+        if keys is None:
+            candidates = self.history
+        elif self.store is not None:
+            candidates = self.store.by_seqs(list(keys))
+        else:
+            candidates = [self._indexed[key] for key in sorted(keys, reverse=True)]
+        return [entry for entry in candidates if _matches(entry, keyword_lower)]
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -196,14 +1167,16 @@ class HistoryManager:
         Returns:
             통계 정보
         """
-        total = len(self.history)
-        favorites = len([e for e in self.history if e.is_favorite])
-
-        # 계산기 종류별 사용 횟수
-        type_counts = {}
-        for entry in self.history:
-            calc_type = entry.calculator_type
-            type_counts[calc_type] = type_counts.get(calc_type, 0) + 1
+        if self.store is not None:
+            counts = self.store.statistics()
+            total, favorites, type_counts = counts['total'], counts['favorites'], counts['type_counts']
+        else:
+            # 추가/즐겨찾기/삭제 때 갱신해 둔 누적 값 사용 (디버그 설정이면 전체 재계산과 비교)
+            totals = self._entries.totals
+            if config.get('storage.verify_aggregates', False):
+                totals.verify(self._entries.items(), '히스토리')
+            total, favorites = totals.get('total'), totals.get('favorite')
+            type_counts = totals.group('type')
 
         # 가장 많이 사용한 계산기
         most_used = max(type_counts.items(), key=lambda x: x[1]) if type_counts else ("없음", 0)
@@ -218,8 +1191,15 @@ class HistoryManager:
 
     def clear_all(self):
         """모든 히스토리 삭제"""
-        self.history = []
-        self._save_history()
+        self._reset_index()
+        if self.store is not None:
+            self.store.clear()
+            logger.info("모든 히스토리 삭제")
+            return
+
+        self._entries.clear()
+        self._retention.clear()
+        self.compact()
         logger.info("모든 히스토리 삭제")
 
     def clear_old_entries(self, days: int = 30):
@@ -229,18 +1209,57 @@ class HistoryManager:
         Args:
             days: 보관 기간 (일)
         """
-        from datetime import timedelta
         cutoff_date = datetime.now() - timedelta(days=days)
+        self._reset_index()
 
-        original_count = len(self.history)
-        self.history = [
-            entry for entry in self.history
-            if datetime.fromisoformat(entry.timestamp) > cutoff_date
-        ]
+        if self.store is not None:
+            deleted_count = self.store.delete_before(cutoff_date.isoformat())
+            logger.info(f"{days}일 이전 기록 {deleted_count}개 삭제")
+            return
 
-        deleted_count = original_count - len(self.history)
+        # 시각 순 색인에서 기준 시각 이전 기록 수를 이진 탐색으로 구해 앞에서부터 삭제
+        deleted_count = self._retention.expire(
+            cutoff_date.timestamp(), self._entries.get, self._entries.remove
+        )
         logger.info(f"{days}일 이전 기록 {deleted_count}개 삭제")
-        self._save_history()
+        self.compact()
+
+    def _count(self, calculator_type: Optional[str] = None) -> int:
+        """현재 기록 수 (계산기 종류를 주면 그 종류만, 누적 집계 사용)"""
+        key = 'total' if calculator_type is None else ('type', calculator_type)
+        return self._entries.totals.get(key)
+
+    def _drop(self, entry_id: str):
+        """보관 정책으로 기록 하나 삭제"""
+        self._entries.remove(entry_id)
+        self._unindex(entry_id)
+        self._record({'op': 'delete', 'id': entry_id})
+
+    def _enforce_retention(self, budget: Optional[int] = RETENTION_BATCH) -> int:
+        """보관 정책을 최대 budget개 삭제까지 적용 (JSON 방식)"""
+        return self._retention.enforce(self._entries.get, self._drop, self._count, budget=budget)
+
+    def apply_retention(self) -> int:
+        """
+        보관 정책을 밀린 것까지 모두 적용
+
+        Returns:
+            삭제한 기록 수
+        """
+        if not self.retention.enabled:
+            return 0
+        if self.store is not None:
+            self._adds_since_retention = 0
+            return self._apply_store_retention()
+        return self._enforce_retention(budget=None)
+
+    def _apply_store_retention(self, age: bool = True) -> int:
+        """저장소 방식 보관 정책 적용 (삭제가 있으면 다음 검색 때 색인을 저장소와 다시 맞춤)"""
+        deleted = self.store.apply_retention(self.retention, age=age)
+        if deleted:
+            self._index_version = None
+            logger.info(f"보관 정책으로 기록 {deleted}개 삭제")
+        return deleted
 
     def export_to_json(self, output_path: str):
         """
@@ -1,15 +1,26 @@
 """
 오답 노트 모듈
 틀린 문제를 저장하고 복습할 수 있는 기능을 제공합니다.
+
+storage.backend를 'sqlite'로 바꾸면 주제/마스터 여부 색인이 있는 SQLite 테이블에서
+필요한 행만 조회합니다. storage.write_behind를 켜면 저장은 백그라운드 스레드가 모아서 합니다.
 """
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
+from ..storage.aggregates import RunningTotals
+from ..storage.backend import resolve_backend
+from ..storage.checked_json import read_checked_json, write_checked_json
+from ..storage.indexed_list import IndexedList, unique_id
+from ..storage.sqlite_store import SQLiteStore, sqlite_path
+from ..storage.write_behind import get_write_behind
+from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 logger = get_logger()
+config = get_config()
 
 
 @dataclass
@@ -26,22 +37,224 @@ class MistakeEntry:
     notes: str  # 사용자 메모
 
 
+def _contribution(entry: MistakeEntry) -> Dict[Any, int]:
+    """오답 하나가 오답 노트 통계에 기여하는 값"""
+    mastered = int(entry.mastered)
+    return {'total': 1, 'mastered': mastered, ('topic', entry.topic): 1, ('mastered', entry.topic): mastered}
+
+
+# 오답 테이블 (seq가 작을수록 먼저 추가됨)
+MISTAKES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mistakes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    question TEXT NOT NULL,
+    user_answer TEXT,
+    correct_answer TEXT,
+    timestamp TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    mastered INTEGER NOT NULL DEFAULT 0,
+    notes TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_mistakes_id ON mistakes(id);
+CREATE INDEX IF NOT EXISTS idx_mistakes_topic ON mistakes(topic, mastered);
+CREATE INDEX IF NOT EXISTS idx_mistakes_mastered ON mistakes(mastered, seq);
+"""
+
+
+class SQLiteMistakeStore:
+    """SQLite 오답 저장소 클래스"""
+
+    def __init__(self, db_path: str):
+        """
+        초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db = SQLiteStore(db_path, MISTAKES_SCHEMA)
+        logger.info(f"SQLite 오답 저장소 초기화: {db_path}")
+
+    @staticmethod
+    def _to_row(entry: MistakeEntry) -> tuple:
+        return (
+            entry.id,
+            entry.topic,
+            entry.question,
+            json.dumps(entry.user_answer, ensure_ascii=False),
+            json.dumps(entry.correct_answer, ensure_ascii=False),
+            entry.timestamp,
+            entry.attempts,
+            int(entry.mastered),
+            entry.notes
+        )
+
+    @staticmethod
+    def _to_entry(row) -> MistakeEntry:
+        return MistakeEntry(
+            id=row['id'],
+            topic=row['topic'],
+            question=row['question'],
+            user_answer=json.loads(row['user_answer']),
+            correct_answer=json.loads(row['correct_answer']),
+            timestamp=row['timestamp'],
+            attempts=row['attempts'],
+            mastered=bool(row['mastered']),
+            notes=row['notes']
+        )
+
+    def _select(self, where: str = '', params: tuple = ()) -> List[MistakeEntry]:
+        sql = 'SELECT * FROM mistakes'
+        if where:
+            sql += f' WHERE {where}'
+        sql += ' ORDER BY seq'
+        return [self._to_entry(row) for row in self.db.query(sql, params)]
+
+    def add_many(self, entries: List[MistakeEntry]):
+        """오답 여러 개 추가"""
+        self.db.executemany(
+            'INSERT INTO mistakes (id, topic, question, user_answer, correct_answer, timestamp, '
+            'attempts, mastered, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [self._to_row(entry) for entry in entries]
+        )
+
+    def count(self) -> int:
+        """오답 수"""
+        return self.db.query_one('SELECT COUNT(*) AS n FROM mistakes')['n']
+
+    def exists(self, mistake_id: str) -> bool:
+        """ID가 있는지 여부 (idx_mistakes_id 사용)"""
+        return self.db.query_one('SELECT 1 FROM mistakes WHERE id = ? LIMIT 1', (mistake_id,)) is not None
+
+    def all(self) -> List[MistakeEntry]:
+        """전체 오답 (추가한 순서)"""
+        return self._select()
+
+    def by_topic(self, topic: str) -> List[MistakeEntry]:
+        """주제별 오답 (idx_mistakes_topic 사용)"""
+        return self._select('topic = ?', (topic,))
+
+    def unmastered(self) -> List[MistakeEntry]:
+        """마스터하지 못한 오답 (idx_mistakes_mastered 사용)"""
+        return self._select('mastered = 0')
+
+    def update(self, mistake_id: str, assignment: str, params: tuple = ()) -> Optional[MistakeEntry]:
+        """
+        ID가 같은 첫 오답 수정
+
+        Args:
+            mistake_id: 오답 ID
+            assignment: SET 절 (예: 'attempts = attempts + 1')
+            params: SET 절 매개변수
+
+        Returns:
+            수정된 오답 (없으면 None)
+        """
+        with self.db.transaction(immediate=True) as conn:
+            row = conn.execute(
+                'SELECT seq FROM mistakes WHERE id = ? ORDER BY seq LIMIT 1', (mistake_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(f'UPDATE mistakes SET {assignment} WHERE seq = ?', params + (row['seq'],))
+            updated = conn.execute('SELECT * FROM mistakes WHERE seq = ?', (row['seq'],)).fetchone()
+        return self._to_entry(updated)
+
+    def delete(self, mistake_id: str) -> int:
+        """오답 삭제 (삭제된 행 수)"""
+        return self.db.execute('DELETE FROM mistakes WHERE id = ?', (mistake_id,))
+
+    def clear(self):
+        """모든 오답 삭제"""
+        self.db.execute('DELETE FROM mistakes')
+
+    def statistics(self) -> Dict[str, Dict[str, int]]:
+        """
+        주제별 전체/마스터 수 (idx_mistakes_topic만 읽음)
+
+        Returns:
+            {주제: {'total': 개수, 'mastered': 개수}}
+        """
+        rows = self.db.query(
+            'SELECT topic, COUNT(*) AS total, SUM(mastered) AS mastered FROM mistakes GROUP BY topic'
+        )
+        return {row['topic']: {'total': row['total'], 'mastered': row['mastered'] or 0} for row in rows}
+
+    def close(self):
+        """연결 닫기"""
+        self.db.close()
+
+
 class MistakeNotes:
     """오답 노트 클래스"""
 
-    def __init__(self, storage_path: str = "data/mistakes.json"):
+    def __init__(
+        self,
+        storage_path: str = "data/mistakes.json",
+        backend: Optional[str] = None,
+        write_behind: Optional[bool] = None
+    ):
         """
         초기화
 
         Args:
             storage_path: 오답 노트 저장 경로
+            backend: 저장 방식 'json' 또는 'sqlite' (None이면 설정값 storage.backend, 'paged'는 json으로 대신함)
+            write_behind: 지연 쓰기 사용 여부 (None이면 설정값 storage.write_behind, json 방식만)
+
+        Raises:
+            ValueError: 지원하지 않는 저장 방식일 때
         """
         logger.info("오답 노트 초기화")
         self.storage_path = storage_path
+        self.backend = resolve_backend(backend, supported=('json', 'sqlite'))
         self.mistakes: List[MistakeEntry] = []
+        self.store: Optional[SQLiteMistakeStore] = None
+        self.writer = None
         self._ensure_storage_dir()
+
+        # 다른 인스턴스가 같은 파일에 아직 쓰지 않은 변경이 있으면 먼저 저장 (SQLite 이전 포함)
+        get_write_behind().flush(storage_path)
+
+        if self.backend == 'sqlite':
+            self.store = SQLiteMistakeStore(sqlite_path(storage_path))
+            self._migrate_json()
+            return
+
+        if write_behind is None:
+            write_behind = config.get('storage.write_behind', False)
+        if write_behind:
+            self.writer = get_write_behind()
+
         self._load_mistakes()
 
+    @property
+    def mistakes(self) -> List[MistakeEntry]:
+        """전체 오답 (추가한 순서, 새 목록)"""
+        if self.store is not None:
+            return self.store.all()
+        return self._entries.items()
+
+    @mistakes.setter
+    def mistakes(self, entries: List[MistakeEntry]):
+        # ID 색인 목록으로 보관 (예전 ID는 초 단위라 겹칠 수 있으므로 뒤에 번호를 붙임)
+        self._entries = IndexedList(totals=RunningTotals(_contribution))
+        for entry in entries:
+            if entry.id in self._entries:
+                entry.id = unique_id(entry.id, self._entries.__contains__)
+            self._entries.put(entry)
+
+    def _migrate_json(self):
+        """SQLite가 비어 있고 기존 JSON 파일이 있으면 한 번 옮겨 담기"""
+        if not os.path.exists(self.storage_path) or self.store.count() > 0:
+            return
+
+        self._load_mistakes()
+        self.store.add_many(self._entries.items())
+        logger.info(f"JSON 오답 노트를 SQLite로 옮김: {len(self._entries)}개")
+        self._entries.clear()
+
     def _ensure_storage_dir(self):
         """저장 디렉토리 생성"""
         os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
@@ -50,11 +263,12 @@ class MistakeNotes:
         """오답 노트 불러오기"""
         if os.path.exists(self.storage_path):
             try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.mistakes = [
-                        MistakeEntry(**entry) for entry in data
-                    ]
+                data = read_checked_json(
+                    self.storage_path, [], config.get('storage.load_cache', True)
+                )
+                self.mistakes = [
+                    MistakeEntry(**entry) for entry in data
+                ]
                 logger.info(f"오답 노트 불러오기 완료: {len(self.mistakes)}개")
             except Exception as e:
                 logger.error(f"오답 노트 불러오기 실패: {e}")
@@ -64,15 +278,27 @@ class MistakeNotes:
             self.mistakes = []
 
     def _save_mistakes(self):
-        """오답 노트 저장"""
+        """오답 노트 저장 (체크섬과 함께 임시 파일에 쓴 뒤 이름을 바꿔 교체, 실패하면 예외 발생)"""
+        entries = self._entries.items()
+        data = [asdict(entry) for entry in entries]
+        write_checked_json(self.storage_path, data)
+        logger.info(f"오답 노트 저장 완료: {len(entries)}개")
+
+    def _persist(self):
+        """지연 쓰기면 저장을 예약하고 (실패하면 지연 쓰기가 재시도), 아니면 바로 저장"""
+        if self.writer is not None:
+            self.writer.schedule(self, self.storage_path, self._save_mistakes)
+            return
         try:
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                data = [asdict(entry) for entry in self.mistakes]
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"오답 노트 저장 완료: {len(self.mistakes)}개")
+            self._save_mistakes()
         except Exception as e:
             logger.error(f"오답 노트 저장 실패: {e}")
 
+    def flush(self):
+        """지연 쓰기로 대기 중인 변경 사항을 지금 저장"""
+        if self.writer is not None:
+            self.writer.flush(self.storage_path)
+
     def add_mistake(
         self,
         topic: str,
@@ -94,7 +320,9 @@ class MistakeNotes:
         Returns:
             오답 ID
         """
-        entry_id = f"{topic}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # 같은 초에 같은 주제의 오답을 추가하면 ID 뒤에 번호를 붙임
+        taken = self.store.exists if self.store is not None else self._entries.__contains__
+        entry_id = unique_id(f"{topic}_{datetime.now().strftime('%Y%m%d%H%M%S')}", taken)
 
         entry = MistakeEntry(
             id=entry_id,
@@ -108,8 +336,11 @@ class MistakeNotes:
             notes=notes
         )
 
-        self.mistakes.append(entry)
-        self._save_mistakes()
+        if self.store is not None:
+            self.store.add_many([entry])
+        else:
+            self._entries.put(entry)
+            self._persist()
 
         logger.info(f"오답 추가: {entry_id}")
         return entry_id
@@ -124,10 +355,14 @@ class MistakeNotes:
         Returns:
             오답 목록
         """
+        if self.store is not None:
+            return self.store.by_topic(topic)
         return [m for m in self.mistakes if m.topic == topic]
 
     def get_unmastered_mistakes(self) -> List[MistakeEntry]:
         """마스터하지 못한 오답 조회"""
+        if self.store is not None:
+            return self.store.unmastered()
         return [m for m in self.mistakes if not m.mastered]
 
     def mark_as_mastered(self, mistake_id: str):
@@ -137,14 +372,21 @@ class MistakeNotes:
         Args:
             mistake_id: 오답 ID
         """
-        for mistake in self.mistakes:
-            if mistake.id == mistake_id:
-                mistake.mastered = True
+        if self.store is not None:
+            if self.store.update(mistake_id, 'mastered = 1') is None:
+                logger.warning(f"오답을 찾을 수 없음: {mistake_id}")
+            else:
                 logger.info(f"마스터 표시: {mistake_id}")
-                self._save_mistakes()
-                return
+            return
 
-        logger.warning(f"오답을 찾을 수 없음: {mistake_id}")
+        mistake = self._entries.get(mistake_id)
+        if mistake is None:
+            logger.warning(f"오답을 찾을 수 없음: {mistake_id}")
+            return
+
+        self._entries.update(mistake_id, mastered=True)
+        logger.info(f"마스터 표시: {mistake_id}")
+        self._persist()
 
     def increment_attempts(self, mistake_id: str):
         """
@@ -153,12 +395,17 @@ class MistakeNotes:
         Args:
             mistake_id: 오답 ID
         """
-        for mistake in self.mistakes:
-            if mistake.id == mistake_id:
-                mistake.attempts += 1
+        if self.store is not None:
+            mistake = self.store.update(mistake_id, 'attempts = attempts + 1')
+            if mistake is not None:
                 logger.info(f"재시도 횟수 증가: {mistake_id} → {mistake.attempts}")
-                self._save_mistakes()
-                return
+            return
+
+        mistake = self._entries.get(mistake_id)
+        if mistake is not None:
+            mistake.attempts += 1
+            logger.info(f"재시도 횟수 증가: {mistake_id} → {mistake.attempts}")
+            self._persist()
 
     def update_notes(self, mistake_id: str, notes: str):
         """
@@ -168,12 +415,16 @@ class MistakeNotes:
             mistake_id: 오답 ID
             notes: 새 메모
         """
-        for mistake in self.mistakes:
-            if mistake.id == mistake_id:
-                mistake.notes = notes
+        if self.store is not None:
+            if self.store.update(mistake_id, 'notes = ?', (notes,)) is not None:
                 logger.info(f"메모 업데이트: {mistake_id}")
-                self._save_mistakes()
-                return
+            return
+
+        mistake = self._entries.get(mistake_id)
+        if mistake is not None:
+            mistake.notes = notes
+            logger.info(f"메모 업데이트: {mistake_id}")
+            self._persist()
 
     def delete_mistake(self, mistake_id: str):
         """
@@ -182,9 +433,12 @@ class MistakeNotes:
         Args:
             mistake_id: 오답 ID
         """
-        self.mistakes = [m for m in self.mistakes if m.id != mistake_id]
+        if self.store is not None:
+            self.store.delete(mistake_id)
+        else:
+            self._entries.remove(mistake_id)
+            self._persist()
         logger.info(f"오답 삭제: {mistake_id}")
-        self._save_mistakes()
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -193,18 +447,23 @@ class MistakeNotes:
         Returns:
             통계 정보
         """
-        total = len(self.mistakes)
-        mastered = len([m for m in self.mistakes if m.mastered])
+        if self.store is not None:
+            topics = self.store.statistics()
+            total = sum(t["total"] for t in topics.values())
+            mastered = sum(t["mastered"] for t in topics.values())
+        else:
+            # 추가/마스터/삭제 때 갱신해 둔 누적 값 사용 (디버그 설정이면 전체 재계산과 비교)
+            totals = self._entries.totals
+            if config.get('storage.verify_aggregates', False):
+                totals.verify(self._entries.items(), '오답 노트')
+            total, mastered = totals.get('total'), totals.get('mastered')
+            mastered_by_topic = totals.group('mastered')
+            topics = {
+                topic: {"total": count, "mastered": mastered_by_topic.get(topic, 0)}
+                for topic, count in totals.group('topic').items()
+            }
         unmastered = total - mastered
 
-        topics = {}
-        for mistake in self.mistakes:
-            if mistake.topic not in topics:
-                topics[mistake.topic] = {"total": 0, "mastered": 0}
-            topics[mistake.topic]["total"] += 1
-            if mistake.mastered:
-                topics[mistake.topic]["mastered"] += 1
-
         return {
             "total_mistakes": total,
             "mastered_count": mastered,
@@ -215,10 +474,15 @@ class MistakeNotes:
 
     def get_all_mistakes(self) -> List[MistakeEntry]:
         """모든 오답 조회"""
-        return self.mistakes.copy()
+        if self.store is not None:
+            return self.store.all()
+        return self._entries.items()
 
     def clear_all(self):
         """모든 오답 삭제"""
-        self.mistakes = []
-        self._save_mistakes()
+        if self.store is not None:
+            self.store.clear()
+        else:
+            self._entries.clear()
+            self._persist()
         logger.info("모든 오답 삭제")
@@ -1,15 +1,24 @@
 """
 학습 진도 추적 모듈
 학생의 학습 진도와 성취도를 추적합니다.
+
+storage.backend를 'sqlite'로 바꾸면 주제별 진도와 세션을 SQLite 테이블에 행 단위로 저장합니다.
+storage.write_behind를 켜면 풀이 기록은 메모리에만 반영하고 저장은 백그라운드 스레드가 모아서 합니다.
 """
-import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
+from ..storage.aggregates import RunningTotals
+from ..storage.backend import resolve_backend
+from ..storage.checked_json import read_checked_json, write_checked_json
+from ..storage.sqlite_store import SQLiteStore, sqlite_path
+from ..storage.write_behind import get_write_behind
+from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 logger = get_logger()
+config = get_config()
 
 
 @dataclass
@@ -35,23 +44,269 @@ class StudySession:
     duration_minutes: int
 
 
+def _contribution(progress: TopicProgress) -> Dict[str, float]:
+    """주제 하나가 전체 학습 통계에 기여하는 값"""
+    return {
+        'attempted': progress.problems_attempted,
+        'correct': progress.problems_correct,
+        'minutes': progress.study_time_minutes,
+        'mastery': progress.mastery_level
+    }
+
+
+# 진도 테이블 (주제별 한 행) 과 세션 테이블
+PROGRESS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS topic_progress (
+    topic TEXT PRIMARY KEY,
+    problems_attempted INTEGER NOT NULL,
+    problems_correct INTEGER NOT NULL,
+    last_studied TEXT NOT NULL,
+    mastery_level REAL NOT NULL,
+    study_time_minutes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_progress_mastery ON topic_progress(mastery_level);
+CREATE TABLE IF NOT EXISTS sessions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    problems_solved INTEGER NOT NULL,
+    problems_correct INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_id ON sessions(session_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time);
+"""
+
+_PROGRESS_COLUMNS = ('topic', 'problems_attempted', 'problems_correct', 'last_studied',
+                     'mastery_level', 'study_time_minutes')
+_SESSION_COLUMNS = ('session_id', 'topic', 'start_time', 'end_time', 'problems_solved',
+                    'problems_correct', 'duration_minutes')
+
+
+class SQLiteProgressStore:
+    """SQLite 학습 진도 저장소 클래스"""
+
+    def __init__(self, db_path: str):
+        """
+        초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db = SQLiteStore(db_path, PROGRESS_SCHEMA)
+        logger.info(f"SQLite 진도 저장소 초기화: {db_path}")
+
+    @staticmethod
+    def _to_progress(row) -> TopicProgress:
+        return TopicProgress(**{col: row[col] for col in _PROGRESS_COLUMNS})
+
+    @staticmethod
+    def _to_session(row) -> StudySession:
+        return StudySession(**{col: row[col] for col in _SESSION_COLUMNS})
+
+    def get_topic(self, topic: str) -> Optional[TopicProgress]:
+        """주제 진도 (기본 키 조회)"""
+        row = self.db.query_one('SELECT * FROM topic_progress WHERE topic = ?', (topic,))
+        return self._to_progress(row) if row is not None else None
+
+    def all_topics(self) -> Dict[str, TopicProgress]:
+        """모든 주제 진도 (처음 기록한 순서)"""
+        rows = self.db.query('SELECT * FROM topic_progress ORDER BY rowid')
+        return {row['topic']: self._to_progress(row) for row in rows}
+
+    def save_topics(self, progresses: List[TopicProgress]):
+        """주제 진도 저장 (있으면 갱신, 처음 기록한 순서는 유지)"""
+        updates = ', '.join(f'{col} = excluded.{col}' for col in _PROGRESS_COLUMNS[1:])
+        self.db.executemany(
+            f'INSERT INTO topic_progress ({", ".join(_PROGRESS_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?) '
+            f'ON CONFLICT(topic) DO UPDATE SET {updates}',
+            [tuple(getattr(p, col) for col in _PROGRESS_COLUMNS) for p in progresses]
+        )
+
+    def update_topic(
+        self,
+        topic: str,
+        change: Callable[[Optional[TopicProgress]], TopicProgress]
+    ) -> TopicProgress:
+        """
+        주제 진도를 읽고 고쳐 쓰기 (한 트랜잭션, 다른 프로세스의 기록과 섞이지 않음)
+
+        Args:
+            topic: 주제
+            change: 현재 진도(없으면 None)를 받아 저장할 진도를 돌려주는 함수
+
+        Returns:
+            저장한 진도
+        """
+        updates = ', '.join(f'{col} = excluded.{col}' for col in _PROGRESS_COLUMNS[1:])
+        with self.db.transaction(immediate=True) as conn:
+            row = conn.execute('SELECT * FROM topic_progress WHERE topic = ?', (topic,)).fetchone()
+            progress = change(self._to_progress(row) if row is not None else None)
+            conn.execute(
+                f'INSERT INTO topic_progress ({", ".join(_PROGRESS_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?) '
+                f'ON CONFLICT(topic) DO UPDATE SET {updates}',
+                tuple(getattr(progress, col) for col in _PROGRESS_COLUMNS)
+            )
+        return progress
+
+    def weak_topics(self, threshold: float) -> List[str]:
+        """숙달도가 기준보다 낮은 주제 (idx_progress_mastery 사용)"""
+        rows = self.db.query(
+            'SELECT topic FROM topic_progress WHERE mastery_level < ? ORDER BY rowid', (threshold,)
+        )
+        return [row['topic'] for row in rows]
+
+    def totals(self) -> Dict[str, Any]:
+        """주제 수와 합계"""
+        row = self.db.query_one(
+            'SELECT COUNT(*) AS topics, SUM(problems_attempted) AS attempted, '
+            'SUM(problems_correct) AS correct, SUM(study_time_minutes) AS minutes, '
+            'AVG(mastery_level) AS mastery FROM topic_progress'
+        )
+        return {
+            'topics': row['topics'],
+            'attempted': row['attempted'] or 0,
+            'correct': row['correct'] or 0,
+            'minutes': row['minutes'] or 0,
+            'mastery': row['mastery'] or 0
+        }
+
+    def delete_topic(self, topic: str) -> int:
+        """주제 진도 삭제 (삭제된 행 수)"""
+        return self.db.execute('DELETE FROM topic_progress WHERE topic = ?', (topic,))
+
+    def add_sessions(self, sessions: List[StudySession]):
+        """세션 여러 개 추가"""
+        self.db.executemany(
+            f'INSERT INTO sessions ({", ".join(_SESSION_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [tuple(getattr(s, col) for col in _SESSION_COLUMNS) for s in sessions]
+        )
+
+    def get_session(self, session_id: str) -> Optional[StudySession]:
+        """ID가 같은 첫 세션"""
+        row = self.db.query_one(
+            'SELECT * FROM sessions WHERE session_id = ? ORDER BY seq LIMIT 1', (session_id,)
+        )
+        return self._to_session(row) if row is not None else None
+
+    def update_session(self, session: StudySession):
+        """세션 종료 정보 저장 (ID가 같은 첫 세션)"""
+        self.db.execute(
+            'UPDATE sessions SET end_time = ?, problems_solved = ?, problems_correct = ?, '
+            'duration_minutes = ? WHERE seq = (SELECT seq FROM sessions WHERE session_id = ? '
+            'ORDER BY seq LIMIT 1)',
+            (session.end_time, session.problems_solved, session.problems_correct,
+             session.duration_minutes, session.session_id)
+        )
+
+    def all_sessions(self) -> List[StudySession]:
+        """전체 세션 (시작한 순서)"""
+        return [self._to_session(row) for row in self.db.query('SELECT * FROM sessions ORDER BY seq')]
+
+    def recent_sessions(self, limit: int) -> List[StudySession]:
+        """최근 세션 (idx_sessions_start 사용)"""
+        rows = self.db.query('SELECT * FROM sessions ORDER BY start_time DESC LIMIT ?', (limit,))
+        return [self._to_session(row) for row in rows]
+
+    def is_empty(self) -> bool:
+        """진도와 세션이 모두 없는지 여부"""
+        row = self.db.query_one(
+            'SELECT (SELECT COUNT(*) FROM topic_progress) + (SELECT COUNT(*) FROM sessions) AS n'
+        )
+        return row['n'] == 0
+
+    def clear(self):
+        """모든 진도와 세션 삭제"""
+        with self.db.transaction() as conn:
+            conn.execute('DELETE FROM topic_progress')
+            conn.execute('DELETE FROM sessions')
+
+    def close(self):
+        """연결 닫기"""
+        self.db.close()
+
+
 class ProgressTracker:
     """학습 진도 추적 클래스"""
 
-    def __init__(self, storage_path: str = "data/progress.json"):
+    def __init__(
+        self,
+        storage_path: str = "data/progress.json",
+        backend: Optional[str] = None,
+        write_behind: Optional[bool] = None
+    ):
         """
         초기화
 
         Args:
             storage_path: 진도 데이터 저장 경로
+            backend: 저장 방식 'json' 또는 'sqlite' (None이면 설정값 storage.backend, 'paged'는 json으로 대신함)
+            write_behind: 지연 쓰기 사용 여부 (None이면 설정값 storage.write_behind, json 방식만)
+
+        Raises:
+            ValueError: 지원하지 않는 저장 방식일 때
         """
         logger.info("학습 진도 추적기 초기화")
         self.storage_path = storage_path
+        self.backend = resolve_backend(backend, supported=('json', 'sqlite'))
         self.topic_progress: Dict[str, TopicProgress] = {}
         self.sessions: List[StudySession] = []
+        self.store: Optional[SQLiteProgressStore] = None
+        self.writer = None
         self._ensure_storage_dir()
+
+        # 다른 인스턴스가 같은 파일에 아직 쓰지 않은 변경이 있으면 먼저 저장 (SQLite 이전 포함)
+        get_write_behind().flush(storage_path)
+
+        if self.backend == 'sqlite':
+            self.store = SQLiteProgressStore(sqlite_path(storage_path))
+            self._migrate_json()
+            return
+
+        if write_behind is None:
+            write_behind = config.get('storage.write_behind', False)
+        if write_behind:
+            self.writer = get_write_behind()
+
         self._load_progress()
 
+    @property
+    def topic_progress(self) -> Dict[str, TopicProgress]:
+        """주제별 진도"""
+        if self.store is not None:
+            return self.store.all_topics()
+        return self._topic_progress
+
+    @topic_progress.setter
+    def topic_progress(self, progress: Dict[str, TopicProgress]):
+        self._topic_progress = progress
+        self._totals = RunningTotals(_contribution, progress.values())
+
+    @property
+    def sessions(self) -> List[StudySession]:
+        """세션 기록 (시작한 순서)"""
+        if self.store is not None:
+            return self.store.all_sessions()
+        return self._sessions
+
+    @sessions.setter
+    def sessions(self, sessions: List[StudySession]):
+        self._sessions = sessions
+
+    def _migrate_json(self):
+        """SQLite가 비어 있고 기존 JSON 파일이 있으면 한 번 옮겨 담기"""
+        if not os.path.exists(self.storage_path) or not self.store.is_empty():
+            return
+
+        self._load_progress()
+        self.store.save_topics(list(self._topic_progress.values()))
+        self.store.add_sessions(self._sessions)
+        logger.info(f"JSON 진도 데이터를 SQLite로 옮김: {len(self._topic_progress)}개 주제")
+        self._topic_progress = {}
+        self._sessions = []
+
     def _ensure_storage_dir(self):
         """저장 디렉토리 생성"""
         os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
@@ -60,20 +315,21 @@ class ProgressTracker:
         """진도 데이터 불러오기"""
         if os.path.exists(self.storage_path):
             try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                    # 주제별 진도
-                    self.topic_progress = {
-                        topic: TopicProgress(**prog)
-                        for topic, prog in data.get("topics", {}).items()
-                    }
-
-                    # 세션 기록
-                    self.sessions = [
-                        StudySession(**session)
-                        for session in data.get("sessions", [])
-                    ]
+                data = read_checked_json(
+                    self.storage_path, {}, config.get('storage.load_cache', True)
+                )
+
+                # 주제별 진도
+                self.topic_progress = {
+                    topic: TopicProgress(**prog)
+                    for topic, prog in data.get("topics", {}).items()
+                }
+
+                # 세션 기록
+                self.sessions = [
+                    StudySession(**session)
+                    for session in data.get("sessions", [])
+                ]
 
                 logger.info(f"진도 데이터 불러오기 완료: {len(self.topic_progress)}개 주제")
             except Exception as e:
@@ -86,22 +342,36 @@ class ProgressTracker:
             self.sessions = []
 
     def _save_progress(self):
-        """진도 데이터 저장"""
+        """진도 데이터 저장 (체크섬과 함께 임시 파일에 쓴 뒤 이름을 바꿔 교체, 실패하면 예외 발생)"""
+        # 다른 스레드가 바꾸는 중에도 안전하도록 얕은 복사본을 직렬화
+        topics = dict(self._topic_progress)
+        sessions = list(self._sessions)
+        data = {
+            "topics": {
+                topic: asdict(prog)
+                for topic, prog in topics.items()
+            },
+            "sessions": [asdict(session) for session in sessions]
+        }
+
+        write_checked_json(self.storage_path, data)
+        logger.info("진도 데이터 저장 완료")
+
+    def _persist(self):
+        """지연 쓰기면 저장을 예약하고 (실패하면 지연 쓰기가 재시도), 아니면 바로 저장"""
+        if self.writer is not None:
+            self.writer.schedule(self, self.storage_path, self._save_progress)
+            return
         try:
-            data = {
-                "topics": {
-                    topic: asdict(prog)
-                    for topic, prog in self.topic_progress.items()
-                },
-                "sessions": [asdict(session) for session in self.sessions]
-            }
-
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info("진도 데이터 저장 완료")
+            self._save_progress()
         except Exception as e:
             logger.error(f"진도 데이터 저장 실패: {e}")
 
+    def flush(self):
+        """지연 쓰기로 대기 중인 변경 사항을 지금 저장"""
+        if self.writer is not None:
+            self.writer.flush(self.storage_path)
+
     def record_attempt(
         self,
         topic: str,
@@ -116,29 +386,41 @@ class ProgressTracker:
             is_correct: 정답 여부
             study_time_minutes: 학습 시간 (분)
         """
-        if topic not in self.topic_progress:
-            self.topic_progress[topic] = TopicProgress(
-                topic=topic,
-                problems_attempted=0,
-                problems_correct=0,
-                last_studied=datetime.now().isoformat(),
-                mastery_level=0.0,
-                study_time_minutes=0
-            )
-
-        progress = self.topic_progress[topic]
-        progress.problems_attempted += 1
-        if is_correct:
-            progress.problems_correct += 1
-        progress.last_studied = datetime.now().isoformat()
-        progress.study_time_minutes += study_time_minutes
-
-        # 숙달도 계산 (정답률 기반)
-        if progress.problems_attempted > 0:
-            progress.mastery_level = progress.problems_correct / progress.problems_attempted
+        def attempt(progress: Optional[TopicProgress]) -> TopicProgress:
+            if progress is None:
+                progress = TopicProgress(
+                    topic=topic,
+                    problems_attempted=0,
+                    problems_correct=0,
+                    last_studied=datetime.now().isoformat(),
+                    mastery_level=0.0,
+                    study_time_minutes=0
+                )
+
+            progress.problems_attempted += 1
+            if is_correct:
+                progress.problems_correct += 1
+            progress.last_studied = datetime.now().isoformat()
+            progress.study_time_minutes += study_time_minutes
+
+            # 숙달도 계산 (정답률 기반)
+            if progress.problems_attempted > 0:
+                progress.mastery_level = progress.problems_correct / progress.problems_attempted
+            return progress
 
         logger.info(f"학습 기록: {topic}, 정답={is_correct}")
-        self._save_progress()
+        if self.store is not None:
+            # 읽기와 저장을 한 트랜잭션으로 (다른 프로세스가 같은 주제를 동시에 기록해도 유지)
+            self.store.update_topic(topic, attempt)
+            return
+
+        progress = self.topic_progress.get(topic)
+        if progress is not None:
+            self._totals.remove(progress)  # 고친 뒤 기여분을 다시 더함
+        progress = attempt(progress)
+        self.topic_progress[topic] = progress
+        self._totals.add(progress)
+        self._persist()
 
     def start_session(self, topic: str) -> str:
         """
@@ -160,7 +442,10 @@ class ProgressTracker:
             problems_correct=0,
             duration_minutes=0
         )
-        self.sessions.append(session)
+        if self.store is not None:
+            self.store.add_sessions([session])
+        else:
+            self.sessions.append(session)
         logger.info(f"세션 시작: {session_id}, {topic}")
         return session_id
 
@@ -178,7 +463,13 @@ class ProgressTracker:
             problems_solved: 푼 문제 수
             problems_correct: 맞힌 문제 수
         """
-        for session in self.sessions:
+        if self.store is not None:
+            session = self.store.get_session(session_id)
+            candidates = [session] if session is not None else []
+        else:
+            candidates = self.sessions
+
+        for session in candidates:
             if session.session_id == session_id:
                 session.end_time = datetime.now().isoformat()
                 session.problems_solved = problems_solved
@@ -190,7 +481,10 @@ class ProgressTracker:
                 session.duration_minutes = int((end - start).total_seconds() / 60)
 
                 logger.info(f"세션 종료: {session_id}, {session.duration_minutes}분")
-                self._save_progress()
+                if self.store is not None:
+                    self.store.update_session(session)
+                else:
+                    self._persist()
                 return
 
     def get_topic_progress(self, topic: str) -> Optional[TopicProgress]:
@@ -203,6 +497,8 @@ class ProgressTracker:
         Returns:
             TopicProgress 또는 None
         """
+        if self.store is not None:
+            return self.store.get_topic(topic)
         return self.topic_progress.get(topic)
 
     def get_all_progress(self) -> Dict[str, TopicProgress]:
@@ -216,21 +512,30 @@ class ProgressTracker:
         Returns:
             통계 정보
         """
-        total_problems = sum(p.problems_attempted for p in self.topic_progress.values())
-        total_correct = sum(p.problems_correct for p in self.topic_progress.values())
-        total_time = sum(p.study_time_minutes for p in self.topic_progress.values())
+        if self.store is not None:
+            totals = self.store.totals()
+            total_topics = totals['topics']
+            total_problems, total_correct = totals['attempted'], totals['correct']
+            total_time = totals['minutes']
+            average_mastery = totals['mastery']
+        else:
+            # 풀이 기록/초기화 때 갱신해 둔 누적 값 사용 (디버그 설정이면 전체 재계산과 비교)
+            totals = self._totals
+            if config.get('storage.verify_aggregates', False):
+                totals.verify(self._topic_progress.values(), '학습 진도')
+            total_topics = len(self._topic_progress)
+            total_problems, total_correct = totals.get('attempted'), totals.get('correct')
+            total_time = totals.get('minutes')
+            average_mastery = totals.get('mastery') / total_topics if total_topics else 0
 
         return {
-            "total_topics": len(self.topic_progress),
+            "total_topics": total_topics,
             "total_problems_attempted": total_problems,
             "total_problems_correct": total_correct,
             "overall_accuracy": (total_correct / total_problems * 100) if total_problems > 0 else 0,
             "total_study_time_minutes": total_time,
             "total_study_time_hours": round(total_time / 60, 2),
-            "average_mastery_level": (
-                sum(p.mastery_level for p in self.topic_progress.values()) /
-                len(self.topic_progress)
-            ) if self.topic_progress else 0
+            "average_mastery_level": average_mastery
         }
 
     def get_weak_topics(self, threshold: float = 0.6) -> List[str]:
@@ -243,6 +548,8 @@ class ProgressTracker:
         Returns:
             약한 주제 목록
         """
+        if self.store is not None:
+            return self.store.weak_topics(threshold)
         weak_topics = [
             topic for topic, progress in self.topic_progress.items()
             if progress.mastery_level < threshold
@@ -259,6 +566,9 @@ class ProgressTracker:
         Returns:
             세션 목록
         """
+        if self.store is not None:
+            return self.store.recent_sessions(limit)
+
         # 최신순으로 정렬
         sorted_sessions = sorted(
             self.sessions,
@@ -274,14 +584,24 @@ class ProgressTracker:
         Args:
             topic: 주제
         """
+        if self.store is not None:
+            if self.store.delete_topic(topic):
+                logger.info(f"진도 초기화: {topic}")
+            return
+
         if topic in self.topic_progress:
-            del self.topic_progress[topic]
+            self._totals.remove(self.topic_progress.pop(topic))
             logger.info(f"진도 초기화: {topic}")
-            self._save_progress()
+            self._persist()
 
     def reset_all_progress(self):
         """모든 진도 초기화"""
+        if self.store is not None:
+            self.store.clear()
+            logger.info("모든 진도 초기화")
+            return
+
         self.topic_progress = {}
         self.sessions = []
         logger.info("모든 진도 초기화")
-        self._save_progress()
+        self._persist()
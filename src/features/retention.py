@@ -0,0 +1,284 @@
+"""
+히스토리 보관 정책 모듈
+기록 ID를 시각(epoch 초) 순서로 보관하고, 가장 오래된 기록부터 꺼내며 보관 정책
+(최대 보관 기간, 최대 개수, 계산기 종류별 최대 개수, 즐겨찾기 보존)을 적용합니다.
+
+기록은 시간 순서대로 추가되므로 보통 목록 끝에 덧붙이기만 하고, 기준 시각 이전 기록 수는
+이진 탐색으로 구합니다. 삭제된 기록은 목록에서 바로 빼지 않고 꺼낼 때 건너뜁니다.
+기록 하나는 한 번만 꺼내지므로 정책 적용 비용은 전체 기록 수가 아니라 삭제하는 기록 수에 비례합니다.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..utils.config import get_config
+from ..utils.logger import get_logger
+
+logger = get_logger()
+config = get_config()
+
+# 한 번에 삭제할 최대 기록 수 (밀린 정리는 다음 추가 때 이어서 함)
+RETENTION_BATCH = 100
+
+# 꺼낸 앞부분이 이만큼 쌓이고 절반을 넘으면 목록에서 잘라냄
+_TRIM_MIN = 1024
+
+
+@dataclass
+class RetentionPolicy:
+    """히스토리 보관 정책 클래스"""
+    max_age_days: Optional[float] = None  # 이보다 오래된 기록 삭제 (None이면 제한 없음)
+    max_count: Optional[int] = None  # 전체 기록 수 상한
+    keep_favorites: bool = True  # 즐겨찾기는 정책과 관계없이 보존
+    type_caps: Dict[str, int] = field(default_factory=dict)  # 계산기 종류별 기록 수 상한
+
+    def __post_init__(self):
+        """정책 값 검증"""
+        if self.max_age_days is not None and self.max_age_days < 0:
+            raise ValueError("최대 보관 기간은 0 이상이어야 합니다.")
+        if self.max_count is not None and self.max_count < 0:
+            raise ValueError("최대 기록 수는 0 이상이어야 합니다.")
+        for calculator_type, cap in self.type_caps.items():
+            if cap < 0:
+                raise ValueError(f"{calculator_type} 기록 수 상한은 0 이상이어야 합니다.")
+
+    @property
+    def enabled(self) -> bool:
+        """적용할 제한이 있는지 여부"""
+        return self.max_age_days is not None or self.max_count is not None or bool(self.type_caps)
+
+    @classmethod
+    def from_config(cls) -> 'RetentionPolicy':
+        """
+        설정값(storage.retention)으로 정책 만들기
+
+        Returns:
+            RetentionPolicy 인스턴스
+        """
+        return cls(
+            max_age_days=config.get('storage.retention.max_age_days'),
+            max_count=config.get('storage.retention.max_count'),
+            keep_favorites=config.get('storage.retention.keep_favorites', True),
+            type_caps=dict(config.get('storage.retention.type_caps') or {})
+        )
+
+
+def entry_epoch(entry: Any) -> float:
+    """
+    기록 시각을 epoch 초로 변환
+
+    Args:
+        entry: timestamp(ISO 형식) 속성이 있는 기록
+
+    Returns:
+        epoch 초 (읽을 수 없으면 0 = 가장 오래된 기록으로 취급)
+    """
+    try:
+        return datetime.fromisoformat(entry.timestamp).timestamp()
+    except (TypeError, ValueError):
+        logger.warning(f"기록 시각을 읽을 수 없음: {entry.timestamp!r}")
+        return 0.0
+
+
+class TimeOrder:
+    """(시각, ID)를 시각 순서로 보관하고 앞에서부터 꺼내는 목록 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self._epochs: List[float] = []
+        self._ids: List[str] = []
+        self._start = 0  # 이미 꺼낸 앞부분
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._start
+
+    def add(self, epoch: float, entry_id: str):
+        """
+        추가 (시각이 마지막보다 이르면 이진 탐색으로 제자리에 넣음)
+
+        Args:
+            epoch: 시각 (epoch 초)
+            entry_id: 기록 ID
+        """
+        if not self._epochs or epoch >= self._epochs[-1]:
+            self._epochs.append(epoch)
+            self._ids.append(entry_id)
+        else:
+            i = bisect_right(self._epochs, epoch, lo=self._start)
+            self._epochs.insert(i, epoch)
+            self._ids.insert(i, entry_id)
+
+    def peek(self) -> Optional[Tuple[float, str]]:
+        """가장 오래된 (시각, ID) (비어 있으면 None)"""
+        if self._start >= len(self._ids):
+            return None
+        return self._epochs[self._start], self._ids[self._start]
+
+    def pop(self) -> Tuple[float, str]:
+        """가장 오래된 (시각, ID) 꺼내기"""
+        item = self._epochs[self._start], self._ids[self._start]
+        self._start += 1
+        if self._start >= _TRIM_MIN and self._start * 2 >= len(self._ids):
+            del self._epochs[:self._start]
+            del self._ids[:self._start]
+            self._start = 0
+        return item
+
+    def count_until(self, epoch: float) -> int:
+        """시각이 epoch 이하인 항목 수 (이진 탐색)"""
+        return bisect_right(self._epochs, epoch, lo=self._start) - self._start
+
+    def clear(self):
+        """모두 비우기"""
+        self._epochs.clear()
+        self._ids.clear()
+        self._start = 0
+
+
+class RetentionEngine:
+    """보관 정책 적용 클래스"""
+
+    def __init__(self, policy: RetentionPolicy):
+        """
+        초기화
+
+        Args:
+            policy: 보관 정책
+        """
+        self.policy = policy
+        self._order = TimeOrder()
+        self._by_type: Dict[str, TimeOrder] = {}  # 상한이 있는 종류만
+        self._pinned: Dict[str, float] = {}  # 정책에서 빼 둔 즐겨찾기 ID → 시각
+
+    def track(self, entry: Any):
+        """
+        기록 추가 알림
+
+        Args:
+            entry: 기록 (id, calculator_type, timestamp 속성)
+        """
+        epoch = entry_epoch(entry)
+        self._order.add(epoch, entry.id)
+        if entry.calculator_type in self.policy.type_caps:
+            self._by_type.setdefault(entry.calculator_type, TimeOrder()).add(epoch, entry.id)
+
+    def restore(self, entry: Any):
+        """
+        즐겨찾기 해제 알림 (보존해 두었던 기록을 다시 정책 대상에 넣음)
+
+        Args:
+            entry: 기록
+        """
+        if self._pinned.pop(entry.id, None) is not None:
+            self.track(entry)
+
+    def clear(self):
+        """모든 기록 삭제 알림"""
+        self._order.clear()
+        self._by_type.clear()
+        self._pinned.clear()
+
+    def _drain(
+        self,
+        order: TimeOrder,
+        over: Callable[[float], bool],
+        lookup: Callable[[str], Any],
+        delete: Callable[[str], None],
+        budget: Optional[int]
+    ) -> int:
+        """over(가장 오래된 시각)가 참인 동안 오래된 기록부터 삭제"""
+        deleted = 0
+        while (budget is None or deleted < budget) and order.peek() is not None and over(order.peek()[0]):
+            epoch, entry_id = order.pop()
+            entry = lookup(entry_id)
+            if entry is None:
+                continue  # 이미 삭제된 기록
+            if self.policy.keep_favorites and entry.is_favorite:
+                self._pinned[entry_id] = epoch
+                continue
+            delete(entry_id)
+            deleted += 1
+        return deleted
+
+    def enforce(
+        self,
+        lookup: Callable[[str], Any],
+        delete: Callable[[str], None],
+        count: Callable[[Optional[str]], int],
+        now: Optional[float] = None,
+        budget: Optional[int] = RETENTION_BATCH,
+        age: bool = True
+    ) -> int:
+        """
+        보관 정책 적용
+
+        Args:
+            lookup: 기록 ID → 기록 (없으면 None)
+            delete: 기록 삭제 함수
+            count: 계산기 종류(None이면 전체)의 현재 기록 수
+            now: 기준 시각 (None이면 현재)
+            budget: 이번에 삭제할 최대 기록 수 (None이면 제한 없음)
+            age: 최대 보관 기간 규칙도 적용할지 여부 (False면 개수 상한만)
+
+        Returns:
+            삭제한 기록 수
+        """
+        policy = self.policy
+        if not policy.enabled:
+            return 0
+        now = datetime.now().timestamp() if now is None else now
+        deleted = 0
+
+        def left() -> Optional[int]:
+            return None if budget is None else budget - deleted
+
+        if age and policy.max_age_days is not None:
+            cutoff = now - policy.max_age_days * 86400
+            deleted += self._drain(self._order, lambda epoch: epoch < cutoff, lookup, delete, left())
+
+        for calculator_type, cap in policy.type_caps.items():
+            order = self._by_type.get(calculator_type)
+            if order is not None:
+                deleted += self._drain(
+                    order, lambda _, t=calculator_type, c=cap: count(t) > c, lookup, delete, left()
+                )
+
+        if policy.max_count is not None:
+            deleted += self._drain(
+                self._order, lambda _: count(None) > policy.max_count, lookup, delete, left()
+            )
+
+        if deleted:
+            logger.info(f"보관 정책으로 기록 {deleted}개 삭제")
+        return deleted
+
+    def expire(
+        self,
+        cutoff: float,
+        lookup: Callable[[str], Any],
+        delete: Callable[[str], None]
+    ) -> int:
+        """
+        cutoff 시각 이전 기록 모두 삭제 (즐겨찾기 포함)
+
+        Args:
+            cutoff: 기준 시각 (epoch 초, 이 시각 이하 삭제)
+            lookup: 기록 ID → 기록 (없으면 None)
+            delete: 기록 삭제 함수
+
+        Returns:
+            삭제한 기록 수
+        """
+        deleted = 0
+        for _ in range(self._order.count_until(cutoff)):
+            _, entry_id = self._order.pop()
+            if lookup(entry_id) is not None:
+                delete(entry_id)
+                deleted += 1
+
+        for entry_id in [i for i, epoch in self._pinned.items() if epoch <= cutoff]:
+            del self._pinned[entry_id]
+            if lookup(entry_id) is not None:
+                delete(entry_id)
+                deleted += 1
+        return deleted
@@ -0,0 +1,166 @@
+"""
+역색인 검색 모듈
+기록을 한글/영문/숫자 토큰으로 나누어 토큰 → 문서 번호 목록을 유지하고,
+접두어 검색을 정렬된 어휘 목록에서 이진 탐색으로 처리합니다.
+
+토큰의 모든 접미사도 색인하므로 낱말 중간도 찾습니다 (접미사의 접두어 = 부분 문자열).
+그래서 "방정식"은 "일차방정식"과, "ation"은 "equation"과, "12"는 "312"와 일치합니다.
+
+검색 결과는 후보입니다. 검색어가 부분 문자열로 들어 있는 문서는 모두 포함하지만,
+토큰이 다른 순서로 떨어져 있는 문서도 포함되므로 호출하는 쪽에서 원문으로 확인해야 합니다.
+"""
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+_HANGUL = 'ㄱ-ㅎㅏ-ㅣ가-힣'
+
+# 토큰: 한글 연속, 문자 연속 (영문 등, x² 포함), 숫자 (소수 포함), 일부 수학 기호
+TOKEN_PATTERN = re.compile(
+    rf'[{_HANGUL}]+|[^\W\d_{_HANGUL}]+|\d+(?:\.\d+)?|[√±∞≤≥≠]'
+)
+
+# 검색어 토큰: 숫자는 소수점으로 나누지 않음 ("1.2.3"의 "2.3"처럼 색인 토큰 경계를 넘는 경우도 찾도록)
+QUERY_TOKEN_PATTERN = re.compile(
+    rf'[{_HANGUL}]+|[^\W\d_{_HANGUL}]+|\d+|[√±∞≤≥≠]'
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    문자열을 검색 토큰으로 나누기 (소문자로 변환)
+
+    Args:
+        text: 문자열
+
+    Returns:
+        토큰 목록 (예: '2x + 3 = 5 일차방정식' → ['2', 'x', '3', '5', '일차방정식'])
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def index_terms(text: str) -> Set[str]:
+    """
+    색인할 용어 (토큰 + 토큰의 접미사)
+
+    Args:
+        text: 문자열
+
+    Returns:
+        용어 집합
+    """
+    terms: Set[str] = set()
+    for token in tokenize(text):
+        terms.update(token[i:] for i in range(len(token)))
+    return terms
+
+
+class InvertedIndex:
+    """접두어 검색을 지원하는 역색인 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocabulary: List[str] = []  # 정렬된 용어 목록 (접두어 범위 탐색용)
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        logger.debug("역색인 초기화")
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._doc_terms
+
+    def _insert(self, key: int, text: str) -> List[str]:
+        """문서의 용어를 색인에 넣고 새로 생긴 용어 반환 (어휘 목록은 건드리지 않음)"""
+        if key in self._doc_terms:
+            self.remove(key)
+
+        terms = index_terms(text)
+        new_terms = []
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = set()
+                new_terms.append(term)
+            posting.add(key)
+        self._doc_terms[key] = tuple(terms)
+        return new_terms
+
+    def add(self, key: int, text: str):
+        """
+        문서 추가 (같은 번호가 있으면 교체)
+
+        Args:
+            key: 문서 번호
+            text: 색인할 문자열
+        """
+        for term in self._insert(key, text):
+            insort(self._vocabulary, term)
+
+    def remove(self, key: int):
+        """
+        문서 삭제 (없으면 무시)
+
+        Args:
+            key: 문서 번호
+        """
+        for term in self._doc_terms.pop(key, ()):
+            posting = self._postings[term]
+            posting.discard(key)
+            if not posting:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+
+    def clear(self):
+        """모든 문서 삭제"""
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._doc_terms.clear()
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        """접두어로 시작하는 모든 용어의 문서 번호"""
+        matches: Set[int] = set()
+        i = bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            matches |= self._postings[self._vocabulary[i]]
+            i += 1
+        return matches
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """
+        모든 검색 토큰을 (부분 문자열로) 포함하는 후보 문서 찾기
+
+        Args:
+            query: 검색어
+
+        Returns:
+            문서 번호 집합 (검색어에 토큰이 없으면 None)
+        """
+        tokens = QUERY_TOKEN_PATTERN.findall(query.lower())
+        if not tokens:
+            return None
+
+        # 긴 토큰일수록 일치하는 문서가 적으므로 먼저 교집합
+        result: Optional[Set[int]] = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            matches = self._prefix_matches(token)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def add_many(self, docs: Iterable[Tuple[int, str]]):
+        """
+        (문서 번호, 문자열) 여러 개 추가
+
+        새 용어를 하나씩 정렬 삽입하지 않고 마지막에 어휘 목록을 한 번만 정렬합니다.
+        """
+        changed = False
+        for key, text in docs:
+            changed = bool(self._insert(key, text)) or changed
+        if changed:
+            self._vocabulary = sorted(self._postings)
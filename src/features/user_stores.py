@@ -0,0 +1,346 @@
+"""
+사용자별 저장소 모듈
+계산 히스토리, 오답 노트, 학습 진도를 사용자(또는 세션) ID마다 별도 디렉토리에 나누어 저장하고,
+열어 둔 관리자를 LRU 풀에 보관해 요청마다 다시 열지 않습니다.
+
+    data/users/<ID 해시 앞 2자리>/<사용자 ID>/history.db, mistakes.db, progress.db
+
+사용자마다 파일이 따로 있으므로 서로 다른 사용자의 쓰기는 부딪히지 않습니다. 같은 사용자를
+여러 워커 프로세스가 함께 다룰 수 있는 것은 sqlite 방식뿐입니다. SQLite 트랜잭션(읽고 고쳐 쓰는
+변경은 BEGIN IMMEDIATE)이 변경을 직렬화하고, 히스토리 검색 색인은 검색할 때 PRAGMA data_version으로
+다른 프로세스의 변경을 확인해 반영합니다. 저장소를 처음 열 때(스키마 생성, JSON 이전)는 사용자
+디렉토리의 파일 잠금으로 한 프로세스씩 엽니다.
+
+로그인 없이 세션마다 만든 ID(SESSION_PREFIX로 시작)의 저장소는 브라우저를 새로 고치면 다시 쓰이지
+않으므로, 마지막 변경 후 storage.users.session_ttl_hours가 지나면 삭제합니다.
+"""
+import atexit
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from ..storage.backend import resolve_backend
+from ..storage.file_lock import FileLock
+from .history_manager import HistoryManager
+from .mistake_notes import MistakeNotes
+from .progress_tracker import ProgressTracker
+from ..utils.config import get_config
+from ..utils.logger import get_logger
+
+logger = get_logger()
+config = get_config()
+
+# 사용자 ID 형식 (경로에 그대로 쓰므로 영문, 숫자, '_', '-'만 허용)
+USER_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+# 기본 사용자 저장소 위치
+DEFAULT_USERS_ROOT = 'data/users'
+
+# 기본 풀 크기 (한 프로세스가 열어 두는 관리자 수)
+DEFAULT_POOL_SIZE = 64
+
+# 세션마다 만든 ID의 접두어 (오래되면 삭제하는 저장소 구분)
+SESSION_PREFIX = 'session-'
+
+# 세션 저장소 기본 보관 시간 (시간)
+DEFAULT_SESSION_TTL_HOURS = 24
+
+# 오래된 세션 저장소를 찾는 최소 간격 (초)
+PURGE_INTERVAL = 3600
+
+# 저장소 종류 → (관리자 클래스, 파일 이름)
+STORE_KINDS = {
+    'history': (HistoryManager, 'history.json'),
+    'mistakes': (MistakeNotes, 'mistakes.json'),
+    'progress': (ProgressTracker, 'progress.json')
+}
+
+
+def new_session_id() -> str:
+    """
+    로그인하지 않은 세션에 쓸 새 ID
+
+    Returns:
+        SESSION_PREFIX로 시작하는 임의의 ID
+    """
+    return SESSION_PREFIX + uuid.uuid4().hex
+
+
+def _listdir(path: str) -> List[str]:
+    """디렉토리 항목 (없으면 빈 목록)"""
+    try:
+        return os.listdir(path)
+    except OSError:
+        return []
+
+
+def _last_modified(directory: str) -> float:
+    """디렉토리와 그 안 파일 중 가장 최근 수정 시각"""
+    latest = os.path.getmtime(directory)
+    for name in _listdir(directory):
+        try:
+            latest = max(latest, os.path.getmtime(os.path.join(directory, name)))
+        except OSError:
+            continue
+    return latest
+
+
+def user_storage_dir(user_id: str, root: str = DEFAULT_USERS_ROOT) -> str:
+    """
+    사용자 저장 디렉토리 (ID 해시 앞 2자리로 나누어 한 디렉토리에 너무 많이 모이지 않게 함)
+
+    Args:
+        user_id: 사용자 또는 세션 ID
+        root: 사용자 저장소 위치
+
+    Returns:
+        디렉토리 경로
+
+    Raises:
+        ValueError: 사용자 ID 형식이 올바르지 않을 때
+    """
+    if not isinstance(user_id, str) or not USER_ID_PATTERN.fullmatch(user_id):
+        raise ValueError("사용자 ID는 영문, 숫자, '_', '-'로 된 1~64자여야 합니다.")
+    shard = hashlib.sha1(user_id.encode('utf-8')).hexdigest()[:2]
+    return os.path.join(root, shard, user_id)
+
+
+class UserStorePool:
+    """사용자별 관리자 LRU 풀 클래스"""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        capacity: Optional[int] = None,
+        backend: Optional[str] = None,
+        session_ttl: Optional[float] = None
+    ):
+        """
+        초기화
+
+        Args:
+            root: 사용자 저장소 위치 (None이면 설정값 storage.users.root)
+            capacity: 열어 둘 최대 관리자 수 (None이면 설정값 storage.users.pool_size)
+            backend: 저장 방식 'sqlite' 또는 'json' (None이면 설정값 storage.users.backend)
+                - 여러 프로세스가 같은 사용자를 다루면 sqlite 사용 (json은 프로세스 하나용)
+            session_ttl: 세션 저장소 보관 시간 (초, None이면 설정값 storage.users.session_ttl_hours, 0이면 삭제 안 함)
+
+        Raises:
+            ValueError: 풀 크기나 저장 방식이 올바르지 않을 때
+        """
+        if capacity is None:
+            capacity = config.get('storage.users.pool_size', DEFAULT_POOL_SIZE)
+        if capacity < 1:
+            raise ValueError("풀 크기는 1 이상이어야 합니다.")
+        if backend is None:
+            backend = config.get('storage.users.backend', 'sqlite')
+
+        self.root = root or config.get('storage.users.root', DEFAULT_USERS_ROOT)
+        self.capacity = capacity
+        self.backend = resolve_backend(backend, supported=('json', 'sqlite'))
+        if session_ttl is None:
+            hours = config.get('storage.users.session_ttl_hours', DEFAULT_SESSION_TTL_HOURS)
+            session_ttl = hours * 3600 if hours else 0
+        self.session_ttl = session_ttl
+        self._last_purge: Optional[float] = None
+        self._lock = threading.Lock()
+        self._open: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        logger.info(f"사용자 저장소 풀 초기화: {self.root} ({self.backend}, 최대 {capacity}개)")
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def history(self, user_id: str) -> HistoryManager:
+        """사용자 계산 히스토리"""
+        return self._get('history', user_id)
+
+    def mistakes(self, user_id: str) -> MistakeNotes:
+        """사용자 오답 노트"""
+        return self._get('mistakes', user_id)
+
+    def progress(self, user_id: str) -> ProgressTracker:
+        """사용자 학습 진도"""
+        return self._get('progress', user_id)
+
+    def _get(self, kind: str, user_id: str) -> Any:
+        """
+        열어 둔 관리자 반환 (없으면 사용자 잠금을 잡고 열어서 풀에 넣음)
+
+        Args:
+            kind: 저장소 종류 (STORE_KINDS)
+            user_id: 사용자 ID
+
+        Returns:
+            관리자
+        """
+        key = (kind, user_id)
+        with self._lock:
+            manager = self._open.get(key)
+            if manager is not None:
+                self._open.move_to_end(key)
+                self._hits += 1
+                return manager
+
+        # 여는 동안 풀 전체를 잠그지 않음 (다른 사용자 요청은 기다리지 않음)
+        directory = user_storage_dir(user_id, self.root)
+        os.makedirs(directory, exist_ok=True)
+        manager_class, filename = STORE_KINDS[kind]
+        with FileLock(os.path.join(directory, kind)):
+            manager = manager_class(storage_path=os.path.join(directory, filename), backend=self.backend)
+
+        with self._lock:
+            existing = self._open.get(key)
+            if existing is None:
+                self._open[key] = manager
+                self._misses += 1
+                evicted = []
+                while len(self._open) > self.capacity:
+                    evicted.append(self._open.popitem(last=False)[1])
+                    self._evictions += 1
+            else:
+                # 다른 스레드가 먼저 열었으면 그쪽을 사용
+                self._open.move_to_end(key)
+                evicted = [manager]
+                manager = existing
+
+        for old in evicted:
+            self._release(old)
+        self._maybe_purge()
+        return manager
+
+    def _maybe_purge(self):
+        """마지막으로 찾은 지 PURGE_INTERVAL이 지났으면 오래된 세션 저장소 삭제 (새 관리자를 열 때 호출)"""
+        if not self.session_ttl:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._last_purge is not None and now - self._last_purge < PURGE_INTERVAL:
+                return
+            self._last_purge = now
+        try:
+            self.purge_sessions(self.session_ttl)
+        except OSError as e:
+            logger.error(f"세션 저장소 정리 실패: {e}")
+
+    def purge_sessions(self, max_idle: float) -> int:
+        """
+        오래 쓰지 않은 세션 저장소 삭제 (세션 ID 디렉토리만, 이 풀에 열려 있는 것은 제외)
+
+        Args:
+            max_idle: 마지막 변경 후 이 시간(초)이 지난 디렉토리를 삭제
+
+        Returns:
+            삭제한 디렉토리 수
+        """
+        with self._lock:
+            in_use = {user_id for _, user_id in self._open}
+        cutoff = time.time() - max_idle
+        removed = 0
+        for shard in _listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            for user_id in _listdir(shard_dir):
+                if not user_id.startswith(SESSION_PREFIX) or user_id in in_use:
+                    continue
+                directory = os.path.join(shard_dir, user_id)
+                if os.path.isdir(directory) and _last_modified(directory) < cutoff:
+                    shutil.rmtree(directory, ignore_errors=True)
+                    removed += 1
+        if removed:
+            logger.info(f"오래된 세션 저장소 {removed}개 삭제")
+        return removed
+
+    @staticmethod
+    def _release(manager: Any):
+        """
+        풀에서 뺀 관리자의 대기 중인 변경 저장
+
+        요청 처리 중인 다른 스레드가 아직 쓰고 있을 수 있으므로 연결은 닫지 않고,
+        마지막 참조가 없어질 때 닫히게 둡니다.
+        """
+        try:
+            manager.flush()
+        except Exception as e:
+            logger.error(f"사용자 저장소 저장 실패: {e}")
+
+    def close(self):
+        """모든 관리자의 변경을 저장하고 연결 닫기 (프로세스 종료용)"""
+        with self._lock:
+            managers = list(self._open.values())
+            self._open.clear()
+        for manager in managers:
+            self._release(manager)
+            if manager.store is not None:
+                manager.store.close()
+        logger.info(f"사용자 저장소 풀 종료: {len(managers)}개")
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        통계
+
+        Returns:
+            열린 관리자 수, 적중/실패/내보낸 횟수
+        """
+        with self._lock:
+            return {
+                'open': len(self._open),
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions
+            }
+
+
+# 전역 사용자 저장소 풀
+_user_stores: Optional[UserStorePool] = None
+_user_stores_lock = threading.Lock()
+
+# 사용자별 저장소를 쓰지 않을 때 모든 세션이 함께 쓰는 관리자 (종류 → 관리자)
+_shared_stores: Dict[str, Any] = {}
+
+
+def get_user_stores() -> UserStorePool:
+    """
+    사용자 저장소 풀 인스턴스 반환 (프로세스가 끝날 때 닫도록 등록)
+
+    Returns:
+        UserStorePool 인스턴스
+    """
+    global _user_stores
+    with _user_stores_lock:
+        if _user_stores is None:
+            _user_stores = UserStorePool()
+            atexit.register(_user_stores.close)
+    return _user_stores
+
+
+def get_shared_store(kind: str) -> Any:
+    """
+    사용자별 저장소를 쓰지 않을 때 모든 세션이 함께 쓰는 기본 경로의 관리자 반환
+
+    Streamlit은 다시 실행할 때마다 페이지 객체를 새로 만드므로, 관리자를 프로세스에 하나만 두어
+    요청마다 파일을 다시 읽거나 검색 색인을 다시 만들지 않게 합니다.
+
+    Args:
+        kind: 저장소 종류 (STORE_KINDS)
+
+    Returns:
+        관리자
+
+    Raises:
+        ValueError: 알 수 없는 저장소 종류일 때
+    """
+    if kind not in STORE_KINDS:
+        raise ValueError(f"알 수 없는 저장소 종류입니다: {kind}")
+    with _user_stores_lock:
+        manager = _shared_stores.get(kind)
+        if manager is None:
+            manager = _shared_stores[kind] = STORE_KINDS[kind][0]()
+            atexit.register(manager.flush)
+    return manager
@@ -1,13 +1,18 @@
 """
 학습 진도 시각화 모듈
 Matplotlib 기반 차트 생성
+
+pyplot 전역 상태와 rcParams를 쓰지 않으므로 여러 스레드에서 동시에 차트를 만들 수 있습니다.
+웹 페이지에서는 render_chart()로 그려 렌더 캐시를 쓰고, 렌더 작업자 풀이 켜져 있으면
+(MATH_HELPER_RENDER_WORKERS) 히트맵 같은 무거운 차트를 작업자 프로세스에서 그립니다.
 """
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+from matplotlib.figure import Figure
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
-import io
 import base64
+from ..rendering.cache import RenderCache, render_graph
+from ..rendering.pool import RenderPool
+from ..rendering.figures import get_figure_manager, korean_font_family, apply_font_family
 
 
 class ProgressVisualizer:
@@ -21,39 +26,60 @@ class ProgressVisualizer:
             use_korean_font: 한글 폰트 사용 여부
         """
         self.use_korean_font = use_korean_font
+        self.font_family: Optional[List[str]] = None
+        self.figures = get_figure_manager()
         if use_korean_font:
             self._setup_korean_font()
 
     def _setup_korean_font(self):
-        """한글 폰트 설정"""
+        """한글 폰트 설정 (전역 rcParams 대신 이 객체가 만드는 Figure에만 적용)"""
         try:
-            # 시스템에 설치된 한글 폰트 찾기
-            korean_fonts = [
-                'NanumGothic',
-                'NanumBarunGothic',
-                'Malgun Gothic',
-                'AppleGothic',
-                'DejaVu Sans'
-            ]
-
-            for font_name in korean_fonts:
-                try:
-                    plt.rcParams['font.family'] = font_name
-                    break
-                except:
-                    continue
-
-            # 마이너스 기호 깨짐 방지
-            plt.rcParams['axes.unicode_minus'] = False
+            self.font_family = korean_font_family()
         except Exception as e:
             print(f"한글 폰트 설정 실패: {e}")
 
+    def _finish(self, fig: Figure) -> Figure:
+        """글꼴 적용 후 레이아웃 정리"""
+        if self.font_family:
+            apply_font_family(fig, self.font_family)
+        fig.tight_layout()
+        return fig
+
+    def render_chart(
+        self,
+        method: str,
+        *args,
+        fmt: str = 'png',
+        dpi: float = 100,
+        cache: Optional[RenderCache] = None,
+        pool: Optional[RenderPool] = None,
+        **kwargs
+    ) -> bytes:
+        """
+        차트를 이미지 바이트로 그리기 (렌더 캐시 사용, 작업자 풀이 켜져 있으면 작업자에서 그림)
+
+        Args:
+            method: Figure를 반환하는 메서드 이름 (예: 'create_weekly_heatmap')
+            *args, **kwargs: 메서드 인자
+            fmt: 이미지 형식 ('png' 또는 'svg')
+            dpi: 해상도
+            cache: 사용할 캐시 (None이면 전역 캐시)
+            pool: 사용할 렌더 작업자 풀 (None이면 전역 풀, 전역 풀도 없으면 현재 프로세스에서 렌더링)
+
+        Returns:
+            이미지 바이트
+        """
+        if method == 'create_weekly_heatmap':
+            # 기준일이 캐시 키에 들어가도록 명시 (날짜가 바뀌면 다시 그림)
+            kwargs.setdefault('end_date', datetime.now().strftime('%Y-%m-%d'))
+        return render_graph(self, method, *args, fmt=fmt, dpi=dpi, cache=cache, pool=pool, **kwargs)
+
     def create_mastery_bar_chart(
         self,
         topics: List[str],
         mastery_levels: List[float],
         figsize: Tuple[int, int] = (10, 6)
-    ) -> plt.Figure:
+    ) -> Figure:
         """
         주제별 숙달도 막대 그래프
 
@@ -65,7 +91,7 @@ class ProgressVisualizer:
         Returns:
             matplotlib Figure 객체
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self.figures.new_figure(figsize=figsize)
 
         # 색상 설정 (숙달도에 따라)
         colors = []
@@ -97,8 +123,7 @@ class ProgressVisualizer:
         ax.set_xlim(0, 110)
         ax.grid(axis='x', alpha=0.3)
 
-        plt.tight_layout()
-        return fig
+        return self._finish(fig)
 
     def create_progress_line_chart(
         self,
@@ -106,7 +131,7 @@ class ProgressVisualizer:
         problems_solved: List[int],
         problems_correct: List[int],
         figsize: Tuple[int, int] = (12, 6)
-    ) -> plt.Figure:
+    ) -> Figure:
         """
         학습 진행 추이 선 그래프
 
@@ -119,7 +144,7 @@ class ProgressVisualizer:
         Returns:
             matplotlib Figure 객체
         """
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+        fig, (ax1, ax2) = self.figures.new_figure(figsize=figsize, nrows=2)
 
         # 문제 수 추이
         ax1.plot(dates, problems_solved, marker='o', linewidth=2,
@@ -144,9 +169,8 @@ class ProgressVisualizer:
         ax2.legend(loc='upper left')
         ax2.grid(alpha=0.3)
 
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        return fig
+        ax2.tick_params(axis='x', labelrotation=45)
+        return self._finish(fig)
 
     def create_topic_comparison_chart(
         self,
@@ -154,7 +178,7 @@ class ProgressVisualizer:
         attempted: List[int],
         correct: List[int],
         figsize: Tuple[int, int] = (10, 6)
-    ) -> plt.Figure:
+    ) -> Figure:
         """
         주제별 풀이/정답 비교 차트
 
@@ -167,7 +191,7 @@ class ProgressVisualizer:
         Returns:
             matplotlib Figure 객체
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self.figures.new_figure(figsize=figsize)
 
         x = range(len(topics))
         width = 0.35
@@ -197,15 +221,14 @@ class ProgressVisualizer:
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        return fig
+        return self._finish(fig)
 
     def create_study_time_pie_chart(
         self,
         topics: List[str],
         study_times: List[int],
         figsize: Tuple[int, int] = (8, 8)
-    ) -> plt.Figure:
+    ) -> Figure:
         """
         주제별 학습 시간 파이 차트
 
@@ -217,7 +240,7 @@ class ProgressVisualizer:
         Returns:
             matplotlib Figure 객체
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self.figures.new_figure(figsize=figsize)
 
         # 색상 팔레트
         colors = ['#3a9ad9', '#66bb6a', '#ffa726', '#ef5350',
@@ -245,15 +268,15 @@ class ProgressVisualizer:
                         for topic, time in zip(topics, study_times)]
         ax.legend(legend_labels, loc='upper left', bbox_to_anchor=(1, 1))
 
-        plt.tight_layout()
-        return fig
+        return self._finish(fig)
 
     def create_weekly_heatmap(
         self,
         daily_data: Dict[str, int],
         weeks: int = 4,
-        figsize: Tuple[int, int] = (12, 4)
-    ) -> plt.Figure:
+        figsize: Tuple[int, int] = (12, 4),
+        end_date: Optional[str] = None
+    ) -> Figure:
         """
         주간 학습 히트맵
 
@@ -261,17 +284,18 @@ class ProgressVisualizer:
             daily_data: {날짜: 문제수} 딕셔너리
             weeks: 표시할 주 수
             figsize: 그래프 크기
+            end_date: 기준일 ('YYYY-MM-DD', None이면 오늘)
 
         Returns:
             matplotlib Figure 객체
         """
         import numpy as np
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self.figures.new_figure(figsize=figsize)
 
         # 날짜 범위 계산
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=weeks * 7)
+        end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+        start_date = end - timedelta(days=weeks * 7)
 
         # 데이터 매트릭스 생성 (7일 x weeks주)
         data_matrix = np.zeros((7, weeks))
@@ -305,15 +329,14 @@ class ProgressVisualizer:
                                  fontweight='bold')
 
         # 컬러바
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = fig.colorbar(im, ax=ax)
         cbar.set_label('문제 수', rotation=270, labelpad=20)
 
         ax.set_title('주간 학습 활동 히트맵', fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        return fig
+        return self._finish(fig)
 
     @staticmethod
-    def fig_to_base64(fig: plt.Figure) -> str:
+    def fig_to_base64(fig: Figure) -> str:
         """
         Figure를 base64 인코딩된 이미지로 변환
 
@@ -323,15 +346,11 @@ class ProgressVisualizer:
         Returns:
             base64 인코딩된 이미지 문자열
         """
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode()
-        plt.close(fig)
-        return img_base64
+        png = get_figure_manager().to_bytes(fig, fmt='png', dpi=100, bbox_inches='tight')
+        return base64.b64encode(png).decode()
 
     @staticmethod
-    def fig_to_html_img(fig: plt.Figure) -> str:
+    def fig_to_html_img(fig: Figure) -> str:
         """
         Figure를 HTML img 태그로 변환
 
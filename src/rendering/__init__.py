@@ -0,0 +1,40 @@
+"""
+렌더링 모듈
+그래프 Figure의 생성과 정리, 그래프 명세와 백엔드, 경로 단순화, 렌더 캐시, 곡선 샘플링, 렌더 작업자 풀, 애니메이션 등 계산기와 학습 기능이 함께 쓰는 렌더링 기반을 제공합니다.
+"""
+from .figures import FigureManager, get_figure_manager, korean_font_family, apply_font_family
+from .cache import RenderCache, make_render_key, render_graph, render_spec_image, get_render_cache
+from .sampling import adaptive_sample
+from .pool import RenderPool, RenderJob, get_render_pool
+from .spec import PlotSpec, Series, Marker, RefLine, Annotation
+from .backends import render_matplotlib, render_plotly, render_svg, render_spec
+from .simplify import simplify_path, simplify_spec
+from .animation import SweepAnimation
+
+__all__ = [
+    'FigureManager',
+    'get_figure_manager',
+    'korean_font_family',
+    'apply_font_family',
+    'RenderCache',
+    'make_render_key',
+    'render_graph',
+    'render_spec_image',
+    'get_render_cache',
+    'adaptive_sample',
+    'RenderPool',
+    'RenderJob',
+    'get_render_pool',
+    'PlotSpec',
+    'Series',
+    'Marker',
+    'RefLine',
+    'Annotation',
+    'render_matplotlib',
+    'render_plotly',
+    'render_svg',
+    'render_spec',
+    'simplify_path',
+    'simplify_spec',
+    'SweepAnimation'
+]
@@ -0,0 +1,198 @@
+"""
+매개변수 변화 애니메이션 모듈
+y = ax² + bx + c에서 a가 -3에서 3으로 변할 때처럼, 한 매개변수를 바꿔 가며
+그래프가 어떻게 달라지는지 보여주는 애니메이션을 만듭니다.
+
+좌표축, 격자, 제목 등 변하지 않는 부분은 한 번만 그려 배경으로 저장하고,
+프레임마다 곡선/점/글자만 다시 그리는 블리팅 방식을 씁니다.
+프레임은 GIF 또는 APNG로 인코딩합니다 (MP4 등 외부 인코더 불필요).
+"""
+import io
+import numpy as np
+from typing import Iterator, List, Optional, Sequence, Tuple
+from PIL import Image
+from .figures import get_figure_manager
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 기본 프레임 설정
+DEFAULT_FPS = 30
+DEFAULT_ANIMATION_DPI = 80
+
+# GIF 팔레트 색 수
+GIF_COLORS = 64
+
+# 지원하는 인코딩 형식
+ANIMATION_FORMATS = ('gif', 'apng')
+
+
+class SweepAnimation:
+    """블리팅 기반 매개변수 변화 애니메이션 클래스"""
+
+    def __init__(
+        self,
+        x: Sequence[float],
+        y_frames,
+        labels: Sequence[str],
+        title: str = '',
+        points=None,
+        xlim: Optional[Tuple[float, float]] = None,
+        ylim: Optional[Tuple[float, float]] = None,
+        figsize: Tuple[float, float] = (8, 6),
+        dpi: float = DEFAULT_ANIMATION_DPI
+    ):
+        """
+        초기화
+
+        Args:
+            x: 모든 프레임이 공유하는 x 좌표 (N,)
+            y_frames: 프레임별 y 좌표 (F, N)
+            labels: 프레임별 표시 글자 (예: 'a = 1.50')
+            title: 그래프 제목 (모든 프레임 공통)
+            points: 프레임별 강조점 좌표 (F, 2) (예: 꼭짓점, 없으면 NaN)
+            xlim: x축 범위 (None이면 x 범위)
+            ylim: y축 범위 (None이면 모든 프레임의 y 범위)
+            figsize: 그래프 크기 (인치)
+            dpi: 해상도
+
+        Raises:
+            ValueError: 배열 크기가 맞지 않을 때
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y_frames = np.atleast_2d(np.asarray(y_frames, dtype=float))
+        self.labels = list(labels)
+        self.points = None if points is None else np.asarray(points, dtype=float).reshape(-1, 2)
+
+        frame_count, n = self.y_frames.shape
+        if n != len(self.x):
+            raise ValueError("y 좌표의 열 수가 x 좌표 개수와 같아야 합니다.")
+        if len(self.labels) != frame_count:
+            raise ValueError("표시 글자 수가 프레임 수와 같아야 합니다.")
+        if self.points is not None and len(self.points) != frame_count:
+            raise ValueError("강조점 수가 프레임 수와 같아야 합니다.")
+
+        self.title = title
+        self.xlim = xlim if xlim is not None else (float(self.x[0]), float(self.x[-1]))
+        self.ylim = ylim if ylim is not None else self._auto_ylim()
+        self.figsize = figsize
+        self.dpi = dpi
+        logger.info(f"매개변수 애니메이션 초기화 (프레임: {frame_count})")
+
+    def __len__(self) -> int:
+        return len(self.y_frames)
+
+    def _auto_ylim(self) -> Tuple[float, float]:
+        """모든 프레임을 담는 y 범위 (축이 프레임마다 흔들리지 않도록 고정)"""
+        finite = self.y_frames[np.isfinite(self.y_frames)]
+        if len(finite) == 0:
+            return -1.0, 1.0
+        lo, hi = float(finite.min()), float(finite.max())
+        margin = (hi - lo) * 0.1 or 1.0
+        return lo - margin, hi + margin
+
+    def iter_frames(self) -> Iterator[np.ndarray]:
+        """
+        프레임을 하나씩 생성 (RGBA 배열)
+
+        Figure와 정적인 배경은 한 번만 그리고, 프레임마다 배경을 복원한 뒤
+        곡선/강조점/글자만 다시 그립니다.
+
+        Yields:
+            (높이, 너비, 4) uint8 배열
+        """
+        manager = get_figure_manager()
+        with manager.figure(figsize=self.figsize, dpi=self.dpi) as (fig, ax):
+            ax.axhline(y=0, color='k', linewidth=1)
+            ax.axvline(x=0, color='k', linewidth=1)
+            ax.grid(True, linestyle='--', alpha=0.6)
+            ax.set_xlim(*self.xlim)
+            ax.set_ylim(*self.ylim)
+            ax.set_xlabel('x', fontsize=12)
+            ax.set_ylabel('y', fontsize=12)
+            ax.set_title(self.title, fontsize=14, fontweight='bold')
+
+            # 프레임마다 바뀌는 요소 (배경에는 그려지지 않음)
+            (line,) = ax.plot(self.x, self.y_frames[0], color='blue', linewidth=2, animated=True)
+            (point,) = ax.plot([], [], 'ro', markersize=8, animated=True)
+            label = ax.text(0.02, 0.95, '', transform=ax.transAxes, fontsize=12,
+                            va='top', animated=True)
+
+            canvas = fig.canvas
+            canvas.draw()
+            background = canvas.copy_from_bbox(fig.bbox)
+
+            for i in range(len(self.y_frames)):
+                canvas.restore_region(background)
+
+                line.set_ydata(self.y_frames[i])
+                ax.draw_artist(line)
+
+                if self.points is not None:
+                    point.set_data(self.points[i, :1], self.points[i, 1:])
+                    ax.draw_artist(point)
+
+                label.set_text(self.labels[i])
+                ax.draw_artist(label)
+
+                yield np.asarray(canvas.buffer_rgba()).copy()
+
+    def encode(self, fmt: str = 'gif', fps: float = DEFAULT_FPS, loop: int = 0) -> bytes:
+        """
+        애니메이션을 이미지 파일 바이트로 인코딩
+
+        Args:
+            fmt: 'gif' 또는 'apng'
+            fps: 초당 프레임 수
+            loop: 반복 횟수 (0이면 무한 반복)
+
+        Returns:
+            인코딩된 바이트
+
+        Raises:
+            ValueError: 지원하지 않는 형식이거나 fps가 0 이하일 때
+        """
+        if fmt not in ANIMATION_FORMATS:
+            raise ValueError(f"지원하지 않는 애니메이션 형식입니다: {fmt}")
+        if fps <= 0:
+            raise ValueError("초당 프레임 수는 0보다 커야 합니다.")
+
+        duration = int(round(1000 / fps))
+        if fmt == 'gif':
+            # GIF는 팔레트 이미지: 그래프 색은 몇 가지뿐이므로 첫 프레임에서 만든
+            # 팔레트 하나를 모든 프레임에 재사용 (프레임마다 색을 세지 않음)
+            images: List[Image.Image] = []
+            palette: Optional[Image.Image] = None
+            for frame in self.iter_frames():
+                rgb = Image.fromarray(frame).convert('RGB')
+                if palette is None:
+                    palette = rgb.quantize(colors=GIF_COLORS, method=Image.Quantize.FASTOCTREE)
+                images.append(rgb.quantize(palette=palette, dither=Image.Dither.NONE))
+            save_kw = dict(format='GIF', optimize=False, disposal=1)
+        else:
+            images = [Image.fromarray(frame) for frame in self.iter_frames()]
+            save_kw = dict(format='PNG')
+
+        buf = io.BytesIO()
+        images[0].save(
+            buf,
+            save_all=True,
+            append_images=images[1:],
+            duration=duration,
+            loop=loop,
+            **save_kw
+        )
+        logger.debug(f"애니메이션 인코딩: {fmt}, 프레임 {len(images)}개, {buf.tell()} 바이트")
+        return buf.getvalue()
+
+    def iter_png_frames(self) -> Iterator[bytes]:
+        """
+        프레임을 하나씩 PNG 바이트로 생성 (스트리밍 전송용)
+
+        Yields:
+            PNG 바이트
+        """
+        for frame in self.iter_frames():
+            buf = io.BytesIO()
+            Image.fromarray(frame).save(buf, format='PNG')
+            yield buf.getvalue()
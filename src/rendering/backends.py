@@ -0,0 +1,325 @@
+"""
+그래프 명세 백엔드 모듈
+PlotSpec을 matplotlib Figure, Plotly Figure, SVG 문자열로 그립니다.
+
+고정 크기 이미지(matplotlib, SVG)는 최종 픽셀 크기를 알 수 있으므로 그리기 직전에 선을
+화면 허용 오차 안에서 단순화합니다. 브라우저에서 확대하는 Plotly 그래프는 확대해도 구별되지
+않는 허용 오차로 한 직선 위의 점만 버려 보내는 좌표 수를 줄입니다.
+"""
+import math
+import numpy as np
+from typing import Any, List
+from xml.sax.saxutils import escape
+from matplotlib.figure import Figure
+from .figures import get_figure_manager, DEFAULT_DPI
+from .simplify import PLOTLY_PIXEL_TOLERANCE, simplify_spec
+from .spec import PlotSpec, Series, Marker, RefLine, Annotation
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 축 이름, 범례 글자 크기 (기존 그리기 메서드와 같은 값)
+LABEL_FONTSIZE = 12
+LEGEND_FONTSIZE = 10
+TITLE_FONTSIZE = 14
+
+# Plotly/SVG 선 모양
+_PLOTLY_DASH = {'-': 'solid', '--': 'dash', ':': 'dot', '-.': 'dashdot'}
+_SVG_DASH = {'-': None, '--': '6,4', ':': '2,3', '-.': '6,3,2,3'}
+_SVG_ANCHOR = {'left': 'start', 'center': 'middle', 'right': 'end'}
+
+# matplotlib 어두운 테마 색 (ThemeManager.DARK_THEME과 같은 값)
+_DARK = {'background': '#1e1e1e', 'surface': '#2d2d2d', 'text': '#e0e0e0', 'border': '#404040'}
+
+# 어두운 배경에서 보이지 않는 검은색 (어두운 테마에서는 글자색으로 바꿈)
+_BLACK = ('black', 'k', '#000000')
+
+
+def _array(coords) -> np.ndarray:
+    """명세 좌표를 float 배열로 (None → NaN)"""
+    return np.array(coords, dtype=float)
+
+
+def _apply_dark_theme(fig: Figure, ax: Any) -> None:
+    """Figure 배경, 축, 글자, 범례를 어두운 테마 색으로 바꾸기"""
+    fig.patch.set_facecolor(_DARK['background'])
+    ax.set_facecolor(_DARK['surface'])
+    ax.tick_params(colors=_DARK['text'])
+    for spine in ax.spines.values():
+        spine.set_color(_DARK['border'])
+    for text in (ax.xaxis.label, ax.yaxis.label, ax.title):
+        text.set_color(_DARK['text'])
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.get_frame().set_facecolor(_DARK['surface'])
+        legend.get_frame().set_edgecolor(_DARK['border'])
+        for text in legend.get_texts():
+            text.set_color(_DARK['text'])
+
+
+def render_matplotlib(spec: PlotSpec, dpi: float = DEFAULT_DPI, theme: str = 'light') -> Figure:
+    """
+    명세를 matplotlib Figure로 그리기
+
+    Args:
+        spec: 그래프 명세
+        dpi: 이미지로 저장할 해상도 (선 단순화의 픽셀 크기 기준)
+        theme: 테마 ('light' 또는 'dark')
+
+    Returns:
+        matplotlib Figure 객체
+    """
+    spec = simplify_spec(spec, dpi=dpi)
+    dark = theme == 'dark'
+
+    def color(value: str) -> str:
+        return _DARK['text'] if dark and value in _BLACK else value
+
+    fig, ax = get_figure_manager().new_figure(figsize=spec.figsize)
+
+    if spec.grid_alpha is not None:
+        ax.grid(True, linestyle='--', alpha=spec.grid_alpha)
+
+    for layer in spec.layers:
+        if isinstance(layer, Series):
+            ax.plot(_array(layer.x), _array(layer.y), label=layer.label, color=color(layer.color),
+                    linewidth=layer.linewidth, linestyle=layer.linestyle, alpha=layer.alpha)
+        elif isinstance(layer, Marker):
+            ax.plot(_array(layer.x), _array(layer.y), 'o', linestyle='none', label=layer.label,
+                    color=color(layer.color), markersize=layer.size)
+        elif isinstance(layer, RefLine):
+            draw = ax.axhline if layer.orientation == 'h' else ax.axvline
+            draw(layer.value, label=layer.label, color=color(layer.color), linewidth=layer.linewidth,
+                 linestyle=layer.linestyle, alpha=layer.alpha)
+        elif isinstance(layer, Annotation):
+            ax.text(layer.x, layer.y, layer.text, color=color(layer.color),
+                    fontsize=layer.fontsize, ha=layer.ha)
+
+    ax.set_xlabel(spec.xlabel, fontsize=LABEL_FONTSIZE)
+    ax.set_ylabel(spec.ylabel, fontsize=LABEL_FONTSIZE)
+    ax.set_title(spec.title, fontsize=TITLE_FONTSIZE,
+                 fontweight='bold' if spec.title_bold else 'normal')
+
+    if spec.xlim is not None:
+        ax.set_xlim(*spec.xlim)
+    if spec.ylim is not None:
+        ax.set_ylim(*spec.ylim)
+    if spec.legend:
+        if spec.legend_loc:
+            ax.legend(fontsize=LEGEND_FONTSIZE, loc=spec.legend_loc)
+        else:
+            ax.legend(fontsize=LEGEND_FONTSIZE)
+    if dark:
+        _apply_dark_theme(fig, ax)
+    return fig
+
+
+def render_plotly(spec: PlotSpec, theme: str = 'light') -> Any:
+    """
+    명세를 Plotly Figure로 그리기 (브라우저에서 확대/이동 가능, 확대해도 매끄럽도록 선을 단순화하지 않음)
+
+    Args:
+        spec: 그래프 명세
+        theme: 테마 ('light' 또는 'dark')
+
+    Returns:
+        plotly.graph_objects.Figure 객체
+
+    Raises:
+        ImportError: plotly가 설치되지 않았을 때
+    """
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        raise ImportError("Plotly 백엔드를 사용하려면 plotly를 설치하세요: pip install plotly")
+
+    spec = simplify_spec(spec, tolerance_px=PLOTLY_PIXEL_TOLERANCE)
+    fig = go.Figure()
+    for layer in spec.layers:
+        if isinstance(layer, Series):
+            fig.add_trace(go.Scatter(
+                x=list(layer.x), y=list(layer.y), mode='lines',
+                name=layer.label, showlegend=layer.label is not None,
+                opacity=layer.alpha, connectgaps=False,
+                line=dict(color=layer.color, width=layer.linewidth,
+                          dash=_PLOTLY_DASH.get(layer.linestyle, 'solid'))
+            ))
+        elif isinstance(layer, Marker):
+            fig.add_trace(go.Scatter(
+                x=list(layer.x), y=list(layer.y), mode='markers',
+                name=layer.label, showlegend=layer.label is not None,
+                marker=dict(color=layer.color, size=layer.size)
+            ))
+        elif isinstance(layer, RefLine):
+            line = dict(color=layer.color, width=layer.linewidth,
+                        dash=_PLOTLY_DASH.get(layer.linestyle, 'solid'))
+            if layer.orientation == 'h':
+                fig.add_hline(y=layer.value, line=line, opacity=layer.alpha)
+            else:
+                fig.add_vline(x=layer.value, line=line, opacity=layer.alpha)
+        elif isinstance(layer, Annotation):
+            fig.add_annotation(
+                x=layer.x, y=layer.y, text=escape(layer.text), showarrow=False,
+                xanchor=layer.ha, yanchor='bottom',
+                font=dict(color=layer.color, size=layer.fontsize)
+            )
+
+    width, height = spec.figsize
+    fig.update_layout(
+        title=dict(text=f'<b>{escape(spec.title)}</b>' if spec.title_bold else escape(spec.title)),
+        xaxis_title=spec.xlabel,
+        yaxis_title=spec.ylabel,
+        showlegend=spec.legend,
+        template='plotly_dark' if theme == 'dark' else 'plotly_white',
+        width=int(width * DEFAULT_DPI),
+        height=int(height * DEFAULT_DPI)
+    )
+    fig.update_xaxes(showgrid=spec.grid_alpha is not None, zeroline=False)
+    fig.update_yaxes(showgrid=spec.grid_alpha is not None, zeroline=False)
+    if spec.xlim is not None:
+        fig.update_xaxes(range=list(spec.xlim))
+    if spec.ylim is not None:
+        fig.update_yaxes(range=list(spec.ylim))
+    return fig
+
+
+def _nice_ticks(lo: float, hi: float, target: int = 8) -> List[float]:
+    """보기 좋은 간격(1, 2, 5 × 10ⁿ)의 눈금"""
+    span = hi - lo
+    raw = span / target
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step) * step
+    count = int(math.floor((hi - first) / step + 1e-9)) + 1
+    return [round(first + i * step, 10) for i in range(count)]
+
+
+def render_svg(spec: PlotSpec) -> str:
+    """
+    명세를 SVG 문자열로 그리기 (matplotlib 없이 바로 작성)
+
+    Args:
+        spec: 그래프 명세
+
+    Returns:
+        SVG 문서 문자열
+    """
+    spec = simplify_spec(spec)
+    width, height = int(spec.figsize[0] * DEFAULT_DPI), int(spec.figsize[1] * DEFAULT_DPI)
+    left, right, top, bottom = 60, 20, 40, 50
+    plot_w, plot_h = width - left - right, height - top - bottom
+    (x0, x1), (y0, y1) = spec.limits()
+
+    def px(x: float) -> float:
+        return left + (x - x0) / (x1 - x0) * plot_w
+
+    def py(y: float) -> float:
+        return top + (y1 - y) / (y1 - y0) * plot_h
+
+    def stroke(color: str, linewidth: float, linestyle: str, alpha: float) -> str:
+        attrs = f'stroke="{color}" stroke-width="{linewidth:g}" fill="none"'
+        dash = _SVG_DASH.get(linestyle)
+        if dash:
+            attrs += f' stroke-dasharray="{dash}"'
+        if alpha < 1:
+            attrs += f' stroke-opacity="{alpha:g}"'
+        return attrs
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<clipPath id="plot"><rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}"/></clipPath>',
+    ]
+
+    # 격자와 눈금
+    for t in _nice_ticks(x0, x1):
+        out.append(f'<text x="{px(t):.2f}" y="{top + plot_h + 16}" font-size="10" '
+                   f'text-anchor="middle">{t:g}</text>')
+        if spec.grid_alpha is not None:
+            out.append(f'<line x1="{px(t):.2f}" y1="{top}" x2="{px(t):.2f}" y2="{top + plot_h}" '
+                       f'{stroke("#b0b0b0", 0.8, "--", spec.grid_alpha)}/>')
+    for t in _nice_ticks(y0, y1):
+        out.append(f'<text x="{left - 6}" y="{py(t) + 3:.2f}" font-size="10" '
+                   f'text-anchor="end">{t:g}</text>')
+        if spec.grid_alpha is not None:
+            out.append(f'<line x1="{left}" y1="{py(t):.2f}" x2="{left + plot_w}" y2="{py(t):.2f}" '
+                       f'{stroke("#b0b0b0", 0.8, "--", spec.grid_alpha)}/>')
+
+    out.append('<g clip-path="url(#plot)">')
+    legend = []
+    for layer in spec.layers:
+        if isinstance(layer, Series):
+            style = stroke(layer.color, layer.linewidth, layer.linestyle, layer.alpha)
+            segment: List[str] = []
+            for x, y in list(zip(layer.x, layer.y)) + [(None, None)]:
+                if x is None or y is None:
+                    if len(segment) > 1:
+                        out.append(f'<polyline points="{" ".join(segment)}" {style}/>')
+                    segment = []
+                else:
+                    segment.append(f'{px(x):.2f},{py(y):.2f}')
+        elif isinstance(layer, Marker):
+            for x, y in zip(layer.x, layer.y):
+                if x is not None and y is not None:
+                    out.append(f'<circle cx="{px(x):.2f}" cy="{py(y):.2f}" r="{layer.size / 2:g}" '
+                               f'fill="{layer.color}"/>')
+        elif isinstance(layer, RefLine):
+            style = stroke(layer.color, layer.linewidth, layer.linestyle, layer.alpha)
+            if layer.orientation == 'h':
+                out.append(f'<line x1="{left}" y1="{py(layer.value):.2f}" x2="{left + plot_w}" '
+                           f'y2="{py(layer.value):.2f}" {style}/>')
+            else:
+                out.append(f'<line x1="{px(layer.value):.2f}" y1="{top}" x2="{px(layer.value):.2f}" '
+                           f'y2="{top + plot_h}" {style}/>')
+        elif isinstance(layer, Annotation):
+            out.append(f'<text x="{px(layer.x):.2f}" y="{py(layer.y):.2f}" font-size="{layer.fontsize:g}" '
+                       f'fill="{layer.color}" text-anchor="{_SVG_ANCHOR.get(layer.ha, "start")}">'
+                       f'{escape(layer.text)}</text>')
+        if spec.legend and getattr(layer, 'label', None):
+            legend.append((layer.label, layer.color))
+    out.append('</g>')
+
+    # 테두리, 제목, 축 이름
+    out.append(f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="black"/>')
+    weight = ' font-weight="bold"' if spec.title_bold else ''
+    out.append(f'<text x="{left + plot_w / 2:.1f}" y="{top - 14}" font-size="{TITLE_FONTSIZE}" '
+               f'text-anchor="middle"{weight}>{escape(spec.title)}</text>')
+    out.append(f'<text x="{left + plot_w / 2:.1f}" y="{height - 12}" font-size="{LABEL_FONTSIZE}" '
+               f'text-anchor="middle">{escape(spec.xlabel)}</text>')
+    out.append(f'<text x="16" y="{top + plot_h / 2:.1f}" font-size="{LABEL_FONTSIZE}" text-anchor="middle" '
+               f'transform="rotate(-90 16 {top + plot_h / 2:.1f})">{escape(spec.ylabel)}</text>')
+
+    # 범례
+    for i, (label, color) in enumerate(legend):
+        y = top + 16 + i * 16
+        out.append(f'<line x1="{left + 10}" y1="{y - 4}" x2="{left + 30}" y2="{y - 4}" '
+                   f'stroke="{color}" stroke-width="2"/>')
+        out.append(f'<text x="{left + 36}" y="{y}" font-size="{LEGEND_FONTSIZE}">{escape(label)}</text>')
+
+    out.append('</svg>')
+    return '\n'.join(out)
+
+
+def render_spec(spec: PlotSpec, backend: str = 'matplotlib', **options) -> Any:
+    """
+    백엔드 이름으로 명세 그리기
+
+    Args:
+        spec: 그래프 명세
+        backend: 'matplotlib', 'plotly', 'svg' 중 하나
+        **options: 백엔드 추가 인자 (예: matplotlib/Plotly의 theme)
+
+    Returns:
+        백엔드별 결과 (matplotlib Figure, Plotly Figure, SVG 문자열)
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드일 때
+    """
+    if backend == 'matplotlib':
+        return render_matplotlib(spec, **options)
+    if backend == 'plotly':
+        return render_plotly(spec, **options)
+    if backend == 'svg':
+        return render_svg(spec)
+    raise ValueError(f"지원하지 않는 그리기 백엔드입니다: {backend}")
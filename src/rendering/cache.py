@@ -0,0 +1,382 @@
+"""
+렌더 캐시 모듈
+그래프 이미지(PNG/SVG) 바이트를 입력값의 해시로 저장해 같은 그래프는 다시 그리지 않습니다.
+
+메모리 LRU 계층과 선택적인 디스크 계층(전체 크기 기준 제거)으로 구성됩니다.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+from .figures import get_figure_manager, DEFAULT_DPI
+from .pool import RenderPool, RenderJob, RENDER_TARGETS, get_render_pool
+from .spec import PlotSpec
+from .backends import render_matplotlib
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 메모리 계층 기본 용량
+DEFAULT_MAX_ITEMS = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 디스크 계층 기본 용량
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _canonical(value: Any) -> Any:
+    """해시 입력용으로 값을 JSON 직렬화 가능한 정규 형태로 변환"""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float):
+        # 1과 1.0이 같은 키가 되도록 정수로 표현 가능한 실수는 정수로
+        return int(value) if value.is_integer() else repr(value)
+    if isinstance(value, (int, str, bool)) or value is None:
+        return value
+    if hasattr(value, 'tolist'):
+        return _canonical(value.tolist())
+    return repr(value)
+
+
+def make_render_key(
+    drawer: str,
+    params: Dict[str, Any],
+    theme: str = 'light',
+    dpi: float = DEFAULT_DPI,
+    fmt: str = 'png'
+) -> str:
+    """
+    렌더 결과를 식별하는 내용 기반 키
+
+    Args:
+        drawer: 그리기 대상 이름 (예: 'QuadraticFunctionDrawer.draw')
+        params: 그래프 입력값
+        theme: 테마
+        dpi: 해상도
+        fmt: 이미지 형식
+
+    Returns:
+        SHA-256 16진 문자열
+    """
+    payload = json.dumps(
+        _canonical({
+            'drawer': drawer,
+            'params': params,
+            'theme': theme,
+            'dpi': dpi,
+            'fmt': fmt
+        }),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """메모리 LRU + 디스크 2계층 렌더 캐시 클래스"""
+
+    def __init__(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: Optional[Union[str, Path]] = None,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES
+    ):
+        """
+        초기화
+
+        Args:
+            max_items: 메모리 계층 최대 항목 수
+            max_bytes: 메모리 계층 최대 바이트
+            disk_dir: 디스크 계층 디렉토리 (None이면 사용하지 않음)
+            disk_max_bytes: 디스크 계층 최대 바이트
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        path = self._disk_path(key)
+        return path is not None and path.exists()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        캐시에서 이미지 바이트 조회 (메모리 → 디스크 순)
+
+        Args:
+            key: make_render_key로 만든 키
+
+        Returns:
+            이미지 바이트 또는 None
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._stats['hits'] += 1
+                return data
+
+        data = self._disk_read(key)
+        with self._lock:
+            if data is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._memory_put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        이미지 바이트 저장
+
+        Args:
+            key: 캐시 키
+            data: 이미지 바이트
+        """
+        with self._lock:
+            self._memory_put(key, data)
+        self._disk_write(key, data)
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        """
+        캐시에 있으면 반환, 없으면 render()로 만들어 저장
+
+        Args:
+            key: 캐시 키
+            render: 이미지 바이트를 만드는 함수
+
+        Returns:
+            이미지 바이트
+        """
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def clear(self) -> None:
+        """메모리와 디스크 계층 모두 비우기"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob('*.bin'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            적중/미스/제거 횟수와 메모리 사용량
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['items'] = len(self._memory)
+            stats['bytes'] = self._memory_bytes
+        return stats
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        """메모리 계층에 저장 후 용량 초과분 제거 (잠금 상태에서 호출)"""
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+
+        if len(data) > self.max_bytes:
+            return
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while len(self._memory) > self.max_items or self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats['evictions'] += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        """디스크 계층의 파일 경로"""
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.bin"
+
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        """디스크 계층에서 읽기 (읽은 파일은 최근 사용으로 표시)"""
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _disk_write(self, key: str, data: bytes) -> None:
+        """디스크 계층에 원자적으로 쓰고 용량 초과 시 오래된 파일 제거"""
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"렌더 캐시 디스크 쓰기 실패: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """디스크 계층 전체 크기가 한도를 넘으면 가장 오래 쓰지 않은 파일부터 제거"""
+        entries = []
+        total = 0
+        for path in self.disk_dir.glob('*.bin'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self.disk_max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                with self._lock:
+                    self._stats['evictions'] += 1
+            except OSError:
+                continue
+
+
+def _drawer_state(drawer: Any) -> Dict[str, Any]:
+    """그리기 결과에 영향을 주는 그리기 객체의 설정값"""
+    return {
+        k: v for k, v in vars(drawer).items()
+        if not k.startswith('_') and isinstance(v, (int, float, str, bool, tuple, list))
+    }
+
+
+def render_graph(
+    drawer: Any,
+    method: str,
+    *args,
+    fmt: str = 'png',
+    dpi: float = DEFAULT_DPI,
+    theme: str = 'light',
+    cache: Optional[RenderCache] = None,
+    pool: Optional[RenderPool] = None,
+    **kwargs
+) -> bytes:
+    """
+    그리기 메서드의 결과를 이미지 바이트로 반환 (캐시 적중 시 matplotlib을 거치지 않음)
+
+    Args:
+        drawer: 그리기 객체 (예: QuadraticFunctionDrawer 인스턴스)
+        method: Figure를 반환하는 메서드 이름 (예: 'draw')
+        *args, **kwargs: 메서드 인자
+        fmt: 이미지 형식 ('png' 또는 'svg')
+        dpi: 해상도
+        theme: 테마
+        cache: 사용할 캐시 (None이면 전역 캐시)
+        pool: 캐시 미스 때 사용할 렌더 작업자 풀 (None이면 전역 풀, 전역 풀도 없으면 현재 프로세스에서 렌더링)
+
+    Returns:
+        이미지 바이트
+    """
+    cache = cache if cache is not None else get_render_cache()
+    key = make_render_key(
+        f"{type(drawer).__name__}.{method}",
+        {'args': args, 'kwargs': kwargs, 'drawer': _drawer_state(drawer)},
+        theme=theme,
+        dpi=dpi,
+        fmt=fmt
+    )
+
+    pool = pool if pool is not None else get_render_pool()
+
+    def render() -> bytes:
+        logger.debug(f"렌더 캐시 미스: {type(drawer).__name__}.{method}")
+        if pool is not None and type(drawer).__name__ in RENDER_TARGETS:
+            job = RenderJob.from_drawer(drawer, method, args, kwargs, fmt=fmt, dpi=dpi)
+            return pool.render(job)
+        fig = getattr(drawer, method)(*args, **kwargs)
+        return get_figure_manager().to_bytes(fig, fmt=fmt, dpi=dpi)
+
+    return cache.get_or_render(key, render)
+
+
+def render_spec_image(
+    spec: PlotSpec,
+    fmt: str = 'png',
+    dpi: float = DEFAULT_DPI,
+    theme: str = 'light',
+    cache: Optional[RenderCache] = None,
+    pool: Optional[RenderPool] = None
+) -> bytes:
+    """
+    그래프 명세를 이미지 바이트로 반환 (명세 해시로 캐시, 적중 시 Figure를 만들지 않음)
+
+    Args:
+        spec: 그래프 명세
+        fmt: 이미지 형식 ('png' 또는 'svg')
+        dpi: 해상도
+        theme: 테마
+        cache: 사용할 캐시 (None이면 전역 캐시)
+        pool: 캐시 미스 때 사용할 렌더 작업자 풀 (None이면 전역 풀, 전역 풀도 없으면 현재 프로세스에서 렌더링)
+
+    Returns:
+        이미지 바이트
+    """
+    cache = cache if cache is not None else get_render_cache()
+    key = make_render_key('PlotSpec', {'spec': spec.key()}, theme=theme, dpi=dpi, fmt=fmt)
+
+    pool = pool if pool is not None else get_render_pool()
+
+    def render() -> bytes:
+        logger.debug(f"렌더 캐시 미스: {spec.title}")
+        if pool is not None:
+            return pool.render_spec(spec, fmt=fmt, dpi=dpi, theme=theme)
+        fig = render_matplotlib(spec, dpi=dpi, theme=theme)
+        return get_figure_manager().to_bytes(fig, fmt=fmt, dpi=dpi)
+
+    return cache.get_or_render(key, render)
+
+
+# 전역 렌더 캐시 인스턴스
+# MATH_HELPER_RENDER_CACHE_DIR 환경변수가 있으면 디스크 계층도 사용합니다
+render_cache = RenderCache(disk_dir=os.environ.get('MATH_HELPER_RENDER_CACHE_DIR') or None)
+
+
+def get_render_cache() -> RenderCache:
+    """렌더 캐시 인스턴스 반환"""
+    return render_cache
@@ -0,0 +1,214 @@
+"""
+Figure 수명 관리 모듈
+pyplot 전역 상태를 거치지 않고 객체지향 Figure/Agg API로 그래프를 만들고 정리합니다.
+
+plt.subplots로 만든 Figure는 pyplot의 전역 Figure 관리자에 등록되어
+plt.close를 호출하기 전까지 해제되지 않습니다. 여기서 만든 Figure는 어디에도
+등록되지 않으므로 참조가 사라지면 해제되고, close()로 즉시 정리할 수도 있습니다.
+
+전역 rcParams도 바꾸지 않습니다. 글꼴 같은 설정은 apply_font_family로 Figure마다
+적용하므로 여러 스레드에서 동시에 그려도 서로 영향을 주지 않습니다.
+"""
+import io
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Tuple, Optional, Iterator, Any, Dict, List
+from matplotlib import font_manager
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 이미지 인코딩 기본 해상도
+DEFAULT_DPI = 100
+
+# 한글 글꼴 후보 (설치된 것만 사용)
+KOREAN_FONT_CANDIDATES = (
+    'NanumGothic',
+    'NanumBarunGothic',
+    'Malgun Gothic',
+    'AppleGothic'
+)
+
+# 한글 글꼴에 없는 글자(마이너스 기호 등)를 대신 그릴 글꼴
+FALLBACK_FONT = 'DejaVu Sans'
+
+
+@lru_cache(maxsize=1)
+def _installed_font_names() -> frozenset:
+    """설치된 글꼴 이름 집합 (한 번만 조회)"""
+    return frozenset(f.name for f in font_manager.fontManager.ttflist)
+
+
+def korean_font_family() -> List[str]:
+    """
+    한글 그래프에 쓸 글꼴 목록
+
+    설치된 한글 글꼴 뒤에 대체 글꼴을 붙여, 한글 글꼴에 없는 글자는
+    대체 글꼴로 그려지게 합니다 (axes.unicode_minus 전역 설정이 필요 없음).
+
+    Returns:
+        글꼴 이름 목록 (우선순위 순)
+    """
+    installed = _installed_font_names()
+    return [name for name in KOREAN_FONT_CANDIDATES if name in installed] + [FALLBACK_FONT]
+
+
+def apply_font_family(fig: Figure, family: List[str]) -> Figure:
+    """
+    Figure 안의 모든 글자에 글꼴 적용 (전역 rcParams를 바꾸지 않음)
+
+    그리기가 끝난 뒤 호출합니다. 눈금 레이블은 그릴 때 새로 만들어지므로
+    Axes별 tick_params로도 지정합니다.
+
+    Args:
+        fig: 대상 Figure
+        family: 글꼴 이름 목록
+
+    Returns:
+        같은 Figure
+    """
+    for ax in fig.axes:
+        ax.tick_params(which='both', labelfontfamily=family)
+    for text in fig.findobj(Text):
+        text.set_fontfamily(family)
+    return fig
+
+
+class FigureManager:
+    """Figure 생성, 인코딩, 정리를 담당하는 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self._live: 'weakref.WeakSet[Figure]' = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = 0
+
+    def new_figure(
+        self,
+        figsize: Tuple[float, float] = (8, 6),
+        nrows: int = 1,
+        ncols: int = 1,
+        dpi: Optional[float] = None,
+        **subplot_kw
+    ) -> Tuple[Figure, Any]:
+        """
+        pyplot 밖에서 Figure와 Axes 생성 (plt.subplots 대체)
+
+        Args:
+            figsize: 그래프 크기 (인치)
+            nrows, ncols: 서브플롯 행/열 수
+            dpi: 해상도 (None이면 matplotlib 기본값)
+            **subplot_kw: Figure.subplots에 전달할 추가 인자
+
+        Returns:
+            (Figure, Axes 또는 Axes 배열)
+        """
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows, ncols, **subplot_kw)
+
+        with self._lock:
+            self._live.add(fig)
+            self._created += 1
+        return fig, axes
+
+    def close(self, fig: Figure) -> None:
+        """
+        Figure 정리 (Artist 해제)
+
+        Args:
+            fig: 정리할 Figure
+        """
+        with self._lock:
+            if fig not in self._live:
+                return
+            self._live.discard(fig)
+            self._closed += 1
+        fig.clear()
+
+    @contextmanager
+    def figure(
+        self,
+        figsize: Tuple[float, float] = (8, 6),
+        nrows: int = 1,
+        ncols: int = 1,
+        dpi: Optional[float] = None,
+        **subplot_kw
+    ) -> Iterator[Tuple[Figure, Any]]:
+        """
+        블록이 끝나면 자동으로 정리되는 Figure
+
+        Example:
+            with figure_manager.figure((8, 6)) as (fig, ax):
+                ax.plot(x, y)
+                png = figure_manager.to_bytes(fig, close=False)
+        """
+        fig, axes = self.new_figure(figsize, nrows, ncols, dpi, **subplot_kw)
+        try:
+            yield fig, axes
+        finally:
+            self.close(fig)
+
+    def to_bytes(
+        self,
+        fig: Figure,
+        fmt: str = 'png',
+        dpi: float = DEFAULT_DPI,
+        close: bool = True,
+        **savefig_kw
+    ) -> bytes:
+        """
+        Figure를 이미지 바이트로 인코딩
+
+        Args:
+            fig: 인코딩할 Figure
+            fmt: 이미지 형식 ('png', 'svg' 등)
+            dpi: 해상도
+            close: 인코딩 후 Figure 정리 여부
+            **savefig_kw: Figure.savefig에 전달할 추가 인자
+
+        Returns:
+            인코딩된 이미지 바이트
+        """
+        buf = io.BytesIO()
+        try:
+            fig.savefig(buf, format=fmt, dpi=dpi, **savefig_kw)
+        finally:
+            if close:
+                self.close(fig)
+        return buf.getvalue()
+
+    @property
+    def live_count(self) -> int:
+        """아직 정리되지 않고 살아 있는 Figure 수"""
+        with self._lock:
+            return len(self._live)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Figure 수명 통계
+
+        Returns:
+            생성/정리/현재 살아 있는 Figure 수
+        """
+        with self._lock:
+            return {
+                'created': self._created,
+                'closed': self._closed,
+                'live': len(self._live)
+            }
+
+
+# 전역 Figure 관리자 인스턴스
+figure_manager = FigureManager()
+
+
+def get_figure_manager() -> FigureManager:
+    """Figure 관리자 인스턴스 반환"""
+    return figure_manager
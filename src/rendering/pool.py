@@ -0,0 +1,380 @@
+"""
+렌더 작업자 풀 모듈
+무거운 차트(히트맵, 비교 그래프, 그래프 명세 등)를 별도 프로세스에서 PNG/SVG로 그려
+웹 서버 프로세스의 GIL을 오래 잡지 않도록 합니다.
+
+작업자는 시작할 때 matplotlib, 글꼴 목록, 그리기 클래스를 미리 불러 두고,
+부모 프로세스는 그리기 대상/메서드/인자로 된 작업(RenderJob)이나 그래프 명세(PlotSpec)만
+보내고 이미지 바이트를 돌려받습니다. 대기 중인 작업 수에 상한을 두어
+요청이 몰리면 제출 단계에서 기다리거나 TimeoutError를 냅니다.
+"""
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from .figures import DEFAULT_DPI
+from .spec import PlotSpec
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 풀에서 그릴 수 있는 대상 (클래스 이름 → 모듈)
+RENDER_TARGETS = {
+    'FunctionGraphDrawer': '..calculators.function_graph',
+    'LinearFunctionDrawer': '..calculators.linear_function',
+    'QuadraticFunctionDrawer': '..calculators.quadratic_function',
+    'ProgressVisualizer': '..features.visualizations'
+}
+
+# 기본 작업자 수
+DEFAULT_MAX_WORKERS = 2
+
+# 작업자당 대기 가능한 작업 수 (back-pressure 상한 = 작업자 수 × 이 값)
+DEFAULT_QUEUE_FACTOR = 4
+
+# 기본 제한 시간 (초)
+DEFAULT_SUBMIT_TIMEOUT = 5.0
+DEFAULT_RESULT_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """작업자에게 보내는 렌더 작업 (피클 가능한 값만 포함)"""
+    target: str  # RENDER_TARGETS의 클래스 이름
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Tuple[Tuple[str, Any], ...] = ()
+    state: Tuple[Tuple[str, Any], ...] = ()  # 그리기 객체 설정값 (x_limit 등)
+    fmt: str = 'png'
+    dpi: float = DEFAULT_DPI
+
+    @classmethod
+    def from_drawer(
+        cls,
+        drawer: Any,
+        method: str,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        fmt: str = 'png',
+        dpi: float = DEFAULT_DPI
+    ) -> 'RenderJob':
+        """
+        그리기 객체와 메서드 호출로 작업 만들기
+
+        Args:
+            drawer: 그리기 객체 (예: QuadraticFunctionDrawer 인스턴스)
+            method: Figure를 반환하는 메서드 이름
+            args, kwargs: 메서드 인자
+            fmt: 이미지 형식
+            dpi: 해상도
+
+        Returns:
+            RenderJob 객체
+
+        Raises:
+            ValueError: 풀에서 그릴 수 없는 대상일 때
+        """
+        from .cache import _drawer_state
+
+        target = type(drawer).__name__
+        if target not in RENDER_TARGETS:
+            raise ValueError(f"렌더 풀에서 지원하지 않는 대상입니다: {target}")
+        return cls(
+            target=target,
+            method=method,
+            args=tuple(args),
+            kwargs=tuple(sorted((kwargs or {}).items())),
+            state=tuple(sorted(_drawer_state(drawer).items())),
+            fmt=fmt,
+            dpi=dpi
+        )
+
+
+def _load_target(target: str) -> type:
+    """대상 클래스 불러오기"""
+    module = importlib.import_module(RENDER_TARGETS[target], package=__package__)
+    return getattr(module, target)
+
+
+def _warm_worker() -> None:
+    """작업자 초기화: matplotlib, 글꼴 목록, 그리기 클래스를 미리 불러오기"""
+    from .figures import get_figure_manager, korean_font_family
+
+    korean_font_family()
+    for target in RENDER_TARGETS:
+        try:
+            _load_target(target)
+        except ImportError as e:
+            logger.warning(f"렌더 작업자: {target} 불러오기 실패: {e}")
+
+    # Agg 렌더러와 글꼴 캐시를 한 번 사용해 둠
+    manager = get_figure_manager()
+    fig, ax = manager.new_figure(figsize=(1, 1))
+    ax.set_title('가')
+    manager.to_bytes(fig)
+
+
+def _ping() -> int:
+    """작업자 준비 확인용"""
+    return os.getpid()
+
+
+def _execute(job: RenderJob) -> bytes:
+    """작업자에서 작업을 실행해 이미지 바이트 반환"""
+    from .figures import get_figure_manager
+
+    drawer = _load_target(job.target)()
+    for name, value in job.state:
+        setattr(drawer, name, value)
+    fig = getattr(drawer, job.method)(*job.args, **dict(job.kwargs))
+    return get_figure_manager().to_bytes(fig, fmt=job.fmt, dpi=job.dpi)
+
+
+def _execute_spec(spec: PlotSpec, fmt: str, dpi: float, theme: str) -> bytes:
+    """작업자에서 그래프 명세를 그려 이미지 바이트 반환"""
+    from .backends import render_matplotlib
+    from .figures import get_figure_manager
+
+    fig = render_matplotlib(spec, dpi=dpi, theme=theme)
+    return get_figure_manager().to_bytes(fig, fmt=fmt, dpi=dpi)
+
+
+class RenderPool:
+    """프로세스 기반 렌더 작업자 풀 클래스"""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: Optional[int] = None,
+        submit_timeout: float = DEFAULT_SUBMIT_TIMEOUT,
+        result_timeout: float = DEFAULT_RESULT_TIMEOUT
+    ):
+        """
+        초기화
+
+        Args:
+            max_workers: 작업자 프로세스 수
+            max_pending: 동시에 제출 가능한 최대 작업 수 (None이면 작업자 수 × 4)
+            submit_timeout: 대기열이 가득 찼을 때 제출을 기다리는 시간 (초)
+            result_timeout: 결과를 기다리는 시간 (초)
+        """
+        if max_workers < 1:
+            raise ValueError("작업자 수는 1 이상이어야 합니다.")
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending or max_workers * DEFAULT_QUEUE_FACTOR
+        self.submit_timeout = submit_timeout
+        self.result_timeout = result_timeout
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._stats = {'submitted': 0, 'completed': 0, 'rejected': 0, 'timeouts': 0, 'restarts': 0}
+        logger.info(f"렌더 작업자 풀 초기화 (작업자: {max_workers}, 대기 상한: {self.max_pending})")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """작업자 풀 (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 있는 서버 프로세스에서 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_worker
+                )
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        """작업자가 비정상 종료된 풀을 버리고 다음 제출 때 새로 만들기"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self._stats['restarts'] += 1
+        logger.warning("렌더 작업자 풀 재시작")
+
+    def start(self, timeout: Optional[float] = None) -> None:
+        """
+        모든 작업자를 미리 띄우고 초기화가 끝날 때까지 대기
+
+        Args:
+            timeout: 대기 시간 (초, None이면 result_timeout)
+        """
+        executor = self._get_executor()
+        futures = [executor.submit(_ping) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result(timeout=timeout or self.result_timeout)
+        logger.info("렌더 작업자 준비 완료")
+
+    def submit(self, job: RenderJob, timeout: Optional[float] = None) -> 'Future[bytes]':
+        """
+        작업 제출 (대기열이 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            job: 렌더 작업
+            timeout: 제출 대기 시간 (초, None이면 submit_timeout)
+
+        Returns:
+            이미지 바이트를 돌려줄 Future
+
+        Raises:
+            ValueError: 지원하지 않는 대상일 때
+            TimeoutError: 대기 시간 안에 자리가 나지 않을 때
+        """
+        if job.target not in RENDER_TARGETS:
+            raise ValueError(f"렌더 풀에서 지원하지 않는 대상입니다: {job.target}")
+        return self._submit(timeout, _execute, job)
+
+    def submit_spec(
+        self,
+        spec: PlotSpec,
+        fmt: str = 'png',
+        dpi: float = DEFAULT_DPI,
+        theme: str = 'light',
+        timeout: Optional[float] = None
+    ) -> 'Future[bytes]':
+        """
+        그래프 명세 렌더 작업 제출 (대기열이 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            spec: 그래프 명세
+            fmt: 이미지 형식
+            dpi: 해상도
+            theme: 테마
+            timeout: 제출 대기 시간 (초, None이면 submit_timeout)
+
+        Returns:
+            이미지 바이트를 돌려줄 Future
+
+        Raises:
+            TimeoutError: 대기 시간 안에 자리가 나지 않을 때
+        """
+        return self._submit(timeout, _execute_spec, spec, fmt, dpi, theme)
+
+    def _submit(self, timeout: Optional[float], fn: Callable[..., bytes], *args) -> 'Future[bytes]':
+        """대기열 자리를 얻어 작업자에게 함수 실행 제출"""
+        wait = self.submit_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=wait):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise TimeoutError("렌더 대기열이 가득 찼습니다.")
+
+        try:
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                self._reset_executor()
+                future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats['submitted'] += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        """작업이 끝나면 대기열 자리 반환"""
+        self._slots.release()
+        with self._lock:
+            self._stats['completed'] += 1
+
+    def render(self, job: RenderJob, timeout: Optional[float] = None) -> bytes:
+        """
+        작업을 제출하고 결과를 기다리기
+
+        Args:
+            job: 렌더 작업
+            timeout: 결과 대기 시간 (초, None이면 result_timeout)
+
+        Returns:
+            이미지 바이트
+
+        Raises:
+            TimeoutError: 제출 또는 결과 대기 시간 초과
+        """
+        return self._result(self.submit(job), f"{job.target}.{job.method}", timeout)
+
+    def render_spec(
+        self,
+        spec: PlotSpec,
+        fmt: str = 'png',
+        dpi: float = DEFAULT_DPI,
+        theme: str = 'light',
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        그래프 명세를 작업자에서 그리고 결과를 기다리기
+
+        Args:
+            spec: 그래프 명세
+            fmt: 이미지 형식
+            dpi: 해상도
+            theme: 테마
+            timeout: 결과 대기 시간 (초, None이면 result_timeout)
+
+        Returns:
+            이미지 바이트
+
+        Raises:
+            TimeoutError: 제출 또는 결과 대기 시간 초과
+        """
+        return self._result(self.submit_spec(spec, fmt, dpi, theme), spec.title, timeout)
+
+    def _result(self, future: 'Future[bytes]', label: str, timeout: Optional[float]) -> bytes:
+        """제출한 작업의 결과 기다리기"""
+        try:
+            return future.result(timeout=self.result_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업은 취소 (실행 중인 작업은 끝까지 진행됨)
+            future.cancel()
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise TimeoutError(f"렌더 시간 초과: {label}")
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """작업자 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("렌더 작업자 풀 종료")
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        작업 통계
+
+        Returns:
+            제출/완료/거부/시간 초과/재시작 횟수
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+# 전역 렌더 작업자 풀 (MATH_HELPER_RENDER_WORKERS 환경변수가 1 이상일 때만 사용)
+_render_pool: Optional[RenderPool] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[RenderPool]:
+    """렌더 작업자 풀 인스턴스 반환 (사용하지 않도록 설정되어 있으면 None)"""
+    global _render_pool
+    try:
+        workers = int(os.environ.get('MATH_HELPER_RENDER_WORKERS', '0'))
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        return None
+
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = RenderPool(max_workers=workers)
+        return _render_pool
@@ -0,0 +1,161 @@
+"""
+적응형 곡선 샘플링 모듈
+곡률이 큰 곳에만 점을 더 찍고 불연속점(점근선)에서는 선을 끊어,
+적은 점으로도 정확한 함수 그래프를 그릴 수 있게 합니다.
+"""
+import numpy as np
+from typing import Callable, Optional, Tuple
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 기본 점 개수 예산
+DEFAULT_MAX_POINTS = 200
+
+# 처음 균등하게 찍는 점 개수
+DEFAULT_INITIAL_POINTS = 17
+
+# 허용 오차 (화면 높이에 대한 비율, 약 1/1000 ≈ 1픽셀 미만)
+DEFAULT_TOLERANCE = 1e-3
+
+# 한 구간에서 화면 높이의 이 비율 이상 뛰면 불연속 후보
+JUMP_RATIO = 0.5
+
+# 불연속 확인을 위한 이분법 반복 횟수
+BISECTION_STEPS = 40
+
+# 화면 밖 값은 화면 높이의 이 비율만큼 여유를 두고 잘라서 오차를 계산
+VIEW_MARGIN = 0.5
+
+
+def _evaluate(func: Callable[[np.ndarray], np.ndarray], x: np.ndarray) -> np.ndarray:
+    """함수 값 계산 (0으로 나누기 등은 NaN/무한대로 처리)"""
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        y = np.asarray(func(x), dtype=float)
+    return np.broadcast_to(y, x.shape).astype(float)
+
+
+def _view_window(y: np.ndarray, y_range: Optional[Tuple[float, float]]) -> Tuple[float, float]:
+    """오차 계산에 사용할 y 범위"""
+    if y_range is not None:
+        lo, hi = float(y_range[0]), float(y_range[1])
+    else:
+        finite = y[np.isfinite(y)]
+        if len(finite) == 0:
+            return -1.0, 1.0
+        # 점근선 근처의 매우 큰 값에 끌려가지 않도록 분위수로 범위 추정
+        lo, hi = np.percentile(finite, [5, 95])
+    if hi - lo <= 0:
+        lo, hi = lo - 1.0, hi + 1.0
+    return lo, hi
+
+
+def adaptive_sample(
+    func: Callable[[np.ndarray], np.ndarray],
+    x_range: Tuple[float, float],
+    max_points: int = DEFAULT_MAX_POINTS,
+    initial_points: int = DEFAULT_INITIAL_POINTS,
+    tolerance: float = DEFAULT_TOLERANCE,
+    y_range: Optional[Tuple[float, float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    곡률 기반 적응형 샘플링
+
+    균등한 점에서 시작해, 구간 중점의 함수 값이 양 끝점을 이은 직선에서
+    허용 오차 이상 벗어나는 구간만 반으로 나눕니다. 오차가 큰 구간부터
+    점 개수 예산을 씁니다. 불연속점이 있는 구간에는 NaN을 넣어 선을 끊습니다.
+
+    Args:
+        func: 벡터화된 함수 (NumPy 배열을 받아 배열을 반환)
+        x_range: x 범위 (시작, 끝)
+        max_points: 최대 점 개수 (불연속점 표시용 NaN 제외)
+        initial_points: 처음 균등하게 찍는 점 개수
+        tolerance: 화면 높이 대비 허용 오차
+        y_range: 화면에 보이는 y 범위 (None이면 함수 값으로 추정)
+
+    Returns:
+        (x 배열, y 배열) - 불연속점과 정의되지 않는 점은 y가 NaN
+    """
+    start, end = float(x_range[0]), float(x_range[1])
+    if not start < end:
+        raise ValueError("x 범위의 시작 값이 끝 값보다 작아야 합니다.")
+    if max_points < 2:
+        raise ValueError("점 개수 예산은 2 이상이어야 합니다.")
+
+    x = np.linspace(start, end, max(2, min(initial_points, max_points)))
+    y = _evaluate(func, x)
+
+    lo, hi = _view_window(y, y_range)
+    height = hi - lo
+    clip_lo, clip_hi = lo - VIEW_MARGIN * height, hi + VIEW_MARGIN * height
+    min_width = (end - start) * 1e-9
+
+    while len(x) < max_points:
+        xm = (x[:-1] + x[1:]) / 2
+        ym = _evaluate(func, xm)
+
+        # 화면 밖 값은 잘라서 비교 (점근선 근처에서 예산을 낭비하지 않도록)
+        yc = np.clip(y, clip_lo, clip_hi)
+        ymc = np.clip(ym, clip_lo, clip_hi)
+        err = np.abs(ymc - (yc[:-1] + yc[1:]) / 2) / height
+        err[~np.isfinite(err)] = 0.0
+        err[(x[1:] - x[:-1]) < min_width] = 0.0
+
+        split = np.flatnonzero(err > tolerance)
+        if len(split) == 0:
+            break
+
+        budget = max_points - len(x)
+        if len(split) > budget:
+            split = np.sort(split[np.argsort(err[split])[::-1][:budget]])
+
+        x = np.insert(x, split + 1, xm[split])
+        y = np.insert(y, split + 1, ym[split])
+
+    x, y = _break_discontinuities(func, x, y, height)
+    logger.debug(f"적응형 샘플링: [{start}, {end}] → 점 {len(x)}개")
+    return x, y
+
+
+def _break_discontinuities(
+    func: Callable[[np.ndarray], np.ndarray],
+    x: np.ndarray,
+    y: np.ndarray,
+    height: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    불연속 구간에 NaN을 넣어 선을 끊기
+
+    양 끝의 차이가 화면 높이의 JUMP_RATIO 이상인 구간을 후보로 삼고, 차이가 큰
+    쪽 절반을 따라 이분법으로 좁혀 갑니다. 구간이 아주 좁아져도 차이가 남으면
+    (예: y = a/x의 x = 0) 불연속, 사라지면 점이 부족했던 연속 구간으로 봅니다.
+    """
+    y = np.where(np.isfinite(y), y, np.nan)
+    if len(x) < 2:
+        return x, y
+
+    with np.errstate(invalid='ignore'):
+        candidates = np.flatnonzero(np.abs(y[1:] - y[:-1]) > JUMP_RATIO * height)
+    if len(candidates) == 0:
+        return x, y
+
+    lo, hi = x[candidates], x[candidates + 1]
+    y_lo, y_hi = y[candidates], y[candidates + 1]
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        y_mid = _evaluate(func, mid)
+        y_mid = np.where(np.isfinite(y_mid), y_mid, np.nan)
+        left = np.nan_to_num(np.abs(y_mid - y_lo), nan=np.inf)
+        right = np.nan_to_num(np.abs(y_hi - y_mid), nan=np.inf)
+        go_left = left >= right
+        hi, y_hi = np.where(go_left, mid, hi), np.where(go_left, y_mid, y_hi)
+        lo, y_lo = np.where(go_left, lo, mid), np.where(go_left, y_lo, y_mid)
+
+    final = np.nan_to_num(np.abs(y_hi - y_lo), nan=np.inf)
+    is_jump = final > JUMP_RATIO * height
+    if not np.any(is_jump):
+        return x, y
+
+    jumps = candidates[is_jump]
+    break_x = (lo[is_jump] + hi[is_jump]) / 2
+    return np.insert(x, jumps + 1, break_x), np.insert(y, jumps + 1, np.nan)
@@ -0,0 +1,157 @@
+"""
+그래프 경로 단순화 모듈
+화면에서 구별되지 않는 점을 버려 고정 크기 이미지(PNG/SVG)를 그릴 때의 좌표 수를 줄입니다.
+최종 픽셀 크기를 아는 출력 단계(matplotlib, SVG 백엔드)에서 적용합니다. 브라우저에서 확대하는
+Plotly 그래프는 확대하면 꺾인 점이 보이므로, 확대해도 구별되지 않는 아주 작은 허용 오차
+(PLOTLY_PIXEL_TOLERANCE)로 한 직선 위의 점만 버립니다.
+
+Ramer–Douglas–Peucker(RDP) 알고리즘을 픽셀 좌표에서 적용하므로, 허용 오차는
+"실제 화면에서 몇 픽셀까지 어긋나도 되는가"로 지정합니다. 직선은 양 끝 두 점만 남고,
+곡률이 큰 곳(꼭짓점 근처 등)에는 점이 촘촘히 남습니다.
+NaN으로 끊긴 구간(반비례 함수의 x = 0 등)은 구간마다 따로 단순화하고 끊김은 그대로 둡니다.
+"""
+import numpy as np
+from dataclasses import replace
+from typing import Optional, Tuple
+from .figures import DEFAULT_DPI
+from .spec import PlotSpec, Series, to_coords
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 기본 허용 오차 (픽셀) - 안티에일리어싱된 선 굵기보다 작음
+DEFAULT_PIXEL_TOLERANCE = 0.5
+
+# Plotly 허용 오차 (픽셀) - 500배로 확대해도 0.5픽셀 이하 (직선과 거의 직선인 구간의 점만 버림)
+PLOTLY_PIXEL_TOLERANCE = 0.001
+
+
+def _rdp_keep(px: np.ndarray, py: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    끊김 없는 한 구간에 RDP 적용
+
+    Args:
+        px: 픽셀 x 좌표
+        py: 픽셀 y 좌표
+        tolerance: 허용 오차 (픽셀)
+
+    Returns:
+        남길 점을 표시한 bool 배열
+    """
+    n = len(px)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+
+    # 재귀 대신 스택 사용 (점이 많아도 재귀 한도에 걸리지 않음)
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        dx, dy = px[j] - px[i], py[j] - py[i]
+        rx, ry = px[i + 1:j] - px[i], py[i + 1:j] - py[i]
+        chord = np.hypot(dx, dy)
+        if chord == 0:
+            dist = np.hypot(rx, ry)
+        else:
+            dist = np.abs(rx * dy - ry * dx) / chord
+
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return keep
+
+
+def simplify_path(
+    x,
+    y,
+    tolerance_px: float = DEFAULT_PIXEL_TOLERANCE,
+    x_range: Optional[Tuple[float, float]] = None,
+    y_range: Optional[Tuple[float, float]] = None,
+    size_px: Tuple[float, float] = (800, 600)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    화면 허용 오차 안에서 경로의 점 줄이기
+
+    Args:
+        x: x 좌표 배열
+        y: y 좌표 배열 (NaN은 선의 끊김)
+        tolerance_px: 허용 오차 (픽셀)
+        x_range: 화면에 보이는 x 범위 (None이면 데이터 범위)
+        y_range: 화면에 보이는 y 범위 (None이면 데이터 범위)
+        size_px: 그림 크기 (너비, 높이) 픽셀
+
+    Returns:
+        (단순화된 x, 단순화된 y)
+
+    Raises:
+        ValueError: 배열 길이가 다르거나 허용 오차가 음수일 때
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x와 y 좌표 개수가 같아야 합니다.")
+    if tolerance_px < 0:
+        raise ValueError("허용 오차는 0 이상이어야 합니다.")
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    if tolerance_px == 0 or np.count_nonzero(finite) < 3:
+        return x, y
+
+    def scale(values: np.ndarray, span: Optional[Tuple[float, float]], pixels: float) -> float:
+        lo, hi = span if span is not None else (values.min(), values.max())
+        return pixels / (hi - lo) if hi > lo else 0.0
+
+    sx = scale(x[finite], x_range, size_px[0])
+    sy = scale(y[finite], y_range, size_px[1])
+    px, py = x * sx, y * sy
+
+    # NaN 점은 그대로 남기고 (끊김 유지) 유한한 구간마다 단순화
+    keep = ~finite
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+    for start, end in zip(edges[::2], edges[1::2]):
+        keep[start:end] = _rdp_keep(px[start:end], py[start:end], tolerance_px)
+
+    return x[keep], y[keep]
+
+
+def simplify_spec(
+    spec: PlotSpec,
+    tolerance_px: float = DEFAULT_PIXEL_TOLERANCE,
+    dpi: float = DEFAULT_DPI
+) -> PlotSpec:
+    """
+    명세의 모든 선(Series)을 화면 허용 오차 안에서 단순화
+
+    픽셀 크기는 그림 전체 크기(figsize × dpi)로 계산합니다. 실제 그림 영역은
+    이보다 작으므로 화면에서의 오차는 지정한 값보다 항상 작습니다.
+
+    Args:
+        spec: 그래프 명세
+        tolerance_px: 허용 오차 (픽셀)
+        dpi: 해상도
+
+    Returns:
+        단순화된 PlotSpec (선 이외의 요소와 옵션은 그대로)
+    """
+    size_px = (spec.figsize[0] * dpi, spec.figsize[1] * dpi)
+    x_range, y_range = spec.limits()
+
+    before = after = 0
+    layers = []
+    for layer in spec.layers:
+        if isinstance(layer, Series):
+            x, y = simplify_path(layer.x, layer.y, tolerance_px, x_range, y_range, size_px)
+            before += len(layer.x)
+            after += len(x)
+            layer = replace(layer, x=to_coords(x), y=to_coords(y))
+        layers.append(layer)
+
+    if before:
+        logger.debug(f"경로 단순화: {before}점 → {after}점 (허용 오차 {tolerance_px}px)")
+    return replace(spec, layers=tuple(layers))
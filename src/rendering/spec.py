@@ -0,0 +1,209 @@
+"""
+그래프 명세 모듈
+그리기 클래스가 matplotlib Figure 대신 만들 수 있는 가벼운 선언형 그래프 명세를 정의합니다.
+
+명세는 값만 담은 불변 객체라 해시로 캐시 키를 만들 수 있고, JSON으로 바꿔
+브라우저에 보낼 수도 있습니다. 실제 그리기는 backends 모듈의 matplotlib,
+Plotly, SVG 백엔드가 담당합니다.
+"""
+import hashlib
+import json
+import math
+from dataclasses import dataclass, asdict, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# 좌표값 (정의되지 않는 점은 None)
+Coords = Tuple[Optional[float], ...]
+
+
+def to_coords(values: Sequence[float]) -> Coords:
+    """
+    숫자 배열을 명세용 좌표 튜플로 변환 (NaN/무한대는 None으로 바꿔 선을 끊음)
+
+    Args:
+        values: 숫자 배열 또는 스칼라
+
+    Returns:
+        float/None 튜플
+    """
+    if not hasattr(values, '__len__'):
+        values = [values]
+    coords = []
+    for v in values:
+        v = float(v)
+        coords.append(v if math.isfinite(v) else None)
+    return tuple(coords)
+
+
+@dataclass(frozen=True)
+class Series:
+    """선 그래프"""
+    x: Coords
+    y: Coords
+    label: Optional[str] = None
+    color: str = 'blue'
+    linewidth: float = 2.0
+    linestyle: str = '-'  # '-', '--', ':'
+    alpha: float = 1.0
+
+    @classmethod
+    def from_arrays(cls, x: Sequence[float], y: Sequence[float], **style) -> 'Series':
+        """NumPy 배열 등으로 선 만들기"""
+        return cls(x=to_coords(x), y=to_coords(y), **style)
+
+
+@dataclass(frozen=True)
+class Marker:
+    """점 표시 (꼭짓점, 절편 등)"""
+    x: Coords
+    y: Coords
+    label: Optional[str] = None
+    color: str = 'red'
+    size: float = 8.0
+
+    @classmethod
+    def at(cls, x: float, y: float, **style) -> 'Marker':
+        """점 하나 만들기"""
+        return cls(x=to_coords(x), y=to_coords(y), **style)
+
+    @classmethod
+    def from_arrays(cls, x: Sequence[float], y: Sequence[float], **style) -> 'Marker':
+        """여러 점을 한 번에 만들기"""
+        return cls(x=to_coords(x), y=to_coords(y), **style)
+
+
+@dataclass(frozen=True)
+class RefLine:
+    """수평선(h) 또는 수직선(v) (좌표축, 대칭축 등)"""
+    orientation: str  # 'h' 또는 'v'
+    value: float
+    label: Optional[str] = None
+    color: str = 'black'
+    linewidth: float = 1.0
+    linestyle: str = '-'
+    alpha: float = 1.0
+
+
+@dataclass(frozen=True)
+class Annotation:
+    """글자 표시"""
+    x: float
+    y: float
+    text: str
+    color: str = 'black'
+    fontsize: float = 10.0
+    ha: str = 'left'  # 'left', 'center', 'right'
+
+
+Layer = Union[Series, Marker, RefLine, Annotation]
+
+# 직렬화할 때 쓰는 요소 종류 이름
+LAYER_TYPES = {
+    'series': Series,
+    'marker': Marker,
+    'refline': RefLine,
+    'annotation': Annotation,
+}
+_LAYER_NAMES = {cls: name for name, cls in LAYER_TYPES.items()}
+
+
+@dataclass(frozen=True)
+class PlotSpec:
+    """그래프 명세 (요소는 그리는 순서대로)"""
+    title: str
+    layers: Tuple[Layer, ...] = ()
+    xlabel: str = 'x'
+    ylabel: str = 'y'
+    figsize: Tuple[float, float] = (8, 6)
+    title_bold: bool = False
+    xlim: Optional[Tuple[float, float]] = None
+    ylim: Optional[Tuple[float, float]] = None
+    grid_alpha: Optional[float] = 0.6  # None이면 격자 없음
+    legend: bool = True
+    legend_loc: Optional[str] = None
+
+    def limits(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """
+        x, y 표시 범위 (지정되지 않았으면 데이터 범위에 5% 여백)
+
+        Returns:
+            ((x 최소, x 최대), (y 최소, y 최대))
+        """
+        xs: List[float] = []
+        ys: List[float] = []
+        for layer in self.layers:
+            if isinstance(layer, (Series, Marker)):
+                xs.extend(v for v in layer.x if v is not None)
+                ys.extend(v for v in layer.y if v is not None)
+            elif isinstance(layer, Annotation):
+                xs.append(layer.x)
+                ys.append(layer.y)
+
+        def bounds(values: List[float], fixed: Optional[Tuple[float, float]]) -> Tuple[float, float]:
+            if fixed is not None:
+                return float(fixed[0]), float(fixed[1])
+            if not values:
+                return -1.0, 1.0
+            lo, hi = min(values), max(values)
+            pad = (hi - lo) * 0.05 or 1.0
+            return lo - pad, hi + pad
+
+        return bounds(xs, self.xlim), bounds(ys, self.ylim)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 직렬화 가능한 딕셔너리로 변환
+
+        Returns:
+            명세 딕셔너리 (요소마다 'type' 포함)
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'layers'}
+        data['layers'] = [
+            {'type': _LAYER_NAMES[type(layer)], **asdict(layer)}
+            for layer in self.layers
+        ]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PlotSpec':
+        """
+        딕셔너리에서 명세 복원
+
+        Args:
+            data: to_dict()의 결과 (JSON을 거친 것도 가능)
+
+        Returns:
+            PlotSpec 객체
+
+        Raises:
+            ValueError: 알 수 없는 요소 종류일 때
+        """
+        layers = []
+        for item in data.get('layers', []):
+            item = dict(item)
+            kind = item.pop('type', None)
+            if kind not in LAYER_TYPES:
+                raise ValueError(f"알 수 없는 그래프 요소입니다: {kind}")
+            for key in ('x', 'y'):
+                if isinstance(item.get(key), list):
+                    item[key] = tuple(item[key])
+            layers.append(LAYER_TYPES[kind](**item))
+
+        options = {k: v for k, v in data.items() if k != 'layers'}
+        for key in ('figsize', 'xlim', 'ylim'):
+            if isinstance(options.get(key), list):
+                options[key] = tuple(options[key])
+        return cls(layers=tuple(layers), **options)
+
+    def to_json(self) -> str:
+        """정규화된 JSON 문자열 (키 정렬)"""
+        return json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+    def key(self) -> str:
+        """
+        내용 기반 키 (렌더 캐시용)
+
+        Returns:
+            SHA-256 16진 문자열
+        """
+        return hashlib.sha256(self.to_json().encode('utf-8')).hexdigest()
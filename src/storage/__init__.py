@@ -0,0 +1,35 @@
+"""
+저장소 모듈
+계산 히스토리, 오답 노트, 학습 진도 등 학습 기능의 데이터를 파일에 저장하는 기반을 제공합니다.
+"""
+from .aggregates import RunningTotals
+from .atomic import atomic_write_bytes, atomic_write_text
+from .backend import STORAGE_BACKENDS, resolve_backend
+from .checked_json import ChecksumError, read_checked_json, write_checked_json
+from .file_lock import FileLock
+from .indexed_list import IndexedList, unique_id
+from .journal import JournalStore
+from .paged import RecordFile, paged_base
+from .sqlite_store import SQLiteStore, sqlite_path
+from .write_behind import WriteBehind, get_write_behind
+
+__all__ = [
+    'RunningTotals',
+    'atomic_write_bytes',
+    'atomic_write_text',
+    'STORAGE_BACKENDS',
+    'resolve_backend',
+    'ChecksumError',
+    'read_checked_json',
+    'write_checked_json',
+    'FileLock',
+    'IndexedList',
+    'unique_id',
+    'JournalStore',
+    'RecordFile',
+    'paged_base',
+    'SQLiteStore',
+    'sqlite_path',
+    'WriteBehind',
+    'get_write_behind'
+]
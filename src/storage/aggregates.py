@@ -0,0 +1,106 @@
+"""
+누적 집계 모듈
+항목이 추가/수정/삭제될 때마다 합계를 갱신해 두어, 통계를 기록 수와 관계없이 바로 돌려줍니다.
+
+집계 값은 항목 하나가 기여하는 값 사전(예: {'total': 1, ('type', '통계'): 1})을 더하고
+빼서 만듭니다. 항목을 고칠 때는 고치기 전 기여분을 빼고 고친 뒤 기여분을 더합니다.
+디버그용으로 verify()는 전체를 다시 계산해 누적 값과 비교합니다.
+"""
+import math
+from typing import Callable, Dict, Generic, Hashable, Iterable, TypeVar
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+T = TypeVar('T')
+
+
+class RunningTotals(Generic[T]):
+    """항목별 기여분을 더하고 빼는 누적 집계 클래스"""
+
+    def __init__(self, contribution: Callable[[T], Dict[Hashable, float]], entries: Iterable[T] = ()):
+        """
+        초기화
+
+        Args:
+            contribution: 항목 하나가 기여하는 {집계 키: 값}을 돌려주는 함수 (0인 값은 무시)
+            entries: 초기 항목
+        """
+        self._contribution = contribution
+        self._totals: Dict[Hashable, float] = {}
+        self.reset(entries)
+
+    def add(self, entry: T):
+        """항목 기여분 더하기"""
+        totals = self._totals
+        for key, value in self._contribution(entry).items():
+            if value:
+                totals[key] = totals.get(key, 0) + value
+
+    def remove(self, entry: T):
+        """항목 기여분 빼기 (값이 0이 된 키는 지움)"""
+        totals = self._totals
+        for key, value in self._contribution(entry).items():
+            if not value:
+                continue
+            remaining = totals.get(key, 0) - value
+            if remaining == 0:
+                totals.pop(key, None)
+            else:
+                totals[key] = remaining
+
+    def reset(self, entries: Iterable[T] = ()):
+        """전체 항목으로 다시 계산"""
+        self._totals = {}
+        for entry in entries:
+            self.add(entry)
+
+    def get(self, key: Hashable, default: float = 0) -> float:
+        """
+        집계 값 조회
+
+        Args:
+            key: 집계 키 (예: 'total')
+            default: 값이 없을 때
+
+        Returns:
+            집계 값
+        """
+        return self._totals.get(key, default)
+
+    def group(self, kind: str) -> Dict[Hashable, float]:
+        """
+        (kind, 이름) 형태 키의 값 모으기
+
+        Args:
+            kind: 키 종류 (예: 'type')
+
+        Returns:
+            {이름: 값}
+        """
+        return {
+            key[1]: value for key, value in self._totals.items()
+            if isinstance(key, tuple) and key[0] == kind
+        }
+
+    def verify(self, entries: Iterable[T], label: str = '') -> bool:
+        """
+        전체를 다시 계산해 누적 값과 비교 (다르면 오류를 기록하고 다시 계산한 값으로 바꿈)
+
+        Args:
+            entries: 전체 항목
+            label: 로그에 표시할 이름
+
+        Returns:
+            일치 여부
+        """
+        expected = RunningTotals(self._contribution, entries)._totals
+        actual = self._totals
+        matches = all(
+            math.isclose(expected.get(key, 0), actual.get(key, 0), rel_tol=1e-9, abs_tol=1e-9)
+            for key in expected.keys() | actual.keys()
+        )
+        if not matches:
+            logger.error(f"누적 집계 불일치 ({label}): 누적={actual}, 재계산={expected}")
+            self._totals = expected
+        return matches
@@ -0,0 +1,61 @@
+"""
+원자적 파일 쓰기 모듈
+같은 디렉토리의 임시 파일에 쓰고 디스크에 반영(fsync)한 뒤 이름을 바꿔 교체합니다.
+쓰는 도중 프로세스가 멈춰도 대상 파일은 이전 내용 그대로 남습니다.
+"""
+import os
+import tempfile
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+def _fsync_directory(directory: str):
+    """이름 바꾸기가 디스크에 반영되도록 디렉토리 동기화 (지원하지 않는 OS는 무시)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory or '.', os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, data: bytes, durable: bool = True):
+    """
+    바이트를 파일에 원자적으로 쓰기
+
+    Args:
+        path: 대상 파일 경로
+        data: 쓸 내용
+        durable: 디스크 반영(fsync)까지 기다릴지 여부 (다시 만들 수 있는 캐시 파일은 False)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if durable:
+        _fsync_directory(directory)
+
+
+def atomic_write_text(path: str, text: str, encoding: str = 'utf-8'):
+    """
+    문자열을 파일에 원자적으로 쓰기
+
+    Args:
+        path: 대상 파일 경로
+        text: 쓸 내용
+        encoding: 문자 인코딩
+    """
+    atomic_write_bytes(path, text.encode(encoding))
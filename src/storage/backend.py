@@ -0,0 +1,38 @@
+"""
+저장 방식 선택 모듈
+학습 기능 관리자들이 공통으로 쓰는 저장 방식 이름과 설정값 해석을 제공합니다.
+"""
+from typing import Optional, Tuple
+from ..utils.config import get_config
+
+config = get_config()
+
+# 지원하는 저장 방식
+# - json: 메모리 목록 + JSON 파일 (저널 사용 여부는 storage.journal)
+# - sqlite: WAL 모드 SQLite 데이터베이스 (색인된 조회, 필요한 행만 읽음)
+# - paged: 레코드 파일 + 위치 색인 (계산 히스토리만, 요청한 기록만 mmap으로 읽어 파싱)
+STORAGE_BACKENDS = ('json', 'sqlite', 'paged')
+
+
+def resolve_backend(backend: Optional[str] = None, supported: Tuple[str, ...] = STORAGE_BACKENDS) -> str:
+    """
+    저장 방식 이름 확인
+
+    Args:
+        backend: 저장 방식 (None이면 설정값 storage.backend, 없으면 'json')
+        supported: 호출하는 관리자가 지원하는 저장 방식
+            - 설정값이 지원하지 않는 방식이면 'json'으로 대신함
+
+    Returns:
+        저장 방식 이름
+
+    Raises:
+        ValueError: 지원하지 않는 저장 방식일 때
+    """
+    if backend is None:
+        backend = config.get('storage.backend', 'json')
+        if backend in STORAGE_BACKENDS and backend not in supported:
+            return 'json'
+    if backend not in supported:
+        raise ValueError(f"지원하지 않는 저장 방식입니다: {backend}")
+    return backend
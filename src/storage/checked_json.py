@@ -0,0 +1,158 @@
+"""
+체크섬 JSON 파일 모듈
+JSON 본문 앞에 형식 버전과 SHA-256 체크섬을 담은 머리줄 한 줄을 붙여 원자적으로 저장합니다.
+
+    MATHHELPER-JSON 1 sha256=<본문 해시>
+    [ ...JSON 본문... ]
+
+불러올 때 체크섬이 맞지 않으면 (디스크 손상, 직접 편집 등) 파일을 '.corrupt'로 옮겨
+보관하고 오류를 냅니다. 그래서 손상된 파일을 빈 데이터로 조용히 덮어쓰지 않습니다.
+
+한 번 파싱한 데이터는 marshal 캐시('.cache')에 체크섬과 함께 저장해 두고, 다음에 불러올 때
+체크섬이 같으면 JSON 파싱 없이 캐시를 읽습니다. 캐시는 언제든 지워도 되고 (다시 만들어짐)
+marshal은 기본 자료형만 다루므로 pickle과 달리 임의 코드를 실행하지 않습니다.
+머리줄이 없는 예전 JSON 파일도 그대로 읽으며, 다음 저장 때 새 형식으로 바뀝니다.
+"""
+import hashlib
+import json
+import marshal
+import os
+from typing import Any, Optional, Tuple
+from .atomic import atomic_write_bytes
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 파일 형식 버전 (머리줄 형식이 바뀌면 올림)
+FORMAT_VERSION = 1
+
+# 머리줄 시작 문자열
+HEADER_MAGIC = b'MATHHELPER-JSON'
+
+# 파싱 결과 캐시 파일 확장자
+CACHE_SUFFIX = '.cache'
+
+# 체크섬이 맞지 않는 파일을 옮겨 둘 확장자
+CORRUPT_SUFFIX = '.corrupt'
+
+
+class ChecksumError(ValueError):
+    """파일 체크섬이 맞지 않을 때 발생하는 예외"""
+
+
+def _checksum(body: bytes) -> str:
+    """본문 SHA-256 체크섬"""
+    return hashlib.sha256(body).hexdigest()
+
+
+def _split_header(raw: bytes) -> Tuple[Optional[int], Optional[str], bytes]:
+    """
+    머리줄과 본문 나누기
+
+    Returns:
+        (형식 버전, 체크섬, 본문) - 머리줄이 없는 예전 파일은 (None, None, 전체)
+    """
+    if not raw.startswith(HEADER_MAGIC + b' '):
+        return None, None, raw
+
+    header, _, body = raw.partition(b'\n')
+    try:
+        _, version, checksum = header.decode('ascii').split(' ')
+        if not checksum.startswith('sha256='):
+            raise ValueError(checksum)
+        return int(version), checksum[len('sha256='):], body
+    except ValueError:
+        raise ChecksumError(f"파일 머리줄을 읽을 수 없습니다: {header[:80]!r}")
+
+
+def write_checked_json(path: str, data: Any, indent: Optional[int] = 2):
+    """
+    JSON 데이터를 체크섬 머리줄과 함께 원자적으로 저장
+
+    Args:
+        path: 파일 경로
+        data: JSON으로 바꿀 수 있는 데이터
+        indent: JSON 들여쓰기
+    """
+    body = json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+    header = b'%s %d sha256=%s\n' % (HEADER_MAGIC, FORMAT_VERSION, _checksum(body).encode('ascii'))
+    atomic_write_bytes(path, header + body)
+
+
+def _read_cache(path: str, checksum: str) -> Tuple[bool, Any]:
+    """체크섬이 같은 캐시가 있으면 (True, 데이터)"""
+    try:
+        with open(path + CACHE_SUFFIX, 'rb') as f:
+            version, cached_checksum, data = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return False, None
+    if version != FORMAT_VERSION or cached_checksum != checksum:
+        return False, None
+    return True, data
+
+
+def _write_cache(path: str, checksum: str, data: Any):
+    """파싱 결과 캐시 저장 (실패해도 무시)"""
+    try:
+        payload = marshal.dumps((FORMAT_VERSION, checksum, data))
+        atomic_write_bytes(path + CACHE_SUFFIX, payload, durable=False)
+    except (OSError, ValueError) as e:
+        logger.debug(f"캐시 저장 건너뜀 ({path}): {e}")
+
+
+def _quarantine(path: str):
+    """손상된 파일을 '.corrupt'로 옮겨 보관"""
+    try:
+        os.replace(path, path + CORRUPT_SUFFIX)
+        logger.error(f"손상된 파일을 보관함: {path + CORRUPT_SUFFIX}")
+    except OSError as e:
+        logger.error(f"손상된 파일 보관 실패 ({path}): {e}")
+
+
+def read_checked_json(path: str, default: Any = None, use_cache: bool = True) -> Any:
+    """
+    체크섬을 확인하며 JSON 데이터 불러오기
+
+    Args:
+        path: 파일 경로
+        default: 파일이 없거나 비어 있을 때 돌려줄 값
+        use_cache: 파싱 결과 캐시 사용 여부
+
+    Returns:
+        데이터
+
+    Raises:
+        ChecksumError: 체크섬이나 머리줄이 맞지 않을 때 (파일은 '.corrupt'로 옮겨짐)
+        ValueError: 지원하지 않는 형식 버전이거나 JSON을 읽을 수 없을 때
+    """
+    if not os.path.exists(path):
+        return default
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if not raw.strip():
+        return default
+
+    try:
+        version, checksum, body = _split_header(raw)
+    except ChecksumError:
+        _quarantine(path)
+        raise
+
+    if version is None:
+        # 예전 형식 (머리줄 없음)
+        return json.loads(body.decode('utf-8'))
+    if version > FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 파일 버전입니다: {version}")
+    if _checksum(body) != checksum:
+        _quarantine(path)
+        raise ChecksumError(f"파일 체크섬이 맞지 않습니다: {path}")
+
+    if use_cache:
+        hit, data = _read_cache(path, checksum)
+        if hit:
+            return data
+
+    data = json.loads(body.decode('utf-8'))
+    if use_cache:
+        _write_cache(path, checksum, data)
+    return data
@@ -0,0 +1,78 @@
+"""
+파일 잠금 모듈
+여러 프로세스(Streamlit 워커 등)가 같은 저장 파일을 동시에 고치지 않도록 권고 잠금(fcntl.flock)을 겁니다.
+
+잠금은 '<경로>.lock' 파일에 걸고, 같은 프로세스 안의 스레드끼리는 스레드 잠금으로도 막습니다.
+같은 스레드가 다시 잡으면 바로 통과합니다 (재진입). fcntl이 없는 환경(Windows)에서는
+프로세스 안의 스레드 잠금만 적용됩니다.
+"""
+import os
+import threading
+from typing import Optional
+from ..utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = get_logger()
+
+# 잠금 파일 확장자
+LOCK_SUFFIX = '.lock'
+
+
+class FileLock:
+    """프로세스 간 배타 잠금 클래스 (with 문으로 사용)"""
+
+    def __init__(self, path: str):
+        """
+        초기화
+
+        Args:
+            path: 보호할 파일 또는 디렉토리 경로 (잠금 파일은 경로 + '.lock')
+        """
+        self.path = path + LOCK_SUFFIX
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self):
+        """잠금 획득 (다른 프로세스가 잡고 있으면 풀릴 때까지 기다림)"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except OSError:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """잠금 해제"""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    @property
+    def locked(self) -> bool:
+        """이 객체가 잠금을 잡고 있는지 여부"""
+        return self._depth > 0
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,216 @@
+"""
+ID 색인 목록 모듈
+추가한 순서를 유지하는 목록과 ID → 위치 사전을 함께 두어 ID로 찾기, 수정, 삭제를 O(1)에 합니다.
+
+삭제는 목록에서 빼지 않고 그 자리를 None(묘비)으로 표시만 합니다. 묘비가 살아 있는
+항목 수만큼 쌓이면 한 번에 목록을 다시 만들어(압축) 분할 상환 O(1)을 유지합니다.
+누적 집계(RunningTotals)를 붙이면 추가/수정/삭제 때 함께 갱신합니다.
+"""
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+from .aggregates import RunningTotals
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+T = TypeVar('T')
+
+# 묘비가 이 개수 이상이면서 살아 있는 항목 수 이상일 때 압축
+TOMBSTONE_COMPACT_MIN = 64
+
+
+def unique_id(base: str, taken: Callable[[str], bool]) -> str:
+    """
+    겹치지 않는 ID 만들기
+
+    Args:
+        base: 기본 ID (예: '대수_20260101120000')
+        taken: 이미 쓰이는 ID인지 확인하는 함수
+
+    Returns:
+        base가 쓰이지 않았으면 그대로, 아니면 base_2, base_3, ...
+    """
+    if not taken(base):
+        return base
+    n = 2
+    while taken(f"{base}_{n}"):
+        n += 1
+    return f"{base}_{n}"
+
+
+class IndexedList(Generic[T]):
+    """ID 색인과 묘비 삭제를 지원하는 순서 목록 클래스"""
+
+    def __init__(
+        self,
+        entries: Iterable[T] = (),
+        key: Callable[[T], str] = lambda entry: entry.id,
+        totals: Optional[RunningTotals] = None
+    ):
+        """
+        초기화
+
+        Args:
+            entries: 초기 항목 (오래된 것부터, ID가 겹치면 나중 항목이 앞 항목 자리를 대신함)
+            key: 항목의 ID를 돌려주는 함수
+            totals: 함께 갱신할 누적 집계 (None이면 집계 안 함)
+        """
+        self._key = key
+        self.totals = totals
+        if totals is not None:
+            totals.reset()
+        self._slots: List[Optional[T]] = []
+        self._positions: Dict[str, int] = {}
+        self._dead = 0
+        for entry in entries:
+            self.put(entry)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._positions
+
+    def __iter__(self) -> Iterator[T]:
+        """오래된 것부터 살아 있는 항목"""
+        return iter(self.items())
+
+    def get(self, entry_id: str) -> Optional[T]:
+        """
+        ID로 항목 찾기
+
+        Args:
+            entry_id: 항목 ID
+
+        Returns:
+            항목 (없으면 None)
+        """
+        position = self._positions.get(entry_id)
+        return None if position is None else self._slots[position]
+
+    def put(self, entry: T) -> bool:
+        """
+        항목 추가 (같은 ID가 있으면 그 자리에서 교체)
+
+        Args:
+            entry: 항목
+
+        Returns:
+            새로 추가했으면 True, 교체했으면 False
+        """
+        entry_id = self._key(entry)
+        position = self._positions.get(entry_id)
+        if self.totals is not None:
+            if position is not None:
+                self.totals.remove(self._slots[position])
+            self.totals.add(entry)
+        if position is not None:
+            self._slots[position] = entry
+            return False
+        self._positions[entry_id] = len(self._slots)
+        self._slots.append(entry)
+        return True
+
+    def update(self, entry_id: str, **changes) -> Optional[T]:
+        """
+        항목 속성 고치기 (누적 집계도 함께 갱신)
+
+        Args:
+            entry_id: 항목 ID
+            **changes: 바꿀 속성과 값 (예: mastered=True)
+
+        Returns:
+            고친 항목 (없으면 None)
+        """
+        entry = self.get(entry_id)
+        if entry is None:
+            return None
+        if self.totals is not None:
+            self.totals.remove(entry)
+        for name, value in changes.items():
+            setattr(entry, name, value)
+        if self.totals is not None:
+            self.totals.add(entry)
+        return entry
+
+    def remove(self, entry_id: str) -> Optional[T]:
+        """
+        항목 삭제 (자리는 묘비로 남김)
+
+        Args:
+            entry_id: 항목 ID
+
+        Returns:
+            삭제한 항목 (없으면 None)
+        """
+        position = self._positions.pop(entry_id, None)
+        if position is None:
+            return None
+        entry = self._slots[position]
+        self._slots[position] = None
+        self._dead += 1
+        if self.totals is not None:
+            self.totals.remove(entry)
+        if self._dead >= TOMBSTONE_COMPACT_MIN and self._dead >= len(self._positions):
+            self.compact()
+        return entry
+
+    def retain(self, keep: Callable[[T], bool]) -> int:
+        """
+        조건에 맞는 항목만 남기기
+
+        Args:
+            keep: 남길 항목이면 True를 돌려주는 함수
+
+        Returns:
+            삭제한 항목 수
+        """
+        before = len(self._positions)
+        self._rebuild([entry for entry in self.items() if keep(entry)])
+        return before - len(self._positions)
+
+    def clear(self):
+        """모든 항목 삭제"""
+        self._rebuild([])
+
+    def compact(self):
+        """묘비를 치우고 목록 다시 만들기"""
+        if self._dead:
+            logger.debug(f"ID 색인 목록 압축: 묘비 {self._dead}개")
+            self._rebuild(self.items(), recount=False)
+
+    def _rebuild(self, entries: List[T], recount: bool = True):
+        """살아 있는 항목만으로 목록과 색인 다시 만들기 (항목이 그대로면 recount=False)"""
+        self._slots = list(entries)
+        self._positions = {self._key(entry): i for i, entry in enumerate(self._slots)}
+        self._dead = 0
+        if recount and self.totals is not None:
+            self.totals.reset(self._slots)
+
+    def items(self) -> List[T]:
+        """
+        살아 있는 항목 목록 (오래된 것부터)
+
+        Returns:
+            새 목록 (고쳐도 원본에 영향 없음)
+        """
+        return [entry for entry in self._slots if entry is not None]
+
+    def newest(self, limit: Optional[int] = None) -> List[T]:
+        """
+        최근 항목부터 (묘비는 건너뜀)
+
+        Args:
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            항목 목록 (최신순)
+        """
+        if limit is None:
+            return [entry for entry in reversed(self._slots) if entry is not None]
+        result: List[T] = []
+        for entry in reversed(self._slots):
+            if len(result) >= limit:
+                break
+            if entry is not None:
+                result.append(entry)
+        return result
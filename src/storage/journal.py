@@ -0,0 +1,149 @@
+"""
+추가 전용 저널 모듈
+변경 사항을 JSON Lines 파일 끝에 한 줄씩 덧붙이고, 일정 개수가 쌓이면
+전체 상태를 스냅샷 파일로 압축(compaction)합니다.
+
+불러올 때는 스냅샷을 읽은 뒤 저널 기록을 순서대로 다시 적용(replay)합니다.
+기록은 모두 "결과 값"을 담도록(예: 토글 후의 즐겨찾기 값) 만들어 같은 기록을 두 번
+적용해도 결과가 같으므로, 스냅샷을 쓴 직후 저널을 비우기 전에 멈춰도 안전합니다.
+"""
+import json
+import os
+from typing import Any, Dict, List, Tuple
+from .checked_json import read_checked_json, write_checked_json
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 저널 파일 확장자 (스냅샷 경로 뒤에 붙임)
+JOURNAL_SUFFIX = '.log'
+
+# 기본 압축 기준 (저널 기록 수)
+DEFAULT_COMPACT_THRESHOLD = 500
+
+
+class JournalStore:
+    """스냅샷 + 추가 전용 저널 저장소 클래스"""
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        use_cache: bool = True
+    ):
+        """
+        초기화
+
+        Args:
+            snapshot_path: 스냅샷(체크섬 JSON) 파일 경로 (저널은 같은 경로 + '.log')
+            compact_threshold: 이 개수만큼 기록이 쌓이면 압축
+            use_cache: 스냅샷 파싱 결과 캐시 사용 여부
+
+        Raises:
+            ValueError: 압축 기준이 1보다 작을 때
+        """
+        if compact_threshold < 1:
+            raise ValueError("압축 기준은 1 이상이어야 합니다.")
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.use_cache = use_cache
+        self.pending = 0  # 마지막 압축 이후 저널 기록 수
+        logger.info(f"저널 저장소 초기화: {self.journal_path}")
+
+    def load(self, default: Any = None) -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        스냅샷과 저널 기록 불러오기
+
+        저널 마지막 줄이 쓰다 만 상태(프로세스 중단)이면 그 줄을 파일에서 잘라내고 버립니다.
+
+        Args:
+            default: 스냅샷이 없거나 읽을 수 없을 때 쓸 값
+
+        Returns:
+            (스냅샷 데이터, 저널 기록 목록)
+        """
+        snapshot = default
+        try:
+            snapshot = read_checked_json(self.snapshot_path, default, self.use_cache)
+        except (OSError, ValueError) as e:
+            logger.error(f"스냅샷 불러오기 실패: {e}")
+
+        records: List[Dict[str, Any]] = []
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb+') as f:
+                data = f.read()
+                # 줄바꿈으로 끝나지 않은 마지막 줄은 쓰다 만 기록이므로 잘라냄
+                # (남겨 두면 다음 기록이 그 뒤에 이어 붙어 함께 버려짐)
+                end = data.rfind(b'\n') + 1
+                if end < len(data):
+                    logger.warning(f"저널 마지막 줄이 완전하지 않아 잘라냄: {len(data) - end}바이트")
+                    f.truncate(end)
+                    data = data[:end]
+            for line_no, line in enumerate(data.decode('utf-8', errors='replace').splitlines(), 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"저널 {line_no}번째 줄을 읽을 수 없어 건너뜀")
+
+        self.pending = len(records)
+        logger.debug(f"저널 불러오기: 기록 {len(records)}개")
+        return snapshot, records
+
+    def append(self, record: Dict[str, Any]):
+        """
+        기록 한 줄 덧붙이기
+
+        Args:
+            record: JSON으로 바꿀 수 있는 기록 (예: {'op': 'add', ...})
+        """
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]):
+        """
+        기록 여러 줄을 한 번에 덧붙이기
+
+        Args:
+            records: 기록 목록
+        """
+        if not records:
+            return
+        lines = ''.join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+            for record in records
+        )
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+        self.pending += len(records)
+
+    @property
+    def needs_compaction(self) -> bool:
+        """압축 기준에 도달했는지 여부"""
+        return self.pending >= self.compact_threshold
+
+    def compact(self, snapshot: Any):
+        """
+        현재 상태를 스냅샷으로 쓰고 저널 비우기
+
+        스냅샷은 체크섬과 함께 임시 파일에 쓴 뒤 이름을 바꿔 교체하므로 도중에 멈춰도
+        이전 스냅샷 + 저널이 그대로 남습니다.
+
+        Args:
+            snapshot: 전체 상태 (JSON으로 바꿀 수 있는 값)
+        """
+        write_checked_json(self.snapshot_path, snapshot)
+
+        # 스냅샷에 모두 반영되었으므로 저널 비우기
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+        logger.info(f"저널 압축 완료: 기록 {self.pending}개 → 스냅샷")
+        self.pending = 0
+
+    def remove(self):
+        """저널 파일 삭제 (스냅샷은 그대로)"""
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.pending = 0
@@ -0,0 +1,124 @@
+"""
+레코드 파일 모듈
+레코드를 JSON 한 줄씩 파일 끝에 덧붙이고, (위치, 길이)로 mmap에서 필요한 레코드만 읽습니다.
+
+위치 색인은 이 파일에 두지 않고 사용하는 쪽(예: 페이지 단위 히스토리 저장소)이 보관합니다.
+레코드를 읽을 때 파일 전체를 파싱하지 않으므로 기록이 늘어도 조회 비용은 읽는 레코드 수에만 비례합니다.
+"""
+import mmap
+import os
+from typing import List, Optional, Tuple
+from .atomic import atomic_write_bytes
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 레코드 파일 확장자
+PAGES_SUFFIX = '.pages'
+
+
+def paged_base(path: str) -> str:
+    """
+    페이지 저장 파일들의 공통 경로 (확장자 제외)
+
+    Args:
+        path: JSON 저장 경로 (예: data/history.json)
+
+    Returns:
+        공통 경로 (예: data/history)
+    """
+    return os.path.splitext(path)[0]
+
+
+class RecordFile:
+    """덧붙이기 전용 레코드 파일 클래스"""
+
+    def __init__(self, path: str):
+        """
+        초기화 (파일이 없으면 만듦)
+
+        Args:
+            path: 레코드 파일 경로
+        """
+        self.path = path
+        self._writer = open(path, 'ab')
+        self._reader = open(path, 'rb')
+        self._mm: Optional[mmap.mmap] = None
+        logger.debug(f"레코드 파일 열기: {path}")
+
+    @property
+    def size(self) -> int:
+        """파일 크기 (바이트)"""
+        return self._writer.tell()
+
+    def append(self, payloads: List[bytes]) -> List[Tuple[int, int]]:
+        """
+        레코드 덧붙이기
+
+        Args:
+            payloads: 레코드 내용 목록 (줄바꿈으로 끝나야 함)
+
+        Returns:
+            각 레코드의 (위치, 길이)
+        """
+        spans = []
+        offset = self._writer.seek(0, os.SEEK_END)
+        for payload in payloads:
+            spans.append((offset, len(payload)))
+            offset += len(payload)
+        self._writer.write(b''.join(payloads))
+        self._writer.flush()
+        return spans
+
+    def read(self, offset: int, length: int) -> bytes:
+        """
+        레코드 하나 읽기 (mmap 사용, 매핑 뒤에 덧붙인 레코드면 다시 매핑)
+
+        Args:
+            offset: 위치
+            length: 길이
+
+        Returns:
+            레코드 내용
+        """
+        end = offset + length
+        if self._mm is None or end > len(self._mm):
+            self._remap()
+        return self._mm[offset:end]
+
+    def _remap(self):
+        """파일 전체를 다시 매핑"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        size = os.fstat(self._reader.fileno()).st_size
+        if size:
+            self._mm = mmap.mmap(self._reader.fileno(), size, access=mmap.ACCESS_READ)
+
+    def copy_to(self, path: str, spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        레코드 일부만 새 파일에 원자적으로 복사 (압축용, 파싱하지 않음)
+
+        Args:
+            path: 새 파일 경로
+            spans: 복사할 (위치, 길이) 목록
+
+        Returns:
+            새 파일에서의 (위치, 길이) 목록
+        """
+        chunks = [self.read(offset, length) for offset, length in spans]
+        new_spans = []
+        offset = 0
+        for chunk in chunks:
+            new_spans.append((offset, len(chunk)))
+            offset += len(chunk)
+        atomic_write_bytes(path, b''.join(chunks))
+        return new_spans
+
+    def close(self):
+        """파일 닫기"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._writer.close()
+        self._reader.close()
@@ -0,0 +1,147 @@
+"""
+SQLite 저장소 모듈
+표준 라이브러리 sqlite3를 WAL 모드로 열어 학습 기능 데이터를 색인된 테이블에 저장합니다.
+
+WAL 모드에서는 읽기와 쓰기가 서로 막지 않고, 변경 하나가 파일 전체를 다시 쓰지 않고
+해당 행만 기록합니다. 테이블 구조(스키마)는 각 관리자 클래스가 정합니다.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# 잠금 대기 시간 (초)
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+
+def sqlite_path(storage_path: str) -> str:
+    """
+    JSON 저장 경로에 대응하는 데이터베이스 경로 (예: data/history.json → data/history.db)
+
+    Args:
+        storage_path: JSON 저장 경로
+
+    Returns:
+        .db 경로
+    """
+    return os.path.splitext(storage_path)[0] + '.db'
+
+
+class SQLiteStore:
+    """WAL 모드 SQLite 연결 관리 클래스"""
+
+    def __init__(self, db_path: str, schema: str = '', timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """
+        초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로 (':memory:'이면 메모리)
+            schema: 처음 열 때 실행할 CREATE TABLE/INDEX 문 (IF NOT EXISTS 사용)
+            timeout: 다른 연결이 잠그고 있을 때 기다릴 시간 (초)
+        """
+        self.db_path = db_path
+        if db_path != ':memory:':
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # Streamlit은 세션마다 다른 스레드에서 실행되므로 연결을 공유하고 잠금으로 보호
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        if schema:
+            with self.transaction() as conn:
+                conn.executescript(schema)
+        logger.info(f"SQLite 저장소 초기화: {db_path}")
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        트랜잭션 (블록이 끝나면 커밋, 예외가 나면 롤백)
+
+        Args:
+            immediate: 시작할 때 쓰기 잠금을 잡음 (BEGIN IMMEDIATE)
+                - 읽고 고쳐 쓰는 블록에서 사용하면 다른 프로세스의 쓰기와 섞이지 않음
+
+        Yields:
+            sqlite3 연결
+        """
+        with self._lock:
+            try:
+                if immediate:
+                    self._conn.execute('BEGIN IMMEDIATE')
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """
+        변경 문 하나 실행 후 커밋
+
+        Args:
+            sql: SQL 문
+            params: 매개변수
+
+        Returns:
+            변경된 행 수
+        """
+        with self.transaction() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        같은 변경 문을 여러 행에 실행 후 한 번에 커밋
+
+        Args:
+            sql: SQL 문
+            rows: 행별 매개변수
+
+        Returns:
+            변경된 행 수
+        """
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """
+        조회 문 실행
+
+        Args:
+            sql: SQL 문
+            params: 매개변수
+
+        Returns:
+            행 목록 (열 이름으로 접근 가능)
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """조회 결과의 첫 행 (없으면 None)"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def query_plan(self, sql: str, params: Sequence[Any] = ()) -> str:
+        """
+        조회 계획 (색인 사용 여부 확인용)
+
+        Returns:
+            EXPLAIN QUERY PLAN 결과를 이은 문자열
+        """
+        rows = self.query('EXPLAIN QUERY PLAN ' + sql, params)
+        return ' | '.join(row['detail'] for row in rows)
+
+    def close(self):
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+        logger.info(f"SQLite 저장소 닫기: {self.db_path}")
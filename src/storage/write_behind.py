@@ -0,0 +1,224 @@
+"""
+지연 쓰기(write-behind) 모듈
+관리자 객체의 저장 요청을 바로 디스크에 쓰지 않고 모아 두었다가 백그라운드 스레드에서 씁니다.
+
+같은 객체의 저장 요청이 여러 번 들어오면 한 번의 저장으로 합쳐집니다. 저장은
+첫 요청 후 일정 시간이 지나거나, 쌓인 요청이 기준 개수를 넘거나, flush()를 부르거나,
+프로세스가 끝날 때 일어납니다. 그래서 사용자 요청 처리 시간에 디스크 쓰기가 포함되지 않습니다.
+저장 함수가 예외를 내면 요청을 다시 대기열에 넣어 다음 주기에 재시도합니다.
+"""
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from ..utils.config import get_config
+from ..utils.logger import get_logger
+
+logger = get_logger()
+config = get_config()
+
+# 기본 저장 주기 (초)
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# 이만큼 요청이 쌓이면 주기를 기다리지 않고 저장
+DEFAULT_MAX_PENDING = 50
+
+
+@dataclass
+class _Pending:
+    """저장 대기 중인 객체"""
+    path: str
+    save: Callable[[], None]
+    count: int
+    since: float
+
+
+class WriteBehind:
+    """지연 쓰기 관리 클래스"""
+
+    def __init__(self, interval: float = DEFAULT_FLUSH_INTERVAL, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        초기화
+
+        Args:
+            interval: 첫 요청 후 저장까지 기다릴 시간 (초)
+            max_pending: 한 객체에 이만큼 요청이 쌓이면 바로 저장
+
+        Raises:
+            ValueError: 설정 값이 올바르지 않을 때
+        """
+        if interval <= 0:
+            raise ValueError("저장 주기는 0보다 커야 합니다.")
+        if max_pending < 1:
+            raise ValueError("저장 기준 요청 수는 1 이상이어야 합니다.")
+
+        self.interval = interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # 저장 함수는 한 번에 하나씩 실행 (같은 파일을 두 스레드가 동시에 쓰지 않도록)
+        self._save_lock = threading.Lock()
+        self._pending: Dict[Tuple[str, int], _Pending] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {'scheduled': 0, 'saves': 0, 'coalesced': 0, 'errors': 0}
+        logger.info(f"지연 쓰기 초기화 (주기: {interval}초, 기준: {max_pending}개)")
+
+    def schedule(self, owner: Any, path: str, save: Callable[[], None]):
+        """
+        저장 요청 (같은 객체의 요청은 한 번의 저장으로 합쳐짐)
+
+        Args:
+            owner: 저장할 상태를 가진 객체
+            path: 저장 파일 경로 (flush(path)로 이 파일의 대기 요청만 저장할 때 사용)
+            save: 저장 함수 (현재 상태 전체를 씀)
+        """
+        if self._closed:
+            save()
+            return
+
+        key = (path, id(owner))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _Pending(path, save, 0, time.monotonic())
+            pending.save = save
+            pending.count += 1
+            self._stats['scheduled'] += 1
+            urgent = pending.count >= self.max_pending
+
+        self._ensure_thread()
+        if urgent:
+            self._wakeup.set()
+
+    def _ensure_thread(self):
+        """백그라운드 스레드 시작 (처음 요청할 때)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """주기적으로 기한이 된 요청 저장"""
+        while not self._closed:
+            self._wakeup.wait(self.interval / 2)
+            self._wakeup.clear()
+            now = time.monotonic()
+            self._flush_where(
+                lambda p: p.count >= self.max_pending or now - p.since >= self.interval
+            )
+
+    def _flush_where(self, due: Callable[[_Pending], bool]) -> int:
+        """조건에 맞는 대기 요청 저장 (실패한 요청은 다시 대기열에 넣음)"""
+        saved = 0
+        with self._save_lock:
+            with self._lock:
+                keys = [key for key, pending in self._pending.items() if due(pending)]
+                batch = [(key, self._pending.pop(key)) for key in keys]
+
+            for key, pending in batch:
+                try:
+                    pending.save()
+                    self._stats['saves'] += 1
+                    self._stats['coalesced'] += pending.count - 1
+                    saved += 1
+                except Exception as e:
+                    self._stats['errors'] += 1
+                    logger.error(f"지연 쓰기 저장 실패, 다음 주기에 재시도 ({pending.path}): {e}")
+                    self._requeue(key, pending)
+        if saved:
+            logger.debug(f"지연 쓰기: {saved}개 저장")
+        return saved
+
+    def _requeue(self, key: Tuple[str, int], failed: _Pending):
+        """저장에 실패한 요청을 대기열에 되돌리기 (그 사이 새 요청이 있으면 합침)"""
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                # 기한을 지금부터 다시 세어 실패한 저장을 매 주기마다 반복하지 않음
+                failed.since = time.monotonic()
+                self._pending[key] = failed
+            else:
+                pending.count += failed.count
+
+    def flush(self, path: Optional[str] = None) -> int:
+        """
+        대기 중인 요청을 지금 저장
+
+        Args:
+            path: 이 파일의 요청만 저장 (None이면 전체)
+
+        Returns:
+            저장한 객체 수 (실패한 객체는 대기열에 남음)
+        """
+        return self._flush_where(lambda p: path is None or p.path == path)
+
+    def discard(self, path: Optional[str] = None) -> int:
+        """
+        대기 중인 요청을 저장하지 않고 버리기
+
+        Args:
+            path: 이 파일의 요청만 버림 (None이면 전체)
+
+        Returns:
+            버린 객체 수
+        """
+        with self._lock:
+            keys = [key for key, p in self._pending.items() if path is None or p.path == path]
+            for key in keys:
+                del self._pending[key]
+        return len(keys)
+
+    def pending_count(self, path: Optional[str] = None) -> int:
+        """저장 대기 중인 객체 수"""
+        with self._lock:
+            return sum(1 for p in self._pending.values() if path is None or p.path == path)
+
+    def close(self):
+        """스레드를 멈추고 남은 요청 모두 저장 (이후 요청은 바로 저장)"""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+        unsaved = self.pending_count()
+        if unsaved:
+            logger.error(f"지연 쓰기 종료: {unsaved}개 객체를 저장하지 못함")
+        logger.info("지연 쓰기 종료")
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        통계
+
+        Returns:
+            요청 수, 실제 저장 수, 합쳐진 요청 수, 실패 수, 대기 중인 객체 수
+        """
+        stats = dict(self._stats)
+        stats['pending'] = self.pending_count()
+        return stats
+
+
+# 전역 지연 쓰기 인스턴스
+_write_behind: Optional[WriteBehind] = None
+_write_behind_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehind:
+    """
+    지연 쓰기 인스턴스 반환 (프로세스가 끝날 때 남은 요청을 저장하도록 등록)
+
+    Returns:
+        WriteBehind 인스턴스
+    """
+    global _write_behind
+    with _write_behind_lock:
+        if _write_behind is None:
+            _write_behind = WriteBehind(
+                interval=config.get('storage.flush_interval', DEFAULT_FLUSH_INTERVAL),
+                max_pending=config.get('storage.flush_max_pending', DEFAULT_MAX_PENDING)
+            )
+            atexit.register(_write_behind.close)
+    return _write_behind
@@ -4,16 +4,44 @@
 """
 import streamlit as st
 from datetime import datetime
+from typing import Dict, Optional
 from ..features import (
     PracticeGenerator,
-    MistakeNotes,
-    ProgressTracker,
-    HistoryManager
+    ProgressVisualizer,
+    get_user_stores,
+    get_shared_store
 )
+from ..features.user_stores import USER_ID_PATTERN, SESSION_PREFIX, new_session_id
+from ..utils.config import get_config
 from ..utils.logger import get_logger
 from .themes import ThemeManager
 
 logger = get_logger()
+config = get_config()
+
+
+def _current_user_id() -> Optional[str]:
+    """
+    사용자별 저장소에 쓸 현재 사용자 ID
+
+    주소의 ?user= 값은 인증되지 않아 누구나 다른 사용자의 ID를 넣을 수 있으므로,
+    storage.users.trust_query_param을 켠 경우에만 사용합니다. 세션 ID 저장소는 새로 고치면
+    다시 쓰이지 않고 session_ttl_hours가 지나면 삭제됩니다.
+
+    Returns:
+        세션마다 만든 ID (trust_query_param이 켜져 있으면 ?user= 값 우선), 설정이 꺼져 있으면 None
+    """
+    if not config.get('storage.users.enabled', False):
+        return None
+    if 'user_id' not in st.session_state:
+        user_id = None
+        if config.get('storage.users.trust_query_param', False):
+            user_id = st.query_params.get('user')
+        # 세션 ID 형식의 이름은 정리 대상이므로 받지 않음
+        if not user_id or not USER_ID_PATTERN.fullmatch(user_id) or user_id.startswith(SESSION_PREFIX):
+            user_id = new_session_id()
+        st.session_state['user_id'] = user_id
+    return st.session_state['user_id']
 
 
 class PracticePage:
@@ -121,7 +149,8 @@ class MistakeNotesPage:
 
     def __init__(self):
         """초기화"""
-        self.notes = MistakeNotes()
+        user_id = _current_user_id()
+        self.notes = get_user_stores().mistakes(user_id) if user_id else get_shared_store('mistakes')
         logger.info("오답 노트 페이지 초기화")
 
     def render(self):
@@ -190,7 +219,7 @@ class MistakeNotesPage:
 
         # 목록 가져오기
         if filter_topic == "전체":
-            mistakes = self.notes.get_unmastered_mistakes() if not show_mastered else self.notes.mistakes
+            mistakes = self.notes.get_unmastered_mistakes() if not show_mastered else self.notes.get_all_mistakes()
         else:
             mistakes = self.notes.get_mistakes_by_topic(filter_topic)
             if not show_mastered:
@@ -279,7 +308,9 @@ class ProgressPage:
 
     def __init__(self):
         """초기화"""
-        self.tracker = ProgressTracker()
+        user_id = _current_user_id()
+        self.tracker = get_user_stores().progress(user_id) if user_id else get_shared_store('progress')
+        self.visualizer = ProgressVisualizer()
         logger.info("학습 진도 페이지 초기화")
 
     def render(self):
@@ -333,12 +364,22 @@ class ProgressPage:
         """주제별 진도 탭"""
         st.subheader("주제별 학습 진도")
 
-        if not self.tracker.topic_progress:
+        all_progress = self.tracker.get_all_progress()
+        if not all_progress:
             st.info("아직 학습 기록이 없습니다. 문제를 풀어보세요!")
             return
 
+        # 주제별 풀이/정답 비교 차트 (캐시, 작업자 풀 사용)
+        topics = list(all_progress)
+        st.image(self.visualizer.render_chart(
+            'create_topic_comparison_chart',
+            topics,
+            [all_progress[topic].problems_attempted for topic in topics],
+            [all_progress[topic].problems_correct for topic in topics]
+        ))
+
         # 주제 목록
-        for topic, progress in self.tracker.topic_progress.items():
+        for topic, progress in all_progress.items():
             with st.container():
                 # 헤더
                 col1, col2 = st.columns([3, 1])
@@ -376,6 +417,13 @@ class ProgressPage:
             st.info("기록된 세션이 없습니다.")
             return
 
+        # 날짜별 풀이 수 히트맵 (캐시, 작업자 풀 사용)
+        daily: Dict[str, int] = {}
+        for session in self.tracker.sessions:
+            day = session.start_time[:10]
+            daily[day] = daily.get(day, 0) + session.problems_solved
+        st.image(self.visualizer.render_chart('create_weekly_heatmap', daily))
+
         for session in sessions:
             with st.container():
                 col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
@@ -398,7 +446,8 @@ class HistoryPage:
 
     def __init__(self):
         """초기화"""
-        self.manager = HistoryManager()
+        user_id = _current_user_id()
+        self.manager = get_user_stores().history(user_id) if user_id else get_shared_store('history')
         logger.info("계산 히스토리 페이지 초기화")
 
     def render(self):
@@ -440,7 +489,9 @@ class HistoryPage:
         elif filter_type != "전체":
             history = self.manager.get_history_by_type(filter_type)
         else:
-            history = self.manager.get_recent_history(limit=limit)
+            # 한 페이지(limit개)만 조회
+            page = st.number_input("페이지", min_value=1, value=1, step=1)
+            history = self.manager.get_recent_history(limit=limit, offset=(int(page) - 1) * limit)
 
         if not history:
             st.info("📭 계산 기록이 없습니다.")
@@ -21,12 +21,59 @@ from ..calculators.probability import ProbabilityCalculator
 from ..calculators.geometry import GeometryCalculator
 from ..calculators.coordinate import CoordinateCalculator
 from .feature_pages import PracticePage, MistakeNotesPage, ProgressPage, HistoryPage
+from ..rendering.cache import render_spec_image
+from ..rendering.backends import render_plotly
+from ..rendering.spec import PlotSpec
 from ..utils.logger import get_logger
 from ..utils.config import get_config
 
 logger = get_logger()
 config = get_config()
 
+# Optional: 대화형 그래프 (plotly 설치 시에만 사용 가능)
+try:
+    import plotly  # noqa: F401
+    _PLOTLY_AVAILABLE = True
+except ImportError:
+    _PLOTLY_AVAILABLE = False
+
+
+def interactive_toggle(key: str) -> bool:
+    """
+    대화형 그래프 모드 선택 스위치
+
+    Args:
+        key: 위젯 키 (페이지/탭마다 다르게)
+
+    Returns:
+        대화형 모드 사용 여부 (plotly가 없으면 항상 False)
+    """
+    if not _PLOTLY_AVAILABLE:
+        return False
+    return st.toggle(
+        "🖱️ 대화형 그래프 (브라우저에서 확대/이동)",
+        value=config.get('ui.interactive_graphs', True),
+        key=key
+    )
+
+
+def show_spec(spec: PlotSpec, interactive: bool = False) -> None:
+    """
+    그래프 명세 표시
+
+    대화형 모드에서는 샘플링된 좌표만 담은 Plotly 그래프를 보내 브라우저에서 그리므로
+    확대/이동에 서버가 다시 렌더링하지 않습니다. 아니면 명세 해시로 캐시된 PNG를 표시합니다.
+
+    Args:
+        spec: 그래프 명세
+        interactive: 대화형 모드 여부
+    """
+    theme = st.session_state.get('theme', 'light')
+    if interactive and _PLOTLY_AVAILABLE:
+        st.plotly_chart(render_plotly(spec, theme=theme), use_container_width=True)
+    else:
+        st.image(render_spec_image(spec, theme=theme))
+
 
 class PrimeFactorPage:
     """소인수분해 페이지"""
@@ -211,17 +258,19 @@ class FunctionGraphPage:
         else:
             st.latex(f"y = \\frac{{{a_val}}}{{x}}")
 
+        interactive = interactive_toggle("fg_interactive")
+
         # 실행 버튼
         if st.button("📈 그래프 그리기", type="primary"):
             try:
                 # 함수 종류에 따라 그래프 그리기
                 if "정비례" in func_type:
-                    fig = self.drawer.draw_proportional(a_val, x_range)
+                    kind = 'proportional'
                 else:
-                    fig = self.drawer.draw_inverse_proportional(a_val, x_range)
+                    kind = 'inverse'
 
                 # 그래프 표시
-                st.pyplot(fig)
+                show_spec(self.drawer.function_spec(kind, a_val, x_range), interactive)
 
                 # 함수 설명
                 with st.expander("📚 함수 설명 보기"):
@@ -1017,10 +1066,11 @@ class LinearFunctionPage:
         # 함수식 표시
         st.latex(f"y = {a}x + {b}")
 
+        interactive = interactive_toggle("graph_interactive")
+
         if st.button("📈 그래프 그리기", type="primary", key="draw_graph"):
             try:
-                fig = self.drawer.draw(a, b, x_range)
-                st.pyplot(fig)
+                show_spec(self.drawer.graph_spec(a, b, x_range), interactive)
 
                 # 함수 설명
                 with st.expander("📚 일차함수 설명"):
@@ -1672,10 +1722,11 @@ class QuadraticFunctionPage:
 
         st.latex(expr)
 
+        interactive = interactive_toggle("qf_interactive")
+
         if st.button("📈 그래프 그리기", type="primary", key="draw_qf"):
             try:
-                fig = self.drawer.draw(a, b, c, x_range)
-                st.pyplot(fig)
+                show_spec(self.drawer.graph_spec(a, b, c, x_range), interactive)
 
                 # 함수 설명
                 with st.expander("📚 이차함수 설명"):
@@ -1774,10 +1825,11 @@ class QuadraticFunctionPage:
             key="cmp_range"
         )
 
+        interactive = interactive_toggle("cmp_interactive")
+
         if st.button("비교 그래프 그리기", type="primary", key="draw_cmp"):
             try:
-                fig = self.drawer.compare_graphs(a1, b1, c1, a2, b2, c2, x_range)
-                st.pyplot(fig)
+                show_spec(self.drawer.compare_spec(a1, b1, c1, a2, b2, c2, x_range), interactive)
 
                 # 비교표
                 with st.expander("📊 특징 비교"):
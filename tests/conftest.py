@@ -11,6 +11,14 @@ sys.path.insert(0, str(project_root))
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def discard_pending_writes():
+    """테스트가 지운 임시 파일을 지연 쓰기가 다시 만들지 않도록 대기 중인 저장 요청 버리기"""
+    from src.storage.write_behind import get_write_behind
+    yield
+    get_write_behind().discard()
+
+
 @pytest.fixture
 def sample_prime_numbers():
     """소수 샘플 데이터"""
@@ -0,0 +1,113 @@
+"""
+누적 집계 테스트
+"""
+import os
+import random
+import tempfile
+from src.features.history_manager import HistoryManager
+from src.features.mistake_notes import MistakeNotes
+from src.features.progress_tracker import ProgressTracker
+from src.storage.aggregates import RunningTotals
+
+
+class TestRunningTotals:
+    """RunningTotals 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.items = [{'kind': 'a', 'score': 1.5}, {'kind': 'b', 'score': 0.0}, {'kind': 'a', 'score': 2.0}]
+        self.totals = RunningTotals(
+            lambda item: {'count': 1, 'score': item['score'], ('kind', item['kind']): 1},
+            self.items
+        )
+
+    def test_add_remove(self):
+        """더하고 빼기, 0이 된 키는 사라짐"""
+        assert self.totals.get('count') == 3
+        assert self.totals.get('score') == 3.5
+        assert self.totals.group('kind') == {'a': 2, 'b': 1}
+
+        self.totals.remove(self.items[1])
+        assert self.totals.group('kind') == {'a': 2}
+        assert self.totals.get('없음', -1) == -1
+
+    def test_verify(self):
+        """재계산과 비교해 어긋나면 바로잡음"""
+        assert self.totals.verify(self.items) is True
+
+        self.items[0]['score'] = 10.0  # 집계를 거치지 않고 직접 수정
+        assert self.totals.verify(self.items, '테스트') is False
+        assert self.totals.get('score') == 12.0
+        assert self.totals.verify(self.items) is True
+
+
+class TestManagerAggregates:
+    """관리자 누적 통계 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rng = random.Random(47)
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_history_statistics(self):
+        """무작위 추가/즐겨찾기/삭제 후에도 누적 통계가 재계산과 같음"""
+        manager = HistoryManager(storage_path=self._path('history.json'), write_behind=False)
+        ids = []
+        for _ in range(200):
+            action = self.rng.random()
+            if action < 0.5 or not ids:
+                calc_type = self.rng.choice(["일차방정식", "통계", "소인수분해"])
+                ids.append(manager.add_calculation(calc_type, {}, {}, []))
+            elif action < 0.8:
+                manager.toggle_favorite(self.rng.choice(ids))
+            else:
+                manager.delete_entry(ids.pop(self.rng.randrange(len(ids))))
+
+        stats = manager.get_statistics()
+        entries = manager.history
+        assert manager._entries.totals.verify(entries) is True
+        assert stats['total_calculations'] == len(entries)
+        assert stats['favorite_count'] == sum(e.is_favorite for e in entries)
+
+        reloaded = HistoryManager(storage_path=self._path('history.json'), write_behind=False)
+        assert reloaded.get_statistics() == stats
+
+    def test_mistake_statistics(self):
+        """무작위 추가/마스터/삭제 후에도 주제별 통계가 재계산과 같음"""
+        notes = MistakeNotes(storage_path=self._path('mistakes.json'), write_behind=False)
+        ids = []
+        for i in range(200):
+            action = self.rng.random()
+            if action < 0.5 or not ids:
+                ids.append(notes.add_mistake(self.rng.choice(["대수", "기하"]), f"문제 {i}", 1, 2))
+            elif action < 0.8:
+                notes.mark_as_mastered(self.rng.choice(ids))
+            else:
+                notes.delete_mistake(ids.pop(self.rng.randrange(len(ids))))
+
+        stats = notes.get_statistics()
+        mistakes = notes.mistakes
+        assert notes._entries.totals.verify(mistakes) is True
+        for topic, counts in stats['topics'].items():
+            in_topic = [m for m in mistakes if m.topic == topic]
+            assert counts == {"total": len(in_topic), "mastered": sum(m.mastered for m in in_topic)}
+
+    def test_progress_statistics(self):
+        """풀이 기록/주제 초기화 후에도 전체 통계가 재계산과 같음"""
+        tracker = ProgressTracker(storage_path=self._path('progress.json'), write_behind=False)
+        for _ in range(100):
+            tracker.record_attempt(self.rng.choice(["대수", "기하", "통계"]), self.rng.random() < 0.6, 1)
+        tracker.reset_topic_progress("기하")
+
+        stats = tracker.get_overall_statistics()
+        progress = tracker.get_all_progress().values()
+        assert tracker._totals.verify(progress) is True
+        assert stats['total_problems_attempted'] == sum(p.problems_attempted for p in progress)
+        assert stats['total_study_time_minutes'] == sum(p.study_time_minutes for p in progress)
@@ -0,0 +1,112 @@
+"""
+매개변수 변화 애니메이션 테스트
+"""
+import io
+import pytest
+import numpy as np
+from PIL import Image
+from src.rendering.animation import SweepAnimation
+from src.rendering.figures import get_figure_manager
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+
+
+class TestSweepAnimation:
+    """애니메이션 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.drawer = QuadraticFunctionDrawer()
+        self.animation = self.drawer.sweep_animation('a', np.linspace(-2, 2, 6))
+
+    def test_frame_count_and_size(self):
+        """프레임 수와 크기"""
+        frames = list(self.animation.iter_frames())
+        assert len(frames) == len(self.animation) == 6
+        assert frames[0].shape == (480, 640, 4)
+        assert frames[0].dtype == np.uint8
+
+    def test_frames_differ(self):
+        """매개변수에 따라 프레임이 달라짐"""
+        frames = list(self.animation.iter_frames())
+        assert not np.array_equal(frames[0], frames[-1])
+
+    def test_blit_matches_full_redraw(self):
+        """블리팅 프레임이 같은 상태를 처음부터 그린 결과와 같음"""
+        last = list(self.animation.iter_frames())[-1]
+        single = SweepAnimation(
+            self.animation.x,
+            self.animation.y_frames[-1:],
+            self.animation.labels[-1:],
+            title=self.animation.title,
+            points=self.animation.points[-1:],
+            xlim=self.animation.xlim,
+            ylim=self.animation.ylim
+        )
+        assert np.array_equal(next(single.iter_frames()), last)
+
+    def test_fixed_axes_limits(self):
+        """모든 프레임을 담도록 y 범위 고정"""
+        lo, hi = self.animation.ylim
+        assert lo <= np.nanmin(self.animation.y_frames)
+        assert hi >= np.nanmax(self.animation.y_frames)
+
+    def test_vertex_hidden_when_linear(self):
+        """a = 0 프레임에는 꼭짓점이 없음"""
+        animation = self.drawer.sweep_animation('a', [-1, 0, 1])
+        assert np.isnan(animation.points[1, 0])
+        assert animation.points[0, 0] == pytest.approx(0.0)
+
+    def test_sweep_other_parameter(self):
+        """b를 바꾸면 꼭짓점 x가 이동"""
+        animation = self.drawer.sweep_animation('b', [-2, 2], a=1)
+        assert animation.points[0, 0] == pytest.approx(1.0)
+        assert animation.points[1, 0] == pytest.approx(-1.0)
+        assert animation.labels == ['b = -2.00', 'b = 2.00']
+
+    def test_invalid_parameter(self):
+        """잘못된 계수 이름"""
+        with pytest.raises(ValueError):
+            self.drawer.sweep_animation('d')
+
+    def test_encode_gif(self):
+        """GIF 인코딩"""
+        data = self.animation.encode('gif', fps=10)
+        image = Image.open(io.BytesIO(data))
+        assert image.format == 'GIF'
+        assert image.n_frames == 6
+
+    def test_encode_apng(self):
+        """APNG 인코딩"""
+        data = self.animation.encode('apng', fps=10)
+        image = Image.open(io.BytesIO(data))
+        assert image.format == 'PNG'
+        assert image.n_frames == 6
+
+    def test_encode_invalid(self):
+        """지원하지 않는 형식과 fps"""
+        with pytest.raises(ValueError):
+            self.animation.encode('mp4')
+        with pytest.raises(ValueError):
+            self.animation.encode('gif', fps=0)
+
+    def test_png_frame_stream(self):
+        """PNG 프레임 스트림"""
+        chunks = list(self.animation.iter_png_frames())
+        assert len(chunks) == 6
+        assert all(chunk.startswith(b'\x89PNG') for chunk in chunks)
+
+    def test_single_figure_reused(self):
+        """애니메이션 전체에 Figure 하나만 만들고 정리"""
+        manager = get_figure_manager()
+        before = manager.get_statistics()
+        list(self.animation.iter_frames())
+        after = manager.get_statistics()
+        assert after['created'] - before['created'] == 1
+        assert after['live'] == before['live']
+
+    def test_shape_mismatch(self):
+        """배열 크기 검증"""
+        with pytest.raises(ValueError):
+            SweepAnimation([0, 1, 2], [[0, 1]], ['a'])
+        with pytest.raises(ValueError):
+            SweepAnimation([0, 1], [[0, 1], [1, 2]], ['a'])
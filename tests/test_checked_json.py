@@ -0,0 +1,98 @@
+"""
+체크섬 JSON 파일 테스트
+"""
+import json
+import os
+import tempfile
+import pytest
+from src.features.mistake_notes import MistakeNotes
+from src.storage.checked_json import (
+    CACHE_SUFFIX, CORRUPT_SUFFIX, ChecksumError, read_checked_json, write_checked_json
+)
+
+
+class TestCheckedJson:
+    """체크섬 JSON 읽기/쓰기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+        self.data = [{"id": "1", "값": 3.5, "목록": [1, 2], "없음": None}]
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_round_trip_with_header(self):
+        """머리줄(형식 버전 + 체크섬)과 함께 저장하고 그대로 불러옴"""
+        write_checked_json(self.path, self.data)
+        with open(self.path, 'rb') as f:
+            header = f.readline()
+        assert header.startswith(b'MATHHELPER-JSON 1 sha256=')
+        assert read_checked_json(self.path) == self.data
+
+    def test_missing_or_empty_file(self):
+        """파일이 없거나 비어 있으면 기본값"""
+        assert read_checked_json(self.path, []) == []
+        open(self.path, 'w').close()
+        assert read_checked_json(self.path, {}) == {}
+
+    def test_legacy_file(self):
+        """머리줄 없는 예전 JSON 파일도 읽음"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        assert read_checked_json(self.path) == self.data
+
+    def test_cache_fast_path(self):
+        """체크섬이 같으면 캐시에서 불러오고, 파일이 바뀌면 캐시를 다시 만듦"""
+        write_checked_json(self.path, self.data)
+        assert not os.path.exists(self.path + CACHE_SUFFIX)
+
+        read_checked_json(self.path)
+        assert os.path.exists(self.path + CACHE_SUFFIX)
+        assert read_checked_json(self.path) == self.data
+
+        write_checked_json(self.path, [])
+        assert read_checked_json(self.path) == []
+
+    def test_broken_cache_is_ignored(self):
+        """읽을 수 없는 캐시는 무시하고 JSON을 파싱"""
+        write_checked_json(self.path, self.data)
+        with open(self.path + CACHE_SUFFIX, 'wb') as f:
+            f.write(b'\x00garbage')
+        assert read_checked_json(self.path) == self.data
+
+    def test_corrupt_file_is_quarantined(self):
+        """체크섬이 맞지 않으면 오류를 내고 파일을 '.corrupt'로 보관"""
+        write_checked_json(self.path, self.data)
+        with open(self.path, 'r+b') as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b'XYZ')
+
+        with pytest.raises(ChecksumError):
+            read_checked_json(self.path)
+        assert not os.path.exists(self.path)
+        assert os.path.exists(self.path + CORRUPT_SUFFIX)
+
+    def test_newer_version_rejected(self):
+        """지원하지 않는 새 형식 버전"""
+        with open(self.path, 'wb') as f:
+            f.write(b'MATHHELPER-JSON 99 sha256=abc\n[]')
+        with pytest.raises(ValueError):
+            read_checked_json(self.path)
+
+    def test_manager_keeps_corrupt_data(self):
+        """관리자가 손상된 파일을 빈 데이터로 덮어쓰지 않음"""
+        notes = MistakeNotes(storage_path=self.path, write_behind=False)
+        notes.add_mistake("대수", "2x = 4", 3, 2)
+        with open(self.path, 'ab') as f:
+            f.write(b' ')
+
+        reloaded = MistakeNotes(storage_path=self.path, write_behind=False)
+        assert reloaded.mistakes == []
+        reloaded.add_mistake("기하", "각", 30, 60)
+
+        with open(self.path + CORRUPT_SUFFIX, 'rb') as f:
+            assert "2x = 4" in f.read().decode('utf-8')
+        assert len(read_checked_json(self.path)) == 1
@@ -3,6 +3,7 @@
 """
 import pytest
 import math
+import numpy as np
 from src.calculators.coordinate import CoordinateCalculator
 
 
@@ -158,3 +159,94 @@ class TestCoordinateCalculator:
         # (0,0)과 (5,12) → 거리 13
         result = self.calculator.distance(0, 0, 5, 12)
         assert result.result == 13.0
+
+    def test_distance_matrix_matches_scalar(self):
+        """거리 행렬: 단일 거리 계산과 일치"""
+        points = [(0, 0), (3, 4), (-1, 2)]
+        matrix = self.calculator.distance_matrix(points)
+        assert matrix.shape == (3, 3)
+        for i, (x1, y1) in enumerate(points):
+            for j, (x2, y2) in enumerate(points):
+                expected = self.calculator.distance(x1, y1, x2, y2).result
+                assert matrix[i, j] == pytest.approx(expected)
+
+    def test_distance_matrix_chunked(self):
+        """거리 행렬: 묶음 크기와 관계없이 같은 결과"""
+        rng = np.random.default_rng(0)
+        a = rng.uniform(-10, 10, (50, 2))
+        b = rng.uniform(-10, 10, (20, 2))
+        full = self.calculator.distance_matrix(a, b, chunk_size=1000)
+        chunked = self.calculator.distance_matrix(a, b, chunk_size=7)
+        assert full.shape == (50, 20)
+        np.testing.assert_allclose(full, chunked)
+
+    def test_distance_matrix_invalid_chunk_size(self):
+        """거리 행렬: 잘못된 묶음 크기"""
+        with pytest.raises(ValueError):
+            self.calculator.distance_matrix([(0, 0)], chunk_size=0)
+
+    def test_nearest_neighbors_matches_brute_force(self):
+        """최근접 점: 전수 비교 결과와 일치"""
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-10, 10, (500, 2))
+        queries = rng.uniform(-12, 12, (40, 2))
+        distances, indices = self.calculator.nearest_neighbors(points, queries, k=3)
+
+        brute = self.calculator.distance_matrix(queries, points)
+        expected = np.sort(brute, axis=1)[:, :3]
+        np.testing.assert_allclose(distances, expected)
+        np.testing.assert_allclose(
+            np.take_along_axis(brute, indices, axis=1), expected
+        )
+
+    def test_point_line_distances_one_line(self):
+        """점과 직선 거리 (벡터화): N개 점과 한 직선"""
+        points = [(0, 0), (1, 1), (5, 3)]
+        result = self.calculator.point_line_distances(points, 3, 4, -5)
+        for (px, py), d in zip(points, result):
+            expected = self.calculator.point_line_distance(px, py, 3, 4, -5).result
+            assert d == pytest.approx(expected)
+
+    def test_point_line_distances_per_line(self):
+        """점과 직선 거리 (벡터화): i번째 점과 i번째 직선"""
+        points = [(5, 3), (0, 2)]
+        result = self.calculator.point_line_distances(points, [1, 0], [0, 1], [-2, 0])
+        np.testing.assert_allclose(result, [3.0, 2.0])
+
+    def test_point_line_distances_invalid_line(self):
+        """점과 직선 거리 (벡터화): a = b = 0"""
+        with pytest.raises(ValueError):
+            self.calculator.point_line_distances([(0, 0)], 0, 0, 1)
+
+    def test_slopes_and_midpoints(self):
+        """기울기, 중점 (벡터화)"""
+        p1 = [(0, 0), (1, 2), (3, 1)]
+        p2 = [(2, 4), (3, 2), (3, 5)]
+        slopes = self.calculator.slopes(p1, p2)
+        assert slopes[0] == 2.0
+        assert slopes[1] == 0.0
+        assert np.isnan(slopes[2])
+
+        mids = self.calculator.midpoints(p1, p2)
+        np.testing.assert_allclose(mids, [(1, 2), (2, 2), (3, 3)])
+
+    def test_collinear_mask(self):
+        """세 점 묶음 일직선 판정 (벡터화)"""
+        mask = self.calculator.collinear_mask(
+            [(0, 0), (0, 0)], [(1, 1), (1, 1)], [(2, 2), (2, 3)]
+        )
+        assert list(mask) == [True, False]
+
+    def test_is_collinear_many(self):
+        """점 집합 일직선 판정"""
+        x = np.linspace(-1000, 1000, 1001)
+        line = np.column_stack([x, 0.5 * x + 3])
+        assert self.calculator.is_collinear_many(line) is True
+
+        line[500, 1] += 0.01
+        assert self.calculator.is_collinear_many(line) is False
+
+    def test_is_collinear_many_degenerate(self):
+        """점 집합 일직선 판정: 점이 적거나 모두 같은 경우"""
+        assert self.calculator.is_collinear_many([(1, 1), (2, 5)]) is True
+        assert self.calculator.is_collinear_many([(1, 1)] * 5) is True
@@ -0,0 +1,82 @@
+"""
+Figure 수명 관리 테스트
+"""
+import gc
+import pytest
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from src.rendering.figures import FigureManager, get_figure_manager
+from src.calculators.function_graph import FunctionGraphDrawer
+from src.calculators.linear_function import LinearFunctionDrawer
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+
+
+class TestFigureManager:
+    """Figure 관리자 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.manager = FigureManager()
+
+    def test_new_figure(self):
+        """Figure와 Axes 생성"""
+        fig, ax = self.manager.new_figure(figsize=(4, 3))
+        assert isinstance(fig, Figure)
+        assert ax in fig.axes
+        assert self.manager.live_count == 1
+
+    def test_new_figure_multiple_axes(self):
+        """서브플롯 여러 개"""
+        fig, axes = self.manager.new_figure(nrows=2, ncols=1)
+        assert len(axes) == 2
+
+    def test_close(self):
+        """정리 후 살아 있는 Figure 수 감소"""
+        fig, _ = self.manager.new_figure()
+        self.manager.close(fig)
+        self.manager.close(fig)  # 두 번 정리해도 안전
+        stats = self.manager.get_statistics()
+        assert stats == {'created': 1, 'closed': 1, 'live': 0}
+
+    def test_context_manager_closes(self):
+        """with 블록이 끝나면 정리"""
+        with self.manager.figure() as (fig, ax):
+            ax.plot([0, 1], [0, 1])
+            assert self.manager.live_count == 1
+        assert self.manager.live_count == 0
+
+    def test_unreferenced_figure_is_released(self):
+        """참조가 사라진 Figure는 해제됨 (pyplot에 남지 않음)"""
+        self.manager.new_figure()
+        gc.collect()
+        assert self.manager.live_count == 0
+
+    def test_to_bytes_png_and_svg(self):
+        """이미지 인코딩"""
+        fig, ax = self.manager.new_figure()
+        ax.plot([0, 1], [1, 0])
+        png = self.manager.to_bytes(fig, close=False)
+        assert png.startswith(b'\x89PNG')
+        svg = self.manager.to_bytes(fig, fmt='svg')
+        assert b'<svg' in svg
+        assert self.manager.live_count == 0
+
+    def test_drawers_do_not_touch_pyplot(self):
+        """계산기 그래프는 pyplot 전역 Figure 목록에 등록되지 않음"""
+        before = len(plt.get_fignums())
+        manager = get_figure_manager()
+        live_before = manager.live_count
+
+        figs = [
+            FunctionGraphDrawer().draw_proportional(2, (-5, 5)),
+            FunctionGraphDrawer().draw_inverse_proportional(2, (-5, 5)),
+            LinearFunctionDrawer().draw(1, 2, (-5, 5)),
+            QuadraticFunctionDrawer().draw(1, 0, -4, (-5, 5)),
+            QuadraticFunctionDrawer().compare_graphs(1, 0, 0, -1, 0, 4, (-5, 5)),
+        ]
+        assert len(plt.get_fignums()) == before
+        assert manager.live_count == live_before + len(figs)
+
+        for fig in figs:
+            manager.close(fig)
+        assert manager.live_count == live_before
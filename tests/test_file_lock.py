@@ -0,0 +1,76 @@
+"""
+파일 잠금 테스트
+"""
+import multiprocessing
+import os
+import tempfile
+import threading
+from src.storage.file_lock import FileLock
+
+
+def _increment(path: str, times: int):
+    """잠금을 잡고 파일의 숫자를 읽어 1 더해 쓰기를 반복 (다른 프로세스에서 실행)"""
+    for _ in range(times):
+        with FileLock(path):
+            with open(path, 'r') as f:
+                value = int(f.read())
+            with open(path, 'w') as f:
+                f.write(str(value + 1))
+
+
+class TestFileLock:
+    """파일 잠금 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'counter')
+        with open(self.path, 'w') as f:
+            f.write('0')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def read_counter(self) -> int:
+        with open(self.path) as f:
+            return int(f.read())
+
+    def test_reentrant(self):
+        """같은 스레드는 다시 잡을 수 있음"""
+        lock = FileLock(self.path)
+        with lock:
+            with lock:
+                assert lock.locked
+            assert lock.locked
+        assert not lock.locked
+        assert os.path.exists(self.path + '.lock')
+
+    def test_threads_do_not_lose_updates(self):
+        """여러 스레드가 같은 잠금 객체로 읽고 고쳐 써도 잃어버리는 변경 없음"""
+        lock = FileLock(self.path)
+
+        def work():
+            for _ in range(50):
+                with lock:
+                    value = self.read_counter()
+                    with open(self.path, 'w') as f:
+                        f.write(str(value + 1))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert self.read_counter() == 200
+
+    def test_processes_do_not_lose_updates(self):
+        """여러 프로세스가 읽고 고쳐 써도 잃어버리는 변경 없음"""
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_increment, args=(self.path, 50)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert self.read_counter() == 200
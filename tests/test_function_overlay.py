@@ -0,0 +1,130 @@
+"""
+여러 함수 겹쳐 그리기 테스트
+"""
+import time
+import pytest
+import numpy as np
+from matplotlib.figure import Figure
+from src.calculators.function_overlay import FunctionOverlayDrawer, OverlayFunction, MAX_LEGEND_ENTRIES
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+from src.rendering.spec import Series, Marker
+
+
+class TestFunctionOverlayDrawer:
+    """여러 함수 겹쳐 그리기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.drawer = FunctionOverlayDrawer()
+        self.functions = [
+            ('linear', (2, 1)),
+            ('quadratic', (1, -2, -3)),
+            ('inverse', (4,)),
+        ]
+
+    def test_evaluate_shape(self):
+        """(K, N) 배열로 계산"""
+        result = self.drawer.evaluate(self.functions, (-5, 5), num_points=101)
+        assert result.y.shape == (3, len(result.x))
+        assert result.kinds == ['linear', 'quadratic', 'inverse']
+
+    def test_values_match_scalar(self):
+        """각 행이 개별 함수 값과 같음"""
+        result = self.drawer.evaluate(self.functions, (-5, 5), num_points=101)
+        x = result.x
+        np.testing.assert_allclose(result.y[0], 2 * x + 1)
+        np.testing.assert_allclose(result.y[1], x**2 - 2 * x - 3)
+        nonzero = x != 0
+        np.testing.assert_allclose(result.y[2][nonzero], 4 / x[nonzero])
+
+    def test_inverse_breaks_at_zero(self):
+        """반비례는 x = 0에서 NaN (다른 함수는 정의됨)"""
+        result = self.drawer.evaluate(self.functions, (-5, 5))
+        zero = np.flatnonzero(result.x == 0)
+        assert len(zero) == 1
+        assert np.isnan(result.y[2, zero[0]])
+        assert result.y[0, zero[0]] == pytest.approx(1.0)
+
+    def test_vertices_match_scalar(self):
+        """꼭짓점이 QuadraticFunctionDrawer.get_vertex와 같음"""
+        quadratics = [('quadratic', (a, b, c)) for a, b, c in [(1, -2, -3), (-2, 4, 1), (0.5, 3, 0)]]
+        result = self.drawer.evaluate(quadratics, (-5, 5))
+        scalar = QuadraticFunctionDrawer()
+        for i, (_, (a, b, c)) in enumerate(quadratics):
+            assert tuple(result.vertices[i]) == pytest.approx(scalar.get_vertex(a, b, c))
+
+    def test_features(self):
+        """꼭짓점, y절편, x절편"""
+        result = self.drawer.evaluate(self.functions, (-5, 5))
+        # 일차함수: 꼭짓점 없음, x절편 -0.5
+        assert np.all(np.isnan(result.vertices[0]))
+        assert result.x_intercepts[0, 0] == pytest.approx(-0.5)
+        assert np.isnan(result.x_intercepts[0, 1])
+        # 이차함수: x절편 -1, 3
+        assert result.x_intercepts[1] == pytest.approx([-1.0, 3.0])
+        assert result.y_intercepts[1] == pytest.approx(-3.0)
+        # 반비례: 절편 없음
+        assert np.isnan(result.y_intercepts[2])
+        assert np.all(np.isnan(result.x_intercepts[2]))
+
+    def test_double_root_and_no_root(self):
+        """중근은 하나, 실근이 없으면 NaN"""
+        result = self.drawer.evaluate([('quadratic', (1, -2, 1)), ('quadratic', (1, 0, 1))], (-5, 5))
+        assert result.x_intercepts[0, 0] == pytest.approx(1.0)
+        assert np.isnan(result.x_intercepts[0, 1])
+        assert np.all(np.isnan(result.x_intercepts[1]))
+
+    def test_horizontal_line(self):
+        """기울기 0인 일차함수는 x절편 없음"""
+        result = self.drawer.evaluate([('linear', (0, 2))], (-5, 5))
+        assert np.all(np.isnan(result.x_intercepts[0]))
+        assert result.y_intercepts[0] == pytest.approx(2.0)
+
+    def test_overlay_function_objects_and_labels(self):
+        """OverlayFunction과 사용자 이름"""
+        result = self.drawer.evaluate([OverlayFunction('linear', (1, 0), '민수')], (-1, 1))
+        assert result.labels == ['민수']
+
+    def test_validation(self):
+        """잘못된 입력"""
+        with pytest.raises(ValueError):
+            self.drawer.evaluate([], (-5, 5))
+        with pytest.raises(ValueError):
+            self.drawer.evaluate([('cubic', (1, 0, 0, 0))], (-5, 5))
+        with pytest.raises(ValueError):
+            self.drawer.evaluate([('linear', (1,))], (-5, 5))
+        with pytest.raises(ValueError):
+            self.drawer.evaluate([('quadratic', (0, 1, 2))], (-5, 5))
+        with pytest.raises(ValueError):
+            self.drawer.evaluate([('inverse', ('a',))], (-5, 5))
+        with pytest.raises(ValueError):
+            self.drawer.evaluate(self.functions, (5, -5))
+
+    def test_overlay_spec(self):
+        """겹쳐 그리기 명세"""
+        spec = self.drawer.overlay_spec(self.functions, (-5, 5))
+        series = [l for l in spec.layers if isinstance(l, Series)]
+        markers = [l for l in spec.layers if isinstance(l, Marker)]
+        assert len(series) == 3
+        assert len(markers) == 1 and markers[0].x == (1.0,)
+        assert spec.ylim == (-10, 10)
+        assert spec.legend
+
+    def test_many_curves(self):
+        """30개 이상의 곡선도 빠르게 (범례 생략)"""
+        rng = np.random.default_rng(0)
+        functions = [('quadratic', (a, b, c)) for a, b, c in rng.uniform(0.5, 2, size=(40, 3))]
+        started = time.perf_counter()
+        spec = self.drawer.overlay_spec(functions, (-5, 5))
+        elapsed = time.perf_counter() - started
+
+        assert len([l for l in spec.layers if isinstance(l, Series)]) == 40
+        assert not spec.legend
+        assert 40 > MAX_LEGEND_ENTRIES
+        assert elapsed < 1.0
+
+    def test_draw_overlay(self):
+        """Figure 생성"""
+        fig = self.drawer.draw_overlay(self.functions, (-5, 5))
+        assert isinstance(fig, Figure)
+        assert len(fig.axes[0].get_lines()) == 2 + 3 + 1
@@ -3,8 +3,10 @@
 """
 import pytest
 import os
+import json
 import tempfile
 from src.features.history_manager import HistoryManager
+from src.storage.checked_json import read_checked_json
 
 
 class TestHistoryManager:
@@ -18,8 +20,9 @@ class TestHistoryManager:
 
     def teardown_method(self):
         """각 테스트 후에 실행"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        for path in (self.temp_file.name, self.temp_file.name + '.log', self.temp_file.name + '.cache'):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_initialization(self):
         """초기화 테스트"""
@@ -136,3 +139,368 @@ class TestHistoryManager:
         finally:
             if os.path.exists(export_file.name):
                 os.unlink(export_file.name)
+
+
+class TestHistoryJournal:
+    """히스토리 저널 저장 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'history.json')
+        self.manager = HistoryManager(
+            storage_path=self.path, journal=True, compact_threshold=10, write_behind=False
+        )
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def _journal_lines(self):
+        with open(self.path + '.log', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_add_appends_one_line(self):
+        """계산 하나에 저널 한 줄만 추가 (스냅샷은 다시 쓰지 않음)"""
+        self.manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, ["x = 1"])
+        self.manager.add_calculation("통계", {"data": [1, 2]}, {"mean": 1.5}, [])
+        records = self._journal_lines()
+        assert [r['op'] for r in records] == ['add', 'add']
+        assert not os.path.exists(self.path)
+
+    def test_replay_on_load(self):
+        """다시 불러오면 추가/즐겨찾기/삭제가 그대로 재현됨"""
+        id1 = self.manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, [])
+        id2 = self.manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, [])
+        id3 = self.manager.add_calculation("통계", {}, {}, [])
+        self.manager.toggle_favorite(id1)
+        self.manager.delete_entry(id2)
+
+        reloaded = HistoryManager(storage_path=self.path, journal=True)
+        assert [e.id for e in reloaded.history] == [id3, id1]
+        assert reloaded.history[1].is_favorite is True
+
+    def test_compaction(self):
+        """기준 개수가 쌓이면 스냅샷으로 압축하고 저널을 비움"""
+        for i in range(10):
+            self.manager.add_calculation("일차방정식", {"a": i}, {"x": i}, [])
+
+        assert self._journal_lines() == []
+        assert len(read_checked_json(self.path)) == 10
+
+        self.manager.add_calculation("통계", {}, {}, [])
+        reloaded = HistoryManager(storage_path=self.path, journal=True)
+        assert len(reloaded.history) == 11
+        assert reloaded.history[0].calculator_type == "통계"
+
+    def test_replay_is_idempotent(self):
+        """스냅샷 후 저널이 남아 있어도 (압축 도중 중단) 결과가 같음"""
+        entry_id = self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.toggle_favorite(entry_id)
+        records = self._journal_lines()
+        self.manager.compact()
+
+        # 압축 전 저널이 그대로 남은 상황 재현
+        with open(self.path + '.log', 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        reloaded = HistoryManager(storage_path=self.path, journal=True)
+        assert len(reloaded.history) == 1
+        assert reloaded.history[0].is_favorite is True
+
+    def test_truncated_last_line_ignored(self):
+        """쓰다 만 마지막 줄은 건너뜀"""
+        self.manager.add_calculation("일차방정식", {}, {}, [])
+        with open(self.path + '.log', 'a', encoding='utf-8') as f:
+            f.write('{"op": "add", "entry": {"id"')
+
+        reloaded = HistoryManager(storage_path=self.path, journal=True)
+        assert len(reloaded.history) == 1
+
+    def test_append_after_truncated_line(self):
+        """쓰다 만 줄 뒤에 새 기록을 덧붙여도 다시 열 때 모두 불러옴"""
+        id1 = self.manager.add_calculation("일차방정식", {}, {}, [])
+        with open(self.path + '.log', 'a', encoding='utf-8') as f:
+            f.write('{"op":"add","entr')
+
+        restarted = HistoryManager(storage_path=self.path, journal=True, write_behind=False)
+        id2 = restarted.add_calculation("통계", {}, {}, [])
+
+        reloaded = HistoryManager(storage_path=self.path, journal=True, write_behind=False)
+        assert [e.id for e in reloaded.history] == [id2, id1]
+
+    def test_reads_legacy_snapshot(self):
+        """기존 전체 저장 파일을 저널 방식으로 읽기"""
+        legacy = HistoryManager(storage_path=self.path, journal=False)
+        legacy.add_calculation("일차방정식", {}, {}, [])
+        assert not os.path.exists(self.path + '.log')
+
+        reloaded = HistoryManager(storage_path=self.path, journal=True)
+        assert len(reloaded.history) == 1
+
+    def test_clear_all_compacts(self):
+        """전체 삭제는 스냅샷을 비우고 저널도 비움"""
+        self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.clear_all()
+        assert self._journal_lines() == []
+        assert HistoryManager(storage_path=self.path, journal=True).history == []
+
+    def test_invalid_threshold(self):
+        """압축 기준 검증"""
+        with pytest.raises(ValueError):
+            HistoryManager(storage_path=self.path, journal=True, compact_threshold=0)
+
+
+class TestHistorySQLite:
+    """SQLite 히스토리 저장 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'history.json')
+        self.manager = HistoryManager(storage_path=self.path, backend='sqlite')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.manager.store.close()
+        self.temp_dir.cleanup()
+
+    def test_wal_mode(self):
+        """WAL 모드 데이터베이스 사용"""
+        row = self.manager.store.db.query_one('PRAGMA journal_mode')
+        assert row[0] == 'wal'
+        assert os.path.exists(os.path.join(self.temp_dir.name, 'history.db'))
+
+    def test_queries(self):
+        """종류별/즐겨찾기/최근 조회"""
+        id1 = self.manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, ["x = 1"])
+        self.manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, [])
+        id3 = self.manager.add_calculation("일차방정식", {"a": 2}, {"x": 3}, [])
+        self.manager.toggle_favorite(id1)
+
+        assert [e.id for e in self.manager.get_history_by_type("일차방정식")] == [id3, id1]
+        assert [e.id for e in self.manager.get_favorites()] == [id1]
+        recent = self.manager.get_recent_history(limit=2)
+        assert recent[0].id == id3 and len(recent) == 2
+        assert recent[0].inputs == {"a": 2}
+        assert self.manager.search_history("x = 1")[0].id == id1
+
+    def test_indexed_query_plans(self):
+        """종류별/즐겨찾기/기간 조회가 색인을 사용"""
+        db = self.manager.store.db
+        assert 'idx_history_type' in db.query_plan(
+            'SELECT * FROM history WHERE calculator_type = ? ORDER BY seq DESC', ('통계',))
+        assert 'idx_history_favorite' in db.query_plan(
+            'SELECT * FROM history WHERE is_favorite = 1 ORDER BY seq DESC')
+        assert 'idx_history_timestamp' in db.query_plan(
+            'DELETE FROM history WHERE timestamp <= ?', ('2000-01-01',))
+
+    def test_statistics_and_delete(self):
+        """통계, 삭제, 오래된 기록 삭제"""
+        id1 = self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.add_calculation("이차방정식", {}, {}, [])
+        self.manager.toggle_favorite(id1)
+
+        stats = self.manager.get_statistics()
+        assert stats['total_calculations'] == 3
+        assert stats['favorite_count'] == 1
+        assert stats['most_used_calculator'] == "일차방정식"
+
+        self.manager.delete_entry(id1)
+        assert len(self.manager.history) == 2
+
+        self.manager.store.db.execute("UPDATE history SET timestamp = '2000-01-01T00:00:00'")
+        self.manager.clear_old_entries(days=30)
+        assert self.manager.history == []
+
+    def test_persistence(self):
+        """다시 열어도 유지"""
+        self.manager.add_calculation("통계", {"data": [1, 2, 3]}, {"mean": 2}, [])
+        manager2 = HistoryManager(storage_path=self.path, backend='sqlite')
+        assert manager2.history[0].inputs == {"data": [1, 2, 3]}
+        manager2.store.close()
+
+    def test_migrate_from_json(self):
+        """기존 JSON 히스토리를 처음 열 때 옮겨 담음"""
+        path = os.path.join(self.temp_dir.name, 'legacy.json')
+        legacy = HistoryManager(storage_path=path, backend='json')
+        old_id = legacy.add_calculation("일차방정식", {}, {}, [])
+        new_id = legacy.add_calculation("통계", {}, {}, [])
+
+        migrated = HistoryManager(storage_path=path, backend='sqlite')
+        assert [e.id for e in migrated.history] == [new_id, old_id]
+        migrated.store.close()
+
+    def test_invalid_backend(self):
+        """지원하지 않는 저장 방식"""
+        with pytest.raises(ValueError):
+            HistoryManager(storage_path=self.path, backend='csv')
+
+
+class TestHistoryPaged:
+    """페이지 히스토리 저장 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'history.json')
+        self.manager = HistoryManager(storage_path=self.path, backend='paged')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.manager.store.close()
+        self.temp_dir.cleanup()
+
+    def reopen(self) -> HistoryManager:
+        self.manager.store.close()
+        self.manager = HistoryManager(storage_path=self.path, backend='paged')
+        return self.manager
+
+    def test_queries(self):
+        """종류별/즐겨찾기/최근/검색 조회"""
+        id1 = self.manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, ["x = 1"])
+        self.manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, [])
+        id3 = self.manager.add_calculation("일차방정식", {"a": 2}, {"x": 3}, [])
+        self.manager.toggle_favorite(id1)
+
+        assert [e.id for e in self.manager.get_history_by_type("일차방정식")] == [id3, id1]
+        assert [e.id for e in self.manager.get_favorites()] == [id1]
+        assert self.manager.get_favorites()[0].is_favorite
+        recent = self.manager.get_recent_history(limit=2)
+        assert [e.id for e in recent] == [id3, self.manager.history[1].id]
+        assert recent[0].inputs == {"a": 2}
+        assert [e.id for e in self.manager.search_history("일차")] == [id3, id1]
+
+    def test_paging_reads_only_requested_rows(self):
+        """페이지 조회는 요청한 기록만 읽음"""
+        ids = [self.manager.add_calculation("통계", {"n": i}, {}, []) for i in range(10)]
+
+        reads = []
+        original = self.manager.store.data.read
+        self.manager.store.data.read = lambda offset, length: reads.append(offset) or original(offset, length)
+
+        page = self.manager.get_recent_history(limit=3, offset=3)
+        assert [e.id for e in page] == ids[6:3:-1]
+        assert len(reads) == 3
+
+    def test_paging_matches_json(self):
+        """JSON 방식과 같은 페이지 결과"""
+        json_manager = HistoryManager(storage_path=os.path.join(self.temp_dir.name, 'plain.json'),
+                                      backend='json', write_behind=False)
+        for i in range(7):
+            self.manager.add_calculation("통계", {"n": i}, {}, [])
+            json_manager.add_calculation("통계", {"n": i}, {}, [])
+
+        for offset in (0, 3, 6, 9):
+            paged = [e.inputs for e in self.manager.get_recent_history(limit=3, offset=offset)]
+            plain = [e.inputs for e in json_manager.get_recent_history(limit=3, offset=offset)]
+            assert paged == plain
+
+    def test_persistence(self):
+        """다시 열면 색인만 불러오고 즐겨찾기/삭제가 유지됨"""
+        id1 = self.manager.add_calculation("통계", {"data": [1, 2, 3]}, {"mean": 2}, [])
+        id2 = self.manager.add_calculation("기하", {}, {}, [])
+        id3 = self.manager.add_calculation("확률", {}, {}, [])
+        self.manager.toggle_favorite(id1)
+        self.manager.delete_entry(id2)
+
+        manager = self.reopen()
+        assert [e.id for e in manager.history] == [id3, id1]
+        assert manager.history[1].inputs == {"data": [1, 2, 3]}
+        assert manager.history[1].is_favorite
+        assert manager.get_statistics()['favorite_count'] == 1
+
+    def test_append_after_truncated_index_line(self):
+        """색인 저널의 쓰다 만 줄 뒤에 기록을 추가해도 다시 열 때 모두 불러옴"""
+        id1 = self.manager.add_calculation("통계", {"n": 1}, {}, [])
+        with open(self.manager.store.journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op":"add","ro')
+
+        manager = self.reopen()
+        id2 = manager.add_calculation("기하", {"n": 2}, {}, [])
+        manager = self.reopen()
+        assert [e.id for e in manager.history] == [id2, id1]
+        assert manager.history[0].inputs == {"n": 2}
+
+    def test_index_compaction(self):
+        """색인 저널이 기준에 도달하면 스냅샷으로 압축"""
+        self.manager.store.close()
+        self.manager = HistoryManager(storage_path=self.path, backend='paged', compact_threshold=5)
+        ids = [self.manager.add_calculation("통계", {"n": i}, {}, []) for i in range(12)]
+        assert self.manager.store.journal.pending < 5
+
+        manager = self.reopen()
+        assert [e.id for e in manager.history] == ids[::-1]
+
+    def test_data_compaction(self):
+        """삭제한 레코드는 압축할 때 새 세대 파일에서 빠짐"""
+        ids = [self.manager.add_calculation("통계", {"n": i}, {}, []) for i in range(6)]
+        for entry_id in ids[:4]:
+            self.manager.delete_entry(entry_id)
+        old_path = self.manager.store.data.path
+        old_size = self.manager.store.data.size
+
+        self.manager.store.compact_data()
+        assert not os.path.exists(old_path)
+        assert self.manager.store.data.size < old_size
+        assert [e.inputs for e in self.manager.history] == [{"n": 5}, {"n": 4}]
+
+        manager = self.reopen()
+        assert [e.id for e in manager.history] == [ids[5], ids[4]]
+        manager.add_calculation("기하", {}, {}, [])
+        assert manager.get_recent_history(limit=1)[0].calculator_type == "기하"
+
+    def test_statistics_and_clear(self):
+        """통계, 오래된 기록 삭제, 전체 삭제"""
+        id1 = self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.add_calculation("일차방정식", {}, {}, [])
+        self.manager.add_calculation("이차방정식", {}, {}, [])
+        self.manager.toggle_favorite(id1)
+
+        stats = self.manager.get_statistics()
+        assert stats['total_calculations'] == 3
+        assert stats['favorite_count'] == 1
+        assert stats['most_used_calculator'] == "일차방정식"
+
+        self.manager.clear_old_entries(days=-1)
+        assert self.manager.history == []
+
+        self.manager.add_calculation("통계", {}, {}, [])
+        self.manager.clear_all()
+        assert self.manager.history == []
+        assert self.reopen().history == []
+
+    def test_retention(self):
+        """보관 정책 (최대 개수, 즐겨찾기 보존)"""
+        from src.features.retention import RetentionPolicy
+        self.manager.store.close()
+        self.manager = HistoryManager(storage_path=self.path, backend='paged',
+                                      retention=RetentionPolicy(max_count=3))
+        ids = [self.manager.add_calculation("통계", {}, {}, []) for i in range(3)]
+        self.manager.toggle_favorite(ids[0])
+        for _ in range(2):
+            self.manager.add_calculation("통계", {}, {}, [])
+
+        # 개수 상한은 추가할 때마다 적용됨
+        assert self.manager.apply_retention() == 0
+        remaining = [e.id for e in self.manager.history]
+        assert len(remaining) == 3 and ids[0] in remaining and ids[1] not in remaining
+
+    def test_migrate_from_json(self):
+        """기존 JSON 히스토리를 처음 열 때 옮겨 담음"""
+        path = os.path.join(self.temp_dir.name, 'legacy.json')
+        legacy = HistoryManager(storage_path=path, backend='json', write_behind=False)
+        old_id = legacy.add_calculation("일차방정식", {}, {}, [])
+        new_id = legacy.add_calculation("통계", {}, {}, [])
+
+        migrated = HistoryManager(storage_path=path, backend='paged')
+        assert [e.id for e in migrated.history] == [new_id, old_id]
+        migrated.store.close()
+
+    def test_paged_only_for_history(self):
+        """페이지 방식은 계산 히스토리만 지원"""
+        from src.features.mistake_notes import MistakeNotes
+        with pytest.raises(ValueError):
+            MistakeNotes(storage_path=os.path.join(self.temp_dir.name, 'mistakes.json'), backend='paged')
@@ -0,0 +1,114 @@
+"""
+ID 색인 목록 테스트
+"""
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from src.features.mistake_notes import MistakeNotes
+from src.storage.indexed_list import IndexedList, TOMBSTONE_COMPACT_MIN, unique_id
+
+
+@dataclass
+class Item:
+    """테스트용 항목"""
+    id: str
+    value: int = 0
+
+
+class TestIndexedList:
+    """IndexedList 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.items = IndexedList(Item(str(i), i) for i in range(5))
+
+    def test_get_and_order(self):
+        """ID로 찾기와 순서 유지"""
+        assert len(self.items) == 5
+        assert self.items.get('3').value == 3
+        assert self.items.get('없음') is None
+        assert [item.id for item in self.items.items()] == ['0', '1', '2', '3', '4']
+        assert [item.id for item in self.items.newest(2)] == ['4', '3']
+
+    def test_put_replaces_in_place(self):
+        """같은 ID는 그 자리에서 교체"""
+        assert self.items.put(Item('1', 100)) is False
+        assert self.items.put(Item('5', 5)) is True
+        assert [item.value for item in self.items] == [0, 100, 2, 3, 4, 5]
+
+    def test_remove_leaves_tombstone(self):
+        """삭제한 항목은 건너뛰고, 같은 ID를 다시 추가하면 최신 항목이 됨"""
+        assert self.items.remove('2').value == 2
+        assert self.items.remove('2') is None
+        assert '2' not in self.items
+        assert [item.id for item in self.items.newest()] == ['4', '3', '1', '0']
+
+        self.items.put(Item('2', 20))
+        assert [item.id for item in self.items.newest(1)] == ['2']
+
+    def test_compaction(self):
+        """묘비가 많이 쌓이면 압축"""
+        items = IndexedList(Item(str(i)) for i in range(TOMBSTONE_COMPACT_MIN * 2))
+        for i in range(TOMBSTONE_COMPACT_MIN):
+            items.remove(str(i))
+        assert items._dead == 0
+        assert len(items._slots) == TOMBSTONE_COMPACT_MIN
+        assert items.get(str(TOMBSTONE_COMPACT_MIN)).id == str(TOMBSTONE_COMPACT_MIN)
+
+    def test_retain_and_clear(self):
+        """조건에 맞는 항목만 남기기와 전체 삭제"""
+        assert self.items.retain(lambda item: item.value % 2 == 0) == 2
+        assert [item.id for item in self.items] == ['0', '2', '4']
+        self.items.clear()
+        assert len(self.items) == 0
+
+    def test_items_returns_copy(self):
+        """돌려준 목록을 고쳐도 원본은 그대로"""
+        self.items.items().clear()
+        self.items.newest().clear()
+        assert len(self.items) == 5
+
+    def test_unique_id(self):
+        """겹치지 않는 ID 만들기"""
+        taken = {'a', 'a_2'}
+        assert unique_id('b', taken.__contains__) == 'b'
+        assert unique_id('a', taken.__contains__) == 'a_3'
+
+
+class TestMistakeIds:
+    """오답 ID 중복 처리 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'mistakes.json')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_same_second_ids_are_unique(self):
+        """같은 초에 추가한 같은 주제 오답도 ID가 다름"""
+        for backend in ('json', 'sqlite'):
+            notes = MistakeNotes(storage_path=self.path, backend=backend, write_behind=False)
+            ids = [notes.add_mistake("대수", f"문제 {i}", 1, 2) for i in range(3)]
+            assert len(set(ids)) == 3
+
+            notes.mark_as_mastered(ids[1])
+            assert [m.mastered for m in notes.get_all_mistakes()][-3:] == [False, True, False]
+            if notes.store is not None:
+                notes.store.close()
+
+    def test_legacy_duplicate_ids_renamed(self):
+        """예전 파일의 겹치는 ID는 불러올 때 번호를 붙여 모두 보존"""
+        entry = {"id": "대수_20260101120000", "topic": "대수", "question": "문제",
+                 "user_answer": 1, "correct_answer": 2, "timestamp": "2026-01-01T12:00:00",
+                 "attempts": 0, "mastered": False, "notes": ""}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump([entry, dict(entry, question="다른 문제")], f, ensure_ascii=False)
+
+        notes = MistakeNotes(storage_path=self.path, write_behind=False)
+        assert [m.id for m in notes.mistakes] == ["대수_20260101120000", "대수_20260101120000_2"]
+        notes.delete_mistake("대수_20260101120000_2")
+        assert [m.question for m in notes.mistakes] == ["문제"]
@@ -0,0 +1,62 @@
+"""
+직선 교점 테스트
+"""
+import pytest
+import numpy as np
+from src.calculators.line_intersection import LineIntersectionEngine
+
+
+class TestLineIntersectionEngine:
+    """직선 교점 계산기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.engine = LineIntersectionEngine()
+
+    def test_two_lines(self):
+        """두 직선의 교점"""
+        result = self.engine.intersect([1, -1], [0, 2])
+        np.testing.assert_allclose(result.points, [(1.0, 1.0)])
+
+    def test_no_lines(self):
+        """직선이 없거나 하나인 경우"""
+        assert len(self.engine.intersect([], [])) == 0
+        assert len(self.engine.intersect([1], [0])) == 0
+
+    def test_all_parallel(self):
+        """모두 평행"""
+        result = self.engine.intersect([3, 3, 3], [0, 1, 2])
+        assert len(result) == 0
+        assert len(result.parallel_pairs) == 3
+
+    def test_matches_brute_force(self):
+        """무작위 직선: 쌍별 계산과 일치"""
+        rng = np.random.default_rng(3)
+        m = rng.integers(-3, 4, 40).astype(float)
+        b = rng.uniform(-5, 5, 40)
+        result = self.engine.intersect(m, b, x_range=(-10, 10), y_range=(-10, 10))
+
+        expected = set()
+        for i in range(40):
+            for j in range(i + 1, 40):
+                if m[i] == m[j]:
+                    continue
+                x = (b[j] - b[i]) / (m[i] - m[j])
+                y = m[i] * x + b[i]
+                if -10 <= x <= 10 and -10 <= y <= 10:
+                    expected.add((i, j))
+
+        assert set(map(tuple, result.pairs)) == expected
+        for (i, j), (x, y) in zip(result.pairs, result.points):
+            assert y == pytest.approx(m[i] * x + b[i])
+            assert y == pytest.approx(m[j] * x + b[j])
+
+    def test_length_mismatch_raises_error(self):
+        """기울기와 y절편 개수가 다른 경우"""
+        with pytest.raises(ValueError):
+            self.engine.intersect([1, 2], [0])
+
+    def test_nan_raises_error(self):
+        """NaN 계수"""
+        with pytest.raises(ValueError):
+            self.engine.intersect([1, float('nan')], [0, 1])
@@ -112,3 +112,22 @@ class TestLinearFunctionDrawer:
         original_slope = 2
         new_a, _ = self.drawer.perpendicular_line(original_slope, (0, 0))
         assert abs(original_slope * new_a - (-1)) < 0.0001
+
+    def test_find_intersections_within_viewport(self):
+        """여러 직선의 교점 (화면 범위 안만)"""
+        # y = x, y = -x + 2 → (1, 1) / y = x, y = 3 → (3, 3) / y = -x + 2, y = 3 → (-1, 3)
+        result = self.drawer.find_intersections([(1, 0), (-1, 2), (0, 3)])
+        assert len(result) == 3
+        assert [tuple(p) for p in result.points] == [(-1.0, 3.0), (1.0, 1.0), (3.0, 3.0)]
+        assert [tuple(p) for p in result.pairs] == [(1, 2), (0, 1), (0, 2)]
+
+        clipped = self.drawer.find_intersections([(1, 0), (-1, 2), (0, 3)], x_range=(0, 2))
+        assert [tuple(p) for p in clipped.points] == [(1.0, 1.0)]
+
+    def test_find_intersections_parallel_and_coincident(self):
+        """평행선과 일치하는 직선은 교점에서 제외"""
+        result = self.drawer.find_intersections([(2, 1), (2, -3), (2, 1), (0, 0)])
+        assert [tuple(p) for p in result.parallel_pairs] == [(0, 1), (1, 2)]
+        assert [tuple(p) for p in result.coincident_pairs] == [(0, 2)]
+        assert len(result) == 3
+        assert set(map(tuple, result.pairs)) == {(0, 3), (1, 3), (2, 3)}
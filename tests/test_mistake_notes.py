@@ -20,8 +20,9 @@ class TestMistakeNotes:
     def teardown_method(self):
         """각 테스트 후에 실행"""
         # 임시 파일 삭제
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        for path in (self.temp_file.name, self.temp_file.name + '.cache'):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_initialization(self):
         """초기화 테스트"""
@@ -124,3 +125,72 @@ class TestMistakeNotes:
 
         self.notes.clear_all()
         assert len(self.notes.mistakes) == 0
+
+
+class TestMistakeNotesSQLite:
+    """SQLite 오답 노트 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'mistakes.json')
+        self.notes = MistakeNotes(storage_path=self.path, backend='sqlite')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.notes.store.close()
+        self.temp_dir.cleanup()
+
+    def test_topic_and_mastered_queries(self):
+        """주제별/마스터 여부 조회"""
+        id1 = self.notes.add_mistake("일차방정식", "2x = 4", 3, 2)
+        self.notes.add_mistake("통계", "평균", 1, 2)
+        self.notes.mark_as_mastered(id1)
+
+        assert len(self.notes.get_mistakes_by_topic("일차방정식")) == 1
+        unmastered = self.notes.get_unmastered_mistakes()
+        assert [m.topic for m in unmastered] == ["통계"]
+        assert unmastered[0].correct_answer == 2
+
+    def test_updates(self):
+        """재시도 횟수와 메모 수정, 삭제"""
+        mistake_id = self.notes.add_mistake("확률", "주사위", "1/3", "1/6")
+        self.notes.increment_attempts(mistake_id)
+        self.notes.increment_attempts(mistake_id)
+        self.notes.update_notes(mistake_id, "경우의 수 다시 세기")
+
+        mistake = self.notes.get_all_mistakes()[0]
+        assert mistake.attempts == 2
+        assert mistake.notes == "경우의 수 다시 세기"
+
+        self.notes.delete_mistake(mistake_id)
+        assert self.notes.mistakes == []
+
+    def test_statistics(self):
+        """주제별 통계"""
+        id1 = self.notes.add_mistake("일차방정식", "q1", 1, 2)
+        self.notes.add_mistake("일차방정식", "q2", 1, 2)
+        self.notes.mark_as_mastered(id1)
+
+        stats = self.notes.get_statistics()
+        assert stats['total_mistakes'] == 2
+        assert stats['mastered_count'] == 1
+        assert stats['mastery_rate'] == 50
+        assert stats['topics']["일차방정식"] == {"total": 2, "mastered": 1}
+
+    def test_indexed_query_plans(self):
+        """주제/마스터 여부 조회가 색인을 사용"""
+        db = self.notes.store.db
+        assert 'idx_mistakes_topic' in db.query_plan(
+            'SELECT * FROM mistakes WHERE topic = ? ORDER BY seq', ('통계',))
+        assert 'idx_mistakes_mastered' in db.query_plan(
+            'SELECT * FROM mistakes WHERE mastered = 0 ORDER BY seq')
+
+    def test_migrate_from_json(self):
+        """기존 JSON 오답 노트를 처음 열 때 옮겨 담음"""
+        path = os.path.join(self.temp_dir.name, 'legacy.json')
+        MistakeNotes(storage_path=path, backend='json').add_mistake("기하", "각", 30, 60)
+
+        migrated = MistakeNotes(storage_path=path, backend='sqlite')
+        assert [m.question for m in migrated.mistakes] == ["각"]
+        migrated.store.close()
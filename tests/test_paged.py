@@ -0,0 +1,56 @@
+"""
+레코드 파일 테스트
+"""
+import os
+import tempfile
+from src.storage.paged import RecordFile, paged_base
+
+
+class TestRecordFile:
+    """레코드 파일 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'records.0.pages')
+        self.records = RecordFile(self.path)
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.records.close()
+        self.temp_dir.cleanup()
+
+    def test_append_and_read(self):
+        """덧붙인 레코드를 위치로 읽기"""
+        spans = self.records.append([b'{"a":1}\n', b'{"b":2}\n'])
+        assert spans == [(0, 8), (8, 8)]
+        assert self.records.read(*spans[1]) == b'{"b":2}\n'
+        assert self.records.size == 16
+
+    def test_read_after_append_remaps(self):
+        """매핑한 뒤 덧붙인 레코드도 읽음"""
+        first = self.records.append([b'first\n'])[0]
+        assert self.records.read(*first) == b'first\n'
+        second = self.records.append([b'second\n'])[0]
+        assert self.records.read(*second) == b'second\n'
+
+    def test_reopen(self):
+        """다시 열면 기존 레코드 뒤에 덧붙임"""
+        self.records.append([b'one\n'])
+        self.records.close()
+        self.records = RecordFile(self.path)
+        assert self.records.append([b'two\n']) == [(4, 4)]
+        assert self.records.read(0, 4) == b'one\n'
+
+    def test_copy_to(self):
+        """일부 레코드만 새 파일로 복사"""
+        spans = self.records.append([b'a\n', b'bb\n', b'ccc\n'])
+        new_path = os.path.join(self.temp_dir.name, 'records.1.pages')
+        new_spans = self.records.copy_to(new_path, [spans[0], spans[2]])
+        assert new_spans == [(0, 2), (2, 4)]
+        with open(new_path, 'rb') as f:
+            assert f.read() == b'a\nccc\n'
+
+    def test_paged_base(self):
+        """저장 경로에서 확장자 빼기"""
+        assert paged_base(os.path.join('data', 'history.json')) == os.path.join('data', 'history')
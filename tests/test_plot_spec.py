@@ -0,0 +1,215 @@
+"""
+그래프 명세 및 백엔드 테스트
+"""
+import json
+import math
+import pytest
+import numpy as np
+from xml.etree import ElementTree
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
+from src.rendering.spec import PlotSpec, Series, Marker, RefLine, Annotation, to_coords
+from src.rendering.backends import render_matplotlib, render_plotly, render_svg, render_spec
+from src.rendering.cache import RenderCache, render_spec_image
+from src.calculators.function_graph import FunctionGraphDrawer
+from src.calculators.linear_function import LinearFunctionDrawer
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+
+
+class TestPlotSpec:
+    """그래프 명세 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.spec = PlotSpec(
+            title='테스트',
+            layers=(
+                RefLine('h', 0),
+                Series.from_arrays([0, 1, 2], [0, np.nan, 4], label='y = x²'),
+                Marker.at(1, 1, color='green', label='점'),
+                Annotation(1, 1.5, '(1, 1)', ha='center'),
+            ),
+            xlim=(0, 2),
+            ylim=(-1, 5)
+        )
+
+    def test_to_coords_replaces_nan(self):
+        """NaN과 무한대는 None으로 변환"""
+        assert to_coords([1, np.nan, np.inf, 2]) == (1.0, None, None, 2.0)
+        assert to_coords(3) == (3.0,)
+
+    def test_spec_is_hashable(self):
+        """명세는 해시 가능하고 같은 내용이면 같음"""
+        other = PlotSpec.from_dict(self.spec.to_dict())
+        assert other == self.spec
+        assert hash(other) == hash(self.spec)
+        assert len({self.spec, other}) == 1
+
+    def test_json_round_trip(self):
+        """JSON을 거쳐도 같은 명세로 복원"""
+        restored = PlotSpec.from_dict(json.loads(self.spec.to_json()))
+        assert restored == self.spec
+        assert restored.key() == self.spec.key()
+
+    def test_key_changes_with_content(self):
+        """내용이 다르면 키가 다름"""
+        changed = PlotSpec(title='다른 제목', layers=self.spec.layers)
+        assert changed.key() != self.spec.key()
+
+    def test_unknown_layer_type(self):
+        """알 수 없는 요소 종류는 예외"""
+        data = self.spec.to_dict()
+        data['layers'].append({'type': 'bar'})
+        with pytest.raises(ValueError):
+            PlotSpec.from_dict(data)
+
+
+class TestBackends:
+    """그래프 백엔드 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.drawer = QuadraticFunctionDrawer()
+        self.spec = self.drawer.graph_spec(1, -2, -3, (-5, 5))
+
+    def test_matplotlib_backend(self):
+        """matplotlib Figure로 그리기"""
+        fig = render_matplotlib(self.spec)
+        ax = fig.axes[0]
+        assert isinstance(fig, Figure)
+        assert ax.get_title() == self.spec.title
+        assert ax.get_xlim() == (-5, 5)
+        assert len(ax.get_lines()) == sum(
+            isinstance(layer, (Series, Marker, RefLine)) for layer in self.spec.layers
+        )
+
+    def test_plotly_backend(self):
+        """Plotly Figure로 그리기"""
+        pytest.importorskip('plotly')
+        fig = render_plotly(self.spec)
+        names = [trace.name for trace in fig.data]
+        assert 'y = 1x² + -2x + -3' in names
+        assert list(fig.layout.xaxis.range) == [-5, 5]
+
+    def test_plotly_theme_and_gaps(self):
+        """Plotly 테마 적용과 정의되지 않는 점에서 선 끊김"""
+        pytest.importorskip('plotly')
+        spec = FunctionGraphDrawer().inverse_proportional_spec(1, (-5, 5))
+        fig = render_plotly(spec, theme='dark')
+        curve = next(trace for trace in fig.data if trace.name == 'y = 1.0/x')
+        assert fig.layout.template.layout.paper_bgcolor != 'white'
+        assert curve.connectgaps is False
+        assert any(v is None for v in curve.y)
+
+    def test_svg_backend(self):
+        """SVG 문자열로 그리기 (올바른 XML)"""
+        svg = render_svg(self.spec)
+        root = ElementTree.fromstring(svg)
+        assert root.tag.endswith('svg')
+        assert '이차함수' in svg
+        assert svg.count('<circle') == sum(
+            len(layer.x) for layer in self.spec.layers if isinstance(layer, Marker)
+        )
+
+    def test_svg_breaks_lines_at_gaps(self):
+        """정의되지 않는 점에서 선이 끊김"""
+        spec = FunctionGraphDrawer().inverse_proportional_spec(1, (-5, 5))
+        assert render_svg(spec).count('<polyline') == 2
+
+    def test_render_spec_dispatch(self):
+        """백엔드 이름으로 그리기"""
+        assert isinstance(render_spec(self.spec, 'matplotlib'), Figure)
+        assert render_spec(self.spec, 'svg').startswith('<svg')
+        with pytest.raises(ValueError):
+            render_spec(self.spec, 'unknown')
+
+    def test_spec_image_cache(self):
+        """명세 해시로 캐시되어 두 번째는 렌더링하지 않음"""
+        cache = RenderCache()
+        first = render_spec_image(self.spec, dpi=50, cache=cache)
+        second = render_spec_image(self.drawer.graph_spec(1, -2, -3, (-5, 5)), dpi=50, cache=cache)
+
+        assert first == second
+        stats = cache.get_statistics()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+
+    def test_spec_image_theme(self):
+        """어두운 테마는 다른 이미지로 그려 따로 캐시"""
+        cache = RenderCache()
+        light = render_spec_image(self.spec, dpi=50, cache=cache)
+        dark = render_spec_image(self.spec, dpi=50, theme='dark', cache=cache)
+        assert light != dark
+        assert cache.get_statistics()['misses'] == 2
+
+    def test_matplotlib_dark_theme(self):
+        """어두운 테마의 배경과 글자색"""
+        fig = render_matplotlib(self.spec, theme='dark')
+        ax = fig.axes[0]
+        assert to_hex(fig.get_facecolor()) == '#1e1e1e'
+        assert to_hex(ax.title.get_color()) == '#e0e0e0'
+
+
+class TestDrawerSpecs:
+    """그리기 클래스의 명세 생성 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.function = FunctionGraphDrawer(y_limit=5)
+        self.linear = LinearFunctionDrawer()
+        self.quadratic = QuadraticFunctionDrawer()
+
+    def test_proportional_spec(self):
+        """정비례 명세"""
+        spec = self.function.proportional_spec(2, (-5, 5))
+        series = [l for l in spec.layers if isinstance(l, Series)]
+        assert spec.title == '정비례 함수: y = 2.0x'
+        assert len(series) == 1
+        assert series[0].y[-1] == pytest.approx(10.0)
+
+    def test_inverse_proportional_spec_limits(self):
+        """반비례 명세의 y 범위 제한"""
+        spec = self.function.inverse_proportional_spec(1, (-5, 5))
+        assert spec.ylim == (-5, 5)
+        assert any(v is None for v in spec.layers[2].y)
+
+    def test_function_spec_invalid_type(self):
+        """지원하지 않는 함수 종류"""
+        with pytest.raises(ValueError):
+            self.function.function_spec('cubic', 1, (-5, 5))
+
+    def test_quadratic_spec_markers(self):
+        """꼭짓점, y절편, x절편 표시"""
+        spec = self.quadratic.graph_spec(1, -2, -3, (-5, 5))
+        markers = [l for l in spec.layers if isinstance(l, Marker)]
+        points = {(m.x[0], m.y[0]) for m in markers}
+        assert (1.0, -4.0) in points
+        assert (0.0, -3.0) in points
+        assert (3.0, 0.0) in points and (-1.0, 0.0) in points
+
+    def test_parabola_from_vertex_spec(self):
+        """표준형 명세는 일반형 명세와 같음"""
+        assert self.quadratic.parabola_from_vertex_spec(1, 1, -4, (-5, 5)) == \
+            self.quadratic.graph_spec(1, -2, -3, (-5, 5))
+
+    def test_compare_spec(self):
+        """두 이차함수 비교 명세"""
+        spec = self.quadratic.compare_spec(1, 0, 0, -1, 0, 0, (-3, 3))
+        labels = [l.label for l in spec.layers if isinstance(l, Series)]
+        assert len(labels) == 2
+        assert spec.xlim == (-3, 3)
+
+    def test_linear_spec(self):
+        """일차함수 명세 (기울기 삼각형 포함)"""
+        spec = self.linear.graph_spec(2, 1, (-5, 5))
+        assert len([l for l in spec.layers if isinstance(l, Series)]) == 4
+        assert any(isinstance(l, Annotation) and l.text == '2' for l in spec.layers)
+
+    def test_draw_uses_spec(self):
+        """draw 결과 Figure가 명세와 일치"""
+        spec = self.quadratic.graph_spec(1, 0, -1, (-4, 4))
+        fig = self.quadratic.draw(1, 0, -1, (-4, 4))
+        ax = fig.axes[0]
+        assert ax.get_title() == spec.title
+        assert ax.get_ylim() == pytest.approx(spec.ylim)
+        assert not math.isnan(ax.get_ylim()[0])
@@ -0,0 +1,119 @@
+"""
+다각형 계산 테스트
+"""
+import pytest
+import math
+import numpy as np
+from src.calculators.polygon import PolygonCalculator
+
+
+class TestPolygonCalculator:
+    """다각형 계산기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.calculator = PolygonCalculator()
+        self.square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+    def test_square_area(self):
+        """정사각형 넓이"""
+        assert self.calculator.area(self.square) == 16.0
+
+    def test_square_perimeter(self):
+        """정사각형 둘레"""
+        assert self.calculator.perimeter(self.square) == 16.0
+
+    def test_square_centroid(self):
+        """정사각형 무게중심"""
+        assert self.calculator.centroid(self.square) == pytest.approx((2.0, 2.0))
+
+    def test_orientation(self):
+        """꼭짓점 방향"""
+        assert self.calculator.orientation(self.square) == 'ccw'
+        assert self.calculator.orientation(self.square[::-1]) == 'cw'
+        assert self.calculator.orientation([(0, 0), (1, 1), (2, 2)]) == 'degenerate'
+
+    def test_signed_area_sign(self):
+        """시계 방향이면 부호 있는 넓이가 음수"""
+        assert self.calculator.signed_area(self.square[::-1]) == -16.0
+
+    def test_triangle_centroid(self):
+        """삼각형 무게중심 = 꼭짓점 평균"""
+        result = self.calculator.analyze([(0, 0), (6, 0), (0, 3)])
+        assert result.area == 9.0
+        assert result.centroid == pytest.approx((2.0, 1.0))
+        assert result.vertex_count == 3
+        assert len(result.steps) > 0
+
+    def test_l_shape_centroid(self):
+        """오목 다각형(L자) 무게중심"""
+        l_shape = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+        result = self.calculator.analyze(l_shape)
+        assert result.area == 3.0
+        # 2x1 직사각형(중심 (1, 0.5)) + 1x1 정사각형(중심 (0.5, 1.5))
+        assert result.centroid == pytest.approx((5 / 6, 5 / 6))
+
+    def test_many_vertices_circle(self):
+        """꼭짓점이 많은 정다각형은 원에 가까움"""
+        theta = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+        circle = np.column_stack([np.cos(theta), np.sin(theta)])
+        result = self.calculator.analyze(circle)
+        assert result.area == pytest.approx(math.pi, rel=1e-4)
+        assert result.perimeter == pytest.approx(2 * math.pi, rel=1e-4)
+        assert result.centroid == pytest.approx((0.0, 0.0), abs=1e-12)
+
+    def test_degenerate_centroid_is_mean(self):
+        """퇴화된 다각형의 무게중심은 꼭짓점 평균"""
+        result = self.calculator.analyze([(0, 0), (1, 1), (2, 2)])
+        assert result.area == 0.0
+        assert result.centroid == pytest.approx((1.0, 1.0))
+
+    def test_batch_matches_single(self):
+        """묶음 계산 결과가 개별 계산과 일치"""
+        polygons = [
+            self.square,
+            [(0, 0), (6, 0), (0, 3)],
+            [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)][::-1],
+            [(0, 0), (1, 1), (2, 2)]
+        ]
+        batch = self.calculator.analyze_many(polygons)
+        assert len(batch) == 4
+
+        for i, polygon in enumerate(polygons):
+            single = self.calculator.analyze(polygon)
+            assert batch.areas[i] == pytest.approx(single.area)
+            assert batch.signed_areas[i] == pytest.approx(single.signed_area)
+            assert batch.perimeters[i] == pytest.approx(single.perimeter)
+            assert tuple(batch.centroids[i]) == pytest.approx(single.centroid)
+
+        assert list(batch.orientations) == [1, 1, -1, 0]
+        assert list(batch.vertex_counts) == [4, 3, 6, 3]
+
+    def test_batch_with_offsets(self):
+        """오프셋 배열로 묶음 계산"""
+        vertices = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0), (2, 0), (0, 2)])
+        batch = self.calculator.analyze_batch(vertices, [0, 4, 7])
+        assert batch.areas == pytest.approx([1.0, 2.0])
+
+    def test_invalid_shape_raises_error(self):
+        """잘못된 형태의 꼭짓점 배열"""
+        with pytest.raises(ValueError):
+            self.calculator.area([1, 2, 3])
+
+    def test_too_few_vertices_raises_error(self):
+        """꼭짓점이 3개 미만"""
+        with pytest.raises(ValueError):
+            self.calculator.area([(0, 0), (1, 1)])
+
+    def test_nan_raises_error(self):
+        """NaN 좌표"""
+        with pytest.raises(ValueError):
+            self.calculator.area([(0, 0), (1, float('nan')), (0, 1)])
+
+    def test_invalid_offsets_raise_error(self):
+        """잘못된 오프셋"""
+        vertices = np.zeros((6, 2))
+        with pytest.raises(ValueError):
+            self.calculator.analyze_batch(vertices, [0, 2, 6])
+        with pytest.raises(ValueError):
+            self.calculator.analyze_batch(vertices, [0, 3, 5])
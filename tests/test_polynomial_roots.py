@@ -0,0 +1,103 @@
+"""
+고차방정식 풀이 테스트
+"""
+import pytest
+import numpy as np
+from fractions import Fraction
+from src.calculators.polynomial_roots import PolynomialRootFinder
+from src.calculators.algebraic_expression import AlgebraicCalculator
+
+
+class TestPolynomialRootFinder:
+    """고차방정식 풀이 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.finder = PolynomialRootFinder()
+
+    def test_cubic_rational_roots(self):
+        """삼차방정식: 정수근"""
+        # (x-1)(x-2)(x-3) = x³ - 6x² + 11x - 6
+        result = self.finder.solve([1, -6, 11, -6])
+        assert result.degree == 3
+        assert result.roots == [1.0, 2.0, 3.0]
+        assert result.rational_roots == [Fraction(1), Fraction(2), Fraction(3)]
+
+    def test_fractional_root_and_multiplicity(self):
+        """유리근(분수)과 중근"""
+        # (2x - 1)(x + 1)² = 2x³ + 3x² - 1
+        result = self.finder.solve([2, 3, 0, -1])
+        assert result.rational_roots == [Fraction(-1), Fraction(-1), Fraction(1, 2)]
+        assert result.roots == [-1.0, -1.0, 0.5]
+
+    def test_zero_root(self):
+        """상수항이 0인 경우 x = 0"""
+        result = self.finder.solve([1, 0, -4, 0])
+        assert result.roots == [-2.0, 0.0, 2.0]
+
+    def test_irrational_and_complex_roots(self):
+        """무리근과 허근"""
+        # (x² - 2)(x² + 1)
+        result = self.finder.solve([1, 0, -1, 0, -2])
+        assert result.real_roots == pytest.approx([-np.sqrt(2), np.sqrt(2)])
+        complex_roots = [r for r in result.roots if isinstance(r, complex)]
+        assert len(complex_roots) == 2
+        assert complex_roots[0] == pytest.approx(-1j)
+        assert complex_roots[1] == pytest.approx(1j)
+
+    def test_non_integer_coefficients(self):
+        """정수가 아닌 계수"""
+        result = self.finder.solve([0.5, -1.5, 1])
+        assert result.roots == pytest.approx([1.0, 2.0])
+        assert result.rational_roots == []
+
+    def test_leading_zeros_are_stripped(self):
+        """최고차항의 0 제거"""
+        result = self.finder.solve([0, 0, 2, -4])
+        assert result.degree == 1
+        assert result.roots == [2.0]
+
+    def test_invalid_coefficients(self):
+        """잘못된 계수"""
+        with pytest.raises(ValueError):
+            self.finder.solve([0, 0, 0])
+        with pytest.raises(ValueError):
+            self.finder.solve([5])
+        with pytest.raises(ValueError):
+            self.finder.solve([1, float('nan')])
+
+    def test_solve_batch_quartics(self):
+        """사차방정식 여러 개를 한 번에 풀기"""
+        rng = np.random.default_rng(5)
+        true_roots = rng.uniform(-5, 5, (1000, 4))
+        coeffs = np.array([np.poly(r) for r in true_roots])
+
+        roots = self.finder.solve_batch(coeffs)
+        assert roots.shape == (1000, 4)
+        np.testing.assert_allclose(
+            np.sort(roots.real, axis=1), np.sort(true_roots, axis=1), atol=1e-6
+        )
+
+    def test_real_roots_batch(self):
+        """실근만 구하기"""
+        coeffs = [[1, 0, -1], [1, 0, 1]]
+        real = self.finder.real_roots_batch(coeffs)
+        np.testing.assert_allclose(real[0], [-1, 1])
+        assert len(real[1]) == 0
+
+    def test_solve_batch_invalid_leading_coefficient(self):
+        """최고차항 계수가 0인 일괄 풀이"""
+        with pytest.raises(ValueError):
+            self.finder.solve_batch([[0, 1, 2]])
+
+    def test_solve_expression(self):
+        """다항식 문자열로 풀기"""
+        result = self.finder.solve_expression("x^3 - 6x^2 + 11x - 6")
+        assert result.roots == [1.0, 2.0, 3.0]
+
+    def test_to_coefficients(self):
+        """AlgebraicCalculator 계수 변환"""
+        calc = AlgebraicCalculator()
+        assert calc.to_coefficients("2x^3 - x + 5") == [2.0, 0.0, -1.0, 5.0]
+        with pytest.raises(ValueError):
+            calc.to_coefficients("x^2 + y")
@@ -18,8 +18,9 @@ class TestProgressTracker:
 
     def teardown_method(self):
         """각 테스트 후에 실행"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        for path in (self.temp_file.name, self.temp_file.name + '.cache'):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_initialization(self):
         """초기화 테스트"""
@@ -114,3 +115,68 @@ class TestProgressTracker:
 
         self.tracker.reset_all_progress()
         assert len(self.tracker.topic_progress) == 0
+
+
+class TestProgressTrackerSQLite:
+    """SQLite 학습 진도 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'progress.json')
+        self.tracker = ProgressTracker(storage_path=self.path, backend='sqlite')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.tracker.store.close()
+        self.temp_dir.cleanup()
+
+    def test_record_and_statistics(self):
+        """풀이 기록과 전체 통계"""
+        self.tracker.record_attempt("일차방정식", True, 5)
+        self.tracker.record_attempt("일차방정식", False, 5)
+        self.tracker.record_attempt("통계", True)
+
+        progress = self.tracker.get_topic_progress("일차방정식")
+        assert progress.problems_attempted == 2
+        assert progress.mastery_level == 0.5
+
+        stats = self.tracker.get_overall_statistics()
+        assert stats['total_topics'] == 2
+        assert stats['total_problems_attempted'] == 3
+        assert stats['overall_accuracy'] == pytest.approx(200 / 3)
+        assert stats['total_study_time_minutes'] == 10
+        assert stats['average_mastery_level'] == pytest.approx(0.75)
+        assert list(self.tracker.get_all_progress()) == ["일차방정식", "통계"]
+
+    def test_weak_topics_and_reset(self):
+        """약한 주제와 진도 초기화"""
+        self.tracker.record_attempt("확률", False)
+        self.tracker.record_attempt("기하", True)
+        assert self.tracker.get_weak_topics(0.6) == ["확률"]
+
+        self.tracker.reset_topic_progress("확률")
+        assert self.tracker.get_topic_progress("확률") is None
+        self.tracker.reset_all_progress()
+        assert self.tracker.topic_progress == {}
+
+    def test_sessions(self):
+        """세션 시작/종료와 최근 세션"""
+        session_id = self.tracker.start_session("통계")
+        self.tracker.end_session(session_id, 10, 8)
+
+        reopened = ProgressTracker(storage_path=self.path, backend='sqlite')
+        sessions = reopened.get_recent_sessions()
+        assert len(sessions) == 1
+        assert sessions[0].problems_correct == 8
+        assert sessions[0].end_time is not None
+        reopened.store.close()
+
+    def test_migrate_from_json(self):
+        """기존 JSON 진도 데이터를 처음 열 때 옮겨 담음"""
+        path = os.path.join(self.temp_dir.name, 'legacy.json')
+        ProgressTracker(storage_path=path, backend='json').record_attempt("기하", True)
+
+        migrated = ProgressTracker(storage_path=path, backend='sqlite')
+        assert migrated.get_topic_progress("기하").problems_correct == 1
+        migrated.store.close()
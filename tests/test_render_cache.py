@@ -0,0 +1,141 @@
+"""
+렌더 캐시 테스트
+"""
+import os
+import tempfile
+import pytest
+from src.rendering.cache import RenderCache, make_render_key, render_graph
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+from src.calculators.function_graph import FunctionGraphDrawer
+
+
+class TestRenderCache:
+    """렌더 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = RenderCache(max_items=3)
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_key_is_stable(self):
+        """같은 입력은 같은 키"""
+        k1 = make_render_key('QuadraticFunctionDrawer.draw', {'a': 1, 'x_range': (-5, 5)})
+        k2 = make_render_key('QuadraticFunctionDrawer.draw', {'x_range': [-5, 5], 'a': 1.0})
+        assert k1 == k2
+
+    def test_key_depends_on_inputs(self):
+        """드로어, 입력, 테마, DPI, 형식이 다르면 다른 키"""
+        base = make_render_key('D.draw', {'a': 1})
+        assert base != make_render_key('D.draw', {'a': 2})
+        assert base != make_render_key('E.draw', {'a': 1})
+        assert base != make_render_key('D.draw', {'a': 1}, theme='dark')
+        assert base != make_render_key('D.draw', {'a': 1}, dpi=200)
+        assert base != make_render_key('D.draw', {'a': 1}, fmt='svg')
+
+    def test_get_put(self):
+        """저장과 조회"""
+        assert self.cache.get('k') is None
+        self.cache.put('k', b'data')
+        assert self.cache.get('k') == b'data'
+        stats = self.cache.get_statistics()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_lru_eviction(self):
+        """최근에 쓰지 않은 항목부터 제거"""
+        for key in ['a', 'b', 'c']:
+            self.cache.put(key, key.encode())
+        self.cache.get('a')
+        self.cache.put('d', b'd')
+        assert 'b' not in self.cache
+        assert 'a' in self.cache
+        assert len(self.cache) == 3
+
+    def test_byte_limit(self):
+        """메모리 바이트 한도"""
+        cache = RenderCache(max_items=100, max_bytes=10)
+        cache.put('a', b'123456')
+        cache.put('b', b'123456')
+        assert 'a' not in cache
+        assert cache.get_statistics()['bytes'] == 6
+
+    def test_get_or_render_calls_once(self):
+        """미스일 때만 렌더 함수 호출"""
+        calls = []
+
+        def render():
+            calls.append(1)
+            return b'png'
+
+        assert self.cache.get_or_render('k', render) == b'png'
+        assert self.cache.get_or_render('k', render) == b'png'
+        assert len(calls) == 1
+
+    def test_disk_tier_survives_new_instance(self):
+        """디스크 계층은 새 인스턴스에서도 조회"""
+        cache = RenderCache(disk_dir=self.temp_dir.name)
+        cache.put('k', b'data')
+
+        fresh = RenderCache(disk_dir=self.temp_dir.name)
+        assert fresh.get('k') == b'data'
+        assert fresh.get_statistics()['disk_hits'] == 1
+
+    def test_disk_size_eviction(self):
+        """디스크 계층 크기 한도 초과 시 오래된 파일 제거"""
+        cache = RenderCache(disk_dir=self.temp_dir.name, disk_max_bytes=25)
+        cache.put('old', b'x' * 10)
+        os.utime(os.path.join(self.temp_dir.name, 'old.bin'), (1, 1))
+        cache.put('mid', b'y' * 10)
+        cache.put('new', b'z' * 10)
+
+        files = sorted(os.listdir(self.temp_dir.name))
+        assert files == ['mid.bin', 'new.bin']
+
+    def test_clear(self):
+        """캐시 비우기"""
+        cache = RenderCache(disk_dir=self.temp_dir.name)
+        cache.put('k', b'data')
+        cache.clear()
+        assert cache.get('k') is None
+
+
+class TestRenderGraph:
+    """그래프 렌더링 캐시 연동 테스트 클래스"""
+
+    def test_second_render_skips_matplotlib(self, monkeypatch):
+        """같은 그래프는 두 번째부터 Figure를 만들지 않음"""
+        cache = RenderCache()
+        drawer = QuadraticFunctionDrawer()
+
+        png = render_graph(drawer, 'draw', 1, 0, -4, (-5, 5), cache=cache)
+        assert png.startswith(b'\x89PNG')
+
+        def fail(*args, **kwargs):
+            raise AssertionError("캐시 적중 시 그리면 안 됨")
+
+        monkeypatch.setattr(drawer, 'draw', fail)
+        assert render_graph(drawer, 'draw', 1, 0, -4, (-5, 5), cache=cache) == png
+
+    def test_svg_format(self):
+        """SVG 형식"""
+        svg = render_graph(QuadraticFunctionDrawer(), 'draw', 1, 0, 0, (-3, 3),
+                           fmt='svg', cache=RenderCache())
+        assert b'<svg' in svg
+
+    def test_drawer_settings_are_part_of_key(self):
+        """드로어 설정(y_limit)이 다르면 다른 캐시 항목"""
+        cache = RenderCache()
+        render_graph(FunctionGraphDrawer(y_limit=10), 'draw_inverse_proportional', 1, (-5, 5), cache=cache)
+        render_graph(FunctionGraphDrawer(y_limit=20), 'draw_inverse_proportional', 1, (-5, 5), cache=cache)
+        assert len(cache) == 2
+
+    def test_errors_are_not_cached(self):
+        """그리기 오류는 캐시하지 않음"""
+        cache = RenderCache()
+        with pytest.raises(ValueError):
+            render_graph(FunctionGraphDrawer(), 'draw_inverse_proportional', 0, (-5, 5), cache=cache)
+        assert len(cache) == 0
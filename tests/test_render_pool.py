@@ -0,0 +1,148 @@
+"""
+렌더 작업자 풀 테스트
+"""
+import pytest
+from src.rendering.figures import get_figure_manager
+from src.rendering.pool import RenderPool, RenderJob, get_render_pool
+from src.rendering.backends import render_matplotlib
+from src.rendering.cache import RenderCache, render_graph, render_spec_image
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+from src.calculators.function_graph import FunctionGraphDrawer
+from src.calculators.coordinate import CoordinateCalculator
+from src.features.visualizations import ProgressVisualizer
+
+
+class TestRenderJob:
+    """렌더 작업 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.drawer = QuadraticFunctionDrawer(x_limit=8, y_limit=12)
+
+    def test_from_drawer_captures_state(self):
+        """그리기 객체 설정값과 인자를 담음"""
+        job = RenderJob.from_drawer(self.drawer, 'draw', (1, 0, -4, (-5, 5)), {'grid_alpha': 0.3})
+        assert job.target == 'QuadraticFunctionDrawer'
+        assert dict(job.state) == {'x_limit': 8, 'y_limit': 12}
+        assert dict(job.kwargs) == {'grid_alpha': 0.3}
+
+    def test_job_is_hashable(self):
+        """같은 작업은 같은 해시"""
+        a = RenderJob.from_drawer(self.drawer, 'draw', (1, 0, -4, (-5, 5)))
+        b = RenderJob.from_drawer(self.drawer, 'draw', (1, 0, -4, (-5, 5)))
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_unsupported_target(self):
+        """지원하지 않는 대상은 예외"""
+        with pytest.raises(ValueError):
+            RenderJob.from_drawer(CoordinateCalculator(), 'distance')
+
+    def test_pool_disabled_by_default(self, monkeypatch):
+        """환경변수가 없으면 전역 풀을 사용하지 않음"""
+        monkeypatch.delenv('MATH_HELPER_RENDER_WORKERS', raising=False)
+        assert get_render_pool() is None
+
+    def test_invalid_worker_count(self):
+        """작업자 수 검증"""
+        with pytest.raises(ValueError):
+            RenderPool(max_workers=0)
+
+
+class TestRenderPool:
+    """렌더 작업자 풀 테스트 클래스 (작업자 시작 비용 때문에 풀을 공유)"""
+
+    @classmethod
+    def setup_class(cls):
+        """클래스의 테스트 전에 한 번 실행"""
+        cls.pool = RenderPool(max_workers=1, max_pending=2)
+        cls.pool.start(timeout=120)
+
+    @classmethod
+    def teardown_class(cls):
+        """클래스의 테스트 후에 한 번 실행"""
+        cls.pool.shutdown()
+
+    def test_render_matches_in_process(self):
+        """작업자 렌더 결과가 현재 프로세스 렌더 결과와 같음"""
+        drawer = QuadraticFunctionDrawer()
+        job = RenderJob.from_drawer(drawer, 'draw', (1, -2, -3, (-5, 5)), dpi=50)
+        expected = get_figure_manager().to_bytes(drawer.draw(1, -2, -3, (-5, 5)), dpi=50)
+
+        assert self.pool.render(job) == expected
+
+    def test_drawer_state_is_applied(self):
+        """그리기 객체 설정값이 작업자에 전달됨"""
+        drawer = FunctionGraphDrawer(y_limit=3)
+        job = RenderJob.from_drawer(drawer, 'draw_proportional', (2, (-5, 5)), dpi=50)
+        expected = get_figure_manager().to_bytes(drawer.draw_proportional(2, (-5, 5)), dpi=50)
+
+        assert self.pool.render(job) == expected
+
+    def test_render_graph_uses_pool(self):
+        """render_graph가 캐시 미스 때 풀로 렌더링"""
+        before = self.pool.get_statistics()['submitted']
+        cache = RenderCache()
+        drawer = QuadraticFunctionDrawer()
+
+        first = render_graph(drawer, 'draw', 2, 0, 0, (-3, 3), dpi=50, cache=cache, pool=self.pool)
+        second = render_graph(drawer, 'draw', 2, 0, 0, (-3, 3), dpi=50, cache=cache, pool=self.pool)
+
+        assert first == second
+        assert self.pool.get_statistics()['submitted'] == before + 1
+
+    def test_render_spec_matches_in_process(self):
+        """작업자에서 그린 명세 이미지가 현재 프로세스 결과와 같음"""
+        spec = QuadraticFunctionDrawer().graph_spec(1, -2, -3, (-5, 5))
+        expected = get_figure_manager().to_bytes(render_matplotlib(spec, dpi=50, theme='dark'), dpi=50)
+
+        assert self.pool.render_spec(spec, dpi=50, theme='dark') == expected
+
+    def test_render_spec_image_uses_pool(self):
+        """render_spec_image가 캐시 미스 때 풀로 렌더링"""
+        before = self.pool.get_statistics()['submitted']
+        cache = RenderCache()
+        spec = QuadraticFunctionDrawer().graph_spec(2, 0, 0, (-3, 3))
+
+        first = render_spec_image(spec, dpi=50, cache=cache, pool=self.pool)
+        second = render_spec_image(spec, dpi=50, cache=cache, pool=self.pool)
+
+        assert first == second
+        assert self.pool.get_statistics()['submitted'] == before + 1
+
+    def test_progress_chart_uses_pool(self):
+        """학습 진도 히트맵을 작업자에서 그리고 결과가 현재 프로세스와 같음"""
+        before = self.pool.get_statistics()['submitted']
+        visualizer = ProgressVisualizer()
+        daily = {'2026-10-01': 3, '2026-10-15': 7}
+        expected = get_figure_manager().to_bytes(
+            visualizer.create_weekly_heatmap(daily, end_date='2026-10-19'), dpi=100
+        )
+
+        image = visualizer.render_chart('create_weekly_heatmap', daily, end_date='2026-10-19',
+                                        cache=RenderCache(), pool=self.pool)
+        assert image == expected
+        assert self.pool.get_statistics()['submitted'] == before + 1
+
+    def test_worker_error_propagates(self):
+        """작업자 안의 예외가 호출한 쪽으로 전달됨"""
+        job = RenderJob.from_drawer(QuadraticFunctionDrawer(), 'draw', (0, 0, 0, (-5, 5)))
+        with pytest.raises(ValueError):
+            self.pool.render(job)
+
+    def test_back_pressure(self):
+        """대기열이 가득 차면 제출이 거부됨"""
+        job = RenderJob.from_drawer(QuadraticFunctionDrawer(), 'draw', (1, 0, 0, (-9, 9)))
+        futures = [self.pool.submit(job) for _ in range(2)]
+        with pytest.raises(TimeoutError):
+            self.pool.submit(job, timeout=0)
+
+        for future in futures:
+            future.result(timeout=60)
+        assert self.pool.get_statistics()['rejected'] >= 1
+
+    def test_result_timeout(self):
+        """결과 대기 시간 초과"""
+        job = RenderJob.from_drawer(QuadraticFunctionDrawer(), 'compare_graphs', (1, 0, 0, -1, 0, 0, (-9, 9)))
+        with pytest.raises(TimeoutError):
+            self.pool.render(job, timeout=0)
@@ -0,0 +1,166 @@
+"""
+히스토리 보관 정책 테스트
+"""
+import os
+import tempfile
+from datetime import datetime, timedelta
+import pytest
+from src.features.history_manager import HistoryManager
+from src.features.retention import RETENTION_BATCH, RetentionPolicy, TimeOrder
+from src.storage.checked_json import write_checked_json
+
+
+class TestTimeOrder:
+    """TimeOrder 테스트 클래스"""
+
+    def test_order_and_cutoff(self):
+        """시각 순서 유지와 기준 시각 이전 개수"""
+        order = TimeOrder()
+        for epoch, entry_id in [(10, 'a'), (30, 'c'), (20, 'b'), (30, 'd')]:
+            order.add(epoch, entry_id)
+
+        assert len(order) == 4
+        assert order.count_until(20) == 2
+        assert order.count_until(5) == 0
+        assert [order.pop()[1] for _ in range(4)] == ['a', 'b', 'c', 'd']
+        assert order.peek() is None
+
+    def test_trim_keeps_remaining(self):
+        """앞부분을 많이 꺼내 잘라내도 남은 항목은 그대로"""
+        order = TimeOrder()
+        for i in range(3000):
+            order.add(i, str(i))
+        for _ in range(2000):
+            order.pop()
+        assert len(order) == 1000
+        assert order.peek() == (2000, '2000')
+        assert order.count_until(2499) == 500
+
+
+class TestRetentionPolicy:
+    """보관 정책 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'history.json')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def _manager(self, backend='json', **policy):
+        return HistoryManager(
+            storage_path=self.path, backend=backend, write_behind=False,
+            retention=RetentionPolicy(**policy)
+        )
+
+    def _write_old_entries(self, count, days_old):
+        """days_old일 전 기록 count개를 스냅샷으로 저장"""
+        base = datetime.now() - timedelta(days=days_old)
+        entries = [
+            {"id": f"old_{i}", "calculator_type": "통계",
+             "timestamp": (base + timedelta(seconds=i)).isoformat(),
+             "inputs": {}, "outputs": {}, "steps": [], "is_favorite": i == 0}
+            for i in range(count)
+        ]
+        write_checked_json(self.path, list(reversed(entries)))
+
+    def test_invalid_policy(self):
+        """잘못된 정책 값"""
+        with pytest.raises(ValueError):
+            RetentionPolicy(max_age_days=-1)
+        with pytest.raises(ValueError):
+            RetentionPolicy(max_count=-1)
+        with pytest.raises(ValueError):
+            RetentionPolicy(type_caps={"통계": -1})
+        assert RetentionPolicy().enabled is False
+
+    def test_max_count_keeps_favorites(self):
+        """최대 개수를 넘으면 오래된 기록부터 삭제하되 즐겨찾기는 보존"""
+        manager = self._manager(max_count=3)
+        first = manager.add_calculation("일차방정식", {"a": 1}, {}, [])
+        manager.toggle_favorite(first)
+        ids = [manager.add_calculation("일차방정식", {"a": i}, {}, []) for i in range(2, 6)]
+
+        assert [e.id for e in manager.history] == [ids[3], ids[2], first]
+
+        # 즐겨찾기를 해제하면 다시 정리 대상
+        manager.toggle_favorite(first)
+        newest = manager.add_calculation("통계", {}, {}, [])
+        assert [e.id for e in manager.history] == [newest, ids[3], ids[2]]
+
+    def test_type_caps(self):
+        """계산기 종류별 최대 개수"""
+        manager = self._manager(type_caps={"통계": 2})
+        stats_ids = [manager.add_calculation("통계", {"n": i}, {}, []) for i in range(3)]
+        other = manager.add_calculation("일차방정식", {}, {}, [])
+
+        assert [e.id for e in manager.history] == [other, stats_ids[2], stats_ids[1]]
+        assert manager.get_statistics()['calculator_usage'] == {"통계": 2, "일차방정식": 1}
+
+    def test_max_age_on_load(self):
+        """오래된 기록은 불러올 때 정리되고 파일에도 반영"""
+        self._write_old_entries(5, days_old=60)
+        manager = self._manager(max_age_days=30)
+        assert [e.id for e in manager.history] == ["old_0"]  # 즐겨찾기만 남음
+
+        reloaded = HistoryManager(storage_path=self.path, write_behind=False, retention=RetentionPolicy())
+        assert len(reloaded.history) == 1
+
+    def test_incremental_batches(self):
+        """한 번에 RETENTION_BATCH개까지만 삭제하고 나머지는 이어서 정리"""
+        self._write_old_entries(RETENTION_BATCH + 50, days_old=60)
+        manager = self._manager(max_age_days=30, keep_favorites=False)
+        assert len(manager.history) == 50
+
+        manager.add_calculation("통계", {}, {}, [])
+        assert len(manager.history) == 1
+
+    def test_clear_old_entries_includes_favorites(self):
+        """clear_old_entries는 즐겨찾기도 삭제"""
+        self._write_old_entries(3, days_old=60)
+        manager = self._manager()
+        recent = manager.add_calculation("통계", {}, {}, [])
+
+        manager.clear_old_entries(days=30)
+        assert [e.id for e in manager.history] == [recent]
+
+    def test_sqlite_policy(self):
+        """SQLite 방식도 같은 정책 적용"""
+        manager = self._manager(backend='sqlite', max_count=4, type_caps={"통계": 4})
+        first = manager.add_calculation("통계", {}, {}, [])
+        manager.toggle_favorite(first)
+        for i in range(4):
+            manager.add_calculation("통계", {"n": i}, {}, [])
+        manager.add_calculation("일차방정식", {}, {}, [])
+
+        # 개수 상한은 추가할 때마다 적용되어 밀린 정리가 없음
+        assert manager.apply_retention() == 0
+        history = manager.history
+        assert len(history) == 4
+        assert first in [e.id for e in history]
+        assert manager.get_statistics()['calculator_usage'] == {"통계": 3, "일차방정식": 1}
+        manager.store.close()
+
+    def _check_caps_on_add(self, backend):
+        """추가할 때마다 개수 상한이 적용되고 검색 색인에도 반영"""
+        manager = self._manager(backend=backend, max_count=5, type_caps={"통계": 2})
+        for _ in range(2):  # 두 번째 검색부터 색인 사용
+            manager.search_history("통계")
+        ids = [manager.add_calculation("일차방정식", {"n": i}, {}, []) for i in range(30)]
+        stats_ids = [manager.add_calculation("통계", {"n": i}, {}, []) for i in range(3)]
+
+        assert len(ids) + len(stats_ids) < RETENTION_BATCH
+        assert [e.id for e in manager.history] == [stats_ids[2], stats_ids[1], ids[29], ids[28], ids[27]]
+        assert [e.id for e in manager.search_history("일차방정식")] == [ids[29], ids[28], ids[27]]
+        assert len(manager.search_history("통계")) == 2
+        manager.store.close()
+
+    def test_sqlite_caps_on_every_add(self):
+        """SQLite 방식은 추가할 때마다 개수 상한 적용"""
+        self._check_caps_on_add('sqlite')
+
+    def test_paged_caps_on_every_add(self):
+        """페이지 방식은 추가할 때마다 개수 상한 적용"""
+        self._check_caps_on_add('paged')
@@ -0,0 +1,89 @@
+"""
+적응형 곡선 샘플링 테스트
+"""
+import pytest
+import numpy as np
+from src.rendering.sampling import adaptive_sample
+from src.calculators.function_graph import FunctionGraphDrawer
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+
+
+def _max_chord_error(func, x, y):
+    """샘플 점을 이은 꺾은선과 실제 함수의 최대 차이 (유한 구간만)"""
+    worst = 0.0
+    for x0, x1, y0, y1 in zip(x[:-1], x[1:], y[:-1], y[1:]):
+        if not (np.isfinite(y0) and np.isfinite(y1)):
+            continue
+        t = np.linspace(0, 1, 21)
+        xs = x0 + (x1 - x0) * t
+        worst = max(worst, np.max(np.abs(func(xs) - (y0 + (y1 - y0) * t))))
+    return worst
+
+
+class TestAdaptiveSample:
+    """적응형 샘플링 테스트 클래스"""
+
+    def test_line_needs_no_refinement(self):
+        """직선은 처음 점만으로 충분"""
+        x, y = adaptive_sample(lambda t: 2 * t + 1, (-5, 5), initial_points=5)
+        assert len(x) == 5
+        np.testing.assert_allclose(y, 2 * x + 1)
+
+    def test_parabola_fewer_points_than_fixed_grid(self):
+        """포물선: 고정 300점보다 적은 점으로 오차 기준 충족"""
+        func = lambda t: t ** 2 - 3
+        x, y = adaptive_sample(func, (-5, 5), max_points=300)
+        assert len(x) < 300
+        height = np.percentile(y, 95) - np.percentile(y, 5)
+        assert _max_chord_error(func, x, y) <= 2e-3 * height
+
+    def test_budget_is_respected(self):
+        """점 개수 예산"""
+        x, _ = adaptive_sample(np.sin, (0, 100), max_points=50)
+        assert len(x) <= 50
+        assert np.all(np.diff(x) > 0)
+
+    def test_endpoints_included(self):
+        """양 끝점 포함"""
+        x, _ = adaptive_sample(np.sin, (-3, 4))
+        assert x[0] == -3
+        assert x[-1] == 4
+
+    def test_asymptote_is_broken(self):
+        """반비례: x = 0에서 선이 끊기고 양쪽 가지가 이어지지 않음"""
+        x, y = adaptive_sample(lambda t: 1 / t, (-5, 5), y_range=(-10, 10))
+        assert np.any(np.isnan(y))
+        finite = np.isfinite(y)
+        connected = finite[:-1] & finite[1:]
+        crosses = (x[:-1] < 0) & (x[1:] > 0)
+        assert not np.any(connected & crosses)
+
+    def test_asymptote_gets_denser_sampling(self):
+        """점근선 근처가 평평한 곳보다 촘촘함"""
+        x, y = adaptive_sample(lambda t: 1 / t, (0.1, 10), y_range=(-10, 10))
+        near = np.sum(x < 1)
+        far = np.sum(x > 9)
+        assert near > far
+
+    def test_invalid_range_raises(self):
+        """잘못된 x 범위"""
+        with pytest.raises(ValueError):
+            adaptive_sample(np.sin, (5, 5))
+
+
+class TestDrawersUseAdaptiveSampling:
+    """그래프 그리기 연동 테스트 클래스"""
+
+    def test_inverse_proportional_single_broken_line(self):
+        """반비례 그래프는 하나의 끊긴 선으로 그림"""
+        fig = FunctionGraphDrawer().draw_inverse_proportional(2, (-5, 5))
+        lines = [l for l in fig.axes[0].get_lines() if l.get_color() == 'red']
+        assert len(lines) == 1
+        ydata = np.asarray(lines[0].get_ydata(), dtype=float)
+        assert np.any(np.isnan(ydata))
+
+    def test_quadratic_uses_fewer_vertices(self):
+        """이차함수 그래프 꼭짓점 수가 고정 300개보다 적음"""
+        fig = QuadraticFunctionDrawer().draw(1, 0, 0, (-5, 5))
+        curve = fig.axes[0].get_lines()[2]
+        assert len(curve.get_xdata()) < 300
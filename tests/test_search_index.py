@@ -0,0 +1,158 @@
+"""
+역색인 검색 테스트
+"""
+import os
+import time
+import tempfile
+from src.features.search_index import InvertedIndex, tokenize, index_terms
+from src.features.history_manager import HistoryManager
+
+
+class TestInvertedIndex:
+    """역색인 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.index = InvertedIndex()
+        self.index.add(1, "일차방정식 {'a': 2, 'b': 3} 2x + 3 = 5")
+        self.index.add(2, "이차방정식 {'a': 1} x² = 4")
+        self.index.add(3, "통계 평균 12.5 Mean")
+
+    def test_tokenize(self):
+        """한글/영문/숫자 토큰 분리"""
+        assert tokenize("2x + 3 = 5 일차방정식") == ['2', 'x', '3', '5', '일차방정식']
+        assert tokenize("Mean 12.5") == ['mean', '12.5']
+        assert tokenize("x²") == ['x²']
+
+    def test_suffix_terms(self):
+        """토큰의 접미사도 색인"""
+        assert {'일차방정식', '방정식', '식'} <= index_terms("일차방정식")
+        assert {'equation', 'ation', 'n'} <= index_terms("equation")
+
+    def test_prefix_and_infix_search(self):
+        """접두어와 낱말 중간 검색"""
+        assert self.index.search("일차") == {1}
+        assert self.index.search("방정식") == {1, 2}
+        assert self.index.search("mea") == {3}
+        assert self.index.search("ean") == {3}
+        assert self.index.search("12") == {3}
+        assert 3 in self.index.search("2.5")  # 후보이므로 원문 확인 전에는 다른 문서도 포함될 수 있음
+
+    def test_all_tokens_required(self):
+        """모든 토큰이 일치해야 함"""
+        assert self.index.search("방정식 x²") == {2}
+        assert self.index.search("방정식 평균") == set()
+
+    def test_no_tokens(self):
+        """토큰이 없는 검색어"""
+        assert self.index.search("+ =") is None
+
+    def test_remove(self):
+        """삭제하면 검색되지 않고 빈 용어도 정리"""
+        self.index.remove(3)
+        assert self.index.search("평균") == set()
+        assert len(self.index) == 2
+        self.index.remove(3)  # 없는 번호는 무시
+
+
+class TestHistorySearch:
+    """히스토리 색인 검색 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'history.json')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def _check_incremental(self, manager):
+        id1 = manager.add_calculation("일차방정식", {"a": 2}, {"x": 1}, ["2x = 2"])
+        manager.add_calculation("통계", {"data": [1, 2]}, {"mean": 1.5}, [])
+        assert [e.id for e in manager.search_history("방정식")] == [id1]
+
+        # 색인이 만들어진 뒤 추가/삭제도 반영
+        id3 = manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, [])
+        assert [e.id for e in manager.search_history("방정식")] == [id3, id1]
+        manager.delete_entry(id1)
+        assert [e.id for e in manager.search_history("방정식")] == [id3]
+        assert len(manager.search_history("mean")) == 1
+
+    def test_json_backend(self):
+        """JSON 방식 검색"""
+        self._check_incremental(HistoryManager(storage_path=self.path, backend='json'))
+
+    def test_sqlite_backend(self):
+        """SQLite 방식 검색"""
+        manager = HistoryManager(storage_path=self.path, backend='sqlite')
+        self._check_incremental(manager)
+        manager.store.close()
+
+    def test_same_results_as_scan(self):
+        """색인 검색 결과가 전체를 훑는 부분 문자열 검색과 같음"""
+        manager = HistoryManager(storage_path=self.path, backend='json')
+        id1 = manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, ["x = 1"])
+        manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, ["1 = x"])
+        id3 = manager.add_calculation("equation", {"v": "1.2.3"}, {}, [])
+
+        assert [e.id for e in manager.search_history("x = 1")] == [id1]
+        assert [e.id for e in manager.search_history("ation")] == [id3]
+        assert [e.id for e in manager.search_history("2.3")] == [id3]
+
+    def test_fresh_manager_scans_first(self):
+        """새로 만든 관리자의 첫 검색은 색인을 만들지 않고 훑고, 다시 검색할 때 색인 생성"""
+        manager = HistoryManager(storage_path=self.path, backend='json')
+        for i in range(50):
+            manager.add_calculation("일차방정식", {"a": i}, {"x": i}, [])
+        manager.flush()
+
+        fresh = HistoryManager(storage_path=self.path, backend='json')
+        assert len(fresh.search_history("'a': 49")) == 1
+        assert fresh._index is None
+
+        assert len(fresh.search_history("'a': 4")) == 11
+        assert fresh._index is not None
+
+    def test_sqlite_index_sees_other_connections(self):
+        """같은 데이터베이스를 쓰는 다른 관리자의 추가/삭제가 검색에 반영됨"""
+        first = HistoryManager(storage_path=self.path, backend='sqlite')
+        second = HistoryManager(storage_path=self.path, backend='sqlite')
+        first.add_calculation("일차방정식", {"a": 1}, {}, [])
+        for _ in range(2):  # 두 번째 검색부터 색인 사용
+            assert len(second.search_history("방정식")) == 1
+
+        other_id = first.add_calculation("이차방정식", {"a": 2}, {}, [])
+        assert len(second.search_history("방정식")) == 2
+
+        first.delete_entry(other_id)
+        assert len(second.search_history("이차")) == 0
+        assert len(second.search_history("방정식")) == 1
+        first.store.close()
+        second.store.close()
+
+    def test_symbol_only_falls_back(self):
+        """기호만 입력하면 부분 문자열 검색"""
+        manager = HistoryManager(storage_path=self.path, backend='json')
+        manager.add_calculation("일차방정식", {}, {}, ["2x + 3 = 5"])
+        assert len(manager.search_history("+")) == 1
+
+    def test_clear_resets_index(self):
+        """전체 삭제 후 검색 결과 없음"""
+        manager = HistoryManager(storage_path=self.path, backend='json')
+        manager.add_calculation("일차방정식", {}, {}, [])
+        assert len(manager.search_history("일차")) == 1
+        manager.clear_all()
+        assert manager.search_history("일차") == []
+
+    def test_large_index_search_fast(self):
+        """기록이 많아도 검색이 빠름"""
+        index = InvertedIndex()
+        for i in range(20000):
+            index.add(i, f"일차방정식 {{'a': {i}, 'b': {i % 7}}} {{'x': {i * 0.5}}} step{i % 13}")
+
+        start = time.perf_counter()
+        result = index.search("19999")
+        elapsed = time.perf_counter() - start
+        assert 19999 in result
+        assert elapsed < 0.05
@@ -0,0 +1,132 @@
+"""
+그래프 경로 단순화 테스트
+"""
+import pytest
+import numpy as np
+from src.rendering.simplify import simplify_path, simplify_spec
+from src.rendering.spec import PlotSpec, Series, Marker
+from src.rendering.backends import render_svg
+from src.calculators.linear_function import LinearFunctionDrawer
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+from src.calculators.function_graph import FunctionGraphDrawer
+
+
+class TestSimplifyPath:
+    """경로 단순화 테스트 클래스"""
+
+    def test_straight_line_two_points(self):
+        """직선은 양 끝 두 점만 남음"""
+        x = np.linspace(-10, 10, 100)
+        sx, sy = simplify_path(x, 2 * x + 1)
+        assert len(sx) == 2
+        assert (sx[0], sx[-1]) == (-10, 10)
+        assert (sy[0], sy[-1]) == (-19, 21)
+
+    def test_error_within_tolerance(self):
+        """단순화한 선과 원래 곡선의 픽셀 오차가 허용 오차 이하"""
+        x = np.linspace(-5, 5, 2000)
+        y = x ** 2
+        size = (800, 600)
+        sx, sy = simplify_path(x, y, 0.5, (-5, 5), (0, 25), size)
+        assert len(sx) < 200
+
+        # 원래 점에서 단순화된 선까지의 세로 픽셀 거리
+        y_interp = np.interp(x, sx, sy)
+        err_px = np.abs(y_interp - y) * size[1] / 25
+        # 세로 거리는 수직 거리보다 크거나 같으므로 기울기를 고려한 여유를 둠
+        slope_px = np.abs(2 * x) * (size[1] / 25) / (size[0] / 10)
+        assert np.all(err_px <= 0.5 * np.sqrt(1 + slope_px ** 2) + 1e-9)
+
+    def test_gaps_preserved(self):
+        """NaN 끊김은 그대로 남고 구간마다 단순화"""
+        x = np.linspace(-5, 5, 101)
+        y = np.where(np.abs(x) < 1e-9, np.nan, 2 * x)
+        sx, sy = simplify_path(x, y)
+        assert np.count_nonzero(np.isnan(sy)) == 1
+        # 두 직선 구간의 양 끝 점 + 끊김 점
+        assert len(sx) == 5
+
+    def test_zero_tolerance_keeps_all(self):
+        """허용 오차가 0이면 그대로"""
+        x = np.linspace(0, 1, 50)
+        sx, _ = simplify_path(x, x, tolerance_px=0)
+        assert len(sx) == 50
+
+    def test_invalid_input(self):
+        """입력 검증"""
+        with pytest.raises(ValueError):
+            simplify_path([0, 1, 2], [0, 1])
+        with pytest.raises(ValueError):
+            simplify_path([0, 1, 2], [0, 1, 2], tolerance_px=-1)
+
+
+class TestSimplifySpec:
+    """명세 단순화 테스트 클래스"""
+
+    def test_only_series_changed(self):
+        """선만 단순화하고 점과 옵션은 그대로"""
+        x = np.linspace(0, 10, 500)
+        spec = PlotSpec(
+            title='t',
+            layers=(Series.from_arrays(x, x), Marker.from_arrays(x[:3], x[:3])),
+            xlim=(0, 10)
+        )
+        simplified = simplify_spec(spec)
+        assert len(simplified.layers[0].x) == 2
+        assert simplified.layers[1] == spec.layers[1]
+        assert simplified.xlim == spec.xlim
+
+    def test_linear_graph_two_points(self):
+        """일차함수 그래프 선은 단순화하면 두 점"""
+        spec = simplify_spec(LinearFunctionDrawer().graph_spec(2, 1, (-10, 10)))
+        assert len(spec.layers[2].x) == 2
+
+    def test_quadratic_payload_smaller(self):
+        """이차함수 곡선 점 수가 줄고 양 끝은 유지"""
+        drawer = QuadraticFunctionDrawer()
+        curve = simplify_spec(drawer.graph_spec(1, -2, -3, (-10, 10))).layers[2]
+        assert len(curve.x) < 100
+        assert curve.x[0] == -10 and curve.x[-1] == 10
+
+    def test_inverse_gap_kept(self):
+        """반비례 그래프는 단순화해도 x = 0에서 끊김 유지"""
+        spec = simplify_spec(FunctionGraphDrawer().inverse_proportional_spec(3, (-10, 10)))
+        curves = [layer for layer in spec.layers if isinstance(layer, Series) and None in layer.y]
+        assert len(curves) == 1
+
+    def test_builders_keep_full_resolution(self):
+        """명세는 단순화하지 않은 좌표를 담음 (확대하는 대화형 그래프용)"""
+        spec = LinearFunctionDrawer().graph_spec(2, 1, (-10, 10))
+        assert len(spec.layers[2].x) > 2
+
+    def test_plotly_keeps_curves(self):
+        """Plotly 그래프는 곡선의 점을 대부분 보냄 (확대해도 매끄럽게)"""
+        pytest.importorskip('plotly')
+        from src.rendering.backends import render_plotly
+        x = np.linspace(-5, 5, 1000)
+        spec = PlotSpec(title='t', layers=(Series.from_arrays(x, x ** 2),))
+        assert len(render_plotly(spec).data[0].x) > 500
+
+    def test_plotly_drops_collinear_points(self):
+        """Plotly 그래프도 직선은 양 끝 두 점만 보냄"""
+        pytest.importorskip('plotly')
+        from src.rendering.backends import render_plotly
+        spec = LinearFunctionDrawer().graph_spec(2, 1, (-10, 10))
+        line = render_plotly(spec).data[0]
+        assert list(line.x) == [-10, 10]
+        assert list(line.y) == [-19, 21]
+
+    def test_matplotlib_simplified_at_output(self):
+        """matplotlib 백엔드는 그릴 때 단순화"""
+        from src.rendering.backends import render_matplotlib
+        x = np.linspace(-5, 5, 1000)
+        spec = PlotSpec(title='t', layers=(Series.from_arrays(x, x),))
+        fig = render_matplotlib(spec)
+        assert len(fig.axes[0].lines[0].get_xdata()) == 2
+
+    def test_svg_simplified_at_output(self):
+        """SVG 백엔드는 그릴 때 단순화"""
+        x = np.linspace(-5, 5, 1000)
+        spec = PlotSpec(title='t', layers=(Series.from_arrays(x, x ** 2),))
+        assert render_svg(spec) == render_svg(simplify_spec(spec))
+        assert render_svg(spec).count(',') < 100
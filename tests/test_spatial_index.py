@@ -0,0 +1,92 @@
+"""
+공간 색인 테스트
+"""
+import time
+import pytest
+import numpy as np
+from src.calculators.spatial_index import PointGridIndex
+
+
+class TestPointGridIndex:
+    """격자 색인 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.points = np.array([(0, 0), (1, 0), (5, 5), (10, 10), (-3, 2)], dtype=float)
+        self.index = PointGridIndex(self.points)
+
+    def test_nearest_single(self):
+        """가장 가까운 점"""
+        dist, idx = self.index.nearest(4.6, 5.1)
+        assert idx[0] == 2
+        assert dist[0] == pytest.approx(np.hypot(0.4, 0.1))
+
+    def test_nearest_k_sorted(self):
+        """가까운 순서로 k개"""
+        dist, idx = self.index.nearest(0.2, 0, k=3)
+        assert list(idx) == [0, 1, 4]
+        assert np.all(np.diff(dist) >= 0)
+
+    def test_query_outside_grid(self):
+        """격자 밖 질의점"""
+        dist, idx = self.index.nearest(100, 100)
+        assert idx[0] == 3
+
+    def test_all_points_when_k_equals_n(self):
+        """k가 점 개수와 같으면 모든 점"""
+        _, idx = self.index.nearest(0, 0, k=5)
+        assert sorted(idx) == [0, 1, 2, 3, 4]
+
+    def test_invalid_k_raises_error(self):
+        """잘못된 k"""
+        with pytest.raises(ValueError):
+            self.index.nearest(0, 0, k=6)
+
+    def test_query_radius(self):
+        """반지름 안의 점"""
+        idx = self.index.query_radius(0, 0, 1.5)
+        assert list(idx) == [0, 1]
+
+    def test_snap(self):
+        """스냅"""
+        assert self.index.snap(9.5, 9.8) == 3
+        assert self.index.snap(7.5, 7.5, max_distance=1.0) is None
+
+    def test_duplicate_points(self):
+        """모든 점이 같은 위치"""
+        index = PointGridIndex([(2, 2)] * 4)
+        dist, idx = index.nearest(0, 0, k=4)
+        assert sorted(idx) == [0, 1, 2, 3]
+
+    def test_query_matches_brute_force(self):
+        """무작위 점: 전수 비교와 일치"""
+        rng = np.random.default_rng(7)
+        points = rng.normal(0, 5, (2000, 2))
+        index = PointGridIndex(points)
+        queries = rng.normal(0, 8, (100, 2))
+        distances, _ = index.query(queries, k=5)
+
+        diff = queries[:, None, :] - points[None, :, :]
+        brute = np.sort(np.hypot(diff[..., 0], diff[..., 1]), axis=1)[:, :5]
+        np.testing.assert_allclose(distances, brute)
+
+    def test_far_queries_match_brute_force(self):
+        """격자에서 멀리 떨어진 질의점도 빠르게 전수 비교와 같은 결과"""
+        rng = np.random.default_rng(11)
+        points = rng.uniform(0, 1, (5000, 2))
+        index = PointGridIndex(points)
+        queries = np.array([(1e4, 0.5), (-1e4, -1e4), (0.5, -5e3), (3e3, 2e3)])
+
+        start = time.perf_counter()
+        distances, _ = index.query(queries, k=3)
+        elapsed = time.perf_counter() - start
+
+        diff = queries[:, None, :] - points[None, :, :]
+        brute = np.sort(np.hypot(diff[..., 0], diff[..., 1]), axis=1)[:, :3]
+        np.testing.assert_allclose(distances, brute)
+        assert elapsed < 1.0
+
+    def test_empty_points_raise_error(self):
+        """빈 점 배열"""
+        with pytest.raises(ValueError):
+            PointGridIndex(np.empty((0, 2)))
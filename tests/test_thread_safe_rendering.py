@@ -0,0 +1,85 @@
+"""
+스레드 안전 렌더링 테스트
+여러 스레드에서 동시에 그린 결과가 순차 렌더링 결과와 같은지 확인합니다.
+"""
+import pytest
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.text import Text
+from concurrent.futures import ThreadPoolExecutor
+from src.rendering.figures import get_figure_manager, korean_font_family, apply_font_family, FALLBACK_FONT
+from src.features.visualizations import ProgressVisualizer
+from src.calculators.quadratic_function import QuadraticFunctionDrawer
+from src.calculators.linear_function import LinearFunctionDrawer
+
+
+def _render_job(job):
+    """작업 하나를 PNG 바이트로 렌더링"""
+    kind, value = job
+    manager = get_figure_manager()
+    if kind == 'quadratic':
+        fig = QuadraticFunctionDrawer().draw(value, -2, 1, (-5, 5))
+    elif kind == 'linear':
+        fig = LinearFunctionDrawer().draw(value, 3, (-5, 5))
+    elif kind == 'mastery':
+        fig = ProgressVisualizer().create_mastery_bar_chart(
+            ['일차방정식', '이차방정식', '통계'], [value / 10, 0.5, 0.9]
+        )
+    else:
+        fig = ProgressVisualizer().create_progress_line_chart(
+            ['01-01', '01-02', '01-03'], [5, value, 7], [4, 2, 6]
+        )
+    return manager.to_bytes(fig, fmt='png', dpi=50)
+
+
+class TestThreadSafeRendering:
+    """스레드 안전 렌더링 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.jobs = [
+            (kind, value)
+            for kind in ('quadratic', 'linear', 'mastery', 'progress')
+            for value in (1, 2, 3)
+        ]
+
+    def test_concurrent_matches_sequential(self):
+        """동시 렌더링 결과가 순차 렌더링과 바이트 단위로 같음"""
+        expected = [_render_job(job) for job in self.jobs]
+
+        work = self.jobs * 4
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(_render_job, work))
+
+        for job, data in zip(work, results):
+            assert data == expected[self.jobs.index(job)]
+
+    def test_no_pyplot_or_rcparams_side_effects(self):
+        """pyplot Figure 등록과 전역 rcParams 변경이 없음"""
+        before_figs = plt.get_fignums()
+        before_family = list(matplotlib.rcParams['font.family'])
+        before_minus = matplotlib.rcParams['axes.unicode_minus']
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_render_job, self.jobs))
+
+        assert plt.get_fignums() == before_figs
+        assert list(matplotlib.rcParams['font.family']) == before_family
+        assert matplotlib.rcParams['axes.unicode_minus'] == before_minus
+
+    def test_korean_font_family_has_fallback(self):
+        """한글 글꼴 목록은 대체 글꼴로 끝남"""
+        family = korean_font_family()
+        assert family[-1] == FALLBACK_FONT
+
+    def test_apply_font_family_per_figure(self):
+        """글꼴은 해당 Figure의 글자에만 적용"""
+        manager = get_figure_manager()
+        with manager.figure((4, 3)) as (fig, ax), manager.figure((4, 3)) as (other, other_ax):
+            ax.set_title('제목')
+            other_ax.set_title('제목')
+            apply_font_family(fig, ['DejaVu Serif'])
+
+            assert ax.title.get_fontfamily() == ['DejaVu Serif']
+            assert other_ax.title.get_fontfamily() != ['DejaVu Serif']
+            assert all(t.get_fontfamily() == ['DejaVu Serif'] for t in fig.findobj(Text))
@@ -0,0 +1,156 @@
+"""
+사용자별 저장소 테스트
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import pytest
+from src.features.history_manager import HistoryManager
+from src.features.user_stores import UserStorePool, get_shared_store, new_session_id, user_storage_dir
+
+
+def _record_attempts(root: str, user_id: str, times: int):
+    """다른 프로세스에서 같은 사용자의 같은 주제를 여러 번 기록"""
+    pool = UserStorePool(root=root, backend='sqlite')
+    tracker = pool.progress(user_id)
+    for i in range(times):
+        tracker.record_attempt('일차방정식', is_correct=i % 2 == 0)
+    pool.close()
+
+
+class TestSharedStore:
+    """공유 저장소 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_same_manager_across_reruns(self, monkeypatch):
+        """다시 실행해도 같은 관리자를 사용 (검색 색인 유지)"""
+        monkeypatch.chdir(self.temp_dir.name)
+        monkeypatch.setattr(sys.modules[UserStorePool.__module__], '_shared_stores', {})
+        manager = get_shared_store('history')
+        assert isinstance(manager, HistoryManager)
+        assert get_shared_store('history') is manager
+        assert get_shared_store('mistakes') is not manager
+
+    def test_unknown_kind(self):
+        """알 수 없는 저장소 종류"""
+        with pytest.raises(ValueError):
+            get_shared_store('unknown')
+
+
+class TestUserStorePool:
+    """사용자별 저장소 풀 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.pool = UserStorePool(root=self.root, capacity=2, backend='sqlite')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.pool.close()
+        self.temp_dir.cleanup()
+
+    def test_user_storage_dir(self):
+        """사용자 ID 해시로 나눈 디렉토리"""
+        path = user_storage_dir('student-01', self.root)
+        assert os.path.basename(path) == 'student-01'
+        assert len(os.path.basename(os.path.dirname(path))) == 2
+        assert user_storage_dir('student-01', self.root) == path
+
+    def test_invalid_user_id(self):
+        """경로로 쓸 수 없는 사용자 ID"""
+        for user_id in ['', '../etc', 'a/b', 'x' * 65, None]:
+            with pytest.raises(ValueError):
+                user_storage_dir(user_id, self.root)
+
+    def test_users_are_isolated(self):
+        """사용자마다 별도 저장소"""
+        self.pool.history('alice').add_calculation("통계", {}, {}, [])
+        assert len(self.pool.history('alice').history) == 1
+        assert self.pool.history('bob').history == []
+        assert os.path.exists(os.path.join(user_storage_dir('alice', self.root), 'history.db'))
+
+    def test_pool_reuses_and_evicts(self):
+        """열어 둔 관리자를 다시 쓰고, 크기를 넘으면 가장 오래 쓰지 않은 것부터 뺌"""
+        first = self.pool.history('alice')
+        assert self.pool.history('alice') is first
+        self.pool.mistakes('alice')
+        self.pool.progress('alice')  # 크기 2 → alice 히스토리를 뺌
+
+        stats = self.pool.get_statistics()
+        assert stats == {'open': 2, 'hits': 1, 'misses': 3, 'evictions': 1}
+        assert self.pool.history('alice') is not first
+
+    def test_evicted_manager_keeps_data(self):
+        """풀에서 빠졌다가 다시 열어도 데이터 유지"""
+        entry_id = self.pool.history('alice').add_calculation("기하", {"r": 1}, {}, [])
+        self.pool.mistakes('bob')
+        self.pool.progress('bob')
+        assert self.pool.history('alice').history[0].id == entry_id
+
+    def test_json_backend(self):
+        """json 저장 방식도 사용자별 파일에 저장"""
+        pool = UserStorePool(root=self.root, backend='json')
+        history = pool.history('carol')
+        assert isinstance(history, HistoryManager) and history.store is None
+        history.add_calculation("통계", {}, {}, [])
+        pool.close()
+        files = os.listdir(user_storage_dir('carol', self.root))
+        assert any(name.startswith('history.json') for name in files)
+
+    def _age(self, user_id: str, seconds: float):
+        """사용자 디렉토리와 파일의 수정 시각을 과거로 돌리기"""
+        directory = user_storage_dir(user_id, self.root)
+        past = time.time() - seconds
+        for name in os.listdir(directory):
+            os.utime(os.path.join(directory, name), (past, past))
+        os.utime(directory, (past, past))
+
+    def test_purge_old_sessions(self):
+        """오래 쓰지 않은 세션 저장소만 삭제 (이름 있는 사용자, 최근 세션, 열린 세션은 유지)"""
+        old, recent, active = new_session_id(), new_session_id(), new_session_id()
+        pool = UserStorePool(root=self.root, capacity=1, backend='sqlite', session_ttl=0)
+        for user_id in (old, recent, 'dave'):
+            pool.history(user_id).add_calculation("통계", {}, {}, [])
+        pool.history(active)  # 풀에는 active만 열려 있음
+        for user_id in (old, 'dave', active):
+            self._age(user_id, 7200)
+
+        assert pool.purge_sessions(3600) == 1
+        assert not os.path.exists(user_storage_dir(old, self.root))
+        for user_id in (recent, 'dave', active):
+            assert os.path.isdir(user_storage_dir(user_id, self.root))
+        pool.close()
+
+    def test_invalid_settings(self):
+        """풀 크기와 저장 방식 검증"""
+        with pytest.raises(ValueError):
+            UserStorePool(root=self.root, capacity=0)
+        with pytest.raises(ValueError):
+            UserStorePool(root=self.root, backend='paged')
+
+    def test_concurrent_processes_do_not_lose_updates(self):
+        """여러 프로세스가 같은 사용자의 진도를 동시에 기록해도 모두 반영"""
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(target=_record_attempts, args=(self.root, 'dave', 25)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+        assert all(worker.exitcode == 0 for worker in workers)
+
+        progress = self.pool.progress('dave').get_topic_progress('일차방정식')
+        assert progress.problems_attempted == 100
+        assert progress.problems_correct == 52
@@ -0,0 +1,236 @@
+"""
+지연 쓰기 및 원자적 쓰기 테스트
+"""
+import os
+import sys
+import tempfile
+import time
+import pytest
+from src.features.history_manager import HistoryManager
+from src.features.mistake_notes import MistakeNotes
+from src.features.progress_tracker import ProgressTracker
+from src.storage.atomic import atomic_write_text
+from src.storage.checked_json import read_checked_json
+from src.storage.write_behind import WriteBehind
+
+
+class TestWriteBehind:
+    """WriteBehind 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+        # 테스트 중에 백그라운드 저장이 끼어들지 않도록 긴 주기 사용
+        self.writer = WriteBehind(interval=60, max_pending=5)
+        self.saves = []
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.writer.discard()
+        self.writer.close()
+        self.temp_dir.cleanup()
+
+    def _save(self):
+        self.saves.append(1)
+
+    def test_coalesce(self):
+        """같은 객체의 여러 요청은 한 번의 저장으로 합쳐짐"""
+        for _ in range(4):
+            self.writer.schedule(self, self.path, self._save)
+        assert self.saves == []
+        assert self.writer.pending_count(self.path) == 1
+
+        assert self.writer.flush(self.path) == 1
+        assert self.saves == [1]
+        stats = self.writer.get_statistics()
+        assert stats['scheduled'] == 4
+        assert stats['saves'] == 1
+        assert stats['coalesced'] == 3
+        assert stats['pending'] == 0
+
+    def test_flush_by_path(self):
+        """flush(path)는 해당 파일의 요청만 저장"""
+        other = []
+        self.writer.schedule(self, self.path, self._save)
+        self.writer.schedule(other, 'other.json', lambda: other.append(1))
+
+        self.writer.flush(self.path)
+        assert self.saves == [1]
+        assert other == []
+        assert self.writer.pending_count() == 1
+
+    def test_max_pending_triggers_save(self):
+        """기준 개수만큼 요청이 쌓이면 주기를 기다리지 않고 저장"""
+        for _ in range(5):
+            self.writer.schedule(self, self.path, self._save)
+        deadline = time.monotonic() + 2
+        while not self.saves and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.saves == [1]
+        assert self.writer.pending_count() == 0
+
+    def test_close_flushes(self):
+        """종료하면 남은 요청을 저장하고 이후 요청은 바로 저장"""
+        self.writer.schedule(self, self.path, self._save)
+        self.writer.close()
+        assert self.saves == [1]
+
+        self.writer.schedule(self, self.path, self._save)
+        assert self.saves == [1, 1]
+
+    def test_save_error_is_counted(self):
+        """저장 실패는 기록하고 다른 요청 저장은 계속"""
+        def fail():
+            raise OSError("디스크 오류")
+
+        self.writer.schedule(object(), 'bad.json', fail)
+        self.writer.schedule(self, self.path, self._save)
+        assert self.writer.flush() == 1
+        assert self.saves == [1]
+        assert self.writer.get_statistics()['errors'] == 1
+
+    def test_failed_save_is_retried(self):
+        """저장에 실패한 요청은 대기열에 남아 다음 저장 때 재시도"""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("디스크 오류")
+
+        self.writer.schedule(self, self.path, flaky)
+        assert self.writer.flush(self.path) == 0
+        assert self.writer.pending_count(self.path) == 1
+
+        assert self.writer.flush(self.path) == 1
+        assert len(attempts) == 2
+        assert self.writer.pending_count(self.path) == 0
+
+    def test_invalid_settings(self):
+        """잘못된 설정 값"""
+        with pytest.raises(ValueError):
+            WriteBehind(interval=0)
+        with pytest.raises(ValueError):
+            WriteBehind(max_pending=0)
+
+
+class TestAtomicWrite:
+    """원자적 쓰기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_replace_leaves_no_temp_files(self):
+        """내용을 교체하고 임시 파일을 남기지 않음"""
+        atomic_write_text(self.path, '첫 번째')
+        atomic_write_text(self.path, '두 번째')
+        with open(self.path, encoding='utf-8') as f:
+            assert f.read() == '두 번째'
+        assert os.listdir(self.temp_dir.name) == ['data.json']
+
+    def test_failed_write_keeps_old_content(self):
+        """쓰기에 실패하면 이전 내용이 그대로 남음"""
+        atomic_write_text(self.path, '원본')
+        with pytest.raises(UnicodeEncodeError):
+            atomic_write_text(self.path, '바뀐 내용', encoding='ascii')
+        with open(self.path, encoding='utf-8') as f:
+            assert f.read() == '원본'
+        assert os.listdir(self.temp_dir.name) == ['data.json']
+
+
+class TestManagersWriteBehind:
+    """학습 기능 관리자 지연 쓰기 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.temp_dir.name
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.temp_dir.cleanup()
+
+    def test_mistakes_saved_on_flush(self):
+        """오답 노트 변경은 flush()까지 파일에 쓰지 않음"""
+        path = os.path.join(self.dir, 'mistakes.json')
+        notes = MistakeNotes(storage_path=path, write_behind=True)
+        mistake_id = notes.add_mistake("대수", "2x = 4", 3, 2)
+        for _ in range(20):
+            notes.increment_attempts(mistake_id)
+        assert not os.path.exists(path)
+
+        notes.flush()
+        assert read_checked_json(path)[0]['attempts'] == 20
+
+    def test_failed_manager_save_is_retried(self, monkeypatch):
+        """관리자 저장 실패는 지연 쓰기로 전달되어 변경을 잃지 않음"""
+        mistake_notes = sys.modules[MistakeNotes.__module__]
+        path = os.path.join(self.dir, 'mistakes.json')
+        notes = MistakeNotes(storage_path=path, write_behind=True)
+        notes.add_mistake("대수", "2x = 4", 3, 2)
+
+        write = mistake_notes.write_checked_json
+
+        def fail(*args, **kwargs):
+            raise OSError("디스크 오류")
+
+        monkeypatch.setattr(mistake_notes, 'write_checked_json', fail)
+        notes.flush()
+        assert not os.path.exists(path)
+
+        monkeypatch.setattr(mistake_notes, 'write_checked_json', write)
+        notes.flush()
+        assert len(read_checked_json(path)) == 1
+
+    def test_failed_journal_append_is_retried(self, monkeypatch):
+        """저널 덧붙이기에 실패한 기록은 다음 저장 때 함께 씀"""
+        path = os.path.join(self.dir, 'history.json')
+        manager = HistoryManager(storage_path=path, journal=True, write_behind=True)
+        append = manager.journal.append_many
+
+        def fail(records):
+            raise OSError("디스크 오류")
+
+        monkeypatch.setattr(manager.journal, 'append_many', fail)
+        manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, [])
+        manager.flush()
+
+        monkeypatch.setattr(manager.journal, 'append_many', append)
+        manager.add_calculation("이차방정식", {"a": 1}, {"x": 2}, [])
+        manager.flush()
+
+        reloaded = HistoryManager(storage_path=path, journal=True, write_behind=True)
+        assert len(reloaded.history) == 2
+
+    def test_progress_visible_to_new_instance(self):
+        """새 인스턴스는 같은 파일의 대기 중인 변경을 먼저 저장한 뒤 불러옴"""
+        path = os.path.join(self.dir, 'progress.json')
+        tracker = ProgressTracker(storage_path=path, write_behind=True)
+        for i in range(20):
+            tracker.record_attempt("대수", i % 2 == 0)
+
+        reloaded = ProgressTracker(storage_path=path, write_behind=True)
+        assert reloaded.get_topic_progress("대수").problems_attempted == 20
+
+    def test_history_journal_batches_records(self):
+        """히스토리 저널 기록은 한 번에 모아서 덧붙임"""
+        path = os.path.join(self.dir, 'history.json')
+        manager = HistoryManager(storage_path=path, journal=True, write_behind=True)
+        entry_id = manager.add_calculation("일차방정식", {"a": 1}, {"x": 1}, [])
+        for _ in range(5):
+            manager.toggle_favorite(entry_id)
+        assert not os.path.exists(path + '.log')
+
+        manager.flush()
+        with open(path + '.log', encoding='utf-8') as f:
+            assert len([line for line in f if line.strip()]) == 6
+
+        reloaded = HistoryManager(storage_path=path, journal=True, write_behind=True)
+        assert reloaded.history[0].is_favorite is True